@@ -1,25 +1,38 @@
 import streamlit as st
 import pandas as pd
-import PyPDF2
-import pdfplumber
-import re
-from io import BytesIO
-import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
 import os
+import time
 from datetime import datetime
-from typing import List, Dict
+from functools import partial
 from dotenv import load_dotenv
-from extract_Eligibility import extract_Eligibility
-from extract_primary_data import extract_primary_data
-from create_comprehensive_excel_with_formatting import create_comprehensive_excel_with_formatting
-from create_addon import create_addon
-from create_AddonCoverages import create_AddonCoverages
 
-# Load environment variables
+# Load environment variables before the modules below read their settings
+# (JOB_WORKERS, PDF_TEXT_CACHE, ...) at import
 load_dotenv()
 
+from app_logging import configure_logging
+from data_export import available_formats, build_export_zip
+from job_queue import DONE, FAILED, QUEUED, QueueFullError, get_default_queue
+from pipeline import RESULT_KEYS, file_hash
+from progress import FINISHED as STAGE_FINISHED, STAGES, current_stage, describe_stage, overall_progress
+from table_view import WIDE_TABLE_COLUMNS, field_value_view, non_empty_columns
+from upload_batch import UploadBatch
+
+# Result tabs: one per extractor result (pipeline.RESULT_KEYS), with its label
+RESULT_TAB_LABELS = {
+    "eligibility_data": "🛡️ Eligibility Coverage",
+    "primary_data": "🏥 Primary Coverage",
+    "addon_data": "➕ Addon Coverage",
+    "AddonCoverages_data": "🔧 Addon Coverages",
+}
+RESULT_TABS = [(key, RESULT_TAB_LABELS.get(key, key)) for key in RESULT_KEYS]
+
+# Seconds between status checks while an upload's job is queued or running
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+
+# Log level and format from LOG_LEVEL / LOG_LEVELS / LOG_FORMAT (see app_logging)
+configure_logging()
+
 def load_users_from_env():
     """Load users from environment variables"""
     users = {}
@@ -209,33 +222,167 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def extract_text_from_pdf(pdf_file):
-    """Extract text from uploaded PDF file using both PyPDF2 and pdfplumber for better accuracy"""
-    try:
-        # Try pdfplumber first for better text extraction
-        text = ""
-        with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        # If pdfplumber didn't extract much text, try PyPDF2 as backup
-        if len(text.strip()) < 100:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-        
-        return text
-    except Exception as e:
-        st.error(f"Error reading PDF: {str(e)}")
-        return None
-
 def display_features():
     """Display feature highlights"""
     pass
 
+def clear_pipeline_results():
+    """Forget the memoized pipeline results for the previous upload"""
+    st.session_state.pipeline_file_hash = None
+    st.session_state.pipeline_job_id = None
+    st.session_state.pipeline_results = None
+
+def get_pipeline_results(uploaded_file, debug=False):
+    """
+    Process the uploaded file in the background job queue and return its results
+    once the job is done, or None while it is still queued or running.
+    Extraction runs in a worker process (see job_queue), so a large PDF does not
+    block the session or the server; this page polls the job every
+    JOB_POLL_SECONDS until it finishes.
+    Results are memoized in session state keyed on the file's SHA-256, so reruns
+    from tab switches, the preview expander or the download button render
+    instantly; a different upload invalidates them.
+    With debug the file is processed again if needed, so the results carry its
+    debug log ("debug_log").
+    """
+    file_bytes = uploaded_file.getvalue()
+    current_hash = file_hash(file_bytes)
+    results = st.session_state.get("pipeline_results")
+    if st.session_state.get("pipeline_file_hash") == current_hash and results and (not debug or "debug_log" in results):
+        return results
+
+    jobs = get_default_queue()
+    job = jobs.get(st.session_state.get("pipeline_job_id"))
+    if job is None or job.file_hash != current_hash or (debug and not job.debug):
+        # New upload (or the job expired): invalidate results for the previous file and queue this one
+        clear_pipeline_results()
+        try:
+            job_id = jobs.submit(file_bytes, uploaded_file.name, debug=debug)
+        except QueueFullError as e:
+            st.warning(f"⏳ The server is busy: {e}")
+            if st.button("🔄 Retry"):
+                st.rerun()
+            return None
+        st.session_state.pipeline_file_hash = current_hash
+        st.session_state.pipeline_job_id = job_id
+        job = jobs.get(job_id)
+
+    if job.status == FAILED:
+        st.error(f"Error processing PDF: {job.error}")
+        return None
+
+    if job.status != DONE:
+        if job.status == QUEUED:
+            st.info(f"⏳ Job {job.job_id[:8]} is queued ({jobs.position(job.job_id)} ahead of it)...")
+        else:
+            st.info(f"🧠 Job {job.job_id[:8]}: extracting and analyzing data ({job.elapsed():.0f}s)...")
+            render_job_progress(job.progress)
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+
+    st.session_state.pipeline_results = job.result
+    return job.result
+
+def render_job_progress(events):
+    """Progress bar over the pipeline stages, with the steps and elapsed time of each stage"""
+    st.progress(overall_progress(events), text=current_stage(events))
+    lines = []
+    for stage, _ in STAGES:
+        event = events.get(stage)
+        icon = "✅" if event and event["status"] == STAGE_FINISHED else "⏳" if event else "▫️"
+        lines.append(f"{icon} {describe_stage(stage, event)}")
+    st.caption("  \n".join(lines))
+
+def render_result_tabs(results):
+    """
+    One tab per result set. Switching tabs reruns the script, so only the open
+    tab builds its DataFrame and sends its table to the browser.
+    """
+    tabs = st.tabs([label for _, label in RESULT_TABS], key="result_tab", on_change="rerun")
+    for tab, (result_key, _) in zip(tabs, RESULT_TABS):
+        with tab:
+            if tab.open:
+                # Keyed on the upload, so the column picks of another PDF do not carry over
+                render_result_table(results[result_key], f"{result_key}_{st.session_state.pipeline_file_hash[:12]}")
+
+@st.fragment
+def render_result_table(data, key):
+    """
+    One result set as a table. Wide tables (more than WIDE_TABLE_COLUMNS columns)
+    show only the picked columns, by default those with a value, and can be
+    flipped to one row per field. A fragment, so the picker only reruns the table.
+    """
+    df = pd.DataFrame(data)
+    if len(df.columns) <= WIDE_TABLE_COLUMNS:
+        st.dataframe(df, use_container_width=True, height=300)
+        return
+
+    filled = non_empty_columns(df)
+    picker, toggle = st.columns([4, 1])
+    columns = picker.multiselect(
+        "Columns",
+        list(df.columns),
+        default=filled,
+        key=f"{key}_columns",
+        help="Columns to show; empty columns are left out by default"
+    )
+    transposed = toggle.toggle("Field / value", value=len(df) == 1, key=f"{key}_transposed")
+    st.caption(f"{len(columns)} of {len(df.columns)} columns shown · {len(df.columns) - len(filled)} empty")
+    view = df[columns]
+    if transposed:
+        st.dataframe(field_value_view(view), use_container_width=True, height=300, hide_index=True)
+    else:
+        st.dataframe(view, use_container_width=True, height=300)
+
+def render_upload_batch(uploaded_files):
+    """
+    Multi-file mode: queue every uploaded PDF (see upload_batch), show per-file
+    progress until all jobs finish, then the combined summary and one ZIP with
+    every workbook, the consolidated workbook and summary.csv.
+    """
+    if not uploaded_files:
+        st.session_state.upload_batch = None
+        st.session_state.upload_batch_key = None
+        return
+
+    # A file gets a new file_id whenever it is uploaded, so the polling reruns
+    # compare ids instead of reading and hashing every file again
+    upload_key = tuple((uploaded.file_id, uploaded.size) for uploaded in uploaded_files)
+    batch = st.session_state.get("upload_batch")
+    if batch is None or st.session_state.get("upload_batch_key") != upload_key:
+        batch = UploadBatch([(uploaded.name, uploaded.getvalue()) for uploaded in uploaded_files])
+        st.session_state.upload_batch = batch
+        st.session_state.upload_batch_key = upload_key
+
+    jobs = get_default_queue()
+    batch.submit_pending(jobs)
+    statuses = batch.statuses(jobs)
+    finished = sum(1 for row in statuses if row["status"] in (DONE, FAILED))
+
+    st.subheader(f"📚 {len(batch)} PDF files")
+    st.progress(finished / len(batch), text=f"{finished} of {len(batch)} processed")
+
+    if finished < len(batch):
+        st.dataframe(pd.DataFrame(statuses), use_container_width=True, hide_index=True)
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+
+    summary = batch.summary(jobs)
+    failed = sum(1 for row in summary if row["status"] == FAILED)
+    if failed:
+        st.warning(f"⚠️ {failed} of {len(batch)} files could not be processed")
+    else:
+        st.success(f"✅ All {len(batch)} files processed")
+    st.dataframe(pd.DataFrame(summary), use_container_width=True, hide_index=True)
+
+    with st.sidebar:
+        st.download_button(
+            label="📥 Download all (zip)",
+            data=batch.build_zip(jobs),
+            file_name=f"policies_{datetime.now().strftime('%d-%m-%Y')}.zip",
+            mime="application/zip"
+        )
+
 def main():
     # Initialize session state for authentication
     if 'authenticated' not in st.session_state:
@@ -266,104 +413,96 @@ def main():
         
         st.markdown("---")
     
+    upload_mode = st.sidebar.radio("Upload mode", ["Single PDF", "Multiple PDFs"], horizontal=True)
+    if upload_mode == "Multiple PDFs":
+        uploaded_files = st.sidebar.file_uploader(
+            "Choose PDF files",
+            type=['pdf'],
+            accept_multiple_files=True,
+            help="Upload several policy PDFs; they are processed side by side"
+        )
+        render_upload_batch(uploaded_files)
+        return
+
     # Sidebar for file upload
     uploaded_file = st.sidebar.file_uploader(
         "Choose a PDF file",
         type=['pdf'],
         help="Upload a PDF file containing eligibility information"
     )
+    debug = st.sidebar.checkbox(
+        "🐞 Debug log for this upload",
+        help="Process the PDF with the extractors' debug logging on and show the log below the results"
+    )
     
-    if uploaded_file is not None:
-        st.success(f"✅ File uploaded: {uploaded_file.name}")
-        
-        # Extract text from PDF
-        with st.spinner("🔍 Extracting text from PDF..."):
-            text = extract_text_from_pdf(uploaded_file)
-        
-        if text:
-            # Text preview
-            with st.expander("📖 Preview Extracted Text", expanded=False):
-                st.text_area(
-                    "Extracted Text Preview", 
-                    text[:400000] + "..." if len(text) > 400000 else text, 
-                    height=200,
-                    label_visibility="collapsed"
-                )
-            
-            # Extract eligibility details
-            with st.spinner("🧠 Analyzing and extracting data..."):
-                eligibility_data = extract_Eligibility(text)
-                primary_data = extract_primary_data(text)
-                addon_data = create_addon(text)
-                AddonCoverages_data = create_AddonCoverages(text)
-                
-                # Debug: Print the data structures
-                print("DEBUG: Data extraction results:")
-                print(f"eligibility_data type: {type(eligibility_data)}, length: {len(eligibility_data) if isinstance(eligibility_data, list) else 'N/A'}")
-                print(f"primary_data type: {type(primary_data)}, length: {len(primary_data) if isinstance(primary_data, list) else 'N/A'}")
-                print(f"addon_data type: {type(addon_data)}, length: {len(addon_data) if isinstance(addon_data, list) else 'N/A'}")
-                print(f"AddonCoverages_data type: {type(AddonCoverages_data)}, length: {len(AddonCoverages_data) if isinstance(AddonCoverages_data, list) else 'N/A'}")
-                
-                if AddonCoverages_data and isinstance(AddonCoverages_data, list) and len(AddonCoverages_data) > 0:
-                    print("DEBUG: AddonCoverages_data first item keys:")
-                    for key, value in AddonCoverages_data[0].items():
-                        if value:  # Only print non-empty values
-                            print(f"  {key}: {value}")
-            
-            # Display extracted data in tabs
-            st.subheader("📊 Extracted Data")
-            
-            tab1, tab2, tab3, tab4 = st.tabs([
-                "🛡️ Eligibility Coverage", 
-                "🏥 Primary Coverage", 
-                "➕ Addon Coverage", 
-                "🔧 Addon Coverages"
-            ])
-            
-            with tab1:
-                df_eligibility = pd.DataFrame(eligibility_data)
-                st.dataframe(df_eligibility, use_container_width=True, height=300)
-            
-            with tab2:
-                df_primary = pd.DataFrame(primary_data)
-                st.dataframe(df_primary, use_container_width=True, height=300)
-            
-            with tab3:
-                df_addon = pd.DataFrame(addon_data)
-                st.dataframe(df_addon, use_container_width=True, height=300)
-            
-            with tab4:
-                df_AddonCoverages = pd.DataFrame(AddonCoverages_data)
-                st.dataframe(df_AddonCoverages, use_container_width=True, height=300)
-            
-            # Generate Excel file
-            with st.sidebar:
-                with st.spinner("Creating Excel file..."):
-                    try:
-                        # Generate the Excel workbook
-                        wb = create_comprehensive_excel_with_formatting(
-                            eligibility_data, primary_data, addon_data, AddonCoverages_data
-                        )
-
-                        # Save workbook to BytesIO
-                        excel_buffer = BytesIO()
-                        wb.save(excel_buffer)
-                        excel_buffer.seek(0)
-
-                        # Create download button with original PDF filename
-                        # Get the original PDF filename without extension
-                        pdf_filename = uploaded_file.name
-                        base_filename = pdf_filename.rsplit('.', 1)[0] if '.' in pdf_filename else pdf_filename
-                        
-                        st.download_button(
-                            label="📥 Download Excel File",
-                            data=excel_buffer.getvalue(),
-                            file_name=f"{base_filename}_{datetime.now().strftime('%d-%m-%Y')}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
-
-                    except Exception as e:
-                        st.error(f"❌ Error generating Excel file: {str(e)}")
+    if uploaded_file is None:
+        # File removed from the uploader: drop the cached results
+        clear_pipeline_results()
+        return
+
+    st.success(f"✅ File uploaded: {uploaded_file.name}")
+    results = get_pipeline_results(uploaded_file, debug)
+    if results is None:
+        return
+
+    # Stage durations of the run that produced these results
+    timings = results.get("timings") or {}
+    if timings:
+        st.caption("⏱️ " + " · ".join(f"{label} {timings[stage]:.1f}s" for stage, label in STAGES if stage in timings)
+                   + f" · total {timings.get('total', 0):.1f}s")
+
+    text = results["text"]
+
+    # Text preview
+    with st.expander("📖 Preview Extracted Text", expanded=False):
+        st.text_area(
+            "Extracted Text Preview", 
+            text[:400000] + "..." if len(text) > 400000 else text, 
+            height=200,
+            label_visibility="collapsed"
+        )
+    
+    if debug and results.get("debug_log") is not None:
+        with st.expander(f"🐞 Debug log ({len(results['debug_log'])} lines)", expanded=False):
+            st.text_area(
+                "Debug log",
+                "\n".join(results["debug_log"]),
+                height=300,
+                label_visibility="collapsed"
+            )
+
+    # Display extracted data in tabs
+    st.subheader("📊 Extracted Data")
+    
+    render_result_tabs(results)
+    
+    # Excel download
+    with st.sidebar:
+        # Create download buttons with original PDF filename
+        # Get the original PDF filename without extension
+        pdf_filename = uploaded_file.name
+        base_filename = pdf_filename.rsplit('.', 1)[0] if '.' in pdf_filename else pdf_filename
+
+        if results["excel_error"]:
+            st.error(f"❌ Error generating Excel file: {results['excel_error']}")
+        else:
+            st.download_button(
+                label="📥 Download Excel File",
+                data=results["excel_bytes"],
+                file_name=f"{base_filename}_{datetime.now().strftime('%d-%m-%Y')}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+
+        # Same data without the workbook formatting, for downstream tools; each
+        # export is only built when its button is clicked
+        for export_format in available_formats():
+            st.download_button(
+                label=f"📥 Download {export_format.upper()} (zip)",
+                data=results["exports"].get(export_format) or partial(build_export_zip, results, export_format),
+                file_name=f"{base_filename}_{datetime.now().strftime('%d-%m-%Y')}_{export_format}.zip",
+                mime="application/zip",
+                key=f"export_{export_format}"
+            )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,223 @@
+"""
+Declarative extraction rules for the addon covers.
+
+Each cover is described by a JSON file in rules/addon_coverages/ (loaded in
+file name order):
+
+    {
+      "cover": "Ambulance Cover",
+      "endorsement": 16,
+      "patterns": {
+        "ambulance_limit": {"regex": "limit of Rs\\.?\\s*([\\d,]+)", "flags": ["IGNORECASE"]}
+      },
+      "fields": [
+        {"name": "Ambulance_Sum_Insured", "default": "$sum_insured"},
+        {"name": "Ambulance_Limit_Amount", "default": "", "match": "ambulance_limit", "convert": "amount"},
+        {"name": "Ambulance_Limit_Percentage", "default": "", "derive": "share_of_sum_insured",
+         "from": "Ambulance_Limit_Amount"}
+      ]
+    }
+
+Patterns are registered in pattern_registry as "addon_coverages.<key>". A list
+of regexes is an ordered fallback list (set "combine": true to search it as one
+alternation, see register_fallbacks). A field is one of:
+  - a constant: "default" only ("$sum_insured" is the policy sum insured)
+  - "match": a pattern key, {"pattern": key, "group": n}, or a list of those in
+    priority order; the first one that matches gives the value, converted with
+    "convert" (int, amount, str) or formatted with "format". "requires" names a
+    field that must have matched first.
+  - "flag": pattern key; the field becomes "value" (default "Yes") if it matches
+  - "derive": a formula from FORMULAS applied to the "from" field once that
+    field has matched; a formula returning None keeps the default
+
+compile_rules turns the files into CoverRules once per process. Extraction
+searches every distinct pattern at most once per endorsement block, however
+many fields use it, and only when a field needs it.
+"""
+import glob
+import json
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pattern_registry import register, register_fallbacks
+
+
+RULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules", "addon_coverages")
+
+SUM_INSURED = "$sum_insured"
+
+CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": int,
+    "amount": lambda value: float(value.replace(",", "")),
+}
+
+
+def share_of_sum_insured(value: float, sum_insured: float) -> Optional[float]:
+    """value as a fraction of the sum insured; nothing if either is zero"""
+    if sum_insured > 0 and value > 0:
+        return value / sum_insured
+    return None
+
+
+def share_of_sum_insured_rounded(value: float, sum_insured: float) -> float:
+    if value > 0 and sum_insured > 0:
+        return round(value / sum_insured, 2)
+    return 0.0
+
+
+def percent_of_sum_insured(value: float, sum_insured: float) -> float:
+    if value > 0 and sum_insured > 0:
+        return round(value / sum_insured * 100, 2)
+    return 0.0
+
+
+FORMULAS: Dict[str, Callable[[float, float], Any]] = {
+    "share_of_sum_insured": share_of_sum_insured,
+    "share_of_sum_insured_rounded": share_of_sum_insured_rounded,
+    "percent_of_sum_insured": percent_of_sum_insured,
+}
+
+
+class FieldRule:
+    """One output field of a cover"""
+
+    __slots__ = ("name", "default", "kind", "sources", "convert", "format", "requires", "value", "formula", "source_field")
+
+    def __init__(self, spec: Dict[str, Any], cover: str):
+        self.name = spec["name"]
+        self.default = spec.get("default", "")
+        self.sources: List[Tuple[str, int]] = []
+        self.convert = None
+        self.format = spec.get("format")
+        self.requires = spec.get("requires")
+        self.value = spec.get("value", "Yes")
+        self.formula = None
+        self.source_field = spec.get("from")
+
+        if "match" in spec:
+            self.kind = "match"
+            sources = spec["match"] if isinstance(spec["match"], list) else [spec["match"]]
+            for source in sources:
+                if isinstance(source, str):
+                    self.sources.append((source, 1))
+                else:
+                    self.sources.append((source["pattern"], source.get("group", 1)))
+            if "convert" in spec:
+                self.convert = CONVERTERS[spec["convert"]]
+        elif "flag" in spec:
+            self.kind = "flag"
+            self.sources.append((spec["flag"], 0))
+        elif "derive" in spec:
+            self.kind = "derive"
+            if spec["derive"] not in FORMULAS:
+                raise ValueError(f"{cover}: unknown formula '{spec['derive']}' for field '{self.name}'")
+            self.formula = FORMULAS[spec["derive"]]
+        else:
+            self.kind = "constant"
+
+
+class CoverRule:
+    """A compiled cover: its patterns, compiled once, and its fields in output order"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.cover: str = spec["cover"]
+        self.endorsement: int = spec["endorsement"]
+        self.patterns: Dict[str, Any] = {
+            key: compile_pattern(key, pattern) for key, pattern in spec.get("patterns", {}).items()
+        }
+        self.fields = [FieldRule(field, self.cover) for field in spec["fields"]]
+        self.field_names = [field.name for field in self.fields]
+
+        for field in self.fields:
+            for key, _ in field.sources:
+                if key not in self.patterns:
+                    raise ValueError(f"{self.cover}: field '{field.name}' uses unknown pattern '{key}'")
+            for dependency in (field.requires, field.source_field):
+                if dependency and dependency not in self.field_names:
+                    raise ValueError(f"{self.cover}: field '{field.name}' refers to unknown field '{dependency}'")
+
+        # Flattened per-field plans so extract() does no attribute lookups per field
+        self._defaults = {field.name: field.default for field in self.fields}
+        self._sum_insured_fields = [field.name for field in self.fields if field.default == SUM_INSURED]
+        self._matchers = [
+            (field.name, field.kind == "flag", field.sources, field.convert, field.format, field.requires, field.value)
+            for field in self.fields if field.kind in ("match", "flag")
+        ]
+        self._derived = [(field.name, field.source_field, field.formula) for field in self.fields if field.kind == "derive"]
+
+    def empty(self) -> Dict[str, Any]:
+        """Every field blank, used when the cover does not apply"""
+        return {name: "" for name in self.field_names}
+
+    def extract(self, text_block: str, sum_insured: float) -> Dict[str, Any]:
+        """Fill every field from one endorsement block"""
+        patterns = self.patterns
+        # Each distinct pattern is searched at most once per block, when a field first needs it
+        found: Dict[str, Any] = {}
+        details = self._defaults.copy()
+        for name in self._sum_insured_fields:
+            details[name] = sum_insured
+        matched = set()
+
+        for name, is_flag, sources, convert, format_, requires, value in self._matchers:
+            if requires and requires not in matched:
+                continue
+            for key, group in sources:
+                match = found[key] if key in found else found.setdefault(key, patterns[key].search(text_block))
+                if match:
+                    if is_flag:
+                        details[name] = value
+                    elif format_:
+                        details[name] = format_.format(match.group(group))
+                    elif convert:
+                        details[name] = convert(match.group(group))
+                    else:
+                        details[name] = match.group(group)
+                    matched.add(name)
+                    break
+
+        for name, source_field, formula in self._derived:
+            if source_field in matched:
+                result = formula(details[source_field], sum_insured)
+                if result is not None:
+                    details[name] = result
+
+        return details
+
+    def __repr__(self):
+        return f"CoverRule({self.cover!r}, Endt. No. {self.endorsement}, {len(self.fields)} fields)"
+
+
+def compile_pattern(key: str, spec: Dict[str, Any]):
+    """Register one rule pattern (or ordered fallback list) under addon_coverages.<key>"""
+    flags = 0
+    for flag in spec.get("flags", []):
+        flags |= getattr(re, flag)
+    name = f"addon_coverages.{key}"
+    if isinstance(spec["regex"], list):
+        return register_fallbacks(name, spec["regex"], flags, combine=spec.get("combine", False))
+    return register(name, spec["regex"], flags)
+
+
+def load_rule_specs(directory: str = RULES_DIR) -> List[Dict[str, Any]]:
+    specs = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, "r", encoding="utf-8") as handle:
+            specs.append(json.load(handle))
+    return specs
+
+
+def compile_rules(directory: str = RULES_DIR) -> Dict[str, CoverRule]:
+    """Compile every rule file in directory, keyed by cover name in file order"""
+    rules = {}
+    for spec in load_rule_specs(directory):
+        rule = CoverRule(spec)
+        if rule.cover in rules:
+            raise ValueError(f"Cover '{rule.cover}' is defined by more than one rule file")
+        rules[rule.cover] = rule
+    return rules
+
+
+ADDON_COVER_RULES = compile_rules()
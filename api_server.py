@@ -0,0 +1,271 @@
+"""
+HTTP API for the extraction pipeline, for systems that cannot drive the Streamlit app.
+
+    python api_server.py --port 8000 --workers 4
+    uvicorn api_server:app --port 8000
+
+Endpoints:
+
+    GET  /health          pool size, requests in flight and the limit
+    POST /extract         PDF in, results out; ?format= picks the output:
+                              json     the four result sets (default)
+                              xlsx     the formatted workbook
+                              csv, jsonl, parquet
+                                       data_export files of the result sets, zipped
+                          ?debug=1 with json adds "debug_log", the pipeline's
+                          debug log lines for this PDF (see app_logging)
+
+The PDF is sent either as the raw request body (Content-Type: application/pdf)
+or as the "file" field of a multipart form:
+
+    curl --data-binary @policy.pdf -H "Content-Type: application/pdf" localhost:8000/extract
+    curl -F file=@policy.pdf "localhost:8000/extract?format=xlsx" -o policy.xlsx
+
+Text extraction, the extractors and the workbook writer are CPU-bound, so they
+run in a process pool of API_WORKERS processes and the event loop only moves
+bytes. At most API_MAX_PENDING requests are processed or waiting for a worker;
+beyond that the API answers 503 with Retry-After instead of queueing without
+bound. Uploads over API_MAX_UPLOAD_MB are refused with 413, as soon as that
+much of the body has arrived. PDFs without readable text get 422; a worker
+process that dies is replaced by a new pool, and the request it was serving
+gets 500.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple, Union
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from app_logging import configure_logging, debug_logging, get_logger
+from data_export import available_formats, build_export_zip
+from extract_pdf_text import extract_text_from_pdf_bytes
+from pipeline import RESULT_KEYS, build_excel_bytes_cached, file_hash, run_extractors
+from progress import StageTimings, log_stage_timings
+
+
+logger = get_logger(__name__)
+
+DEFAULT_WORKERS = int(os.getenv("API_WORKERS", "0")) or (os.cpu_count() or 1)
+MAX_PENDING = int(os.getenv("API_MAX_PENDING", "0")) or DEFAULT_WORKERS * 4
+MAX_UPLOAD_BYTES = int(os.getenv("API_MAX_UPLOAD_MB", "50")) * 1024 * 1024
+RETRY_AFTER_SECONDS = 5
+
+# Page-parallel extraction per request; requests already run side by side
+API_PAGE_WORKERS = int(os.getenv("API_PAGE_WORKERS", "1"))
+
+JSON_FORMAT = "json"
+EXCEL_FORMAT = "xlsx"
+
+MEDIA_TYPES = {
+    EXCEL_FORMAT: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "zip": "application/zip",
+}
+
+
+class UnreadablePDF(Exception):
+    """The upload is not a PDF the text extraction can read, or holds no text"""
+
+
+class UploadTooLarge(Exception):
+    """More than MAX_UPLOAD_BYTES of request body arrived"""
+
+
+def output_formats():
+    """Values accepted by ?format="""
+    return [JSON_FORMAT, EXCEL_FORMAT] + available_formats()
+
+
+def process_request(pdf_bytes: bytes, output_format: str, file_name: str = "upload.pdf",
+                    debug: bool = False) -> Union[Dict[str, Any], bytes]:
+    """
+    Runs in a worker process: the results for json, otherwise the file bytes.
+    Raises UnreadablePDF when the PDF cannot be read or holds no text.
+    The stage timings are logged as for the app (see progress.log_stage_timings).
+    With debug (json only) the results carry the debug log of the run as "debug_log".
+    """
+    configure_logging()
+    if not (debug and output_format == JSON_FORMAT):
+        return _process(pdf_bytes, output_format, file_name)
+    with debug_logging() as debug_log:
+        output = _process(pdf_bytes, output_format, file_name)
+    return dict(output, debug_log=debug_log)
+
+
+def _process(pdf_bytes: bytes, output_format: str, file_name: str) -> Union[Dict[str, Any], bytes]:
+    timings = StageTimings()
+    try:
+        with timings.stage("extract_text") as progress:
+            text = extract_text_from_pdf_bytes(pdf_bytes, API_PAGE_WORKERS, progress=progress)
+    except Exception as e:
+        raise UnreadablePDF(f"Could not read the PDF: {type(e).__name__}: {e}") from e
+    if not text or not text.strip():
+        raise UnreadablePDF("No text could be extracted from the PDF")
+
+    with timings.stage("extractors") as progress:
+        results = run_extractors(text, progress)
+    if output_format == JSON_FORMAT:
+        output = {key: results[key] for key in RESULT_KEYS}
+    elif output_format == EXCEL_FORMAT:
+        with timings.stage("excel") as progress:
+            output = build_excel_bytes_cached(results, progress=progress)
+    else:
+        with timings.stage("exports"):
+            output = build_export_zip(results, output_format)
+    log_stage_timings(file_name, dict(timings.timings, total=timings.total()),
+                      sha256=file_hash(pdf_bytes), format=output_format)
+    return output
+
+
+def error_response(status_code: int, message: str, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse({"error": message}, status_code=status_code, headers=headers)
+
+
+def limit_body(request: Request, max_bytes: int) -> Request:
+    """The request with its body stream raising UploadTooLarge once more than max_bytes arrived"""
+    received = 0
+
+    async def receive():
+        nonlocal received
+        message = await request.receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > max_bytes:
+                raise UploadTooLarge()
+        return message
+
+    return Request(request.scope, receive)
+
+
+async def read_pdf(request: Request) -> Tuple[str, bytes]:
+    """(file name, bytes) of the uploaded PDF, from a multipart "file" field or the raw body"""
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        async with request.form(max_files=1) as form:
+            upload = form.get("file")
+            if upload is None or isinstance(upload, str):
+                raise ValueError('Send the PDF in a multipart field named "file"')
+            return upload.filename or "upload.pdf", await upload.read()
+    return request.query_params.get("filename", "upload.pdf"), await request.body()
+
+
+async def health(request: Request) -> JSONResponse:
+    state = request.app.state
+    return JSONResponse({
+        "status": "ok",
+        "workers": state.workers,
+        "in_flight": state.in_flight,
+        "max_pending": state.max_pending,
+    })
+
+
+async def extract(request: Request) -> Response:
+    state = request.app.state
+    output_format = request.query_params.get("format", JSON_FORMAT)
+    debug = request.query_params.get("debug", "").lower() in ("1", "true", "yes")
+    if output_format not in output_formats():
+        return error_response(400, f"Unknown format '{output_format}'; choose from {', '.join(output_formats())}")
+    if int(request.headers.get("content-length") or 0) > MAX_UPLOAD_BYTES:
+        return error_response(413, f"Upload larger than {MAX_UPLOAD_BYTES // (1024 * 1024)} MB")
+    # Backpressure: refuse rather than queue without bound. The counter is only
+    # touched from the event loop thread, so it needs no lock.
+    if state.in_flight >= state.max_pending:
+        return error_response(503, "Too many documents in progress; retry later",
+                              {"Retry-After": str(RETRY_AFTER_SECONDS)})
+
+    state.in_flight += 1
+    try:
+        try:
+            # Chunked uploads carry no content-length; stop reading once over the limit
+            file_name, pdf_bytes = await read_pdf(limit_body(request, MAX_UPLOAD_BYTES))
+        except UploadTooLarge:
+            return error_response(413, f"Upload larger than {MAX_UPLOAD_BYTES // (1024 * 1024)} MB")
+        except ValueError as e:
+            return error_response(400, str(e))
+        if not pdf_bytes:
+            return error_response(400, "Empty upload; send a PDF")
+
+        loop = asyncio.get_running_loop()
+        executor = state.executor
+        try:
+            output = await loop.run_in_executor(executor, process_request, pdf_bytes, output_format,
+                                                file_name, debug)
+        except UnreadablePDF as e:
+            return error_response(422, str(e))
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); the pool is unusable from now on, so replace it
+            # once, whichever of the requests on it gets here first
+            logger.error("Worker process died while extracting %s; restarting the pool", file_name)
+            if state.executor is executor:
+                state.executor = ProcessPoolExecutor(max_workers=state.workers)
+                executor.shutdown(wait=False, cancel_futures=True)
+            return error_response(500, "Extraction failed: the worker process terminated")
+        except Exception as e:
+            logger.exception("Extraction of %s failed", file_name)
+            return error_response(500, f"Extraction failed: {type(e).__name__}")
+    finally:
+        state.in_flight -= 1
+
+    if output_format == JSON_FORMAT:
+        body = {"file": file_name, "sha256": file_hash(pdf_bytes), **output}
+        # default=str and no allow_nan check, as for the JSON Lines export
+        return Response(json.dumps(body, ensure_ascii=False, default=str), media_type="application/json")
+    base_filename = os.path.splitext(os.path.basename(file_name))[0]
+    extension = EXCEL_FORMAT if output_format == EXCEL_FORMAT else f"{output_format}.zip"
+    return Response(output, media_type=MEDIA_TYPES.get(output_format, MEDIA_TYPES["zip"]),
+                    headers={"Content-Disposition": f'attachment; filename="{base_filename}.{extension}"'})
+
+
+def create_app(workers: int = DEFAULT_WORKERS, max_pending: int = MAX_PENDING) -> Starlette:
+    """The ASGI app, with its own process pool started and stopped with the server"""
+    configure_logging()
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette):
+        app.state.executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield
+        finally:
+            app.state.executor.shutdown(wait=True, cancel_futures=True)
+
+    app = Starlette(routes=[
+        Route("/health", health, methods=["GET"]),
+        Route("/extract", extract, methods=["POST"]),
+    ], lifespan=lifespan)
+    app.state.workers = workers
+    app.state.max_pending = max_pending
+    app.state.in_flight = 0
+    return app
+
+
+app = create_app()
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS,
+                        help="Worker processes for extraction (default: API_WORKERS or CPU count)")
+    parser.add_argument("--max-pending", type=int, default=0,
+                        help="Requests in progress before answering 503 (default: API_MAX_PENDING or 4 per worker)")
+    parser.add_argument("--log-level", help="Level of the pipeline's log output (default: LOG_LEVEL or INFO)")
+    args = parser.parse_args()
+
+    configure_logging(args.log_level, force=True)
+
+    max_pending = args.max_pending or int(os.getenv("API_MAX_PENDING", "0")) or args.workers * 4
+    uvicorn.run(create_app(args.workers, max_pending), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
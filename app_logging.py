@@ -0,0 +1,185 @@
+"""
+Level-gated logging for the pipeline, on top of the standard logging module.
+
+Modules log through a named logger with %-style arguments, which are only
+formatted when the record is emitted:
+
+    logger = get_logger(__name__)
+    logger.debug("Found condition: %s", condition_name)
+
+configure_logging() sets up the handler once per process from the environment:
+
+    LOG_LEVEL    level of every logger (default INFO)
+    LOG_LEVELS   per-module levels, e.g. "extract_Eligibility=DEBUG,pipeline=WARNING"
+    LOG_FORMAT   "text" (default) or "json": one JSON object per line with the
+                 time, level, logger, message and any extra= fields
+
+Debug output for one request, whatever the configured levels, comes from
+debug_logging(); it also collects the lines logged inside it, e.g. to return
+them with the results of a PDF being diagnosed:
+
+    with debug_logging() as lines:
+        results = run_extractors(text)
+
+The switch is a context variable, so other requests running at the same time
+in other threads keep their configured levels, and the extra records only go
+to the collected lines, not to the configured handler.
+"""
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Optional
+
+
+DEFAULT_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+MODULE_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else came from extra= and goes into the JSON
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+# Level forced on for the current request by debug_logging(), or None
+_request_level: contextvars.ContextVar = contextvars.ContextVar("request_log_level", default=None)
+# Identifies the debug_logging() block the current code runs in, for collecting its lines
+_request_token: contextvars.ContextVar = contextvars.ContextVar("request_log_token", default=None)
+
+_configured = False
+
+
+class RequestLogger(logging.Logger):
+    """Logger that is also enabled for the levels debug_logging() turned on for the current request"""
+
+    def isEnabledFor(self, level: int) -> bool:
+        request_level = _request_level.get()
+        if request_level is not None and level >= request_level:
+            return True
+        return super().isEnabledFor(level)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    The logger for a module; use __name__. Only loggers obtained here follow
+    debug_logging(), so third-party loggers (pdfminer, ...) stay at their level.
+    """
+    logger = logging.getLogger(name)
+    if not isinstance(logger, RequestLogger):
+        logger.__class__ = RequestLogger
+    return logger
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the extra= fields as keys"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ConfiguredLevelFilter(logging.Filter):
+    """
+    Keeps records below their logger's configured level off the handler, so
+    the debug output of a debug_logging() request only goes to its own lines
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.getLogger(record.name).getEffectiveLevel()
+
+
+def make_formatter(log_format: str = LOG_FORMAT) -> logging.Formatter:
+    return JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT)
+
+
+def parse_module_levels(spec: str) -> Dict[str, str]:
+    """"module=LEVEL,other=LEVEL" as a dict"""
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(level: Optional[str] = None, module_levels: Optional[Dict[str, str]] = None,
+                      log_format: Optional[str] = None, force: bool = False) -> None:
+    """
+    Send log records to stderr with the given (or environment) levels and format.
+    Only the first call configures the process unless force is set; entry points
+    call it, library modules only log.
+    """
+    global _configured
+    if _configured and not force:
+        return
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if getattr(handler, "_app_logging", False):
+            root.removeHandler(handler)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(make_formatter(log_format or LOG_FORMAT))
+    handler.addFilter(ConfiguredLevelFilter())
+    handler._app_logging = True
+    root.addHandler(handler)
+    root.setLevel(level or DEFAULT_LEVEL)
+    levels = parse_module_levels(MODULE_LEVELS)
+    levels.update(module_levels or {})
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+    _configured = True
+
+
+class _RequestFilter(logging.Filter):
+    """Passes only records logged inside one debug_logging() block"""
+
+    def __init__(self, token: object):
+        super().__init__()
+        self.token = token
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return _request_token.get() is self.token
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, lines: List[str]):
+        super().__init__(logging.NOTSET)
+        self.lines = lines
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+
+@contextlib.contextmanager
+def debug_logging(level: int = logging.DEBUG) -> Iterator[List[str]]:
+    """
+    Enable the pipeline's loggers down to level for the code run inside the
+    block, in this thread or task only, and collect the formatted lines logged
+    there. The configured handlers still only get records at their usual levels.
+    """
+    token = object()
+    lines: List[str] = []
+    handler = _ListHandler(lines)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    handler.addFilter(_RequestFilter(token))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    level_reset = _request_level.set(level)
+    token_reset = _request_token.set(token)
+    try:
+        yield lines
+    finally:
+        _request_token.reset(token_reset)
+        _request_level.reset(level_reset)
+        root.removeHandler(handler)
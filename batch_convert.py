@@ -0,0 +1,314 @@
+"""
+Convert a directory (or glob) of policy PDFs to Excel workbooks without the Streamlit app.
+
+    python batch_convert.py renewals/ --output-dir out/
+    python batch_convert.py "renewals/2025-Q3/*.pdf" --workers 4
+
+Each PDF goes through the same extraction and Excel generation as Main.py in a
+process pool. Workbooks are written to the output directory together with a
+manifest.json listing status, timings and errors for every input.
+
+With --consolidated FILE the results of all PDFs go into one workbook instead
+(see consolidated_excel): one row per policy and relationship, with the PDF
+name in a leading Policy column. Rows are streamed as each PDF finishes, so
+memory does not grow with the number of PDFs.
+
+    python batch_convert.py renewals/ --consolidated all_policies.xlsx
+
+With --formats the results are also (or only) written as CSV, JSON Lines or
+Parquet, one file per result set (see data_export):
+
+    python batch_convert.py renewals/ --formats xlsx,csv,jsonl
+
+With --profile-regex (or REGEX_PROFILE=1) the extraction of every PDF is
+profiled per pattern; the per-document and aggregated reports are written to
+regex_profile.json and the hottest patterns are printed at the end.
+
+--log-level DEBUG (or LOG_LEVEL / LOG_LEVELS, see app_logging) shows the
+extractors' debug log on stderr.
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from app_logging import configure_logging
+from consolidated_excel import ConsolidatedWorkbook
+from data_export import EXPORT_FORMATS, available_formats, write_exports
+from extract_pdf_text import extract_text_from_pdf_bytes, read_pdf_bytes
+from pipeline import file_hash, run_extractors, write_excel
+from regex_profiler import PROFILE_ENABLED, aggregate_reports, format_report, profile_document, write_report
+
+
+MANIFEST_NAME = "manifest.json"
+EXCEL_FORMAT = "xlsx"
+REGEX_PROFILE_NAME = "regex_profile.json"
+
+
+def collect_pdfs(inputs: List[str]) -> List[str]:
+    """Expand directories and glob patterns into a sorted, de-duplicated list of PDF paths"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = glob.glob(os.path.join(item, "*.pdf")) + glob.glob(os.path.join(item, "*.PDF"))
+        else:
+            matches = glob.glob(item, recursive=True)
+        paths.extend(path for path in matches if os.path.isfile(path) and path.lower().endswith(".pdf"))
+    return sorted(set(os.path.abspath(path) for path in paths))
+
+
+def output_path_for(pdf_path: str, output_dir: str) -> str:
+    """Workbook path using the same naming as the Streamlit download button"""
+    base_filename = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(output_dir, f"{base_filename}_{datetime.now().strftime('%d-%m-%Y')}.xlsx")
+
+
+def output_paths_for(pdf_paths: Sequence[str], output_dir: str) -> Dict[str, str]:
+    """
+    output_path_for of every PDF; PDFs from different directories sharing a
+    name get numbered workbooks (name_2.xlsx, ...) instead of overwriting each other
+    """
+    paths = {}
+    taken = set()
+    for pdf_path in pdf_paths:
+        output_path = output_path_for(pdf_path, output_dir)
+        base, extension = os.path.splitext(output_path)
+        counter = 1
+        while output_path in taken:
+            counter += 1
+            output_path = f"{base}_{counter}{extension}"
+        taken.add(output_path)
+        paths[pdf_path] = output_path
+    return paths
+
+
+def policy_id_for(output_path: str) -> str:
+    """
+    Identifier of a policy in the consolidated workbook: the name of its
+    workbook from output_paths_for without extension, so PDFs sharing a name
+    stay apart (name, name_2, ...)
+    """
+    return os.path.splitext(os.path.basename(output_path))[0]
+
+
+def convert_pdf(pdf_path: str, output_dir: str, page_workers: int = 1, profile_regex: bool = False,
+                keep_results: bool = False, formats: Sequence[str] = (EXCEL_FORMAT,),
+                output_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Convert one PDF to a workbook and return its manifest entry.
+    output_path defaults to output_path_for (see output_paths_for for a batch).
+    formats may add data_export formats (csv, jsonl, parquet) next to or instead of xlsx.
+    With profile_regex the entry also carries the per-pattern report of the extractors.
+    With keep_results no workbook is written; the entry carries the extractor
+    results instead, for the consolidated workbook.
+    """
+    entry = {
+        "input": pdf_path,
+        "output": None,
+        "status": "ok",
+        "error": None,
+        "sha256": None,
+        "timings": {},
+    }
+    output_path = output_path or output_path_for(pdf_path, output_dir)
+    started = time.perf_counter()
+    stage_started = started
+    stage = "read"
+
+    def finish_stage(name: str):
+        nonlocal stage_started
+        now = time.perf_counter()
+        entry["timings"][name] = round(now - stage_started, 4)
+        stage_started = now
+
+    try:
+        pdf_bytes = read_pdf_bytes(pdf_path)
+        entry["sha256"] = file_hash(pdf_bytes)
+        finish_stage(stage)
+
+        stage = "extract_text"
+        text = extract_text_from_pdf_bytes(pdf_bytes, page_workers)
+        finish_stage(stage)
+        if not text or not text.strip():
+            entry["status"] = "no_text"
+            entry["error"] = "No text could be extracted from the PDF"
+            return entry
+
+        stage = "extractors"
+        profiling = profile_document(pdf_path) if profile_regex else contextlib.nullcontext()
+        with profiling as regex_profile:
+            results = run_extractors(text)
+        if profile_regex:
+            entry["regex_profile"] = regex_profile
+        finish_stage(stage)
+
+        export_formats = [name for name in formats if name != EXCEL_FORMAT]
+        if export_formats:
+            stage = "export"
+            output_prefix = os.path.splitext(output_path)[0]
+            entry["exports"] = write_exports(results, output_prefix, export_formats)
+            finish_stage(stage)
+
+        if keep_results:
+            entry["results"] = results
+            return entry
+        if EXCEL_FORMAT not in formats:
+            return entry
+
+        stage = "excel"
+        write_excel(results, output_path)
+        entry["output"] = output_path
+        finish_stage(stage)
+    except Exception as e:
+        entry["status"] = "error"
+        entry["error"] = f"{stage}: {type(e).__name__}: {e}"
+        entry["traceback"] = traceback.format_exc()
+    finally:
+        entry["timings"]["total"] = round(time.perf_counter() - started, 4)
+    return entry
+
+
+def run_batch(pdf_paths: List[str], output_dir: str, workers: int, page_workers: int = 1,
+              profile_regex: bool = False, consolidated: Optional[str] = None,
+              formats: Sequence[str] = (EXCEL_FORMAT,)) -> Dict[str, Any]:
+    """
+    Convert every PDF across a process pool and return the manifest.
+    With consolidated (a file name inside output_dir, or a path) all results go
+    into that one workbook, in the order the PDFs finish, instead of one each.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    started = time.perf_counter()
+    entries = []
+    keep_results = consolidated is not None
+    workbook = ConsolidatedWorkbook() if keep_results else None
+    output_paths = output_paths_for(pdf_paths, output_dir)
+
+    def fail(entry: Dict[str, Any], stage: str, error: Exception):
+        entry.update(status="error", error=f"{stage}: {type(error).__name__}: {error}",
+                     traceback=traceback.format_exc())
+
+    def collect(entry: Dict[str, Any]):
+        if "results" in entry:
+            consolidate_started = time.perf_counter()
+            try:
+                workbook.add_policy(policy_id_for(output_paths[entry["input"]]), entry.pop("results"))
+            except Exception as e:
+                fail(entry, "consolidate", e)
+            entry["timings"]["consolidate"] = round(time.perf_counter() - consolidate_started, 4)
+        entries.append(entry)
+        print(f"[{entry['status'].upper()}] {entry['input']}")
+
+    if workers <= 1:
+        for pdf_path in pdf_paths:
+            collect(convert_pdf(pdf_path, output_dir, page_workers, profile_regex, keep_results, formats,
+                                output_paths[pdf_path]))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(convert_pdf, pdf_path, output_dir, page_workers, profile_regex, keep_results,
+                                formats, output_paths[pdf_path]): pdf_path
+                for pdf_path in pdf_paths
+            }
+            for future in as_completed(futures):
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    # e.g. BrokenProcessPool when a worker dies; the other PDFs still get their entries
+                    entry = {"input": futures[future], "output": None, "status": "error", "error": None,
+                             "sha256": None, "timings": {}}
+                    fail(entry, "worker", e)
+                collect(entry)
+
+    manifest = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "output_dir": os.path.abspath(output_dir),
+        "workers": workers,
+    }
+    if keep_results:
+        consolidated_path = os.path.join(output_dir, consolidated)
+        workbook.save(consolidated_path)
+        manifest["consolidated"] = os.path.abspath(consolidated_path)
+        manifest["policies"] = len(workbook)
+
+    entries.sort(key=lambda entry: entry["input"])
+    statuses = [entry["status"] for entry in entries]
+    manifest.update({
+        "total": len(entries),
+        "ok": statuses.count("ok"),
+        "no_text": statuses.count("no_text"),
+        "error": statuses.count("error"),
+        "elapsed_seconds": round(time.perf_counter() - started, 4),
+        "files": entries,
+    })
+    return manifest
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", help="Input directories, PDF files or glob patterns")
+    parser.add_argument("--output-dir", "-o", default="output", help="Directory for workbooks and the manifest")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1,
+                        help="Number of PDFs converted in parallel")
+    parser.add_argument("--page-workers", type=int, default=1,
+                        help="Page-parallel workers per PDF (keep at 1 when --workers > 1)")
+    parser.add_argument("--manifest", default=MANIFEST_NAME, help="Manifest file name inside the output directory")
+    parser.add_argument("--formats", default=EXCEL_FORMAT,
+                        help=f"Comma-separated output formats per PDF: {EXCEL_FORMAT}, {', '.join(EXPORT_FORMATS)} "
+                             f"(default {EXCEL_FORMAT})")
+    parser.add_argument("--consolidated", metavar="FILE",
+                        help="Write all policies into this one workbook (inside the output directory) "
+                             "instead of one workbook per PDF")
+    parser.add_argument("--profile-regex", action="store_true", default=PROFILE_ENABLED,
+                        help=f"Profile every extraction pattern and write {REGEX_PROFILE_NAME}")
+    parser.add_argument("--log-level", help="Level of the pipeline's log output (default: LOG_LEVEL or INFO)")
+    args = parser.parse_args(argv)
+
+    # Worker processes are forked from here and keep this configuration
+    configure_logging(args.log_level, force=True)
+
+    formats = [name.strip().lower() for name in args.formats.split(",") if name.strip()]
+    usable = [EXCEL_FORMAT] + available_formats()
+    unusable = [name for name in formats if name not in usable]
+    if unusable or not formats:
+        print(f"[ERROR] Unsupported output format(s) {', '.join(unusable) or '(none)'}; available: "
+              f"{', '.join(usable)} (parquet needs pyarrow)", file=sys.stderr)
+        return 2
+
+    pdf_paths = collect_pdfs(args.inputs)
+    if not pdf_paths:
+        print("[ERROR] No PDF files found for the given inputs", file=sys.stderr)
+        return 2
+
+    print(f"[INFO] Converting {len(pdf_paths)} PDF(s) with {args.workers} worker(s)")
+    manifest = run_batch(pdf_paths, args.output_dir, args.workers, args.page_workers, args.profile_regex,
+                         args.consolidated, formats)
+
+    if args.profile_regex:
+        # Keep the manifest small; the reports go to their own file
+        reports = [entry.pop("regex_profile") for entry in manifest["files"] if "regex_profile" in entry]
+        aggregate = aggregate_reports(reports)
+        profile_path = os.path.join(args.output_dir, REGEX_PROFILE_NAME)
+        write_report({"documents": reports, "aggregate": aggregate}, profile_path)
+        print(format_report(aggregate))
+        print(f"[INFO] Regex profile written to {profile_path}")
+
+    manifest_path = os.path.join(args.output_dir, args.manifest)
+    with open(manifest_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+
+    if args.consolidated:
+        print(f"[INFO] {manifest['policies']} policies written to {manifest['consolidated']}")
+    print(f"[INFO] {manifest['ok']} ok, {manifest['no_text']} without text, {manifest['error']} failed "
+          f"in {manifest['elapsed_seconds']}s; manifest written to {manifest_path}")
+    return 0 if manifest["error"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
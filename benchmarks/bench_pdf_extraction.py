@@ -0,0 +1,72 @@
+"""
+Benchmark sequential vs page-parallel PDF text extraction.
+
+    python -m benchmarks.bench_pdf_extraction --pages 300 --workers 1 2 4
+    python -m benchmarks.bench_pdf_extraction --pdf path/to/policy.pdf
+"""
+import argparse
+import os
+import time
+from typing import List
+
+from benchmarks.pdf_fixture import build_pdf
+from extract_pdf_text import extract_text_from_pdf_bytes, read_pdf_bytes
+
+
+def synthetic_policy_pages(page_count: int, lines_per_page: int = 60) -> List[List[str]]:
+    """Generate schedule-like pages with endorsement headers sprinkled through them"""
+    pages = []
+    for page_number in range(page_count):
+        lines = [f"Group Health Policy - Schedule page {page_number + 1}"]
+        if page_number % 5 == 0:
+            lines.append(f"Endt. No. {page_number % 21 + 1} Endorsement wording for clause {page_number}")
+        for line_number in range(lines_per_page - len(lines)):
+            lines.append(
+                f"Room rent limited to 1% of Sum Insured per day, ICU 2% of Sum Insured; "
+                f"sublimit Rs. {5000 + line_number * 100} for member {line_number}"
+            )
+        pages.append(lines)
+    return pages
+
+
+def time_extraction(pdf_bytes: bytes, workers: int, repeat: int) -> float:
+    """Return the best wall time over repeat runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_text_from_pdf_bytes(pdf_bytes, workers, use_cache=False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="Benchmark a real PDF instead of the synthetic fixture")
+    parser.add_argument("--pages", type=int, default=300, help="Pages in the synthetic fixture")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.pdf:
+        pdf_bytes = read_pdf_bytes(args.pdf)
+        label = args.pdf
+    else:
+        pdf_bytes = build_pdf(synthetic_policy_pages(args.pages))
+        label = f"synthetic fixture ({args.pages} pages)"
+
+    # The parallel path must reassemble exactly what the sequential path produces
+    sequential_text = extract_text_from_pdf_bytes(pdf_bytes, 1, use_cache=False)
+    for workers in sorted(set(args.workers)):
+        if workers > 1:
+            assert extract_text_from_pdf_bytes(pdf_bytes, workers, use_cache=False) == sequential_text
+
+    print(f"PDF text extraction: {label}, {len(pdf_bytes) / 1024:.0f} KiB")
+    baseline = None
+    for workers in sorted(set(args.workers)):
+        elapsed = time_extraction(pdf_bytes, workers, args.repeat)
+        baseline = baseline or elapsed
+        print(f"  workers={workers:<3} {elapsed:8.3f}s  speedup x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from typing import List
+
+
+def _escape(line: str) -> str:
+    """Escape a line of text for a PDF string literal"""
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(pages: List[List[str]]) -> bytes:
+    """
+    Build a minimal text-only PDF (Helvetica, one line per entry) without any
+    third-party writer, so benchmarks can generate multi-hundred-page fixtures.
+    """
+    objects = []
+    page_count = len(pages)
+    # 1: catalog, 2: pages tree, 3: font, then a (page, content) pair per page
+    page_ids = [4 + i * 2 for i in range(page_count)]
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    for i, lines in enumerate(pages):
+        content_id = page_ids[i] + 1
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        stream = "BT /F1 9 Tf 11 TL 40 800 Td " + " ".join(f"({_escape(line)}) '" for line in lines) + " ET"
+        stream_bytes = stream.encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream_bytes) + stream_bytes + b"\nendstream")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(output)
+
+
+def paginate(text: str, lines_per_page: int = 60) -> List[List[str]]:
+    """Split text into pages of at most lines_per_page lines"""
+    lines = text.splitlines() or [""]
+    return [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
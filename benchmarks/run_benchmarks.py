@@ -0,0 +1,192 @@
+"""
+Time every public extraction function and the Excel writer on synthetic policies.
+
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes small large --repeat 10
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/previous.json
+
+Results are written as JSON (one file per run) so runs can be compared over time.
+Cases that produce a file (the .xlsx bytes, the CSV / JSON Lines / Parquet
+exports) also record its size.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+import create_AddonCoverages
+import create_addon
+import create_comprehensive_excel_with_formatting
+import data_export
+import extract_Eligibility
+import extract_primary_data
+from benchmarks.synthetic_policy import SIZES, generate_corpus
+from endorsement_segmenter import segment_endorsements
+from pipeline import build_excel_bytes, build_excel_bytes_cached, run_extractors
+from text_normalizer import normalize_text
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def build_cases(text: str) -> List[Tuple[str, Callable[[], Any]]]:
+    """Return (name, zero-argument callable) pairs for every benchmarked function"""
+    index = segment_endorsements(text)
+    section_5ii = index.section(5, "ii", form="endt") or ""
+    blocks = {number: (index.bodies(number, form="endt") or [""])[0] for number in (14, 15, 16, 17, 20)}
+    results = run_extractors(text)
+    sum_insured = 500000.0
+    # Each export case returns the four result-set files joined, so its size compares with the .xlsx
+    exports = [
+        (f"data_export.export_bytes[{export_format}]",
+         lambda export_format=export_format: b"".join(data_export.export_bytes(results, export_format).values()))
+        for export_format in data_export.available_formats()
+    ]
+
+    return [
+        ("text_normalizer.normalize_text", lambda: normalize_text(text)),
+        ("endorsement_segmenter.segment_endorsements", lambda: segment_endorsements(text)),
+        ("extract_Eligibility.extract_age_ranges", lambda: extract_Eligibility.extract_age_ranges(text)),
+        ("extract_Eligibility.extract_sublimits_from_endorsement_5i",
+         lambda: extract_Eligibility.extract_sublimits_from_endorsement_5i(text, index)),
+        ("extract_Eligibility.extract_all_sublimits_from_endorsement_5ii",
+         lambda: extract_Eligibility.extract_all_sublimits_from_endorsement_5ii(text, index)),
+        ("extract_Eligibility.extract_merged_format", lambda: extract_Eligibility.extract_merged_format(section_5ii)),
+        ("extract_Eligibility.extract_individual_format",
+         lambda: extract_Eligibility.extract_individual_format(section_5ii)),
+        ("extract_Eligibility.extract_corporate_buffer_applicability",
+         lambda: extract_Eligibility.extract_corporate_buffer_applicability(text)),
+        ("extract_Eligibility.extract_Eligibility", lambda: extract_Eligibility.extract_Eligibility(text, index)),
+        ("extract_primary_data.extract_newborn_from_endt_12",
+         lambda: extract_primary_data.extract_newborn_from_endt_12(text, index)),
+        ("extract_primary_data.extract_pre_post_natal_from_endt_11b",
+         lambda: extract_primary_data.extract_pre_post_natal_from_endt_11b(text, index)),
+        ("extract_primary_data.extract_maternity_from_endt_11b",
+         lambda: extract_primary_data.extract_maternity_from_endt_11b(text, index)),
+        ("extract_primary_data.extract_primary_data", lambda: extract_primary_data.extract_primary_data(text, index)),
+        ("create_addon.create_addon", lambda: create_addon.create_addon(text, index)),
+        ("create_AddonCoverages.extract_ambulance_cover_details",
+         lambda: create_AddonCoverages.extract_ambulance_cover_details(blocks[16], sum_insured)),
+        ("create_AddonCoverages.extract_convalescence_benefit_details",
+         lambda: create_AddonCoverages.extract_convalescence_benefit_details(blocks[15], sum_insured)),
+        ("create_AddonCoverages.extract_home_nursing_allowance_details",
+         lambda: create_AddonCoverages.extract_home_nursing_allowance_details(blocks[17], sum_insured)),
+        ("create_AddonCoverages.extract_critical_illness_field_identifiers",
+         lambda: create_AddonCoverages.extract_critical_illness_field_identifiers(blocks[20])),
+        ("create_AddonCoverages.extract_daily_cash_cover_details",
+         lambda: create_AddonCoverages.extract_daily_cash_cover_details(blocks[14])),
+        ("create_AddonCoverages.create_AddonCoverages",
+         lambda: create_AddonCoverages.create_AddonCoverages(text, index)),
+        ("create_comprehensive_excel_with_formatting.create_comprehensive_excel_with_formatting",
+         lambda: create_comprehensive_excel_with_formatting.create_comprehensive_excel_with_formatting(
+             results["eligibility_data"], results["primary_data"],
+             results["addon_data"], results["AddonCoverages_data"])),
+        ("pipeline.build_excel_bytes[normal]", lambda: build_excel_bytes(results, write_only=False)),
+        ("pipeline.build_excel_bytes", lambda: build_excel_bytes(results)),
+        # Served from the workbook cache after the warm-up run
+        ("pipeline.build_excel_bytes_cached", lambda: build_excel_bytes_cached(results)),
+        *exports,
+        ("pipeline.run_extractors", lambda: run_extractors(text)),
+    ]
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> Tuple[List[float], Any]:
+    """Run func repeat times (plus one warm-up); return wall times and the last result"""
+    timings = []
+    result = func()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def git_commit() -> str:
+    """Current commit hash, or an empty string outside a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_benchmarks(sizes: List[str], repeat: int, only: str = "") -> Dict[str, Any]:
+    """Benchmark every case on every synthetic document and return the result document"""
+    corpus = generate_corpus(sizes)
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "documents": {name: {"chars": len(text)} for name, text in corpus.items()},
+        "results": [],
+    }
+    for document, text in corpus.items():
+        for name, func in build_cases(text):
+            if only and only not in name:
+                continue
+            timings, result = time_call(func, repeat)
+            row = {
+                "function": name,
+                "document": document,
+                "min_s": min(timings),
+                "median_s": statistics.median(timings),
+                "mean_s": statistics.fmean(timings),
+                "runs": repeat,
+            }
+            size = ""
+            if isinstance(result, bytes):
+                row["output_bytes"] = len(result)
+                size = f" {len(result):10d} bytes"
+            report["results"].append(row)
+            print(f"{document:<20} {name:<85} median {statistics.median(timings) * 1000:10.3f} ms{size}")
+    return report
+
+
+def compare(report: Dict[str, Any], previous_path: str) -> None:
+    """Print the median-time ratio of this run against a previous results file"""
+    with open(previous_path, "r", encoding="utf-8") as handle:
+        previous = json.load(handle)
+    before = {(row["document"], row["function"]): row for row in previous["results"]}
+    print(f"\nCompared with {previous_path} ({previous.get('commit') or 'unknown commit'}):")
+    for row in report["results"]:
+        key = (row["document"], row["function"])
+        if key in before and row["median_s"] > 0:
+            size = ""
+            if "output_bytes" in row and "output_bytes" in before[key]:
+                size = f"  output {row['output_bytes'] - before[key]['output_bytes']:+d} bytes"
+            print(f"{row['document']:<20} {row['function']:<85} x{before[key]['median_s'] / row['median_s']:.2f} faster"
+                  f"{size}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES),
+                        help=f"Preset sizes ({', '.join(SIZES)}) or numbers of boilerplate lines")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="", help="Only run functions whose name contains this text")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="Previous results file to compare against")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, args.repeat, args.only)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Synthetic group health policy schedules for benchmarking.
+
+The wording follows the endorsements the extractors look for (1, 5(i), 5(ii)
+in merged and individual table format, 10, 11(b), 12, 14-17, 20 and the
+Special Clauses/Conditions), padded with schedule boilerplate to reach a
+configurable size.
+"""
+import random
+from typing import Dict, List
+
+
+HEADER = """GROUP MEDICLAIM POLICY SCHEDULE
+Policy No. 2025/GMC/{policy_number}  Insured: Synthetic Employer {policy_number} Private Limited
+Sum insured is on floater basis with limit of Rs.500,000/- as Corporate floater for the policy.
+Ayush covered up to 25% of the Sum Insured. Ambulance limit of Rs.2000/- per claim.
+AYUSH 20% of the sum insured subject to a maximum of INR.40,000/-
+"""
+
+ENDT_1 = """Endt. No. 1 Definition of Family
+Insured Person covers employees of the Insured, Spouse - Spouse means the employee's legally married partner.
+Maximum of the first 2 dependent children aged between 3 to 25 years. Dependent Parents and Dependant Parents in law are covered.
+employee age between 18 to 65 years. Parents age between 40 to 80 years. Children over 90 days.
+Family floater with limit of Rs.300,000 per family.
+"""
+
+ENDT_5I = """Endt. No. 5(i) Room Rent Capping
+Room, Boarding Expenses are payable up to 1% of the Sum Insured per day.
+Intensive Care Unit expenses are payable up to 2% of the Sum Insured per day.
+"""
+
+ENDT_5II_MERGED = """Endt. No. 5(ii) Sublimits on specific treatments
+Cataract Nil Capping
+Treatment of mental illness, stress or psychological disorders and neurodegenerative disorders sublimit of 30000
+Balloon Sinsuplasty, bronchical thermoplasty, vaporization of prostate(green laser treatment), intra operative neuro monitoring, Intra vitreal injections 50% of the Sum Insured subject to a maximum of INR.100000/-
+Stem Cell therapy - Hematopoietic stem cells for bone marrow transplant for haematological conditions to be covered Rs.200000/-
+Oral Chemotherapy, Immunotherapy(monoclonal antibody to be given as injection) 5% of the Sum Insured per month subject to a maximum of Rs.50000/- 100000 during the Period of Insurance
+"""
+
+ENDT_5II_INDIVIDUAL = """Endt. No. 5(ii) Sublimits on specific treatments
+Condition | Limit
+Cataract | Rs. 40,000/-
+Balloon Sinsuplasty | 50% of the sum insured subject to a maximum of INR.100000/-
+Stem Cell therapy | INR 150000/-
+Bronchical Thermoplasty | Rs.75000
+vaporization of prostate(green laser treatment) | 10%
+Rs. 60000/-
+Intra Operative Neuro Monitoring | Rs 80000
+Intra vitreal injections | INR. 25000
+Oral Chemotherapy | Rs. 20000
+Immunotherapy | Rs. 30000
+"""
+
+ENDT_10 = """Endt. No. 10 Corporate Buffer
+A limit of Rs.5,000,000/- as corporate floater is available. Corporate buffer limit per family Rs.200000 and corporate buffer limit per parent Rs. 100000.
+Reload equivalent to the per person limit. Buffer OPD limit Rs.10000.
+"""
+
+ENDT_11B = """Endt. No. 11 (b) Maternity Treatment Charges Benefit Extension
+The maximum benefit under this Benefit is limited to Rs. 25000/- Per Family for Normal delivery and 35000/- for Caesarean for first two children.
+10% of the admissible claim is payable by member contribution copay.
+Pre and Post natal OPD expenses as sublimit of Rs. 5000 within the Maternity limit
+"""
+
+ENDT_12 = """Endt. No. 12 (a) New Born Baby Cover
+New born baby is covered from day one within the family limit. New born limit Rs.50000.
+"""
+
+ENDT_14 = """Endt. No. 14 Daily Cash
+Daily cash of Rs. 1000 per day is payable over and above the sum insured for hospitalisation of more than 3 days, maximum days of 10 per policy period, excluding first 2 days, maternity excluded.
+"""
+
+ENDT_15 = """Endt. No. 15 Convalescence Benefit
+If hospitalisation exceeds 10 days, a benefit of Rs. 5,000 is payable.
+"""
+
+ENDT_16 = """Endt. No. 16 Ambulance Charges
+Ambulance charges are payable up to a limit of Rs. 2,000 per hospitalisation, number of trips: 2.
+"""
+
+ENDT_17 = """Endt. No. 17 Home Nursing Allowance
+A daily allowance of Rs. 500 for a maximum 15 days following discharge.
+"""
+
+ENDT_20 = """Endt. No. 20 Critical Illness
+Critical illness benefit over and above the individual sum insured, sum insured of Rs. 300000, maximum limit of Rs. 100000 with a survival period of 30 days survival.
+"""
+
+SPECIAL_CLAUSES = """Special Clauses: Pre Hospitalisation Expenses for 45 days preceding hospitalisation. Post Hospitalisation Expenses for 90 days immediately after discharge.
+Special Conditions: Pre-natal and post-natal expenses are covered only if in-patient hospital. over and above maternity limit Rs.8000. 30 days waiting period.
+"""
+
+BOILERPLATE_WORDS = (
+    "the insured person shall be entitled to claim reasonable and customary hospital expenses "
+    "incurred during the policy period subject to the terms conditions exclusions and limits "
+    "specified in the schedule network provider cashless third party administrator claim"
+).split()
+
+# Lines of boilerplate spread between the endorsements for each preset size
+SIZES = {
+    "small": 0,
+    "medium": 600,
+    "large": 6000,
+}
+
+LINES_PER_PAGE = 60
+
+
+def boilerplate(lines: int, rnd: random.Random, first_page: int) -> str:
+    """Generate schedule boilerplate with a 'Group Health Policy' footer every page"""
+    out = []
+    for i in range(lines):
+        out.append(" ".join(rnd.choice(BOILERPLATE_WORDS) for _ in range(14)))
+        if (i + 1) % LINES_PER_PAGE == 0:
+            out.append(f"Group Health Policy Page {first_page + (i + 1) // LINES_PER_PAGE}")
+    return "\n".join(out) + "\n" if out else ""
+
+
+def generate_policy_text(filler_lines: int = 0, sublimit_format: str = "merged", seed: int = 0) -> str:
+    """
+    Generate a synthetic policy schedule.
+    filler_lines: boilerplate lines spread evenly between the endorsements
+    sublimit_format: "merged" or "individual" layout for Endt. No. 5(ii)
+    """
+    rnd = random.Random(seed)
+    sections: List[str] = [
+        ENDT_1,
+        ENDT_5I,
+        ENDT_5II_MERGED if sublimit_format == "merged" else ENDT_5II_INDIVIDUAL,
+        ENDT_10,
+        ENDT_11B,
+        ENDT_12,
+        ENDT_14,
+        ENDT_15,
+        ENDT_16,
+        ENDT_17,
+        ENDT_20,
+        SPECIAL_CLAUSES,
+    ]
+    per_gap = filler_lines // (len(sections) + 1)
+    page = 1
+    parts = [HEADER.format(policy_number=seed), boilerplate(per_gap, rnd, page)]
+    for section in sections:
+        page += per_gap // LINES_PER_PAGE
+        parts.append(section)
+        parts.append(boilerplate(per_gap, rnd, page))
+    return "".join(parts)
+
+
+def generate_corpus(sizes: List[str] = None, seed: int = 0) -> Dict[str, str]:
+    """
+    Generate one document per (size, sublimit format) pair, keyed "<size>-<format>".
+    A size is either a preset name from SIZES or a number of boilerplate lines.
+    """
+    corpus = {}
+    for size in sizes or list(SIZES):
+        filler_lines = SIZES[size] if size in SIZES else int(size)
+        for sublimit_format in ("merged", "individual"):
+            corpus[f"{size}-{sublimit_format}"] = generate_policy_text(filler_lines, sublimit_format, seed)
+    return corpus
@@ -0,0 +1,109 @@
+"""
+One workbook with the rows of many policies.
+
+create_comprehensive_excel_with_formatting writes one policy from row 4 down.
+ConsolidatedWorkbook keeps the same four sheets and header rows, adds a
+"Policy" column in front and appends the data rows of every policy below each
+other:
+
+    consolidated = ConsolidatedWorkbook()
+    for policy_id, results in policies:           # results from pipeline.run_extractors
+        consolidated.add_policy(policy_id, results)
+    consolidated.save("all_policies.xlsx")
+
+The workbook is write-only: each policy's rows are written by the usual row
+writers into a scratch SheetBuffer, moved one column right and streamed to the
+sheet straight away, so memory stays the same however many policies are added.
+Rows without any value (the bordered filler rows of the single-policy layout)
+are left out; a policy without data for a sheet still gets a row with its id.
+"""
+from typing import Any, BinaryIO, Dict, Iterable, Tuple, Union
+
+import openpyxl
+
+from create_comprehensive_excel_with_formatting import SHEET_WRITERS, header_template, register_named_styles
+from excel_streaming import BufferedCell, SheetBuffer, SheetTemplate, StyleCache
+from pipeline import RESULT_KEYS
+
+
+# First data row of the single-policy layout; everything above is header
+DATA_START_ROW = 4
+
+POLICY_HEADER = "Policy"
+POLICY_COLUMN_WIDTH = 40
+
+
+class ConsolidatedSheet:
+    """One sheet of the consolidated workbook"""
+
+    __slots__ = ("buffer", "write_rows", "row_defaults")
+
+    def __init__(self, worksheet, styles: StyleCache, title: str, write_header, write_rows):
+        template = header_template(title, write_header)
+        self.buffer = SheetBuffer(worksheet, styles)
+        self.write_rows = write_rows
+        # Cells the row writers expect to find on the data rows (the bordered row 4),
+        # without the sizes: those belong to the real sheet
+        defaults = template.part(first_row=DATA_START_ROW)
+        self.row_defaults = SheetTemplate(defaults.rows, defaults.merged, {}, {})
+
+        template.part(last_row=DATA_START_ROW - 1, column_offset=1).apply(self.buffer, styles)
+        for row in range(1, DATA_START_ROW):
+            self.buffer.cell(row=row, column=1).style = "header"
+        self.buffer.cell(row=DATA_START_ROW - 1, column=1, value=POLICY_HEADER)
+        self.buffer.column_dimensions["A"].width = POLICY_COLUMN_WIDTH
+        self.buffer.flush()
+
+    def add_policy(self, policy_id: str, data: Any) -> int:
+        """Write the policy's rows below the previous ones and stream them; returns the number of rows"""
+        scratch = SheetBuffer(self.buffer.worksheet, self.buffer.styles)
+        self.row_defaults.apply(scratch, self.buffer.styles)
+        self.write_rows(scratch, data)
+
+        rows = scratch.take_rows(DATA_START_ROW) or [{}]
+        for cells in rows:
+            policy_cell = BufferedCell(policy_id)
+            policy_cell.style = "text"
+            shifted = {1: policy_cell}
+            for column, cell in cells.items():
+                shifted[column + 1] = cell
+            self.buffer.append_row(shifted)
+        self.buffer.flush()
+        return len(rows)
+
+
+class ConsolidatedWorkbook:
+    """Write-only workbook collecting the extraction results of many policies"""
+
+    def __init__(self):
+        self.workbook = openpyxl.Workbook(write_only=True)
+        register_named_styles(self.workbook)
+        self.styles = StyleCache(self.workbook)
+        self.sheets = [
+            ConsolidatedSheet(self.workbook.create_sheet(title), self.styles, title, write_header, write_rows)
+            for title, write_header, write_rows in SHEET_WRITERS
+        ]
+        self.policies = 0
+
+    def add_policy(self, policy_id: str, results: Dict[str, Any]) -> None:
+        """Append one policy's run_extractors results to every sheet"""
+        # RESULT_KEYS is in SHEET_WRITERS order: each extractor result feeds its sheet
+        for sheet, key in zip(self.sheets, RESULT_KEYS):
+            sheet.add_policy(policy_id, results.get(key))
+        self.policies += 1
+
+    def save(self, output: Union[str, BinaryIO]) -> None:
+        """Save to a path or binary file; a write-only workbook can only be saved once"""
+        self.workbook.save(output)
+
+    def __len__(self) -> int:
+        return self.policies
+
+
+def write_consolidated_excel(policies: Iterable[Tuple[str, Dict[str, Any]]], output: Union[str, BinaryIO]) -> int:
+    """Write (policy id, results) pairs, e.g. from a generator, into one workbook; returns the policy count"""
+    consolidated = ConsolidatedWorkbook()
+    for policy_id, results in policies:
+        consolidated.add_policy(policy_id, results)
+    consolidated.save(output)
+    return len(consolidated)
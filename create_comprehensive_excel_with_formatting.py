@@ -1,80 +1,89 @@
 import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-
-
-def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_data=None, addon_data=None, AddonCoverages_data=None):
-    """Create Excel file with exact format matching the reference image"""
-    
-    def safe_float(value):
-        """Safely convert value to float, return empty string if conversion fails"""
-        if value is None or value == "":
-            return ""
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return ""
-    
-    # Define styles
-    yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-    black_font = Font(name='Arial', size=10, bold=True, color='000000')
-    header_font = Font(name='Arial', size=9, bold=True, color='000000')
-    left_alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
-    center_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    thin_border = Border(
-        left=Side(border_style='thin'),
-        right=Side(border_style='thin'),
-        top=Side(border_style='thin'),
-        bottom=Side(border_style='thin')
-    )
-
-    # Create a new workbook
-    wb = openpyxl.Workbook()
-    # Create Eligibility sheet
-    ws1 = wb.create_sheet("Eligibility")
-    # Remove the default sheet
-    wb.remove(wb['Sheet'])
-    
-    # Apply yellow background to entire header area A1:AO3
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+from excel_streaming import OPENPYXL_INTERNALS, SheetBuffer, SheetTemplate, StyleCache
+
+
+def safe_float(value):
+    """Safely convert value to float, return empty string if conversion fails"""
+    if value is None or value == "":
+        return ""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return ""
+
+
+# Part of the workbook cache key (see excel_cache): bump when the layout or formatting changes
+EXCEL_WRITER_VERSION = "1"
+
+# Styles shared by every sheet
+YELLOW_FILL = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
+BLACK_FONT = Font(name='Arial', size=10, bold=True, color='000000')
+HEADER_FONT = Font(name='Arial', size=9, bold=True, color='000000')
+LEFT_ALIGNMENT = Alignment(horizontal='left', vertical='center', wrap_text=True)
+CENTER_ALIGNMENT = Alignment(horizontal='center', vertical='center', wrap_text=True)
+THIN_BORDER = Border(
+    left=Side(border_style='thin'),
+    right=Side(border_style='thin'),
+    top=Side(border_style='thin'),
+    bottom=Side(border_style='thin')
+)
+
+# Named styles, registered once per workbook and applied with cell.style = name.
+# Assigning a named style only copies its prebuilt style ids, while assigning
+# Font / Border objects makes openpyxl hash them again for every cell.
+NAMED_STYLES = {
+    # Yellow header area: titles and column headers
+    "header": dict(font=BLACK_FONT, fill=YELLOW_FILL, border=THIN_BORDER, alignment=LEFT_ALIGNMENT,
+                   number_format='@'),
+    # Centered section titles
+    "subheader": dict(font=BLACK_FONT, fill=YELLOW_FILL, border=THIN_BORDER, alignment=CENTER_ALIGNMENT,
+                      number_format='@'),
+    # Data cells
+    "text": dict(font=DEFAULT_FONT, border=THIN_BORDER, number_format='@'),
+    "numeric": dict(font=DEFAULT_FONT, border=THIN_BORDER, number_format='#,##0'),
+    "percentage": dict(font=DEFAULT_FONT, border=THIN_BORDER, number_format='0.00%'),
+    "bordered": dict(font=DEFAULT_FONT, border=THIN_BORDER),
+}
+
+
+def register_named_styles(wb):
+    """Add NAMED_STYLES to a new workbook"""
+    for name, attributes in NAMED_STYLES.items():
+        wb.add_named_style(NamedStyle(name=name, **attributes))
+
+
+def write_eligibility_header(ws1):
+    """Static header rows, merges and sizes of the Eligibility sheet"""
+    # Yellow, bordered header area A1:AO3
     for row in range(1, 4):  # Rows 1-3
         for col in range(1, 42):  # Columns A-AO (1-41)
-            cell = ws1.cell(row=row, column=col)
-            cell.fill = yellow_fill
-            cell.border = thin_border
+            ws1.cell(row=row, column=col).style = "header"
     
     # Row 1: High-level category headers
     ws1.merge_cells('A1:N1')
     ws1['A1'] = "Eligibility"
-    ws1['A1'].font = black_font
-    ws1['A1'].alignment = left_alignment
-    ws1['A1'].number_format = '@'
+    ws1['A1'].style = "header"
     
     # Row 2: Sub-category headers
     # Relationship & Sub limit (A2:N2)
     ws1.merge_cells('A2:N2')
     ws1['A2'] = "Relationship & Sub limit"
-    ws1['A2'].font = black_font
-    ws1['A2'].alignment = left_alignment
-    ws1['A2'].number_format = '@'
+    ws1['A2'].style = "header"
     ws1.merge_cells('O2:O2')
     ws1['O2'] = "Network List"
-    ws1['O2'].font = black_font
-    ws1['O2'].alignment = center_alignment
-    ws1['O2'].number_format = '@'
+    ws1['O2'].style = "subheader"
     ws1.merge_cells('P2:P2')
     ws1['P2'] = "Provider Details"
-    ws1['P2'].font = black_font
-    ws1['P2'].alignment = center_alignment
-    ws1['P2'].number_format = '@'
+    ws1['P2'].style = "subheader"
     ws1.merge_cells('Q2:Q2')
     ws1['Q2'] = "Corporate Buffer Eligibility"
-    ws1['Q2'].font = black_font
-    ws1['Q2'].alignment = center_alignment
-    ws1['Q2'].number_format = '@'
+    ws1['Q2'].style = "subheader"
     ws1.merge_cells('AL2:AL2')
     ws1['AL2'] = "Critical Illness Eligible"
-    ws1['AL2'].font = black_font
-    ws1['AL2'].alignment = center_alignment
-    ws1['AL2'].number_format = '@'
+    ws1['AL2'].style = "subheader"
     # Row 3: Detailed column headers
     column_headers_sheet3 = [
         'Max No Of Members Covered', 'Relationship Covered ', 'Relationship Covered', 'Min_Age(In Years)', 'Min_Age(In Months)',
@@ -95,9 +104,8 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
     # Set the detailed headers in row 3 (A3:AO3)
     for col, header in enumerate(column_headers_sheet3, 1):
         cell = ws1.cell(row=3, column=col, value=header)
-        cell.font = header_font
-        cell.alignment = left_alignment  # Left-aligned as shown in image
-        cell.number_format = '@'
+        cell.style = "header"  # Left-aligned as shown in image
+        cell.font = HEADER_FONT
     
     # Set row heights for sheet 3
     ws1.row_dimensions[1].height = 18
@@ -119,8 +127,10 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
     
     for col, width in enumerate(column_widths_sheet3, 1):
         ws1.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
-        
-    
+
+
+def write_eligibility_rows(ws1, eligibility_data=None):
+    """One row per relationship on the Eligibility sheet"""
     # Add actual data rows for sheet 3 (starting from row 4)
     if eligibility_data:
         for row_idx, data in enumerate(eligibility_data, 4):  # Start from row 4
@@ -128,141 +138,130 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
             max_members = safe_float(data.get("Max No Of Members Covered", ""))
             cell = ws1.cell(row=row_idx, column=1, value=max_members)  # A
             if max_members != "":
-                cell.number_format = "#,##0"
+                cell.style = "numeric"
             cell_2 = ws1.cell(row=row_idx, column=2, value=safe_float(data.get("Relationship Covered ", "")))  # B
-            cell_2.number_format = "#,##0"
+            cell_2.style = "numeric"
             cell_3 = ws1.cell(row=row_idx, column=3, value=data.get("Relationship Covered", ""))  # C
-            cell_3.number_format = '@'
+            cell_3.style = "text"
             cell_4 = ws1.cell(row=row_idx, column=4, value=safe_float(data.get("Min_Age(In Years)", "")))  # D
-            cell_4.number_format = "#,##0"
+            cell_4.style = "numeric"
             cell_5 = ws1.cell(row=row_idx, column=5, value=safe_float(data.get("Min_Age(In Months)", "")))  # E
-            cell_5.number_format = "#,##0"
+            cell_5.style = "numeric"
             cell_6 = ws1.cell(row=row_idx, column=6, value=safe_float(data.get("Max_Age(In Years)", "")))  # F
-            cell_6.number_format = "#,##0"
+            cell_6.style = "numeric"
             cell_7 = ws1.cell(row=row_idx, column=7, value=safe_float(data.get("Max_Age(In Months)", "")))  # G
-            cell_7.number_format = "#,##0"
+            cell_7.style = "numeric"
             cell_8 = ws1.cell(row=row_idx, column=8, value=safe_float(data.get("Member_Count", "")))  # H
-            cell_8.number_format = "#,##0"
+            cell_8.style = "numeric"
             cell_9 = ws1.cell(row=row_idx, column=9, value=data.get("Member_Type", ""))  # I
-            cell_9.number_format = '@'
+            cell_9.style = "text"
             cell_10 = ws1.cell(row=row_idx, column=10, value=data.get("Sublimit_Applicable", ""))  # J
-            cell_10.number_format = '@'
+            cell_10.style = "text"
             cell_11 = ws1.cell(row=row_idx, column=11, value=data.get("Sublimit_Type", ""))  # K
-            cell_11.number_format = '@'
+            cell_11.style = "text"
             cell_12 = ws1.cell(row=row_idx, column=12, value=safe_float(data.get("Sub_Limit", "")))  # L
-            cell_12.number_format = "#,##0"
+            cell_12.style = "numeric"
             cell_13 = ws1.cell(row=row_idx, column=13, value=data.get("Family Buffer Applicable", ""))  # M
-            cell_13.number_format = '@'
+            cell_13.style = "text"
             cell_14 = ws1.cell(row=row_idx, column=14, value=safe_float(data.get("Family Buffer Amount", "")))  # N
-            cell_14.number_format = "#,##0"
+            cell_14.style = "numeric"
             cell_15 = ws1.cell(row=row_idx, column=15, value=data.get("Is Network Applicable", ""))  # O
-            cell_15.number_format = '@'
+            cell_15.style = "text"
             cell_16 = ws1.cell(row=row_idx, column=16, value=data.get("Black listed hospitals are applicable?", ""))  # P
-            cell_16.number_format = '@'
+            cell_16.style = "text"
             cell_17 = ws1.cell(row=row_idx, column=17, value=data.get("Corporate Buffer applicable", ""))  # O
-            cell_17.number_format = '@'
+            cell_17.style = "text"
             cell_18 = ws1.cell(row=row_idx, column=18, value=data.get("Buffer Type", ""))  # P
-            cell_18.number_format = '@'
+            cell_18.style = "text"
             cell_19 = ws1.cell(row=row_idx, column=19, value=data.get("Applicable for", ""))  # Q
-            cell_19.number_format = '@'
+            cell_19.style = "text"
             cell_20 = ws1.cell(row=row_idx, column=20, value=safe_float(data.get("Total Corporate Buffer", "")))  # R
-            cell_20.number_format = "#,##0"
+            cell_20.style = "numeric"
             cell_21 = ws1.cell(row=row_idx, column=21, value=safe_float(data.get("Corporate Buffer Limit Per Family", "")))  # S
-            cell_21.number_format = "#,##0"
+            cell_21.style = "numeric"
             cell_22 = ws1.cell(row=row_idx, column=22, value=safe_float(data.get("Corporate Buffer Limit Per Parent", "")))  # T
-            cell_22.number_format = "#,##0"
+            cell_22.style = "numeric"
             ws1.cell(row=row_idx, column=23, value=data.get("Reload of SI", ""))  # U
             
             cell_24 = ws1.cell(row=row_idx, column=24, value=safe_float(data.get("Total Corporate Buffer.1", "")))  # V
-            cell_24.number_format = "#,##0"
+            cell_24.style = "numeric"
             cell_25 = ws1.cell(row=row_idx, column=25, value=safe_float(data.get("Corporate Buffer Limit Per Family.1", "")))  # W
-            cell_25.number_format = "#,##0"
+            cell_25.style = "numeric"
             cell_26 = ws1.cell(row=row_idx, column=26, value=safe_float(data.get("Corporate Buffer Limit Per Parent.1", "")))  # X
-            cell_26.number_format = "#,##0"
+            cell_26.style = "numeric"
             cell_27 = ws1.cell(row=row_idx, column=27, value=data.get("Reload of SI.1", ""))
-            cell_27.number_format = '@'
+            cell_27.style = "text"
             cell_28 = ws1.cell(row=row_idx, column=28, value=data.get("Approving Authority", ""))
-            cell_28.number_format = '@'
+            cell_28.style = "text"
             cell_29 = ws1.cell(row=row_idx, column=29, value=data.get("Buffer OPD Limit", ""))
-            cell_29.number_format = '@'  
-            ws1.cell(row=row_idx, column=30, value=data.get("Whether increase in sum insured permissible at renewal", "")).number_format = '@'  
-            ws1.cell(row=row_idx, column=31, value=safe_float(data.get("Total Plan Buffer", ""))).number_format = "#,##0"  
-            ws1.cell(row=row_idx, column=32, value=safe_float(data.get("Corporate Bufferr Limit for Employee/Family", ""))).number_format = "#,##0"  
-            ws1.cell(row=row_idx, column=33, value=safe_float(data.get("Corporate Buffer Limit Per Parent.2", ""))).number_format = "#,##0"  
-            ws1.cell(row=row_idx, column=34, value=data.get("Reload of SI.2", "")).number_format = '@'  
-            ws1.cell(row=row_idx, column=35, value=data.get("Approving Authority.1", "")).number_format = '@'  
-            ws1.cell(row=row_idx, column=36, value=data.get("Buffer OPD Limit.1", "")).number_format = '@'  
-            ws1.cell(row=row_idx, column=37, value=data.get("Whether increase in sum insured permissible at renewal.1", "")).number_format = '@'  
+            cell_29.style = "text"  
+            ws1.cell(row=row_idx, column=30, value=data.get("Whether increase in sum insured permissible at renewal", "")).style = "text"  
+            ws1.cell(row=row_idx, column=31, value=safe_float(data.get("Total Plan Buffer", ""))).style = "numeric"  
+            ws1.cell(row=row_idx, column=32, value=safe_float(data.get("Corporate Bufferr Limit for Employee/Family", ""))).style = "numeric"  
+            ws1.cell(row=row_idx, column=33, value=safe_float(data.get("Corporate Buffer Limit Per Parent.2", ""))).style = "numeric"  
+            ws1.cell(row=row_idx, column=34, value=data.get("Reload of SI.2", "")).style = "text"  
+            ws1.cell(row=row_idx, column=35, value=data.get("Approving Authority.1", "")).style = "text"  
+            ws1.cell(row=row_idx, column=36, value=data.get("Buffer OPD Limit.1", "")).style = "text"  
+            ws1.cell(row=row_idx, column=37, value=data.get("Whether increase in sum insured permissible at renewal.1", "")).style = "text"  
             
             # Critical Illness fields
-            ws1.cell(row=row_idx, column=38, value=data.get("Critical Illness applicable", "")).number_format = '@'  
-            ws1.cell(row=row_idx, column=39, value=safe_float(data.get("Critical Illness limit per family", ""))).number_format = "#,##0.00"  
-            ws1.cell(row=row_idx, column=40, value=data.get("Critical Illness Approving Authority", "")).number_format = '@'  
-            ws1.cell(row=row_idx, column=41, value=data.get("Critical Illness Whether increase in sum insured permissible at renewal", "")).number_format = '@'  
+            ws1.cell(row=row_idx, column=38, value=data.get("Critical Illness applicable", "")).style = "text"  
+            cell_39 = ws1.cell(row=row_idx, column=39, value=safe_float(data.get("Critical Illness limit per family", "")))
+            cell_39.style = "numeric"
+            cell_39.number_format = "#,##0.00"
+            ws1.cell(row=row_idx, column=40, value=data.get("Critical Illness Approving Authority", "")).style = "text"  
+            ws1.cell(row=row_idx, column=41, value=data.get("Critical Illness Whether increase in sum insured permissible at renewal", "")).style = "text"  
             
-            # Apply borders to all data cells
+            # Apply borders to the data cells without a number format
             for col in range(1, 42):  # A-AO (1-41)
                 cell = ws1.cell(row=row_idx, column=col)
-                cell.border = thin_border
+                if not cell.has_style:
+                    cell.style = "bordered"
     
     # Add empty rows with borders for remaining rows
     start_row = 4 + (len(eligibility_data) if eligibility_data else 0)
     for row in range(start_row, max(10, start_row + 2)):  # Add at least a few empty rows
         for col in range(1, 42):  # A-AO (1-41)
-            cell = ws1.cell(row=row, column=col)
-            cell.border = thin_border
+            ws1.cell(row=row, column=col).style = "bordered"
 
-    # Create fifth sheet: Primary Cover
-    ws2 = wb.create_sheet("Primary Cover")
 
-    # Apply yellow background to rows 1-3 and borders to rows 1-4
+def write_primary_cover_header(ws2):
+    """Static header rows, merges and sizes of the Primary Cover sheet"""
+    # Yellow, bordered header rows 1-3 and a bordered row 4
     for row in range(1, 5):  # Rows 1-4
         for col in range(1, 85):  # Columns A-CG (1-83)
-            cell = ws2.cell(row=row, column=col)
-            
-            # Apply yellow background only to rows 1-3
-            if row <= 3:
-                cell.fill = yellow_fill
-            
-            # Apply border to all rows 1-4
-            cell.border = thin_border
+            ws2.cell(row=row, column=col).style = "header" if row <= 3 else "bordered"
 
     # Row 1: High-level category headers
     # Primary Cover (A1:C1)
     ws2.merge_cells('A1:C1')
     ws2['A1'] = "Primary Cover"
-    ws2['A1'].font = black_font
-    ws2['A1'].alignment = left_alignment
+    ws2['A1'].style = "header"
 
     # Row 2: Sub-category headers
     # Pre & Post Hospitalization (I2:S2)
     ws2.merge_cells('A2:S2')
     ws2['A2'] = "Pre & Post Hospitalization"
-    ws2['A2'].font = black_font
-    ws2['A2'].alignment = center_alignment
+    ws2['A2'].style = "subheader"
 
     # Maternity (T2:U2)
     ws2.merge_cells('U2:U2')
     ws2['U2'] = "Maternity"
-    ws2['U2'].font = black_font
-    ws2['U2'].alignment = center_alignment
+    ws2['U2'].style = "subheader"
 
     
 
     ws2.merge_cells('AI2:AI2')
     ws2['AI2'] = "Normal"
-    ws2['AI2'].font = black_font
-    ws2['AI2'].alignment = center_alignment
+    ws2['AI2'].style = "subheader"
 
     ws2.merge_cells('AP2:AP2')
     ws2['AP2'] = "Caesarian"
-    ws2['AP2'].font = black_font
-    ws2['AP2'].alignment = center_alignment
+    ws2['AP2'].style = "subheader"
 
     ws2.merge_cells('AW2:AW2')
     ws2['AW2'] = "Critical"
-    ws2['AW2'].font = black_font
-    ws2['AW2'].alignment = center_alignment
+    ws2['AW2'].style = "subheader"
 
     
 
@@ -288,37 +287,61 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
 
 
     for col, header in enumerate(column_headers_row3, 1):  # Start from column C (3)
-        cell = ws2.cell(row=3, column=col, value=header)
-        cell.font = black_font
-        cell.alignment = left_alignment
+        ws2.cell(row=3, column=col, value=header).style = "header"
+
 
+    # Set row heights for sheet 5
+    ws2.row_dimensions[1].height = 18
+    ws2.row_dimensions[2].height = 18
+    ws2.row_dimensions[3].height = 18
+    ws2.row_dimensions[4].height = 35
+
+    # Set column widths for sheet 5 - Further increased for better visibility
+    column_widths_sheet5 = [
+        35, 35, 45, 30, 35,  # A-E (further increased from 25,25,35,20,25)
+        30, 30, 35,  # F-H (further increased from 20,20,25)
+        40, 30, 35, 35, 35, 35,  # I-N (further increased from 30,20,25,25,25,25)
+        40, 30, 35, 35, 35, 35,  # O-T (further increased from 30,20,25,25,25,25)
+        30  # U (further increased from 20)
+    ]
+
+    # Extend widths till CG (83 columns) with default width 35 (further increased from 25)
+    while len(column_widths_sheet5) < 83:
+        column_widths_sheet5.append(35)
+
+    for col, width in enumerate(column_widths_sheet5, 1):
+        ws2.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+
+
+def write_primary_cover_rows(ws2, primary_data=None):
+    """Data rows of the Primary Cover sheet"""
     if primary_data:
         for row_idx, data in enumerate(primary_data, 4):
             # Combined section (columns 1-8)
-            ws2.cell(row=row_idx, column=1, value=data.get("Combined_Benefit_Applicable", "Yes")).number_format = '@'
-            ws2.cell(row=row_idx, column=2, value=data.get("Combined_Is_Pre_and_Post_Combined", "")).number_format = '@'
-            ws2.cell(row=row_idx, column=3, value=data.get("Combined_Type_Of_Expense", "")).number_format = '@'
+            ws2.cell(row=row_idx, column=1, value=data.get("Combined_Benefit_Applicable", "Yes")).style = "text"
+            ws2.cell(row=row_idx, column=2, value=data.get("Combined_Is_Pre_and_Post_Combined", "")).style = "text"
+            ws2.cell(row=row_idx, column=3, value=data.get("Combined_Type_Of_Expense", "")).style = "text"
             ws2.cell(row=row_idx, column=4, value=data.get("Combined_No_Of_Days", ""))
-            ws2.cell(row=row_idx, column=5, value=data.get("Combined_Percent_Limit_Applicable_On", "")).number_format = '@'
-            ws2.cell(row=row_idx, column=6, value=data.get("Combined_Percent_Limit", "")).number_format = "0.00%"
+            ws2.cell(row=row_idx, column=5, value=data.get("Combined_Percent_Limit_Applicable_On", "")).style = "text"
+            ws2.cell(row=row_idx, column=6, value=data.get("Combined_Percent_Limit", "")).style = "percentage"
             ws2.cell(row=row_idx, column=7, value=data.get("Combined_Limit", ""))
-            ws2.cell(row=row_idx, column=8, value=data.get("Combined_Applicability", "")).number_format = '@'
+            ws2.cell(row=row_idx, column=8, value=data.get("Combined_Applicability", "")).style = "text"
             
             # Pre Hospitalisation section (columns 9-14)
-            ws2.cell(row=row_idx, column=9, value=data.get("Type of expense 1", "")).number_format = '@'
-            ws2.cell(row=row_idx, column=10, value=data.get("No. Of Days 1", "")).number_format = '#,##0'
-            ws2.cell(row=row_idx, column=11, value=data.get("% Limit Applicable 1", "")).number_format = '@'
-            ws2.cell(row=row_idx, column=12, value=data.get("Limit Percentage 1", "")).number_format = "0.00%"
-            ws2.cell(row=row_idx, column=13, value=data.get("Limit Amount_19", "500000")).number_format = "#,##0"
-            ws2.cell(row=row_idx, column=14, value=data.get("Applicability 1", "")).number_format = '@'
+            ws2.cell(row=row_idx, column=9, value=data.get("Type of expense 1", "")).style = "text"
+            ws2.cell(row=row_idx, column=10, value=data.get("No. Of Days 1", "")).style = "numeric"
+            ws2.cell(row=row_idx, column=11, value=data.get("% Limit Applicable 1", "")).style = "text"
+            ws2.cell(row=row_idx, column=12, value=data.get("Limit Percentage 1", "")).style = "percentage"
+            ws2.cell(row=row_idx, column=13, value=data.get("Limit Amount_19", "500000")).style = "numeric"
+            ws2.cell(row=row_idx, column=14, value=data.get("Applicability 1", "")).style = "text"
             
             # Post Hospitalisation/OPD section (columns 15-20)
-            ws2.cell(row=row_idx, column=15, value=data.get("Type of expense 2", "")).number_format = '@'
-            ws2.cell(row=row_idx, column=16, value=data.get("No. Of Days 2", "")).number_format = '#,##0'
-            ws2.cell(row=row_idx, column=17, value=data.get("% Limit Applicable 2", "")).number_format = '@'
-            ws2.cell(row=row_idx, column=18, value=data.get("Limit Percentage 2", "")).number_format = "0.00%"
-            ws2.cell(row=row_idx, column=19, value=data.get("Limit Amount_20", "500000")).number_format = "#,##0"
-            ws2.cell(row=row_idx, column=20, value=data.get("Applicability 2", "")).number_format = '@'
+            ws2.cell(row=row_idx, column=15, value=data.get("Type of expense 2", "")).style = "text"
+            ws2.cell(row=row_idx, column=16, value=data.get("No. Of Days 2", "")).style = "numeric"
+            ws2.cell(row=row_idx, column=17, value=data.get("% Limit Applicable 2", "")).style = "text"
+            ws2.cell(row=row_idx, column=18, value=data.get("Limit Percentage 2", "")).style = "percentage"
+            ws2.cell(row=row_idx, column=19, value=data.get("Limit Amount_20", "500000")).style = "numeric"
+            ws2.cell(row=row_idx, column=20, value=data.get("Applicability 2", "")).style = "text"
 
                         # Main Maternity section (columns 21-32)
             ws2.cell(row=row_idx, column=21, value=data.get("Maternity Benefit Applicable?", "No"))
@@ -330,11 +353,11 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
                     ws2.cell(row=row_idx, column=col, value="")
             else:
                 # If Yes: Continue with all maternity logic
-                ws2.cell(row=row_idx, column=22, value=data.get("Maternity Waiting Period(In Days)", "")).number_format = '#,##0'
-                ws2.cell(row=row_idx, column=23, value=data.get("Maternity Limit On Number Of Live Children", "")).number_format = '#,##0'
-                ws2.cell(row=row_idx, column=24, value=data.get("Maternity Member Contribution Applicable?", "")).number_format = '@'
-                ws2.cell(row=row_idx, column=25, value=data.get("Maternity Copay or deductible Applicable?", "")).number_format = '@'
-                ws2.cell(row=row_idx, column=26, value=data.get("Maternity Is Combined?", "")).number_format = '@'
+                ws2.cell(row=row_idx, column=22, value=data.get("Maternity Waiting Period(In Days)", "")).style = "numeric"
+                ws2.cell(row=row_idx, column=23, value=data.get("Maternity Limit On Number Of Live Children", "")).style = "numeric"
+                ws2.cell(row=row_idx, column=24, value=data.get("Maternity Member Contribution Applicable?", "")).style = "text"
+                ws2.cell(row=row_idx, column=25, value=data.get("Maternity Copay or deductible Applicable?", "")).style = "text"
+                ws2.cell(row=row_idx, column=26, value=data.get("Maternity Is Combined?", "")).style = "text"
                 
                 # Maternity Is Combined? Logic
                 if data.get("Maternity Is Combined?", "") == "No":
@@ -348,32 +371,32 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
                     ws2.cell(row=row_idx, column=33, value="")
                     
                     # Return original data for columns 34-48
-                    ws2.cell(row=row_idx, column=34, value=data.get("Normal_Sum_Insured", "500000")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=35, value=data.get("Normal_Limit_%", "Sum Insured")).number_format = "0.00%"
-                    ws2.cell(row=row_idx, column=36, value=data.get("Normal Delivery Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=37, value=data.get("Normal Delivery Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=38, value=data.get("Normal_Applicability", "Lower")).number_format = '@'
-                    ws2.cell(row=row_idx, column=39, value=data.get("Normal_copay", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=40, value=data.get("Normal_Delivery_Applicability", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=41, value=data.get("Ceaserean_sum_insured", "500000")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=42, value=data.get("Ceaserean_Limit_%", "Sum Insured")).number_format = "0.00%"
-                    ws2.cell(row=row_idx, column=43, value=data.get("Caesarean Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=44, value=data.get("Caesarean Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=45, value=data.get("Caesarean_applicability", "Lower")).number_format = '@'
-                    ws2.cell(row=row_idx, column=46, value=data.get("Ceaserean_copay", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=47, value=data.get("Caesarean_Applicability", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=48, value=data.get("critical_sum_insured", "")).number_format = "#,##0"
+                    ws2.cell(row=row_idx, column=34, value=data.get("Normal_Sum_Insured", "500000")).style = "numeric"
+                    ws2.cell(row=row_idx, column=35, value=data.get("Normal_Limit_%", "Sum Insured")).style = "percentage"
+                    ws2.cell(row=row_idx, column=36, value=data.get("Normal Delivery Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=37, value=data.get("Normal Delivery Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=38, value=data.get("Normal_Applicability", "Lower")).style = "text"
+                    ws2.cell(row=row_idx, column=39, value=data.get("Normal_copay", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=40, value=data.get("Normal_Delivery_Applicability", "")).style = "text"
+                    ws2.cell(row=row_idx, column=41, value=data.get("Ceaserean_sum_insured", "500000")).style = "numeric"
+                    ws2.cell(row=row_idx, column=42, value=data.get("Ceaserean_Limit_%", "Sum Insured")).style = "percentage"
+                    ws2.cell(row=row_idx, column=43, value=data.get("Caesarean Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=44, value=data.get("Caesarean Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=45, value=data.get("Caesarean_applicability", "Lower")).style = "text"
+                    ws2.cell(row=row_idx, column=46, value=data.get("Ceaserean_copay", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=47, value=data.get("Caesarean_Applicability", "")).style = "text"
+                    ws2.cell(row=row_idx, column=48, value=data.get("critical_sum_insured", "")).style = "numeric"
                     
                 elif data.get("Maternity Is Combined?", "") == "Yes":
                     # If Yes: Return original data for columns 27-32, return empty for columns 34-48
-                    ws2.cell(row=row_idx, column=27, value=data.get("Maternity Sum Insured_1", "500000")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=28, value=data.get("Maternity % Limit_1", "Sum Insured")).number_format = "0.00%"
-                    ws2.cell(row=row_idx, column=29, value=data.get("Normal Delivery Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=30, value=data.get("Normal Delivery Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=31, value=data.get("Maternity Applicability_10", "Lower")).number_format = '@'
-                    ws2.cell(row=row_idx, column=32, value=data.get("Maternity Copay_1", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=33, value=data.get("Maternity Deductible_1", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=34, value=data.get("Maternity Is Combined?", "")).number_format = '@'
+                    ws2.cell(row=row_idx, column=27, value=data.get("Maternity Sum Insured_1", "500000")).style = "numeric"
+                    ws2.cell(row=row_idx, column=28, value=data.get("Maternity % Limit_1", "Sum Insured")).style = "percentage"
+                    ws2.cell(row=row_idx, column=29, value=data.get("Normal Delivery Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=30, value=data.get("Normal Delivery Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=31, value=data.get("Maternity Applicability_10", "Lower")).style = "text"
+                    ws2.cell(row=row_idx, column=32, value=data.get("Maternity Copay_1", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=33, value=data.get("Maternity Deductible_1", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=34, value=data.get("Maternity Is Combined?", "")).style = "text"
                     
                     # Return empty for columns 34-48
                     for col in range(34, 49):
@@ -392,22 +415,22 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
 
                 # Pre-Natal section (columns 34-48) - Only populate if Maternity Is Combined is NOT "Yes"
                 if data.get("Maternity Is Combined?", "") != "Yes":
-                    ws2.cell(row=row_idx, column=34, value=data.get("Maternity Is Combined?", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=35, value=data.get("Normal_Sum_Insured", "500000")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=36, value=data.get("Normal_Limit_%", "Sum Insured")).number_format = "0.00%"
-                    ws2.cell(row=row_idx, column=37, value=data.get("Normal Delivery Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=38, value=data.get("Normal Delivery Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=39, value=data.get("Normal_Applicability", "Lower")).number_format = '@'
-                    ws2.cell(row=row_idx, column=40, value=data.get("Normal_copay", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=41, value=data.get("Normal_Delivery_Applicability", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=42, value=data.get("Ceaserean_sum_insured", "500000")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=43, value=data.get("Ceaserean_Limit_%", "Sum Insured")).number_format = "0.00%"
-                    ws2.cell(row=row_idx, column=44, value=data.get("Caesarean Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=45, value=data.get("Caesarean Limit", "")).number_format = "#,##0"
-                    ws2.cell(row=row_idx, column=46, value=data.get("Caesarean_applicability", "Lower")).number_format = '@'
-                    ws2.cell(row=row_idx, column=47, value=data.get("Ceaserean_copay", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=48, value=data.get("Caesarean_Applicability", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=49, value=data.get("critical_sum_insured", "")).number_format = "#,##0"
+                    ws2.cell(row=row_idx, column=34, value=data.get("Maternity Is Combined?", "")).style = "text"
+                    ws2.cell(row=row_idx, column=35, value=data.get("Normal_Sum_Insured", "500000")).style = "numeric"
+                    ws2.cell(row=row_idx, column=36, value=data.get("Normal_Limit_%", "Sum Insured")).style = "percentage"
+                    ws2.cell(row=row_idx, column=37, value=data.get("Normal Delivery Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=38, value=data.get("Normal Delivery Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=39, value=data.get("Normal_Applicability", "Lower")).style = "text"
+                    ws2.cell(row=row_idx, column=40, value=data.get("Normal_copay", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=41, value=data.get("Normal_Delivery_Applicability", "")).style = "text"
+                    ws2.cell(row=row_idx, column=42, value=data.get("Ceaserean_sum_insured", "500000")).style = "numeric"
+                    ws2.cell(row=row_idx, column=43, value=data.get("Ceaserean_Limit_%", "Sum Insured")).style = "percentage"
+                    ws2.cell(row=row_idx, column=44, value=data.get("Caesarean Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=45, value=data.get("Caesarean Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=46, value=data.get("Caesarean_applicability", "Lower")).style = "text"
+                    ws2.cell(row=row_idx, column=47, value=data.get("Ceaserean_copay", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=48, value=data.get("Caesarean_Applicability", "")).style = "text"
+                    ws2.cell(row=row_idx, column=49, value=data.get("critical_sum_insured", "")).style = "numeric"
                 else:
                     # Leave columns 34-48 empty if Maternity Is Combined is "Yes"
                     for col in range(35, 50):
@@ -420,9 +443,9 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
                 ws2.cell(row=row_idx, column=53, value=data.get("critical_Limit", ""))
                 ws2.cell(row=row_idx, column=54, value=data.get("critical_Limit", ""))
                 ws2.cell(row=row_idx, column=55, value=data.get("Critical_Applicability", ""))
-                ws2.cell(row=row_idx, column=56, value=data.get("Pre-Natal and Post-Natal Expenses Covered", "No")).number_format = '@'
-                ws2.cell(row=row_idx, column=57, value=data.get("Over-Above-Maternity Limit Applicable", "No")).number_format = '@'
-                ws2.cell(row=row_idx, column=58, value=data.get("Is Pre&Post Natal Combined?", "")).number_format = '@'
+                ws2.cell(row=row_idx, column=56, value=data.get("Pre-Natal and Post-Natal Expenses Covered", "No")).style = "text"
+                ws2.cell(row=row_idx, column=57, value=data.get("Over-Above-Maternity Limit Applicable", "No")).style = "text"
+                ws2.cell(row=row_idx, column=58, value=data.get("Is Pre&Post Natal Combined?", "")).style = "text"
                 
                 # Pre&Post Natal Combined Logic
                 if data.get("Is Pre&Post Natal Combined?", "") == "No":
@@ -435,27 +458,27 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
                     ws2.cell(row=row_idx, column=64, value="")
                     
                     # Return original data for columns 64-75
-                    ws2.cell(row=row_idx, column=65, value=data.get("Maternity_hardcode_2", "Pre-Natal Expenses")).number_format = '@'
-                    ws2.cell(row=row_idx, column=66, value=data.get("No.of Days_6", "30")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=67, value=data.get("Sum Insured_3", "Sum Insured")).number_format = '@'
-                    ws2.cell(row=row_idx, column=68, value=data.get("Pre-Natal Limit Calc Percentage", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=69, value=data.get("Pre-Natal Limit", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=70, value=data.get("Aplicability_pre", "Lower")).number_format = '@'
-                    ws2.cell(row=row_idx, column=71, value=data.get("Maternity_hardcode_3", "Post-Natal Expenses")).number_format = '@'
-                    ws2.cell(row=row_idx, column=72, value=data.get("No.of Days_10", "60")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=73, value=data.get("sum insured_11", "Sum Insured")).number_format = '@'
-                    ws2.cell(row=row_idx, column=74, value=data.get("Pre-Natal Limit Calc Percentage", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=75, value=data.get("Post-Natal Limit", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=76, value=data.get("Applicability_post", "Lower")).number_format = '@'
+                    ws2.cell(row=row_idx, column=65, value=data.get("Maternity_hardcode_2", "Pre-Natal Expenses")).style = "text"
+                    ws2.cell(row=row_idx, column=66, value=data.get("No.of Days_6", "30")).style = "numeric"
+                    ws2.cell(row=row_idx, column=67, value=data.get("Sum Insured_3", "Sum Insured")).style = "text"
+                    ws2.cell(row=row_idx, column=68, value=data.get("Pre-Natal Limit Calc Percentage", "")).style = "text"
+                    ws2.cell(row=row_idx, column=69, value=data.get("Pre-Natal Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=70, value=data.get("Aplicability_pre", "Lower")).style = "text"
+                    ws2.cell(row=row_idx, column=71, value=data.get("Maternity_hardcode_3", "Post-Natal Expenses")).style = "text"
+                    ws2.cell(row=row_idx, column=72, value=data.get("No.of Days_10", "60")).style = "numeric"
+                    ws2.cell(row=row_idx, column=73, value=data.get("sum insured_11", "Sum Insured")).style = "text"
+                    ws2.cell(row=row_idx, column=74, value=data.get("Pre-Natal Limit Calc Percentage", "")).style = "text"
+                    ws2.cell(row=row_idx, column=75, value=data.get("Post-Natal Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=76, value=data.get("Applicability_post", "Lower")).style = "text"
                     
                 elif data.get("Is Pre&Post Natal Combined?", "") == "Yes":
                     # If Yes: Return original data for columns 58-63, return empty for columns 64-75
-                    ws2.cell(row=row_idx, column=59, value=data.get("Materninity_hardcode", "Pre & Post Natal Expenses")).number_format = '@'
-                    ws2.cell(row=row_idx, column=60, value=data.get("No.of Days_5", "30")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=61, value=data.get("Sum Insured_2", "Sum Insured")).number_format = '@'
-                    ws2.cell(row=row_idx, column=62, value=data.get("Pre-Natal Limit Calc Percentage", "")).number_format = '@'
-                    ws2.cell(row=row_idx, column=63, value=data.get("Pre-Natal Limit", "")).number_format = '#,##0'
-                    ws2.cell(row=row_idx, column=64, value=data.get("Applicability_7", "Lower")).number_format = '@'
+                    ws2.cell(row=row_idx, column=59, value=data.get("Materninity_hardcode", "Pre & Post Natal Expenses")).style = "text"
+                    ws2.cell(row=row_idx, column=60, value=data.get("No.of Days_5", "30")).style = "numeric"
+                    ws2.cell(row=row_idx, column=61, value=data.get("Sum Insured_2", "Sum Insured")).style = "text"
+                    ws2.cell(row=row_idx, column=62, value=data.get("Pre-Natal Limit Calc Percentage", "")).style = "text"
+                    ws2.cell(row=row_idx, column=63, value=data.get("Pre-Natal Limit", "")).style = "numeric"
+                    ws2.cell(row=row_idx, column=64, value=data.get("Applicability_7", "Lower")).style = "text"
                     
                     # Return empty for columns 64-75
                     for col in range(65, 77):
@@ -494,14 +517,14 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
                 ws2.cell(row=row_idx, column=78, value=data.get("covered From", ""))
 
                 # New Born section (columns 78-85) - Using maternity_26_columns.py logic
-                ws2.cell(row=row_idx, column=79, value=data.get("Is New Born Limit Applicable", "")).number_format = '@'
-                ws2.cell(row=row_idx, column=80, value=data.get("covered From_1", "")).number_format = '@'
-                ws2.cell(row=row_idx, column=81, value=data.get("Is New Born Limit Applicable_1", "")).number_format = '@'
-                ws2.cell(row=row_idx, column=82, value=data.get("Newborn_sum_insured", "")).number_format = '#,##0'
-                ws2.cell(row=row_idx, column=83, value=data.get("Newborn_Limit_applicable_on", "")).number_format = '@'
-                ws2.cell(row=row_idx, column=84, value=data.get("Newborn_Limit_percentage", "")).number_format = '@'
-                ws2.cell(row=row_idx, column=85, value=data.get("Newborn_Limit_amount", "")).number_format = '#,##0'
-                ws2.cell(row=row_idx, column=86, value=data.get("Newborn_applicability", "")).number_format = '@'
+                ws2.cell(row=row_idx, column=79, value=data.get("Is New Born Limit Applicable", "")).style = "text"
+                ws2.cell(row=row_idx, column=80, value=data.get("covered From_1", "")).style = "text"
+                ws2.cell(row=row_idx, column=81, value=data.get("Is New Born Limit Applicable_1", "")).style = "text"
+                ws2.cell(row=row_idx, column=82, value=data.get("Newborn_sum_insured", "")).style = "numeric"
+                ws2.cell(row=row_idx, column=83, value=data.get("Newborn_Limit_applicable_on", "")).style = "text"
+                ws2.cell(row=row_idx, column=84, value=data.get("Newborn_Limit_percentage", "")).style = "text"
+                ws2.cell(row=row_idx, column=85, value=data.get("Newborn_Limit_amount", "")).style = "numeric"
+                ws2.cell(row=row_idx, column=86, value=data.get("Newborn_applicability", "")).style = "text"
             else:
                 # Leave columns 77-85 empty if "new born covered?" is not "yes"
                 for col in range(78, 87):
@@ -510,65 +533,35 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
             # Apply borders to all data cells
             for col in range(1, 85):  # A-CG
                 cell = ws2.cell(row=row_idx, column=col)
-                cell.border = thin_border
+                if not cell.has_style:
+                    cell.style = "bordered"
 
     
 
-    # Set row heights for sheet 5
-    ws2.row_dimensions[1].height = 18
-    ws2.row_dimensions[2].height = 18
-    ws2.row_dimensions[3].height = 18
-    ws2.row_dimensions[4].height = 35
-
-    # Set column widths for sheet 5 - Further increased for better visibility
-    column_widths_sheet5 = [
-        35, 35, 45, 30, 35,  # A-E (further increased from 25,25,35,20,25)
-        30, 30, 35,  # F-H (further increased from 20,20,25)
-        40, 30, 35, 35, 35, 35,  # I-N (further increased from 30,20,25,25,25,25)
-        40, 30, 35, 35, 35, 35,  # O-T (further increased from 30,20,25,25,25,25)
-        30  # U (further increased from 20)
-    ]
-
-    # Extend widths till CG (83 columns) with default width 35 (further increased from 25)
-    while len(column_widths_sheet5) < 83:
-        column_widths_sheet5.append(35)
-
-    for col, width in enumerate(column_widths_sheet5, 1):
-        ws2.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
-
     # Add data rows for sheet 5 (starting from row 5) with borders only
     for row in range(5, 6):  # Rows 5-26 as shown in image (fixed range)
         for col in range(1, 84):  # A-CG
             cell = ws2.cell(row=row, column=col)
-            cell.border = thin_border
-            
-    # Create sixth sheet: Secondary Cover
-    ws3 = wb.create_sheet("Addon covers")
+            if not cell.has_style:
+                cell.style = "bordered"
 
-    # Apply yellow background to rows 1-3 and borders to rows 1-4
+
+def write_addon_covers_header(ws3):
+    """Static header rows, merges and sizes of the Addon covers sheet"""
+    # Yellow, bordered header rows 1-3 and a bordered row 4
     for row in range(1, 5):  # Rows 1-4
         for col in range(1, 33):  
-            cell = ws3.cell(row=row, column=col)
-            # Apply yellow background only to rows 1-3
-            if row <= 3:
-                cell.fill = yellow_fill
-            
-            # Apply border to all rows 1-4
-            cell.border = thin_border
+            ws3.cell(row=row, column=col).style = "header" if row <= 3 else "bordered"
 
     # Row 1: High-level category headers
     ws3.merge_cells('A1:AF1')
     ws3['A1'] = "Addon Covers"
-    ws3['A1'].font = black_font
-    ws3['A1'].alignment = left_alignment
-    ws3['A1'].number_format = '@'
+    ws3['A1'].style = "header"
 
     # Row 2: Sub-category headers
     ws3.merge_cells('A2:AF2')
     ws3['A2'] = ""
-    ws3['A2'].font = black_font
-    ws3['A2'].alignment = center_alignment
-    ws3['A2'].number_format = '@'
+    ws3['A2'].style = "subheader"
     column_headers_row3 = ["Ambulance Cover", "Anyone Illness", "Attendant Care", "Cancer Cover", "Convalescence Benefit",
     "Critical Illness Benefit", "Daily/Hospital Cash Benefit", "Dental Cover", "Diabetic Cover",
     "Doctor & Nurse Home Visit Cover", "Education Fund", "Funeral", "Getwell Benefit",
@@ -581,46 +574,8 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
 ]
 
     for col, header in enumerate(column_headers_row3, 1):
-        cell = ws3.cell(row=3, column=col, value=header)
-        cell.font = black_font
-        cell.alignment = left_alignment
-        cell.number_format = '@'
+        ws3.cell(row=3, column=col, value=header).style = "header"
         
-    if addon_data:
-        for row_idx, data in enumerate(addon_data, 4):
-             ws3.cell(row=row_idx, column=1, value=data.get("Ambulance Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=2, value=data.get("Anyone Illness", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=3, value=data.get("Attendant Care", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=4, value=data.get("Cancer Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=5, value=data.get("Convalescence Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=6, value=data.get("Critical Illness Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=7, value=data.get("Daily/Hospital Cash Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=8, value=data.get("Dental Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=9, value=data.get("Diabetic Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=10, value=data.get("Doctor & Nurse Home Visit Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=11, value=data.get("Education Fund", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=12, value=data.get("Funeral", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=13, value=data.get("Getwell Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=14, value=data.get("Hardship Critical Illness Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=15, value=data.get("Health Check up", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=16, value=data.get("Hypertension Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=17, value=data.get("Intensive Care Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=18, value=data.get("Loss Of Pay Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=19, value=data.get("Medical Evacuation Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=20, value=data.get("Medical Second Opinion", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=21, value=data.get("Non Medical Expense Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=22, value=data.get("Out Patient Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=23, value=data.get("Optical Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=24, value=data.get("Organ Donor Medical Expense Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=25, value=data.get("Personal Accident Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=26, value=data.get("Pre Existing Disease Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=27, value=data.get("Psychiatric Cover", "")).number_format = '@'  
-             ws3.cell(row=row_idx, column=28, value=data.get("Recovery Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=29, value=data.get("Referral Hospital Care", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=30, value=data.get("Surgical Benefit", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=31, value=data.get("Top Up Cover", "")).number_format = '@'
-             ws3.cell(row=row_idx, column=32, value=data.get("Vaccination/Immunization Cover", "")).number_format = '@'
-                
 
     # Set row heights for sheet 6
     ws3.row_dimensions[1].height = 18
@@ -634,195 +589,165 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
     
     for col, width in enumerate(column_widths_sheet6, 1):
         ws3.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width  
-    
+
+
+def write_addon_covers_rows(ws3, addon_data=None):
+    """Data rows of the Addon covers sheet"""
+    if addon_data:
+        for row_idx, data in enumerate(addon_data, 4):
+             ws3.cell(row=row_idx, column=1, value=data.get("Ambulance Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=2, value=data.get("Anyone Illness", "")).style = "text"
+             ws3.cell(row=row_idx, column=3, value=data.get("Attendant Care", "")).style = "text"
+             ws3.cell(row=row_idx, column=4, value=data.get("Cancer Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=5, value=data.get("Convalescence Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=6, value=data.get("Critical Illness Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=7, value=data.get("Daily/Hospital Cash Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=8, value=data.get("Dental Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=9, value=data.get("Diabetic Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=10, value=data.get("Doctor & Nurse Home Visit Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=11, value=data.get("Education Fund", "")).style = "text"
+             ws3.cell(row=row_idx, column=12, value=data.get("Funeral", "")).style = "text"
+             ws3.cell(row=row_idx, column=13, value=data.get("Getwell Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=14, value=data.get("Hardship Critical Illness Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=15, value=data.get("Health Check up", "")).style = "text"
+             ws3.cell(row=row_idx, column=16, value=data.get("Hypertension Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=17, value=data.get("Intensive Care Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=18, value=data.get("Loss Of Pay Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=19, value=data.get("Medical Evacuation Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=20, value=data.get("Medical Second Opinion", "")).style = "text"
+             ws3.cell(row=row_idx, column=21, value=data.get("Non Medical Expense Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=22, value=data.get("Out Patient Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=23, value=data.get("Optical Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=24, value=data.get("Organ Donor Medical Expense Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=25, value=data.get("Personal Accident Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=26, value=data.get("Pre Existing Disease Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=27, value=data.get("Psychiatric Cover", "")).style = "text"  
+             ws3.cell(row=row_idx, column=28, value=data.get("Recovery Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=29, value=data.get("Referral Hospital Care", "")).style = "text"
+             ws3.cell(row=row_idx, column=30, value=data.get("Surgical Benefit", "")).style = "text"
+             ws3.cell(row=row_idx, column=31, value=data.get("Top Up Cover", "")).style = "text"
+             ws3.cell(row=row_idx, column=32, value=data.get("Vaccination/Immunization Cover", "")).style = "text"
+                
+
     # Add data rows for sheet 6 (starting from row 4) with borders only
     for row in range(4, 5):  # Rows 4-27 as shown in image
         for col in range(1, 32):  # A-AF (1-32)
             cell = ws3.cell(row=row, column=col)
-            cell.border = thin_border
+            if not cell.has_style:
+                cell.style = "bordered"
 
-    # Create seventh sheet: Addon Coverages
-    ws4 = wb.create_sheet("Addon Coverages")
 
-    # Apply yellow background to rows 1-3 and borders to rows 1-4
+def write_addon_coverages_header(ws4):
+    """Static header rows, merges and sizes of the Addon Coverages sheet"""
+
+    # Yellow, bordered header rows 1-3 and a bordered row 4
     for row in range(1, 5):  # Rows 1-4
         for col in range(1, 449):  # A to QF (1-448, so range needs to be 1-449)
-            cell = ws4.cell(row=row, column=col)
-            # Apply yellow background only to rows 1-3
-            if row <= 3:
-                cell.fill = yellow_fill
-            
-            # Apply border to all rows 1-4
-            cell.border = thin_border
+            ws4.cell(row=row, column=col).style = "header" if row <= 3 else "bordered"
 
     ws4.merge_cells('A1:QF1')
     ws4['A1'] = "Addon Coverages" 
-    ws4['A1'].font = black_font
-    ws4['A1'].alignment = center_alignment
+    ws4['A1'].style = "subheader"
 
     # Row 2: High-level category headers
     ws4.merge_cells('A2:F2')
     ws4['A2'] = "Ambulance Cover"
-    ws4['A2'].font = black_font
-    ws4['A2'].alignment = center_alignment
-    ws4['A2'].number_format = '@'
+    ws4['A2'].style = "subheader"
     ws4.merge_cells('G2:Y2')
     ws4['G2'] = "Anyone Illness"
-    ws4['G2'].font = black_font
-    ws4['G2'].alignment = center_alignment
-    ws4['G2'].number_format = '@'
+    ws4['G2'].style = "subheader"
     ws4.merge_cells('Z2:AQ2')
     ws4['Z2'] = "Attendant Care"
-    ws4['Z2'].font = black_font
-    ws4['Z2'].alignment = center_alignment
-    ws4['Z2'].number_format = '@'
+    ws4['Z2'].style = "subheader"
     ws4.merge_cells('AR2:AR2')
     ws4['AR2'] = "Cancer Cover"
-    ws4['AR2'].font = black_font
-    ws4['AR2'].alignment = center_alignment
-    ws4['AR2'].number_format = '@'
+    ws4['AR2'].style = "subheader"
     ws4.merge_cells('AS2:AV2')
     ws4['AS2'] = "Convalescence Benefit"
-    ws4['AS2'].font = black_font
-    ws4['AS2'].alignment = center_alignment
-    ws4['AS2'].number_format = '@'
+    ws4['AS2'].style = "subheader"
     ws4.merge_cells('AW2:BO2')
     ws4['AW2'] = "Critical Illness"
-    ws4['AW2'].font = black_font
-    ws4['AW2'].alignment = center_alignment
-    ws4['AW2'].number_format = '@'
+    ws4['AW2'].style = "subheader"
     ws4.merge_cells('BP2:CD2')
     ws4['BP2'] = "Daily Cash"
-    ws4['BP2'].font = black_font
-    ws4['BP2'].alignment = left_alignment
-    ws4['BP2'].number_format = '@'
+    ws4['BP2'].style = "header"
     ws4.merge_cells('CE2:CY2')
     ws4['CE2'] = "Dental Cover"
-    ws4['CE2'].font = black_font
-    ws4['CE2'].alignment = center_alignment
-    ws4['CE2'].number_format = '@'
+    ws4['CE2'].style = "subheader"
     ws4.merge_cells('CZ2:CZ2')
     ws4['CZ2'] = "Diabetic Cover"
-    ws4['CZ2'].font = black_font
-    ws4['CZ2'].alignment = center_alignment
-    ws4['CZ2'].number_format = '@'
+    ws4['CZ2'].style = "subheader"
     ws4.merge_cells('DA2:DG2')
     ws4['DA2'] = "Applicability of Doctor's Home Visit & Nursing Charges"
-    ws4['DA2'].font = black_font
-    ws4['DA2'].alignment = left_alignment
-    ws4['DA2'].number_format = '@'
+    ws4['DA2'].style = "header"
     ws4.merge_cells('DH2:DN2')
     ws4['DH2'] = "Education Fund"
-    ws4['DH2'].font = black_font
-    ws4['DH2'].alignment = center_alignment
-    ws4['DH2'].number_format = '@'  
+    ws4['DH2'].style = "subheader"
     ws4.merge_cells('DO2:ED2')
     ws4['DO2'] = "Funeral Expenses"
-    ws4['DO2'].font = black_font
-    ws4['DO2'].alignment = center_alignment
-    ws4['DO2'].number_format = '@'
+    ws4['DO2'].style = "subheader"
     ws4.merge_cells('EE2:ET2')
     ws4['EE2'] = "Get Well Benefit"
-    ws4['EE2'].font = black_font
-    ws4['EE2'].alignment = center_alignment
-    ws4['EE2'].number_format = '@'
+    ws4['EE2'].style = "subheader"
     ws4.merge_cells('EU2:FO2')
     ws4['EU2'] = "Hardship Critical Illness Cover"
-    ws4['EU2'].font = black_font
-    ws4['EU2'].alignment = center_alignment
-    ws4['EU2'].number_format = '@'
+    ws4['EU2'].style = "subheader"
     ws4.merge_cells('FP2:GH2')
     ws4['FP2'] = "Health Check-up"
-    ws4['FP2'].font = black_font
-    ws4['FP2'].alignment = center_alignment
-    ws4['FP2'].number_format = '@'
+    ws4['FP2'].style = "subheader"
     ws4.merge_cells('GI2:GI2')
     ws4['GI2'] = "Hypertension Cover"
-    ws4['GI2'].font = black_font
-    ws4['GI2'].alignment = center_alignment
-    ws4['GI2'].number_format = '@'
+    ws4['GI2'].style = "subheader"
     # Fixed the overlapping merge - this was causing issues
     ws4.merge_cells('GJ2:GQ2')
     ws4['GJ2'] = "Intensive Care Benefit"
-    ws4['GJ2'].font = black_font
-    ws4['GJ2'].alignment = center_alignment
-    ws4['GJ2'].number_format = '@'
+    ws4['GJ2'].style = "subheader"
     ws4.merge_cells('GR2:HH2')
     ws4['GR2'] = "Loss Of Pay"
-    ws4['GR2'].font = black_font
-    ws4['GR2'].alignment = center_alignment
-    ws4['GR2'].number_format = '@'
+    ws4['GR2'].style = "subheader"
     ws4.merge_cells('HI2:HO2')
     ws4['HI2'] = "Medical Evacuation"
-    ws4['HI2'].font = black_font
-    ws4['HI2'].alignment = center_alignment
-    ws4['HI2'].number_format = '@'
+    ws4['HI2'].style = "subheader"
     ws4.merge_cells('HP2:IF2')
     ws4['HP2'] = "Medical Second Opinion"
-    ws4['HP2'].font = black_font
-    ws4['HP2'].alignment = center_alignment
-    ws4['HP2'].number_format = '@'
+    ws4['HP2'].style = "subheader"
     ws4.merge_cells('IG2:IW2')
     ws4['IG2'] = "Non Medical Expense"
-    ws4['IG2'].font = black_font
-    ws4['IG2'].alignment = center_alignment
-    ws4['IG2'].number_format = '@'
+    ws4['IG2'].style = "subheader"
     ws4.merge_cells('IX2:KN2')
     ws4['IX2'] = "Out Patient Configuration"
-    ws4['IX2'].font = black_font
-    ws4['IX2'].alignment = center_alignment
-    ws4['IX2'].number_format = '@'
+    ws4['IX2'].style = "subheader"
     ws4.merge_cells('KO2:LO2')
     ws4['KO2'] = "Optical Cover"
-    ws4['KO2'].font = black_font
-    ws4['KO2'].alignment = center_alignment
-    ws4['KO2'].number_format = '@'      
+    ws4['KO2'].style = "subheader"
     # Fixed the cell reference - was using KP2 instead of LP2
     ws4.merge_cells('LP2:MF2')
     ws4['LP2'] = "Organ Donor Medical Expenses"
-    ws4['LP2'].font = black_font
-    ws4['LP2'].alignment = center_alignment
-    ws4['LP2'].number_format = '@'
+    ws4['LP2'].style = "subheader"
     ws4.merge_cells('MG2:MJ2')
     ws4['MG2'] = "Personal Accident Cover"
-    ws4['MG2'].font = black_font
-    ws4['MG2'].alignment = center_alignment
-    ws4['MG2'].number_format = '@'
+    ws4['MG2'].style = "subheader"
     ws4.merge_cells('MK2:MM2')
     ws4['MK2'] = "Pre Existing Disease Benefit"
-    ws4['MK2'].font = black_font
-    ws4['MK2'].alignment = center_alignment
-    ws4['MK2'].number_format = '@'
+    ws4['MK2'].style = "subheader"
     ws4.merge_cells('MN2:NJ2')
     ws4['MN2'] = "Psychiatric Cover"
-    ws4['MN2'].font = black_font
-    ws4['MN2'].alignment = center_alignment
-    ws4['MN2'].number_format = '@'
+    ws4['MN2'].style = "subheader"
     ws4.merge_cells('NK2:OC2')
     ws4['NK2'] = "Recovery Benefit"
-    ws4['NK2'].font = black_font
-    ws4['NK2'].alignment = center_alignment
-    ws4['NK2'].number_format = '@'
+    ws4['NK2'].style = "subheader"
     ws4.merge_cells('OD2:OS2')
     ws4['OD2'] = "Referral Hospital Care"
-    ws4['OD2'].font = black_font
-    ws4['OD2'].alignment = center_alignment
-    ws4['OD2'].number_format = '@'
+    ws4['OD2'].style = "subheader"
     ws4.merge_cells('OT2:PK2')
     ws4['OT2'] = "Surgical Benefit"
-    ws4['OT2'].font = black_font
-    ws4['OT2'].alignment = center_alignment
-    ws4['OT2'].number_format = '@'
+    ws4['OT2'].style = "subheader"
     ws4.merge_cells('PL2:PO2')
     ws4['PL2'] = "Top Up Cover"
-    ws4['PL2'].font = black_font
-    ws4['PL2'].alignment = center_alignment
-    ws4['PL2'].number_format = '@'
+    ws4['PL2'].style = "subheader"
     ws4.merge_cells('PP2:QF2')
     ws4['PP2'] = "Vaccination/Immunization Cover"
-    ws4['PP2'].font = black_font
-    ws4['PP2'].alignment = center_alignment
-    ws4['PP2'].number_format = '@'  
+    ws4['PP2'].style = "subheader"
 
     column_headers_row3 = ["Number of Trips", "Sum Insured", "% Limit Applicable On", "Limit Percentage", "Limit Amount", "Applicability",
     "Valid from last consultation", "Consultation days", "Valid from date of discharge", "Discharge days",
@@ -898,192 +823,8 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
     "% Applicable", "Amount Applicable", "Applicable Limit", "Action"]
 
     for col, header in enumerate(column_headers_row3, 1):
-            cell = ws4.cell(row=3, column=col, value=header)
-            cell.font = black_font
-            cell.alignment = left_alignment
-
-    if AddonCoverages_data:
-        # FLEXIBLE COLUMN MAPPING: You can decide which data goes in which column
-        # Just modify the column numbers and field names as needed
-        row_idx = 4  # Default row for data
-        
-        # Get all available data from different coverage types
-        all_data = {}
-        
-        # Collect Critical Illness data
-        if "Critical Illness" in AddonCoverages_data and AddonCoverages_data["Critical Illness"]:
-            ci_data = AddonCoverages_data["Critical Illness"][0] if isinstance(AddonCoverages_data["Critical Illness"], list) and len(AddonCoverages_data["Critical Illness"]) > 0 else AddonCoverages_data["Critical Illness"]
-            all_data.update(ci_data)
-        
-        # Collect Ambulance Cover data
-        if "Ambulance Cover" in AddonCoverages_data and AddonCoverages_data["Ambulance Cover"]:
-            amb_data = AddonCoverages_data["Ambulance Cover"][0] if isinstance(AddonCoverages_data["Ambulance Cover"], list) and len(AddonCoverages_data["Ambulance Cover"]) > 0 else AddonCoverages_data["Ambulance Cover"]
-            all_data.update(amb_data)
-        
-        # Collect Convalescence Benefit data
-        if "Convalescence Benefit" in AddonCoverages_data and AddonCoverages_data["Convalescence Benefit"]:
-            conv_data = AddonCoverages_data["Convalescence Benefit"][0] if isinstance(AddonCoverages_data["Convalescence Benefit"], list) and len(AddonCoverages_data["Convalescence Benefit"]) > 0 else AddonCoverages_data["Convalescence Benefit"]
-            all_data.update(conv_data)
-        
-        # Collect Daily Cash Cover data
-        if "Daily Cash Cover" in AddonCoverages_data and AddonCoverages_data["Daily Cash Cover"]:
-            daily_cash_data = AddonCoverages_data["Daily Cash Cover"][0] if isinstance(AddonCoverages_data["Daily Cash Cover"], list) and len(AddonCoverages_data["Daily Cash Cover"]) > 0 else AddonCoverages_data["Daily Cash Cover"]
-            all_data.update(daily_cash_data)
-        
-        # Collect Home Nursing Allowance data
-        if "Home Nursing Allowance" in AddonCoverages_data and AddonCoverages_data["Home Nursing Allowance"]:
-            home_nursing_data = AddonCoverages_data["Home Nursing Allowance"][0] if isinstance(AddonCoverages_data["Home Nursing Allowance"], list) and len(AddonCoverages_data["Home Nursing Allowance"]) > 0 else AddonCoverages_data["Home Nursing Allowance"]
-            all_data.update(home_nursing_data)
-        
-        # NOW YOU CAN MAP ANY FIELD TO ANY COLUMN
-        # Format: ws4.cell(row=row_idx, column=COLUMN_NUMBER, value=all_data.get("FIELD_NAME", ""))
-        #Ambulance Cover
-        try:
-            ws4.cell(row=row_idx, column=1, value=float(all_data.get("Ambulance_Number_of_Trips", ""))).number_format = "#,##0"
-        except (ValueError, TypeError):
-            ws4.cell(row=row_idx, column=1, value=all_data.get("Ambulance_Number_of_Trips", "")).number_format = "#,##0"
-        ws4.cell(row=row_idx, column=2, value=all_data.get("Ambulance_Sum_Insured", "")).number_format = "#,##0"
-        ws4.cell(row=row_idx, column=3, value=all_data.get("Ambulance_Limit_Applicable_On", "")).number_format = "@"
-        ws4.cell(row=row_idx, column=4, value=all_data.get("Ambulance_Limit_Percentage", "")).number_format = "0.00%"
-        try:
-            ws4.cell(row=row_idx, column=5, value=float(all_data.get("Ambulance_Limit_Amount", ""))).number_format = "#,##0"
-        except (ValueError, TypeError):
-            ws4.cell(row=row_idx, column=5, value=all_data.get("Ambulance_Limit_Amount", "")).number_format = "#,##0"
-        ws4.cell(row=row_idx, column=6, value=all_data.get("Ambulance_Applicability", "")).number_format = "@"
-        
-        #Convalescence Benefit
-        try:
-            ws4.cell(row=row_idx, column=45, value=float(all_data.get("Convalescence_Minimum_LOS_in_days", ""))).number_format = "#,##0"
-        except (ValueError, TypeError):
-            ws4.cell(row=row_idx, column=45, value=all_data.get("Convalescence_Minimum_LOS_in_days", "")).number_format = "#,##0"
-        ws4.cell(row=row_idx, column=46, value=all_data.get("Convalescence_Applicable_From", ""))
-        ws4.cell(row=row_idx, column=47, value=all_data.get("Convalescence_Sum_Insured", ""))
-        try:
-            ws4.cell(row=row_idx, column=48, value=float(all_data.get("Convalescence_Benefit_Amount", ""))).number_format = "#,##0"
-        except (ValueError, TypeError):
-            ws4.cell(row=row_idx, column=48, value=all_data.get("Convalescence_Benefit_Amount", "")).number_format = "#,##0"
-        
-        
-        
-        # Critical Illness - Check column 49 for yes/no logic
-        column_49_value = all_data.get("Over And Above Policy Sum Insured?", "")
-        ws4.cell(row=row_idx, column=49, value=column_49_value).number_format = "@"
-        
-        # Check if column 49 contains "yes" or "no" (case insensitive)
-        if column_49_value and str(column_49_value).lower() in ["yes", "no"]:
-            # If yes/no found, populate columns 49, 50, 64, 65, 66, 67, 68 with actual values
-            ws4.cell(row=row_idx, column=50, value=all_data.get("Survival Period Applicable1?", "Yes")).number_format = "@"
-            try:
-                ws4.cell(row=row_idx, column=64, value=float(all_data.get("Applicable_Limit_default", "500000"))).number_format = "#,##0"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=64, value=all_data.get("Applicable_Limit_default", "500000")).number_format = "#,##0"
-            try:
-                ws4.cell(row=row_idx, column=65, value=float(all_data.get("Maximum Limit Percentage", "0"))).number_format = "0.00%"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=65, value=all_data.get("Maximum Limit Percentage", "0")).number_format = "0.00%"
-            ws4.cell(row=row_idx, column=66, value=all_data.get("Maximum Limit", "")).number_format = "#,##0"
-            ws4.cell(row=row_idx, column=67, value=all_data.get("critical_Applicability", "Lower")).number_format = "@"
-            
-        else:
-            # If no yes/no value, leave columns 49, 50, 64, 65, 66, 67, 68 blank
-            ws4.cell(row=row_idx, column=50, value="")
-            ws4.cell(row=row_idx, column=64, value="")
-            ws4.cell(row=row_idx, column=65, value="")
-            ws4.cell(row=row_idx, column=66, value="")
-            ws4.cell(row=row_idx, column=67, value="")
-            
+            ws4.cell(row=3, column=col, value=header).style = "header"
 
-        # Daily Cash Cover mappings - Check column 69 for yes/no logic
-        column_69_value = all_data.get("DailyCash_Over_And_Above_Policy_Sum_Insured", "")
-        ws4.cell(row=row_idx, column=69, value=column_69_value).number_format = "@"
-        
-        # Check if column 69 contains "yes" or "no" (case insensitive)
-        if column_69_value and str(column_69_value).lower() in ["yes", "no"]:
-            # If yes/no found, populate columns 68, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82 with actual values
-            try:
-                ws4.cell(row=row_idx, column=68, value=float(all_data.get("DailyCash_Minimum_LOS_in_days", ""))).number_format = "#,##0"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=68, value=all_data.get("DailyCash_Minimum_LOS_in_days", "")).number_format = "#,##0"
-            try:
-                ws4.cell(row=row_idx, column=70, value=float(all_data.get("DailyCash_Max_Days_Per_Policy_year", ""))).number_format = "#,##0"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=70, value=all_data.get("DailyCash_Max_Days_Per_Policy_year", "")).number_format = "#,##0"
-            try:
-                ws4.cell(row=row_idx, column=71, value=float(all_data.get("DailyCash_Max_Days_Per_Illness", ""))).number_format = "#,##0"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=71, value=all_data.get("DailyCash_Max_Days_Per_Illness", "")).number_format = "#,##0"
-            ws4.cell(row=row_idx, column=72, value=all_data.get("DailyCash_Fixed_limit", "")).number_format = "@"
-            ws4.cell(row=row_idx, column=73, value=all_data.get("DailyCash_Sum_Insured_default", "500000"))
-            ws4.cell(row=row_idx, column=74, value=all_data.get("DailyCash_Threshold1", ""))
-            ws4.cell(row=row_idx, column=75, value=all_data.get("DailyCash_Sum Insured", "Yes")).number_format = "@"
-            try:
-                ws4.cell(row=row_idx, column=76, value=float(all_data.get("DailyCash_Daily_cash_percentage", "")))
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=76, value=all_data.get("DailyCash_Daily_cash_percentage", ""))
-            try:
-                ws4.cell(row=row_idx, column=77, value=float(all_data.get("DailyCash_Limit_Amount", ""))).number_format = "#,##0"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=77, value=all_data.get("DailyCash_Limit_Amount", "")).number_format = "#,##0"
-            ws4.cell(row=row_idx, column=78, value=all_data.get("DailyCash_Applicability", "Lower")).number_format = "@"
-            ws4.cell(row=row_idx, column=79, value=all_data.get("DailyCash_Open_range", "")).number_format = "@"
-            ws4.cell(row=row_idx, column=80, value=all_data.get("DailyCash_Waiting_Period_Days 1", ""))
-            try:
-                ws4.cell(row=row_idx, column=81, value=float(all_data.get("DailyCash_Daily_Limit_Range_From", ""))).number_format = "#,##0"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=81, value=all_data.get("DailyCash_Daily_Limit_Range_From", "")).number_format = "#,##0"
-            try:
-                ws4.cell(row=row_idx, column=82, value=float(all_data.get("DailyCash_Daily_Limit_Range_To", ""))).number_format = "#,##0"
-            except (ValueError, TypeError):
-                ws4.cell(row=row_idx, column=82, value=all_data.get("DailyCash_Daily_Limit_Range_To", "")).number_format = "#,##0"
-        else:
-            # If no yes/no value, leave columns 68, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82 blank
-            ws4.cell(row=row_idx, column=68, value="")
-            ws4.cell(row=row_idx, column=70, value="")
-            ws4.cell(row=row_idx, column=71, value="")
-            ws4.cell(row=row_idx, column=72, value="")
-            ws4.cell(row=row_idx, column=73, value="")
-            ws4.cell(row=row_idx, column=74, value="")
-            ws4.cell(row=row_idx, column=75, value="")
-            ws4.cell(row=row_idx, column=76, value="")
-            ws4.cell(row=row_idx, column=77, value="")
-            ws4.cell(row=row_idx, column=78, value="")
-            ws4.cell(row=row_idx, column=79, value="")
-            ws4.cell(row=row_idx, column=80, value="")
-            ws4.cell(row=row_idx, column=81, value="")
-            ws4.cell(row=row_idx, column=82, value="")
-
-        # Applicability of Doctor's Home Visit & Nursing Charges
-        ws4.cell(row=row_idx, column=105, value=all_data.get("Nursing_Applicable_On", "")).number_format = "@"
-        ws4.cell(row=row_idx, column=106, value=all_data.get("Nursing_Doctor_Nursing_Combined", "")).number_format = "@"
-        ws4.cell(row=row_idx, column=107, value=all_data.get("Nursing_Limit_Applicable_On", "")).number_format = "@"
-        ws4.cell(row=row_idx, column=108, value=all_data.get("Nursing_Limit_Percentage", ""))
-        try:
-            ws4.cell(row=row_idx, column=109, value=float(all_data.get("Nursing_Limit_Amount", ""))).number_format = "#,##0"
-        except (ValueError, TypeError):
-            ws4.cell(row=row_idx, column=109, value=all_data.get("Nursing_Limit_Amount", "")).number_format = "#,##0"
-        ws4.cell(row=row_idx, column=110, value=all_data.get("Nursing_Applicability", ""))
-        try:
-            ws4.cell(row=row_idx, column=111, value=float(all_data.get("Nursing_Days_Allowed", ""))).number_format = "#,##0"
-        except (ValueError, TypeError):
-            ws4.cell(row=row_idx, column=111, value=all_data.get("Nursing_Days_Allowed", "")).number_format = "#,##0"
-        # ADD MORE MAPPINGS HERE - Just copy and modify:
-        # ws4.cell(row=row_idx, column=16, value=all_data.get("Your Field Name", ""))
-        # ws4.cell(row=row_idx, column=17, value=all_data.get("Another Field", ""))
-        # ws4.cell(row=row_idx, column=18, value=all_data.get("Third Field", ""))
-        # ... and so on for any column you want
-        
-        # Available fields you can use:
-        # Critical Illness: "Over And Above Policy Sum Insured?", "Survival Period Applicable?", "Applicable Limit", "Sum Insured Per Person", "Maximum Limit", "Survival Period", "Maximum Limit Percentage"
-        # Ambulance Cover: "Sum Insured", "Number of Trips", "% Limit Applicable On", "Limit Amount", "Applicability", "Limit Percentage"
-        # Convalescence Benefit: "Sum Insured", "Minimum LOS in days", "Applicable From", "Benefit Amount"
-        # Daily Cash Cover: "DailyCash_Over_And_Above_Policy_Sum_Insured", "DailyCash_Max_Days_Per_Policy_year", "DailyCash_Max_Days_Per_Illness", "DailyCash_Fixed_limit", "DailyCash_Sum_Insured", "DailyCash_Threshold", "DailyCash_Limit_Amount", "DailyCash_Daily_Cash_Amount", "DailyCash_Daily_cash_percentage", "DailyCash_Minimum_Hospitalization_Days", "DailyCash_Minimum_LOS_in_days", "DailyCash_Maximum_Days_Per_Person", "DailyCash_Waiting_Period_Days", "DailyCash_Maternity_Exclusion", "DailyCash_First_Days_Exclusion", "DailyCash_Open_range"
-
-    
-    # Add data rows for sheet 4 (starting from row 4) with borders
-    for row in range(4, 5):  # Row 4 (you can extend this range as needed)
-        for col in range(1, 449):  # A to QF (1-448, so range needs to be 1-449)
-            cell = ws4.cell(row=row, column=col)
-            cell.border = thin_border
 
     # Set row heights for sheet 4
     ws4.row_dimensions[1].height = 18
@@ -1096,4 +837,180 @@ def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_da
     for col, width in enumerate(column_widths_sheet4, 1):
         ws4.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
 
+
+def to_number(value):
+    """float(value) when it converts, otherwise value unchanged"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+# How a column's source value is converted before it is written
+COLUMN_TYPES = {
+    "value": None,
+    "number": to_number,
+}
+
+# Covers whose first entry feeds the Addon Coverages row, merged in this order
+ADDON_COVERAGES_SOURCES = [
+    "Critical Illness", "Ambulance Cover", "Convalescence Benefit", "Daily Cash Cover", "Home Nursing Allowance",
+]
+
+# Data row of the Addon Coverages sheet, one entry per column:
+#   (column, source key, type, named style, default, gate)
+# The value is AddonCoverages field "source key" (or default), converted by
+# COLUMN_TYPES[type]. A named style of None keeps the bordered style of the
+# row. A column with a gate is only filled when the gate field is Yes or No
+# (any case) and is written blank otherwise. New columns only need a new entry.
+ADDON_COVERAGES_SCHEMA = [
+    # Ambulance Cover
+    (1, "Ambulance_Number_of_Trips", "number", "numeric", "", None),
+    (2, "Ambulance_Sum_Insured", "value", "numeric", "", None),
+    (3, "Ambulance_Limit_Applicable_On", "value", "text", "", None),
+    (4, "Ambulance_Limit_Percentage", "value", "percentage", "", None),
+    (5, "Ambulance_Limit_Amount", "number", "numeric", "", None),
+    (6, "Ambulance_Applicability", "value", "text", "", None),
+    # Convalescence Benefit
+    (45, "Convalescence_Minimum_LOS_in_days", "number", "numeric", "", None),
+    (46, "Convalescence_Applicable_From", "value", None, "", None),
+    (47, "Convalescence_Sum_Insured", "value", None, "", None),
+    (48, "Convalescence_Benefit_Amount", "number", "numeric", "", None),
+    # Critical Illness
+    (49, "Over And Above Policy Sum Insured?", "value", "text", "", None),
+    (50, "Survival Period Applicable1?", "value", "text", "Yes", "Over And Above Policy Sum Insured?"),
+    (64, "Applicable_Limit_default", "number", "numeric", "500000", "Over And Above Policy Sum Insured?"),
+    (65, "Maximum Limit Percentage", "number", "percentage", "0", "Over And Above Policy Sum Insured?"),
+    (66, "Maximum Limit", "value", "numeric", "", "Over And Above Policy Sum Insured?"),
+    (67, "critical_Applicability", "value", "text", "Lower", "Over And Above Policy Sum Insured?"),
+    # Daily Cash Cover
+    (68, "DailyCash_Minimum_LOS_in_days", "number", "numeric", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (69, "DailyCash_Over_And_Above_Policy_Sum_Insured", "value", "text", "", None),
+    (70, "DailyCash_Max_Days_Per_Policy_year", "number", "numeric", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (71, "DailyCash_Max_Days_Per_Illness", "number", "numeric", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (72, "DailyCash_Fixed_limit", "value", "text", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (73, "DailyCash_Sum_Insured_default", "value", None, "500000", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (74, "DailyCash_Threshold1", "value", None, "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (75, "DailyCash_Sum Insured", "value", "text", "Yes", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (76, "DailyCash_Daily_cash_percentage", "number", None, "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (77, "DailyCash_Limit_Amount", "number", "numeric", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (78, "DailyCash_Applicability", "value", "text", "Lower", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (79, "DailyCash_Open_range", "value", "text", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (80, "DailyCash_Waiting_Period_Days 1", "value", None, "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (81, "DailyCash_Daily_Limit_Range_From", "number", "numeric", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    (82, "DailyCash_Daily_Limit_Range_To", "number", "numeric", "", "DailyCash_Over_And_Above_Policy_Sum_Insured"),
+    # Applicability of Doctor's Home Visit & Nursing Charges
+    (105, "Nursing_Applicable_On", "value", "text", "", None),
+    (106, "Nursing_Doctor_Nursing_Combined", "value", "text", "", None),
+    (107, "Nursing_Limit_Applicable_On", "value", "text", "", None),
+    (108, "Nursing_Limit_Percentage", "value", None, "", None),
+    (109, "Nursing_Limit_Amount", "number", "numeric", "", None),
+    (110, "Nursing_Applicability", "value", None, "", None),
+    (111, "Nursing_Days_Allowed", "number", "numeric", "", None),
+]
+
+# The schema with the converters looked up once
+ADDON_COVERAGES_COLUMNS = [
+    (column, key, COLUMN_TYPES[kind], style, default, gate)
+    for column, key, kind, style, default, gate in ADDON_COVERAGES_SCHEMA
+]
+ADDON_COVERAGES_GATES = {gate for *_, gate in ADDON_COVERAGES_SCHEMA if gate}
+
+
+def write_addon_coverages_rows(ws4, AddonCoverages_data=None):
+    """The data row of the Addon Coverages sheet, written from ADDON_COVERAGES_SCHEMA"""
+    # Row 4 is already bordered by the header template
+    if not AddonCoverages_data:
+        return
+    row_idx = 4
+
+    # Fields of every cover in one dict
+    all_data = {}
+    for cover in ADDON_COVERAGES_SOURCES:
+        cover_data = AddonCoverages_data.get(cover)
+        if cover_data:
+            all_data.update(cover_data[0] if isinstance(cover_data, list) else cover_data)
+
+    open_gates = set()
+    for gate in ADDON_COVERAGES_GATES:
+        gate_value = all_data.get(gate, "")
+        if gate_value and str(gate_value).lower() in ("yes", "no"):
+            open_gates.add(gate)
+
+    get = all_data.get
+    for column, key, convert, style, default, gate in ADDON_COVERAGES_COLUMNS:
+        if gate and gate not in open_gates:
+            ws4.cell(row=row_idx, column=column, value="")
+            continue
+        value = get(key, default)
+        if convert:
+            value = convert(value)
+        cell = ws4.cell(row=row_idx, column=column, value=value)
+        if style:
+            cell.style = style
+
+
+# Sheet titles in workbook order with the functions writing their header and data rows
+SHEET_WRITERS = [
+    ("Eligibility", write_eligibility_header, write_eligibility_rows),
+    ("Primary Cover", write_primary_cover_header, write_primary_cover_rows),
+    ("Addon covers", write_addon_covers_header, write_addon_covers_rows),
+    ("Addon Coverages", write_addon_coverages_header, write_addon_coverages_rows),
+]
+
+# Header templates by sheet title, built on first use and reused for every workbook
+HEADER_TEMPLATES = {}
+
+
+def header_template(title, write_header):
+    """The SheetTemplate of a sheet's static header rows, recorded once per process"""
+    template = HEADER_TEMPLATES.get(title)
+    if template is None:
+        template = HEADER_TEMPLATES[title] = SheetTemplate.record(write_header, register_named_styles)
+    return template
+
+
+def create_comprehensive_excel_with_formatting(eligibility_data=None, primary_data=None, addon_data=None,
+                                               AddonCoverages_data=None, write_only=False, progress=None):
+    """
+    Create Excel file with exact format matching the reference image.
+    The static header rows of each sheet come from a prebuilt template; only the
+    data rows are written per call. With write_only=True the sheets are
+    streamed into a write-only workbook (see excel_streaming); it looks the
+    same but can only be saved, once.
+    progress, if given, is called with (sheets written, 4, sheet title) after each sheet.
+    Without the openpyxl internals the templates and streaming need
+    (excel_streaming.OPENPYXL_INTERNALS) the headers are written directly into a
+    normal workbook, whatever write_only says.
+    """
+    sheet_data = [eligibility_data, primary_data, addon_data, AddonCoverages_data]
+
+    if write_only and OPENPYXL_INTERNALS:
+        wb = openpyxl.Workbook(write_only=True)
+        register_named_styles(wb)
+        styles = StyleCache(wb)
+        for done, ((title, write_header, write_rows), data) in enumerate(zip(SHEET_WRITERS, sheet_data), 1):
+            buffer = SheetBuffer(wb.create_sheet(title), styles)
+            header_template(title, write_header).apply(buffer, styles)
+            write_rows(buffer, data)
+            buffer.flush()
+            if progress is not None:
+                progress(done, len(SHEET_WRITERS), title)
+        return wb
+
+    # Create a new workbook
+    wb = openpyxl.Workbook()
+    register_named_styles(wb)
+    styles = StyleCache(wb)
+    for done, ((title, write_header, write_rows), data) in enumerate(zip(SHEET_WRITERS, sheet_data), 1):
+        ws = wb.create_sheet(title)
+        if OPENPYXL_INTERNALS:
+            header_template(title, write_header).apply(ws, styles)
+        else:
+            write_header(ws)
+        write_rows(ws, data)
+        if progress is not None:
+            progress(done, len(SHEET_WRITERS), title)
+    # Remove the default sheet
+    wb.remove(wb['Sheet'])
     return wb
@@ -0,0 +1,151 @@
+"""
+Machine-readable exports of the extractor results, built without openpyxl.
+
+The four result sets of pipeline.run_extractors are exported as flat records:
+
+    eligibility      eligibility_data, one record per relationship
+    primary          primary_data
+    addon            addon_data
+    addon_coverages  AddonCoverages_data, one record per cover entry with the
+                     cover name in a leading "Cover" field
+
+in CSV, JSON Lines or Parquet, one file per result set:
+
+    files = export_bytes(results, "csv")       # {"eligibility.csv": b"...", ...}
+    write_exports(results, "out/policy", ["csv", "jsonl"])   # out/policy_eligibility.csv, ...
+    build_export_zip(results, "jsonl")         # the four files in one .zip
+
+Parquet needs pyarrow, which is optional; PARQUET_AVAILABLE tells whether it
+is installed. CSV and JSON Lines only use the standard library.
+"""
+import csv
+import io
+import json
+import zipfile
+from typing import Any, Callable, Dict, Iterable, List
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+PARQUET_AVAILABLE = pyarrow is not None
+
+
+# Export name of each result set and its key in the run_extractors results
+RESULT_SETS = [
+    ("eligibility", "eligibility_data"),
+    ("primary", "primary_data"),
+    ("addon", "addon_data"),
+    ("addon_coverages", "AddonCoverages_data"),
+]
+
+COVER_FIELD = "Cover"
+
+
+def result_records(data: Any) -> List[Dict[str, Any]]:
+    """One result set as a list of flat records"""
+    if not data:
+        return []
+    if isinstance(data, dict):
+        # AddonCoverages_data: {cover: [entry, ...] or entry}
+        records = []
+        for cover, entries in data.items():
+            for entry in entries if isinstance(entries, list) else [entries]:
+                record = {COVER_FIELD: cover}
+                record.update(entry)
+                records.append(record)
+        return records
+    return list(data)
+
+
+def field_names(records: Iterable[Dict[str, Any]]) -> List[str]:
+    """Every field of the records, in order of first appearance"""
+    names = {}
+    for record in records:
+        for name in record:
+            names.setdefault(name, None)
+    return list(names)
+
+
+def to_csv(records: List[Dict[str, Any]]) -> bytes:
+    output = io.StringIO(newline="")
+    writer = csv.DictWriter(output, fieldnames=field_names(records), restval="")
+    writer.writeheader()
+    writer.writerows(records)
+    return output.getvalue().encode("utf-8")
+
+
+def to_jsonl(records: List[Dict[str, Any]]) -> bytes:
+    return "".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records).encode("utf-8")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parquet_column(values: List[Any]):
+    """
+    A typed column: numeric when every non-blank value is a number (blanks
+    become nulls), text otherwise. The extractors mix numbers with "" for
+    missing values, which a single Parquet type cannot hold as is.
+    """
+    if any(_is_number(value) for value in values) and all(
+            _is_number(value) or value is None or value == "" for value in values):
+        return pyarrow.array([None if value == "" else value for value in values])
+    return pyarrow.array([None if value is None else str(value) for value in values], type=pyarrow.string())
+
+
+def to_parquet(records: List[Dict[str, Any]]) -> bytes:
+    if pyarrow is None:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+    names = field_names(records)
+    table = pyarrow.table({name: _parquet_column([record.get(name) for record in records]) for name in names})
+    output = io.BytesIO()
+    pyarrow.parquet.write_table(table, output)
+    return output.getvalue()
+
+
+EXPORT_FORMATS: Dict[str, Callable[[List[Dict[str, Any]]], bytes]] = {
+    "csv": to_csv,
+    "jsonl": to_jsonl,
+    "parquet": to_parquet,
+}
+
+
+def available_formats() -> List[str]:
+    """Export formats usable in this environment"""
+    return [name for name in EXPORT_FORMATS if name != "parquet" or PARQUET_AVAILABLE]
+
+
+def export_bytes(results: Dict[str, Any], export_format: str) -> Dict[str, bytes]:
+    """The four result sets in export_format, keyed by file name ("eligibility.csv", ...)"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{export_format}'; choose from {', '.join(EXPORT_FORMATS)}")
+    convert = EXPORT_FORMATS[export_format]
+    return {
+        f"{name}.{export_format}": convert(result_records(results.get(key)))
+        for name, key in RESULT_SETS
+    }
+
+
+def build_export_zip(results: Dict[str, Any], export_format: str) -> bytes:
+    """export_bytes(results, export_format) as one .zip, for a single download"""
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file_name, data in export_bytes(results, export_format).items():
+            archive.writestr(file_name, data)
+    return output.getvalue()
+
+
+def write_exports(results: Dict[str, Any], output_prefix: str, export_formats: Iterable[str]) -> List[str]:
+    """Write every result set in every format as <output_prefix>_<result set>.<format>; returns the paths"""
+    paths = []
+    for export_format in export_formats:
+        for file_name, data in export_bytes(results, export_format).items():
+            path = f"{output_prefix}_{file_name}"
+            with open(path, "wb") as handle:
+                handle.write(data)
+            paths.append(path)
+    return paths
@@ -0,0 +1,109 @@
+"""
+Policy-wide facts shared by every extractor.
+
+Several extractors need the same global values (the corporate floater sum
+insured, the Endt. No. 10 floater limit, which endorsements exist). Instead
+of each one searching the whole policy again, pipeline.run_extractors builds
+one DocumentFacts per policy and passes it to all of them. Each fact is
+computed on first access and then reused:
+
+    facts = DocumentFacts(text, index)
+    facts.sum_insured           # 500000, or None if the policy does not state it
+    facts.policy_sum_insured    # the same, falling back to DEFAULT_SUM_INSURED
+"""
+import re
+from functools import cached_property
+from typing import List, Optional, Tuple
+
+from endorsement_segmenter import ANY_SUB, EndorsementIndex, segment_endorsements
+from pattern_registry import register
+
+
+# Sum insured used for percentage calculations when the policy does not state one
+DEFAULT_SUM_INSURED = 500000
+
+CORPORATE_FLOATER = register("facts.corporate_floater", r'limit of Rs\.([\d,]+)/- as Corporate floater', re.IGNORECASE)
+FLOATER_LIMIT = register("facts.floater_limit", r'limit\s+of\s+Rs[\.:]?\s?([\d,]+).*?corporate\s+(?:buffer|floater)', re.IGNORECASE)
+
+# "Period of Insurance: 01/04/2025 to 31/03/2026", "Policy Period from 1-Apr-2025 till 31 March 2026"
+DATE = r'\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}|\d{1,2}(?:st|nd|rd|th)?[\s-][A-Za-z]{3,9},?[\s-]\d{4}'
+POLICY_PERIOD = register(
+    "facts.policy_period",
+    rf'(?:Period\s+of\s+Insurance|Policy\s+Period)\s*:?\s*(?:from\s+)?({DATE})\s*(?:to|till|-)\s*({DATE})',
+    re.IGNORECASE
+)
+
+
+def parse_amount(value: str) -> int:
+    """'5,00,000' -> 500000"""
+    return int(value.replace(",", ""))
+
+
+class DocumentFacts:
+    """Lazily computed facts about one policy text"""
+
+    def __init__(self, text: str, index: Optional[EndorsementIndex] = None):
+        self.text = text
+        self._index = index
+
+    @cached_property
+    def index(self) -> EndorsementIndex:
+        return self._index or segment_endorsements(self.text)
+
+    @cached_property
+    def corporate_floater(self) -> Optional[str]:
+        """The corporate floater amount as written ("5,00,000"), or None"""
+        match = CORPORATE_FLOATER.search(self.text)
+        return match.group(1) if match else None
+
+    @cached_property
+    def sum_insured(self) -> Optional[int]:
+        """Policy sum insured (the corporate floater limit), or None if not stated"""
+        return parse_amount(self.corporate_floater) if self.corporate_floater else None
+
+    @property
+    def policy_sum_insured(self) -> int:
+        """Sum insured for percentage calculations, DEFAULT_SUM_INSURED if not stated"""
+        return self.sum_insured or DEFAULT_SUM_INSURED
+
+    @cached_property
+    def floater_limit(self) -> Optional[int]:
+        """Corporate buffer/floater limit from Endt. No. 10, or None"""
+        endorsement_10_text = self.index.section(10, form="endt")
+        if not endorsement_10_text:
+            return None
+        match = FLOATER_LIMIT.search(endorsement_10_text)
+        return parse_amount(match.group(1)) if match else None
+
+    @cached_property
+    def endorsements(self) -> List[str]:
+        """Labels of the endorsements present, in document order ("1", "5(ii)", "12", ...)"""
+        labels = []
+        for header in self.index.headers:
+            if not header.number:
+                continue
+            label = f"{header.number}({header.sub})" if header.sub else header.number
+            if label not in labels:
+                labels.append(label)
+        return labels
+
+    def has_endorsement(self, number, sub=ANY_SUB, form: Optional[str] = "endt") -> bool:
+        return self.index.has(number, sub, form=form)
+
+    @cached_property
+    def policy_period(self) -> Tuple[str, str]:
+        """Policy start and end dates as written, or empty strings"""
+        match = POLICY_PERIOD.search(self.text)
+        return (match.group(1), match.group(2)) if match else ("", "")
+
+    @property
+    def policy_start_date(self) -> str:
+        return self.policy_period[0]
+
+    @property
+    def policy_end_date(self) -> str:
+        return self.policy_period[1]
+
+    def __repr__(self):
+        return f"DocumentFacts({len(self.text)} chars)"
+
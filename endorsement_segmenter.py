@@ -0,0 +1,188 @@
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from pattern_registry import PATTERNS, NamedPattern, register
+
+
+# One pattern that finds every marker the extractors care about in a single pass:
+#   - endorsement headers ("Endt. No. 5(ii)", "Endorsement No. 1")
+#   - loose "Endt." / "Endorsement" mentions (terminators for Special Conditions/Clauses)
+#   - the "Group Health Policy" page footer
+#   - named sections ("Special Clauses", "Special Conditions")
+MARKER_PATTERN = register(
+    "endorsements.marker",
+    r'(?P<header>(?P<form>Endt\.|Endorsement)\s*No\.\s*(?:(?P<number>\d+)\s*(?:\(\s*(?P<sub>[a-z]{1,4})\s*\))?)?)'
+    r'|(?P<loose>Endt\.|Endorsement)'
+    r'|(?P<footer>Group Health Policy)'
+    r'|(?P<named>Special\s+Clauses|Special\s+Conditions)',
+    re.IGNORECASE
+)
+WHITESPACE_RUN = register("endorsements.whitespace_run", r'\s+')
+
+ANY_SUB = object()
+
+
+def title_pattern_name(title: str) -> str:
+    return f"endorsements.title.{title}"
+
+
+def register_title(title: str) -> NamedPattern:
+    """
+    Register the pattern titled_section matches after an endorsement header;
+    call at import time, next to the module's other patterns
+    """
+    return register(title_pattern_name(title), r'\s*' + title, re.IGNORECASE)
+
+
+class Header:
+    """A single endorsement header found in the policy text"""
+
+    __slots__ = ("form", "number", "sub", "start", "number_end", "end")
+
+    def __init__(self, form: str, number: str, sub: str, start: int, number_end: int, end: int):
+        self.form = form
+        self.number = number
+        self.sub = sub
+        self.start = start
+        self.number_end = number_end
+        self.end = end
+
+    def __repr__(self):
+        label = f"{self.number}({self.sub})" if self.sub else f"{self.number}"
+        return f"Header({self.form} {label} @ {self.start})"
+
+
+class EndorsementIndex:
+    """
+    Index of endorsement and named-section spans built with a single walk over the text.
+    Every endorsement runs from its header up to the next "Endt. No." / "Endorsement No."
+    header, matching the lookahead the extractors used to apply with separate DOTALL scans.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.headers: List[Header] = []
+        self.named: Dict[str, List[Tuple[int, int]]] = {"special clauses": [], "special conditions": []}
+        self._header_starts: List[int] = []
+        self._loose_starts: List[int] = []
+        self._footer_starts: List[int] = []
+
+        for match in MARKER_PATTERN.finditer(text):
+            start = match.start()
+            if match.group("header"):
+                number = match.group("number") or ""
+                number_end = match.end("number") if number else match.end()
+                self.headers.append(Header(
+                    form="endt" if match.group("form").lower().startswith("endt") else "endorsement",
+                    number=number,
+                    sub=(match.group("sub") or "").lower(),
+                    start=start,
+                    number_end=number_end,
+                    end=match.end()
+                ))
+                self._header_starts.append(start)
+                self._loose_starts.append(start)
+            elif match.group("loose"):
+                self._loose_starts.append(start)
+            elif match.group("footer"):
+                self._footer_starts.append(start)
+            else:
+                name = WHITESPACE_RUN.sub(' ', match.group("named")).lower()
+                self.named[name].append((start, match.end()))
+
+    @staticmethod
+    def _next_stop(stops: List[int], position: int, default: int) -> int:
+        """Return the first stop at or after position, or default if there is none"""
+        idx = bisect_left(stops, position)
+        return stops[idx] if idx < len(stops) else default
+
+    def _header_end(self, header: Header) -> int:
+        """End of an endorsement body: the next header after this one, or end of text"""
+        return self._next_stop(self._header_starts, header.start + 1, len(self.text))
+
+    def find_headers(self, number, sub=ANY_SUB, form: Optional[str] = None) -> List[Header]:
+        """Return all headers for an endorsement number (and optional sub-letter/form) in document order"""
+        number = str(number)
+        return [
+            header for header in self.headers
+            if header.number == number
+            and (sub is ANY_SUB or header.sub == (sub or ""))
+            and (form is None or header.form == form)
+        ]
+
+    def has(self, number, sub=ANY_SUB, form: Optional[str] = None) -> bool:
+        """Check whether an endorsement is present in the policy"""
+        return bool(self.find_headers(number, sub, form))
+
+    def span(self, number, sub=ANY_SUB, form: Optional[str] = None, stop_at_footer: bool = False) -> Optional[Tuple[int, int]]:
+        """Return the (start, end) span of the first matching endorsement, or None"""
+        headers = self.find_headers(number, sub, form)
+        if not headers:
+            return None
+        header = headers[0]
+        end = self._header_end(header)
+        if stop_at_footer:
+            end = min(end, self._next_stop(self._footer_starts, header.end, len(self.text)))
+        return header.start, end
+
+    def section(self, number, sub=ANY_SUB, form: Optional[str] = None, stop_at_footer: bool = False) -> Optional[str]:
+        """Return the text of the first matching endorsement (header included), or None"""
+        span = self.span(number, sub, form, stop_at_footer)
+        if span is None:
+            return None
+        return self.text[span[0]:span[1]]
+
+    def titled_section(self, number, sub, title: str, stop_at_footer: bool = False) -> Optional[str]:
+        """
+        Return the first endorsement whose header is immediately followed by the given
+        title, which must have been registered with register_title
+        """
+        title_pattern = PATTERNS.get(title_pattern_name(title))
+        for header in self.find_headers(number, sub, form="endt"):
+            title_match = title_pattern.match(self.text, header.end)
+            if not title_match:
+                continue
+            end = self._header_end(header)
+            if stop_at_footer:
+                end = min(end, self._next_stop(self._footer_starts, title_match.end(), len(self.text)))
+            return self.text[header.start:end]
+        return None
+
+    def until_next_header(self, start: int, search_from: int) -> str:
+        """Return the text from start up to the first header at or after search_from"""
+        return self.text[start:self._next_stop(self._header_starts, search_from, len(self.text))]
+
+    def bodies(self, number, form: Optional[str] = None) -> List[str]:
+        """Return the text after the endorsement number for every occurrence of that endorsement"""
+        return [
+            self.text[header.number_end:self._header_end(header)]
+            for header in self.find_headers(number, form=form)
+        ]
+
+    def named_section(self, name: str, stop_at_headers_only: bool = False, stop_at_footer: bool = False,
+                      require_colon: bool = False, body_only: bool = False) -> Optional[str]:
+        """
+        Return a named section such as "Special Clauses" or "Special Conditions".
+        By default the section ends at the next "Endt." / "Endorsement" mention; with
+        stop_at_headers_only it only ends at a full "Endt. No." / "Endorsement No." header.
+        """
+        for start, heading_end in self.named.get(name.lower(), []):
+            body_start = heading_end
+            if require_colon:
+                if self.text[heading_end:heading_end + 1] != ":":
+                    continue
+                body_start = heading_end + 1
+            stops = self._header_starts if stop_at_headers_only else self._loose_starts
+            end = self._next_stop(stops, heading_end, len(self.text))
+            if stop_at_footer:
+                end = min(end, self._next_stop(self._footer_starts, heading_end, len(self.text)))
+            if body_only:
+                return self.text[body_start:end].strip()
+            return self.text[start:end]
+        return None
+
+
+def segment_endorsements(text: str) -> EndorsementIndex:
+    """Walk the policy text once and return the endorsement/section index"""
+    return EndorsementIndex(text)
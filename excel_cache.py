@@ -0,0 +1,92 @@
+"""
+In-memory cache of built workbooks.
+
+Entries are keyed by a SHA-256 over the four extractor results (serialized as
+canonical JSON) plus the Excel writer version, so the same extracted data is
+only turned into a workbook once per process, whichever upload, rerun or
+session asks for it. Least-recently-used entries are dropped once the cache
+holds more than its entry cap.
+
+    EXCEL_CACHE_SIZE=0 disables the cache
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("EXCEL_CACHE_SIZE", "32"))
+
+
+class WorkbookCache:
+    """Workbook bytes keyed by result hash, with LRU eviction"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(data: Sequence[Any], version: str) -> str:
+        """SHA-256 of the extractor results in canonical JSON, salted with the writer version"""
+        digest = hashlib.sha256(json.dumps(list(data), sort_keys=True, ensure_ascii=False, default=str)
+                                .encode("utf-8"))
+        digest.update(b"\0" + version.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached workbook for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: bytes) -> None:
+        """Store a workbook, then evict the least recently used ones if over the entry cap"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> int:
+        """Drop every cached workbook and return how many were removed"""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the current footprint"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size_bytes": sum(len(entry) for entry in self._entries.values()),
+                "max_entries": self.max_entries,
+            }
+
+
+_default_cache: Optional[WorkbookCache] = None
+
+
+def get_default_cache() -> WorkbookCache:
+    """Return the process-wide cache configured from the environment"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = WorkbookCache()
+    return _default_cache
@@ -0,0 +1,411 @@
+"""
+Streaming (write-only) output for the workbook writer.
+
+openpyxl's normal mode keeps every cell of every sheet in memory and hashes
+the Font / Fill / Border / Alignment objects again on every style assignment.
+In write-only mode rows are serialized as they are appended, but they must be
+appended in order and cells cannot be revisited. The sheet writers in
+create_comprehensive_excel_with_formatting fill rows out of order and restyle
+cells, so they write into a SheetBuffer instead:
+
+    wb = openpyxl.Workbook(write_only=True)
+    styles = StyleCache(wb)
+    buffer = SheetBuffer(wb.create_sheet("Eligibility"), styles)
+    write_eligibility_header(buffer)
+    write_eligibility_rows(buffer, eligibility_data)
+    buffer.flush()
+
+SheetBuffer supports the part of the Worksheet API the writers use (cell(),
+ws["A1"], merge_cells, row/column dimensions, named styles) and keeps plain
+cells until flush() streams them row by row. Every distinct combination of
+named style and style objects is resolved to the workbook's style indices once
+(StyleCache), so streamed cells only reuse a prebuilt style array. Merges reproduce the border handling
+of Worksheet.merge_cells, so the streamed sheet looks the same as one built
+in normal mode.
+
+The header rows of a sheet are the same for every policy. A SheetTemplate
+records them once per process (cells with their final styles after merging,
+merges, row heights, column widths) and copies them into each new sheet,
+write-only or normal, before its data rows are written:
+
+    template = SheetTemplate.record(write_eligibility_header, register_named_styles)
+    template.apply(buffer, styles)        # or template.apply(worksheet, styles)
+    write_eligibility_rows(buffer, eligibility_data)
+
+Resolving styles once relies on openpyxl internals (cell._style, StyleArray,
+Worksheet._cells, Workbook._named_styles); requirements.txt pins the openpyxl
+version this was tested with. OPENPYXL_INTERNALS is False when the installed
+openpyxl lacks them, and the workbook writer then uses only the public API
+(normal mode, headers written cell by cell).
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import openpyxl
+from openpyxl.cell import MergedCell, WriteOnlyCell
+from openpyxl.styles import Border
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple, get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.merge import MergedCellRange
+
+try:
+    from openpyxl.styles.cell_style import StyleArray
+except ImportError:
+    # Private module; see OPENPYXL_INTERNALS
+    StyleArray = None
+
+
+# What a cell without an explicit border has in normal mode
+DEFAULT_BORDER = Border()
+
+# The named style every cell starts with
+NORMAL_STYLE = "Normal"
+
+STYLE_ATTRIBUTES = ("font", "fill", "border", "alignment", "number_format")
+
+
+def _internals_available() -> bool:
+    """Whether the installed openpyxl has the private attributes SheetBuffer and SheetTemplate use"""
+    if StyleArray is None:
+        return False
+    try:
+        workbook = openpyxl.Workbook()
+        worksheet = workbook.active
+        cell = worksheet.cell(row=1, column=1)
+        cell.border = DEFAULT_BORDER
+        streamed = WriteOnlyCell(worksheet)
+        streamed.border = DEFAULT_BORDER
+        return (isinstance(cell._style, StyleArray) and isinstance(streamed._style, StyleArray)
+                and isinstance(worksheet._cells, dict) and NORMAL_STYLE in workbook._named_styles.names)
+    except (AttributeError, TypeError):
+        return False
+
+
+OPENPYXL_INTERNALS = _internals_available()
+
+
+class BufferedCell:
+    """Value, named style and style objects of one cell until its row is streamed"""
+
+    __slots__ = ("value", "_style_name") + STYLE_ATTRIBUTES
+
+    def __init__(self, value: Any = None):
+        self.value = value
+        self._style_name = NORMAL_STYLE
+        self.font = None
+        self.fill = None
+        self.border = None
+        self.alignment = None
+        self.number_format = None
+
+    @property
+    def style(self) -> str:
+        return self._style_name
+
+    @style.setter
+    def style(self, name: str) -> None:
+        # Like Cell.style, a named style replaces everything set on the cell so far
+        self._style_name = name
+        self.font = None
+        self.fill = None
+        self.border = None
+        self.alignment = None
+        self.number_format = None
+
+    @property
+    def has_style(self) -> bool:
+        return (self._style_name != NORMAL_STYLE or self.font is not None or self.fill is not None
+                or self.border is not None or self.alignment is not None or self.number_format is not None)
+
+    def copy(self) -> "BufferedCell":
+        cell = BufferedCell(self.value)
+        cell._style_name = self._style_name
+        cell.font = self.font
+        cell.fill = self.fill
+        cell.border = self.border
+        cell.alignment = self.alignment
+        cell.number_format = self.number_format
+        return cell
+
+
+class StyleCache:
+    """
+    Style arrays of one write-only workbook, keyed by the identity of the style
+    objects. The writers share a handful of Font / Fill / Border / Alignment
+    objects, so each combination is registered with the workbook (and hashed)
+    only once instead of once per cell.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._arrays: Dict[Tuple, Any] = {}
+        # Keeps the keyed objects alive so their ids stay unique
+        self._objects: List[Tuple] = []
+        self._combined: Dict[Tuple[int, int], Border] = {}
+        self._named_borders: Dict[str, Border] = {}
+
+    def style_array(self, cell: BufferedCell):
+        """The workbook style array for cell's styles, or None if it has none"""
+        key = (cell._style_name, id(cell.font), id(cell.fill), id(cell.border), id(cell.alignment),
+               cell.number_format)
+        array = self._arrays.get(key)
+        if array is None:
+            styles = tuple(getattr(cell, name) for name in STYLE_ATTRIBUTES)
+            if not cell.has_style:
+                return None
+            scratch = WriteOnlyCell(_StyleParent(self.workbook))
+            if cell._style_name != NORMAL_STYLE:
+                scratch.style = cell._style_name
+            for name, style in zip(STYLE_ATTRIBUTES, styles):
+                if style is not None:
+                    setattr(scratch, name, style)
+            array = scratch._style
+            self._arrays[key] = array
+            self._objects.append(styles)
+        return array
+
+    def border_of(self, cell: BufferedCell) -> Border:
+        """The border cell is drawn with: its own, else its named style's"""
+        if cell.border is not None:
+            return cell.border
+        if cell._style_name == NORMAL_STYLE:
+            return DEFAULT_BORDER
+        border = self._named_borders.get(cell._style_name)
+        if border is None:
+            border = self._named_borders[cell._style_name] = self.workbook._named_styles[cell._style_name].border
+        return border
+
+    def add_borders(self, border: Border, other: Border) -> Border:
+        """border + other as Worksheet.merge_cells combines them, computed once per pair"""
+        key = (id(border), id(other))
+        combined = self._combined.get(key)
+        if combined is None:
+            combined = border + other
+            self._combined[key] = combined
+            self._objects.append((border, other, combined))
+        return combined
+
+
+class _StyleParent:
+    """Stands in for a worksheet so a scratch cell can register styles with the workbook"""
+
+    __slots__ = ("parent",)
+
+    def __init__(self, workbook):
+        self.parent = workbook
+
+
+class SheetBuffer:
+    """Collects cells for a write-only worksheet and streams them in row order on flush()"""
+
+    def __init__(self, worksheet, styles: StyleCache):
+        self.worksheet = worksheet
+        self.styles = styles
+        self._rows: Dict[int, Dict[int, BufferedCell]] = {}
+        # Next row the write-only worksheet will write
+        self._next_row = 1
+        self._side_borders: Dict[Tuple, Tuple] = {}
+
+    @property
+    def title(self) -> str:
+        return self.worksheet.title
+
+    @property
+    def row_dimensions(self):
+        return self.worksheet.row_dimensions
+
+    @property
+    def column_dimensions(self):
+        return self.worksheet.column_dimensions
+
+    def cell(self, row: int, column: int, value: Any = None) -> BufferedCell:
+        if row < self._next_row:
+            raise ValueError(f"Row {row} of '{self.title}' has already been written")
+        cells = self._rows.get(row)
+        if cells is None:
+            cells = self._rows[row] = {}
+        cell = cells.get(column)
+        if cell is None:
+            cell = cells[column] = BufferedCell()
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def __getitem__(self, coordinate: str) -> BufferedCell:
+        row, column = coordinate_to_tuple(coordinate)
+        return self.cell(row, column)
+
+    def __setitem__(self, coordinate: str, value: Any) -> None:
+        self[coordinate].value = value
+
+    def merge_cells(self, range_string: str) -> None:
+        """Merge like Worksheet.merge_cells: only the top-left cell keeps its content, edge cells get its borders"""
+        cell_range = CellRange(range_string)
+        self.worksheet.merged_cells.add(cell_range)
+        add_borders = self.styles.add_borders
+        border_of = self.styles.border_of
+
+        start = self.cell(cell_range.min_row, cell_range.min_col)
+        end = self._rows.get(cell_range.max_row, {}).get(cell_range.max_col)
+        if end is not None:
+            end_border = border_of(end)
+            start.border = add_borders(border_of(start), self._side_border("right", end_border.right, "bottom",
+                                                                              end_border.bottom))
+
+        # Everything but the top-left cell is replaced by an empty merged cell
+        cells = cell_range.cells
+        next(cells)
+        for row, column in cells:
+            self._rows.setdefault(row, {})[column] = BufferedCell()
+
+        start_border = border_of(start)
+        for name in ("top", "left", "right", "bottom"):
+            side = getattr(start_border, name)
+            if side and side.style is None:
+                continue
+            border = self._side_border(name, side)
+            for row, column in getattr(cell_range, name):
+                cell = self.cell(row, column)
+                cell.border = add_borders(border_of(cell), border)
+
+    def _side_border(self, name: str, side, other_name: Optional[str] = None, other_side=None) -> Border:
+        """Border(name=side[, other_name=other_side]), one object per distinct sides"""
+        key = (name, id(side), other_name, id(other_side))
+        cached = self._side_borders.get(key)
+        if cached is None:
+            sides = {name: side}
+            if other_name:
+                sides[other_name] = other_side
+            # The sides are kept with the border so their ids stay unique
+            cached = self._side_borders[key] = (Border(**sides), side, other_side)
+        return cached[0]
+
+    def take_rows(self, first_row: int) -> List[Dict[int, BufferedCell]]:
+        """Remove and return the buffered rows from first_row on that hold a value, in row order"""
+        rows = []
+        for row_index in sorted(self._rows):
+            if row_index < first_row:
+                continue
+            cells = self._rows.pop(row_index)
+            if any(cell.value is not None and cell.value != "" for cell in cells.values()):
+                rows.append(cells)
+        return rows
+
+    def append_row(self, cells: Dict[int, BufferedCell]) -> int:
+        """Buffer cells (by column) as the row below everything buffered or written so far; returns its index"""
+        row_index = max(self._next_row, max(self._rows, default=0) + 1)
+        self._rows[row_index] = cells
+        return row_index
+
+    def flush(self) -> None:
+        """Stream every buffered row to the worksheet; rows up to the last one are then closed"""
+        worksheet = self.worksheet
+        style_array = self.styles.style_array
+        for row_index in sorted(self._rows):
+            while self._next_row < row_index:
+                worksheet.append([])
+                self._next_row += 1
+            cells = self._rows[row_index]
+            row: List[Optional[WriteOnlyCell]] = [None] * max(cells, default=0)
+            for column, buffered in cells.items():
+                array = style_array(buffered)
+                if buffered.value is None and array is None:
+                    continue
+                cell = WriteOnlyCell(worksheet, buffered.value)
+                if array is not None:
+                    # Shared, not copied: the cell is serialized right away and never restyled
+                    cell._style = array
+                row[column - 1] = cell
+            worksheet.append(row)
+            self._next_row += 1
+        self._rows.clear()
+
+
+class SheetTemplate:
+    """
+    The static top of a sheet, written once by write_header into a scratch
+    SheetBuffer (SheetTemplate.record) and copied into every sheet it is
+    applied to. The cells keep the borders their merges gave them, so applying
+    a template does no merge formatting.
+    """
+
+    __slots__ = ("rows", "merged", "row_heights", "column_widths", "_merged_cells")
+
+    def __init__(self, rows: List[Tuple[int, List[Tuple[int, BufferedCell]]]], merged: List[str],
+                 row_heights: Dict[int, float], column_widths: Dict[int, float]):
+        self.rows = rows
+        self.merged = merged
+        self.row_heights = row_heights
+        self.column_widths = column_widths
+        # Cells covered by a merge other than its top-left one
+        self._merged_cells = set()
+        for coord in self.merged:
+            cells = CellRange(coord).cells
+            next(cells)
+            self._merged_cells.update(cells)
+
+    @classmethod
+    def record(cls, write_header: Callable[[Any], None], register_styles: Callable[[Any], None]) -> "SheetTemplate":
+        """Run write_header once on a scratch sheet of a workbook prepared by register_styles"""
+        # Never saved and never appended to, so it opens no temporary file
+        workbook = openpyxl.Workbook(write_only=True)
+        register_styles(workbook)
+        worksheet = workbook.create_sheet()
+        buffer = SheetBuffer(worksheet, StyleCache(workbook))
+        write_header(buffer)
+        return cls(
+            [(row, sorted(cells.items())) for row, cells in sorted(buffer._rows.items())],
+            [cell_range.coord for cell_range in worksheet.merged_cells.sorted()],
+            {index: dimension.height for index, dimension in worksheet.row_dimensions.items()
+             if dimension.height is not None},
+            {column_index_from_string(letter): dimension.width
+             for letter, dimension in worksheet.column_dimensions.items()},
+        )
+
+    def part(self, first_row: int = 1, last_row: Optional[int] = None, column_offset: int = 0) -> "SheetTemplate":
+        """The rows first_row..last_row (merges inside them included), moved column_offset columns right"""
+        last_row = last_row or max((row for row, _ in self.rows), default=0)
+        rows = [
+            (row, [(column + column_offset, cell) for column, cell in cells])
+            for row, cells in self.rows if first_row <= row <= last_row
+        ]
+        merged = []
+        for coord in self.merged:
+            cell_range = CellRange(coord)
+            if first_row <= cell_range.min_row and cell_range.max_row <= last_row:
+                cell_range.shift(col_shift=column_offset)
+                merged.append(cell_range.coord)
+        row_heights = {row: height for row, height in self.row_heights.items() if first_row <= row <= last_row}
+        column_widths = {column + column_offset: width for column, width in self.column_widths.items()}
+        return SheetTemplate(rows, merged, row_heights, column_widths)
+
+    def apply(self, sheet, styles: StyleCache) -> None:
+        """Copy the template into an empty SheetBuffer or normal Worksheet of styles' workbook"""
+        for index, height in self.row_heights.items():
+            sheet.row_dimensions[index].height = height
+        for column, width in self.column_widths.items():
+            sheet.column_dimensions[get_column_letter(column)].width = width
+
+        if isinstance(sheet, SheetBuffer):
+            merged_cells = sheet.worksheet.merged_cells
+            for coord in self.merged:
+                merged_cells.add(CellRange(coord))
+            for row, cells in self.rows:
+                # Copies: the data writers may restyle cells of the last template row
+                sheet._rows[row] = {column: cell.copy() for column, cell in cells}
+            return
+
+        # Normal worksheet: set the resolved style arrays instead of assigning style objects
+        style_array = styles.style_array
+        merged_cells = self._merged_cells
+        worksheet_cells = sheet._cells
+        for row, cells in self.rows:
+            for column, buffered in cells:
+                if (row, column) in merged_cells:
+                    cell = worksheet_cells[row, column] = MergedCell(sheet, row, column)
+                else:
+                    cell = sheet.cell(row=row, column=column, value=buffered.value)
+                array = style_array(buffered)
+                if array is not None:
+                    cell._style = StyleArray(array)
+        for coord in self.merged:
+            sheet.merged_cells.add(MergedCellRange(sheet, coord))
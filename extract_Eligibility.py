@@ -1,5 +1,321 @@
+import logging
 import re
-from typing import List, Dict
+from typing import List, Dict, Optional
+from app_logging import get_logger
+from document_facts import DEFAULT_SUM_INSURED, DocumentFacts
+from endorsement_segmenter import EndorsementIndex, segment_endorsements
+from pattern_registry import register, register_fallbacks, register_list
+
+logger = get_logger(__name__)
+
+# Age ranges (Endt. No. 1)
+EMPLOYEE_AGE_RANGE = register("eligibility.employee_age_range", r'employee.*?(?:age|years?)\s*(?:between|from|range)?\s*(\d+)\s*(?:to|-)\s*(\d+)', re.IGNORECASE)
+CHILDREN_AGE_RANGE = register("eligibility.children_age_range", r'(?:children|dependent).*?(?:age|years?)\s*(?:between|from|range)?\s*(\d+)\s*(?:to|-)\s*(\d+)', re.IGNORECASE)
+CHILDREN_MIN_DAYS = register("eligibility.children_min_days", r'over\s+(\d+)\s+days?', re.IGNORECASE)
+PARENTS_AGE_RANGE = register("eligibility.parents_age_range", r'(?:parents?|father|mother).*?(?:age|years?)\s*(?:between|from|range)?\s*(\d+)\s*(?:to|-)\s*(\d+)', re.IGNORECASE)
+
+# Room, Boarding and ICU percentages (Endt. No. 5(i)), tried in order
+ROOM_BOARDING_PATTERNS = register_fallbacks("eligibility.room_boarding", [
+    r'Room,\s*Boarding\s+Expenses.*?(\d+)%\s+of\s+the\s+Sum\s+Insured\s+per\s+day',
+    r'Room.*?Boarding.*?(\d+)%\s+of\s+the\s+Sum\s+Insured',
+    r'Room.*?Boarding.*?(\d+)%',
+    r'Room,\s*Boarding.*?(\d+)%'
+], re.IGNORECASE | re.DOTALL)
+
+ICU_PATTERNS = register_fallbacks("eligibility.icu", [
+    r'Intensive\s+Care\s+Unit.*?(\d+)%\s+of\s+the\s+Sum\s+Insured\s+per\s+day',
+    r'Intensive\s+Care.*?(\d+)%\s+of\s+the\s+Sum\s+Insured',
+    r'Intensive\s+Care.*?(\d+)%',
+    r'ICU.*?(\d+)%',
+    r'Intensive.*?(\d+)%'
+], re.IGNORECASE | re.DOTALL)
+
+# Endt. No. 5(ii) format detection
+MERGED_CONDITIONS_ROW = register("eligibility.merged_conditions_row", r'Balloon\s*Sinsuplasty,.*?bronchical\s+thermoplasty,.*?vaporization.*?intra\s+operative\s+neuro\s+monitoring,.*?Intra\s+vitreal\s+injections', re.IGNORECASE | re.DOTALL)
+MERGED_CONDITION_HINT = register("eligibility.merged_condition_hint", r'(?:Treatment\s+of\s+mental\s+illness.*?neurodegenerative|Oral\s+Chemotherapy.*?Immunotherapy.*?monoclonal)', re.IGNORECASE | re.DOTALL)
+
+
+# Merged format (Endt. No. 5(ii))
+def register_condition(key: str, name: str, patterns: List[str]) -> Dict:
+    """
+    Register a merged-format condition's name patterns together with the variants
+    built from each of them: the rest of the line after the condition ("context")
+    and the first INR/Rs amount after it ("amount").
+    """
+    flags = re.IGNORECASE | re.DOTALL
+    return {
+        "name": name,
+        "patterns": register_list(f"eligibility.{key}", patterns, flags),
+        "context_patterns": register_list(f"eligibility.{key}_context",
+                                          [pattern + r'.*?(?:\n|$)' for pattern in patterns], flags),
+        "amount_patterns": register_list(f"eligibility.{key}_amount",
+                                         [pattern + r'.*?(?:INR\.?|Rs\.?)\s*([\d,]+)' for pattern in patterns], flags),
+        "percentage_pattern": register(f"eligibility.{key}_percentage",
+                                       rf'{name.lower().replace(" ", ".*?")}.*?(\d+)%\s+of\s+the\s+sum\s+insured', flags),
+    }
+
+
+# Conditions in the order they appear in the input
+MERGED_CONDITIONS = [
+    register_condition(
+        "cataract",
+        "Cataract",
+        [
+            r'\bCataract\b',
+            r'Treatment\s*\n\s*Cataract',
+            r'Treatment\s+Cataract',
+            r'Cataract\s+Nil\s+Capping',
+            r'Cataract.*?Nil\s+Capping',
+            r'Cataract\s*\|.*?Nil\s+Capping',
+            r'Cataract\s*\|.*?Nil'
+        ]
+    ),
+    register_condition(
+        "mental_illness",
+        "Treatment of mental illness, stress or psychological disorders and neurodegenerative disorders",
+        [
+            r'Treatment\s+of\s+mental\s+illness,?\s+stress\s+or\s+psychological\s+disorders\s+and\s+neurodegenerative\s+disorders',
+            r'Treatment\s+of\s+mental\s+illness,\s*stress\s*or\s*psychological\s*disorders\s*and\s*neurodegenerative\s*disorders',
+            r'Treatment\s+of\s+mental\s+illness.*?neurodegenerative\s+disorders',
+            r'Treatment\s+of\s+mental\s+illness.*?psychological\s+disorders.*?neurodegenerative\s+disorders',
+            r'mental\s+illness.*?psychological\s+disorders.*?neurodegenerative\s+disorders',
+            r'Treatment\s+of\s+mental\s+illness.*?stress.*?psychological.*?neurodegenerative',
+            r'mental\s+illness.*?stress.*?psychological.*?neurodegenerative'
+        ]
+    ),
+    register_condition(
+        "balloon_group",
+        "Balloon Sinsuplasty, bronchical thermoplasty, vaporization of prostate(green laser treatment), intra operative neuro monitoring, Intra vitreal injections",
+        [
+            r'Balloon\s*Sinsuplasty,\s*bronchical\s+thermoplasty,\s*vaporization\s+of\s+prostate\s*\([^)]*\),?\s*intra\s+operative\s+neuro\s+monitoring,?\s*Intra\s+vitreal\s+injections',
+            r'Balloon\s*Sinsuplasty,\s*bronchical\s+thermoplasty,\s*vaporization.*?intra\s+operative\s+neuro\s+monitoring.*?Intra\s+vitreal\s+injections',
+            r'Balloon.*?thermoplasty.*?vaporization.*?monitoring.*?injections',
+            r'Balloon\s*Sinsuplasty,.*?bronchical\s+thermoplasty,.*?vaporization.*?intra\s+operative\s+neuro\s+monitoring.*?Intra\s+vitreal\s+injections'
+        ]
+    ),
+    register_condition(
+        "stem_cell",
+        "Stem Cell therapy",
+        [
+            r'Stem\s+Cell\s+therapy\s*-\s*Hematopoietic\s+stem\s+cells\s+for\s+bone\s+marrow\s+transplant\s+for\s+haematological\s+conditions\s+to\s+be\s+covered',
+            r'Stem\s+Cell\s+therapy\s*-\s*Hematopoietic\s+stem\s+cells\s+for\s+bone\s+marrow\s+transplant\s+for\s+h[ae]ematological\s+conditions\s+to\s+be\s+covered',
+            r'Stem\s+Cell\s+therapy.*?Hematopoietic.*?bone\s+marrow\s+transplant.*?haematological\s+conditions.*?covered',
+            r'Stem\s+Cell\s+therapy.*?bone\s+marrow\s+transplant.*?covered',
+            r'Stem\s+Cell\s+therapy\s*-\s*Hematopoietic.*?bone.*?marrow.*?transplant.*?haematological.*?conditions.*?covered',
+            r'Stem\s+Cell\s+therapy.*?Hematopoietic.*?transplant.*?conditions.*?covered',
+            r'Stem\s+Cell\s+therapy.*?bone\s+marrow.*?transplant.*?covered',
+            r'Stem\s+Cell\s+therapy.*?haematological.*?conditions.*?covered',
+            r'Stem\s+Cell\s+therapy'
+        ]
+    ),
+    register_condition(
+        "chemotherapy",
+        "Oral Chemotherapy, Immunotherapy(monoclonal antibody to be given as injection)",
+        [
+            r'Oral\s+Chemotherapy,?\s+Immunotherapy\s*\(\s*monoclonal\s+antibody\s+to\s+be\s+given\s+as\s+injection\s*\)',
+            r'Oral\s+Chemotherapy,?\s+Immunotherapy\s*\([^)]*monoclonal[^)]*\)',
+            r'Oral\s+Chemotherapy,?\s+Immunotherapy\s*\([^)]*\)',
+            r'Oral\s+Chemotherapy,?\s+Immunotherapy',
+            r'Oral\s+Chemotherapy.*?Immunotherapy.*?monoclonal.*?antibody',
+            r'Oral\s+Chemotherapy.*?Immunotherapy.*?injection',
+            r'Oral\s+Chemotherapy.*?Immunotherapy'
+        ]
+    )
+]
+
+# Percentage-of-sum-insured pattern by lower-cased merged condition name
+PERCENTAGE_PATTERN_BY_CONDITION = {condition["name"].lower(): condition["percentage_pattern"] for condition in MERGED_CONDITIONS}
+
+
+# Amounts next to a condition, tried in order
+AMOUNT_PATTERNS_IN_CONTEXT = register_fallbacks("eligibility.amount_in_context", [
+    r'sublimit\s+of\s+(\d+)',  # "sublimit of 30000"
+    r'(?:INR\.?|Rs\.?)\s*([\d,]+)/-',  # "Rs.100000/-"
+    r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)',  # "maximum of Rs.100000"
+    r'(\d+)\s*during\s+the\s+Period\s+of\s+Insurance',  # "100000 during the Period of Insurance"
+    r'(?:INR\.?|Rs\.?)\s*([\d,]+)',  # General amount pattern
+], re.IGNORECASE, combine=False)
+
+# Amounts anywhere in the section, tried in order
+AMOUNT_PATTERNS = register_list("eligibility.amount_in_section", [
+    r'sublimit\s+of\s+(\d+)',  # "sublimit of 30000"
+    r'(?:INR\.?|Rs\.?)\s*([\d,]+)/-',  # "Rs.100000/-"
+    r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)',  # "maximum of Rs.100000"
+    r'(?:INR\.?|Rs\.?)\s*([\d,]+)',  # General amount pattern
+    r'(\d+)\s*during\s+the\s+Period\s+of\s+Insurance'  # "100000 during the Period of Insurance"
+], re.IGNORECASE)
+
+CATARACT_MENTION = register("eligibility.cataract_mention", r'[Cc]ataract', re.IGNORECASE)
+CATARACT_NIL_CAPPING = register("eligibility.cataract_nil_capping", r'Cataract.*?Nil\s+Capping', re.IGNORECASE | re.DOTALL)
+CATARACT_MISSING_PERCENTAGE = register("eligibility.cataract_missing_percentage", r'Cataract.*?%\s+of\s+the\s+sum\s+insured.*?maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', re.IGNORECASE | re.DOTALL)
+CATARACT_CONTEXT = register("eligibility.cataract_context", r'Cataract.*?(?:\n|$)', re.IGNORECASE | re.DOTALL)
+NIL_CAPPING = register("eligibility.nil_capping", r'Nil\s+Capping', re.IGNORECASE)
+PERCENT_OF_SUM_INSURED = register("eligibility.percent_of_sum_insured", r'(\d+)%\s+of\s+the\s+sum\s+insured', re.IGNORECASE)
+FIRST_NUMBER = register("eligibility.first_number", r'(\d+)')
+STEM_CELL_MENTION = register("eligibility.stem_cell_mention", r'Stem\s+Cell', re.IGNORECASE)
+STEM_CELL_CONTEXT = register("eligibility.stem_cell_context", r'Stem\s+Cell.*?(?:\n.*?){0,5}', re.IGNORECASE | re.DOTALL)
+MAXIMUM_AMOUNT = register("eligibility.maximum_amount", r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', re.IGNORECASE)
+SUBLIMIT_OF_AMOUNT = register("eligibility.sublimit_of_amount", r'sublimit\s+of\s+(\d+)', re.IGNORECASE)
+DURING_PERIOD_AMOUNT = register("eligibility.during_period_amount", r'(\d+)\s*during\s+the\s+Period\s+of\s+Insurance', re.IGNORECASE)
+RUPEE_AMOUNT = register("eligibility.rupee_amount", r'(?:INR\.?|Rs\.?)\s*([\d,]+)', re.IGNORECASE)
+MENTAL_ILLNESS_MENTION = register("eligibility.mental_illness_mention", r'mental\s+illness', re.IGNORECASE)
+CHEMOTHERAPY_MENTION = register("eligibility.chemotherapy_mention", r'(?:oral\s+)?chemotherapy|immunotherapy', re.IGNORECASE)
+BALLOON_GROUP_MENTION = register("eligibility.balloon_group_mention", r'balloon.*?thermoplasty.*?vaporization.*?monitoring.*?injections', re.IGNORECASE)
+PERCENT_PER_MONTH_WITH_MAXIMUM = register("eligibility.percent_per_month_with_maximum", r'(\d+)%\s+of\s+the\s+Sum\s+Insured\s+per\s+month\s+subject\s+to\s+a\s+maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', re.IGNORECASE)
+PERCENT_WITH_MAXIMUM = register("eligibility.percent_with_maximum", r'(\d+)%\s+of\s+the\s+Sum\s+Insured\s+subject\s+to\s+a\s+maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', re.IGNORECASE)
+
+# Condition name cleanup
+BRACKETED_TEXT = register("eligibility.bracketed_text", r'\s*\([^)]*\)')
+HYPHEN = register("eligibility.hyphen", r'\s*-\s*')
+WHITESPACE_RUN = register("eligibility.whitespace_run", r'\s+')
+TRAILING_COMMA = register("eligibility.trailing_comma", r',\s*$')
+LEADING_NUMBERS_PIPES = register("eligibility.leading_numbers_pipes", r'^[\d\.\s\|]+')
+AFTER_PIPE = register("eligibility.after_pipe", r'\s*\|\s*.*$')
+ONLY_NUMBERS_SYMBOLS = register("eligibility.only_numbers_symbols", r'^[0-9%\s\-/]+$')
+
+# Individual (table) format (Endt. No. 5(ii)), tried in order on each line
+TABLE_ROW_PATTERNS = register_list("eligibility.table_row", [
+    # Pattern 1: Exact condition names from table (case-insensitive) - ENHANCED PATTERNS
+    r'^\s*(Cataract)\s*(?:\||Nil|50%|5\(ii\)|$)',
+    r'^\s*(Cataract)\s*Nil\s*Capping',
+    r'^\s*(Cataract)\s*\|.*?Nil\s*Capping',
+    r'^\s*(Cataract)\s*\|.*?Nil',
+    r'^\s*(Cataract)\s*Nil',
+    r'^\s*(Balloon\s+Sinsuplasty)\s*(?:\||50%|5\(ii\)|$)',
+    r'^\s*(Stem\s+Cell\s+therapy)\s*(?:\||50%|5\(ii\)|$)',
+    r'^\s*(Oral\s+Chemotherapy,?\s+Immunotherapy\s*\(\s*monoclonal\s+antibody\s+to\s+be\s+given\s+as\s+injection\s*\))\s*(?:\||50%|5\(ii\)|$)',
+    r'^\s*(Bronchical\s+Thermoplasty)\s*(?:\||50%|5\(ii\)|$)',
+
+    # VAPORIZATION PATTERNS - individual line formats
+    r'^\s*(vaporization\s+of\s+prostate\s*\(\s*green\s+laser\s+treatment\s*\))\s*(?:\||Nil|50%|10%|5\(ii\)|$)',
+    r'^\s*(vaporization\s+of\s+prostate\s*\(\s*green\s+laser\s+treatment\s*\))',
+    r'^\s*(vaporization\s+of\s+prostate\s*\([^)]*\))',
+    r'^\s*(vaporization\s+of\s+prostate)',
+
+    r'^\s*(Intra\s+Operative\s+Neuro\s+Monitoring)\s*(?:\||50%|5\(ii\)|$)',
+    r'^\s*(Intra\s+vitreal\s+injections)\s*(?:\||50%|5\(ii\)|$)',
+
+    # Individual mental illness conditions
+    r'^\s*(Treatment\s+of\s+mental\s+illness)\s*(?:\||50%|5\(ii\)|$)',
+    r'^\s*(stress\s+or\s+psychological\s+disorders)\s*(?:\||50%|5\(ii\)|$)',
+    r'^\s*(neurodegenerative\s+disorders)\s*(?:\||50%|5\(ii\)|$)',
+
+    # Individual chemotherapy conditions
+    r'^\s*(Oral\s+Chemotherapy)\s*(?:\||50%|5\(ii\)|$)',
+    r'^\s*(Immunotherapy)\s*(?:\||50%|5\(ii\)|$)',
+
+    # Pattern 2: More flexible patterns for variations
+    r'(Treatment\s+of\s+mental\s+illness,\s+stress\s+or\s+psychological\s+disorders\s+and\s+neurodegenerative\s+disorders\.?)',
+    r'(Treatment\s+of\s+mental\s+illness)',
+    r'(stress\s+or\s+psychological\s+disorders)',
+    r'(neurodegenerative\s+disorders)',
+    r'(Stem\s+[Cc]ell\s+[Tt]herapy(?:\s*-[^|]*)?)',
+    r'(Oral\s+[Cc]hemotherapy,?\s*[Ii]mmunotherapy(?:\s*\([^)]+\))?)',
+    r'(Oral\s+[Cc]hemotherapy)',
+    r'([Ii]mmunotherapy)',
+    r'(Balloon\s+[Ss]in[us]*plasty)',
+    r'(Bronchical?\s+[Tt]hermoplasty)',
+    r'(Intra\s+[Oo]perative\s+[Nn]euro\s+[Mm]onitoring)',
+    r'(Intra\s+[Vv]itreal\s+[Ii]njections)',
+
+    # Pattern 3: Condition followed by "Nil Capping" - enhanced for vaporization
+    r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+Nil\s+Capping',
+    r'(vaporization[^|]+?)\s+Nil\s+Capping',
+
+    # Pattern 4: Condition followed by percentage and amount description - enhanced for vaporization
+    r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured',
+    r'(vaporization[^|]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured',
+
+    # Pattern 5: Specific format from user's text - condition followed by percentage and maximum
+    r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured\s+subject\s+to\s+a\s+maximum',
+    r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured\s+subject\s+to\s+a\s+maximum\s+of',
+    r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured\s+subject\s+to\s+a\s+maximum\s+of\s+(?:INR\.?|Rs\.?)\s*[\d,]+/-',
+
+    # Pattern 5a: Condition followed by 5(ii) - specific to user's format
+    r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+5\(ii\)',
+    r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+5\(ii\)\s*$',
+
+    # Pattern 6: Medical conditions with specific keywords (broader match)
+    r'([A-Za-z\s,\-()]*(?:[Tt]herapy|[Pp]lasty|[Mm]onitoring|[Ii]njections|[Cc]hemotherapy|[Ii]mmunotherapy|[Cc]ell|[Pp]rostate|[Nn]euro|[Vv]itreal|[Cc]ataract|[Tt]reatment)[A-Za-z\s,\-()]*)',
+], re.IGNORECASE | re.MULTILINE)
+
+NIL_CAPPING_ANY_CASE = register("eligibility.nil_capping_any_case", r'Nil\s+Capping|nil\s+capping|NIL\s+CAPPING', re.IGNORECASE)
+RUPEE_AMOUNT_NEXT_LINE = register("eligibility.rupee_amount_next_line", r'(?:INR\.?|Rs\.?)\s*([\d,]+)/?-?', re.IGNORECASE)
+
+# Members covered (Endt. No. 1)
+ELIGIBILITY_SECTION_HINT = register("eligibility.eligibility_section_hint", r'Eligibility|Member|Insured Person', re.IGNORECASE)
+EMPLOYEES_COVERED = register("eligibility.employees_covered", r'Insured Person covers employees of the Insured', re.IGNORECASE)
+EMPLOYEE_MENTION = register("eligibility.employee_mention", r'employee', re.IGNORECASE)
+INSURED_PERSON_MENTION = register("eligibility.insured_person_mention", r'insured person', re.IGNORECASE)
+SPOUSE_MENTION = register("eligibility.spouse_mention", r'spouse', re.IGNORECASE)
+CHILDREN_MENTION = register("eligibility.children_mention", r'children', re.IGNORECASE)
+DEPENDENT_CHILDREN_MENTION = register("eligibility.dependent_children_mention", r'dependent children', re.IGNORECASE)
+DEPENDANT_CHILDREN_MENTION = register("eligibility.dependant_children_mention", r'dependant children', re.IGNORECASE)
+
+SPOUSE_PATTERNS = register_fallbacks("eligibility.spouse", [
+    r"Spouse\s*-\s*Spouse means the employee['s]{0,2}\s+legally married partner",
+    r'spouse',
+    r'Dependent Spouse',
+    r'Dependant Spouse',
+    r'Spouse\s*-\s*(\d+)',
+    r'Spouse\s*:\s*(\d+)'
+], re.IGNORECASE, combine=False)
+
+# Different formats of dependent children mentions, tried in order
+CHILDREN_PATTERNS = register_fallbacks("eligibility.children", [
+    r'Maximum of (?:the )?first\s*(\d+)\s*dependent children',
+    r'Maximum of (?:the )?first\s*(\d+)\s*dependant children',
+    r'(\d+)\s*dependent children',
+    r'(\d+)\s*dependant children',
+    r'Maximum of (?:the )?first\s*(\d+)\s*children',
+    r'(\d+)\s*children',
+    r'Dependent Children\s*-\s*(\d+)',
+    r'Dependant Children\s*-\s*(\d+)',
+    r'Children\s*-\s*(\d+)',
+    r'Maximum of (?:the )?first\s*(\d+)\s*dependent',
+    r'(\d+)\s*dependent',
+    r'Children\s*:\s*(\d+)',
+    r'Dependent Children\s*:\s*(\d+)',
+    r'Dependant Children\s*:\s*(\d+)',
+    r'Maximum\s*(\d+)\s*children',
+    r'Maximum\s*(\d+)\s*dependent',
+    r'Maximum\s*(\d+)\s*dependant',
+    r'Up to\s*(\d+)\s*children',
+    r'Up to\s*(\d+)\s*dependent',
+    r'Up to\s*(\d+)\s*dependant'
+], re.IGNORECASE, combine=False)
+
+DEPENDENT_PARENTS_PATTERNS = register_list("eligibility.dependent_parents", [
+    r'Dependent Parents',
+    r'Dependant Parents',
+    r'Dependent Parent',
+    r'Dependant Parent',
+    r'Parents\s*-\s*(\d+)',
+    r'Parent\s*-\s*(\d+)'
+], re.IGNORECASE)
+
+PARENTS_IN_LAW_PATTERNS = register_list("eligibility.parents_in_law", [
+    r'Dependant Parents in law',
+    r'Dependent Parents in law',
+    r'Dependant Parents-in-law',
+    r'Dependent Parents-in-law',
+    r'Parents in law',
+    r'Parents-in-law'
+], re.IGNORECASE)
+
+# Buffers (Endt. No. 1 and Endt. No. 10); the sum insured and floater limit come from DocumentFacts
+BUFFER_LIMIT = register("eligibility.buffer_limit", r'limit of Rs[\.:]?\s?([\d,]+)', re.IGNORECASE)
+ENDORSEMENT_10_HEADER = register("eligibility.endorsement_10_header", r'(Endt\.|Endorsement)\s*No\.?\s*10\b', re.IGNORECASE)
+CORPORATE_BUFFER_MENTION = register("eligibility.corporate_buffer_mention", r'corporate\s+(?:buffer|floater)', re.IGNORECASE)
+BUFFER_LIMIT_PER_FAMILY = register("eligibility.buffer_limit_per_family", r'corporate\s+buffer\s+limit\s+per\s+family.*?Rs[\.:]?\s?([\d,]+)', re.IGNORECASE)
+BUFFER_LIMIT_PER_PARENT = register("eligibility.buffer_limit_per_parent", r'corporate\s+buffer\s+limit\s+per\s+parent.*?Rs[\.:]?\s?([\d,]+)', re.IGNORECASE)
+PER_PERSON_LIMIT = register("eligibility.per_person_limit", r'per\s+person\s+limit', re.IGNORECASE)
+RELOAD_EQUIVALENT = register("eligibility.reload_equivalent", r'equivalent\s+to\s+the\s+per\s+person\s+limit', re.IGNORECASE)
+RELOAD_DOUBLE = register("eligibility.reload_double", r'double\s+to\s+the\s+per\s+person\s+limit', re.IGNORECASE)
+RELOAD_THRICE = register("eligibility.reload_thrice", r'thrice\s+to\s+the\s+per\s+person\s+limit', re.IGNORECASE)
+BUFFER_OPD_LIMIT = register("eligibility.buffer_opd_limit", r'buffer\s+opd\s+limit.*?Rs[\.:]?\s?([\d,]+)', re.IGNORECASE)
+CRITICAL_ILLNESS_FAMILY_LIMIT = register("eligibility.critical_illness_family_limit", r'critical\s+illness\s+limit\s+per\s+family.*?Rs[\.:]?\s?([\d,]+)', re.IGNORECASE)
+CRITICAL_ILLNESS_LIMIT = register("eligibility.critical_illness_limit", r'critical\s+illness.*?limit.*?Rs[\.:]?\s?([\d,]+)', re.IGNORECASE)
 
 
 def extract_age_ranges(text: str) -> Dict[str, Dict]:
@@ -15,11 +331,7 @@ def extract_age_ranges(text: str) -> Dict[str, Dict]:
     }
 
     # Employee / Spouse
-    employee_age_match = re.search(
-        r'employee.*?(?:age|years?)\s*(?:between|from|range)?\s*(\d+)\s*(?:to|-)\s*(\d+)',
-        text,
-        re.IGNORECASE
-    )
+    employee_age_match = EMPLOYEE_AGE_RANGE.search(text)
     if employee_age_match:
         min_age = int(employee_age_match.group(1))
         max_age = int(employee_age_match.group(2))
@@ -29,11 +341,7 @@ def extract_age_ranges(text: str) -> Dict[str, Dict]:
         age_ranges["spouse"]["max_years"] = max_age
 
     # Children
-    children_age_match = re.search(
-        r'(?:children|dependent).*?(?:age|years?)\s*(?:between|from|range)?\s*(\d+)\s*(?:to|-)\s*(\d+)',
-        text,
-        re.IGNORECASE
-    )
+    children_age_match = CHILDREN_AGE_RANGE.search(text)
     if children_age_match:
         min_age = int(children_age_match.group(1))
         max_age = int(children_age_match.group(2))
@@ -41,18 +349,14 @@ def extract_age_ranges(text: str) -> Dict[str, Dict]:
         age_ranges["children"]["max_years"] = max_age
 
     # over X days pattern for children minimum
-    children_days_match = re.search(r'over\s+(\d+)\s+days?', text, re.IGNORECASE)
+    children_days_match = CHILDREN_MIN_DAYS.search(text)
     if children_days_match:
         days = int(children_days_match.group(1))
         months = days // 30
         age_ranges["children"]["min_months"] = months
 
     # Parents
-    parents_age_match = re.search(
-        r'(?:parents?|father|mother).*?(?:age|years?)\s*(?:between|from|range)?\s*(\d+)\s*(?:to|-)\s*(\d+)',
-        text,
-        re.IGNORECASE
-    )
+    parents_age_match = PARENTS_AGE_RANGE.search(text)
     if parents_age_match:
         min_age = int(parents_age_match.group(1))
         max_age = int(parents_age_match.group(2))
@@ -61,210 +365,135 @@ def extract_age_ranges(text: str) -> Dict[str, Dict]:
 
     return age_ranges
 
-def extract_sublimits_from_endorsement_5i(text: str) -> List[Dict]:
+def extract_sublimits_from_endorsement_5i(text: str, index: Optional[EndorsementIndex] = None,
+                                          facts: Optional[DocumentFacts] = None) -> List[Dict]:
     """Extract sublimits from Endt. No. 5(i) - Room, Boarding Expenses and Intensive Care Unit"""
     sublimits = []
+    index = index or segment_endorsements(text)
+    facts = facts or DocumentFacts(text, index)
     
-    # Look for Endt. No. 5(i) patterns
-    endorsement_5i_match = re.search(r'Endt\.\s*No\.\s*5\(i\).*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
-    if endorsement_5i_match:
-        endorsement_5i_text = endorsement_5i_match.group(0)
-        print(f"[DEBUG] Found Endt. No. 5(i) section")
+    # Look for Endt. No. 5(i) section
+    endorsement_5i_text = index.section(5, "i", form="endt")
+    if endorsement_5i_text:
+        logger.debug("Found Endt. No. 5(i) section")
         
         # Extract Room, Boarding Expenses - look for percentage pattern
-        room_boarding_patterns = [
-            r'Room,\s*Boarding\s+Expenses.*?(\d+)%\s+of\s+the\s+Sum\s+Insured\s+per\s+day',
-            r'Room.*?Boarding.*?(\d+)%\s+of\s+the\s+Sum\s+Insured',
-            r'Room.*?Boarding.*?(\d+)%',
-            r'Room,\s*Boarding.*?(\d+)%'
-        ]
         
         room_boarding_percentage = None
-        for pattern in room_boarding_patterns:
-            room_boarding_match = re.search(pattern, endorsement_5i_text, re.IGNORECASE | re.DOTALL)
-            if room_boarding_match:
-                room_boarding_percentage = int(room_boarding_match.group(1))
-                break
+        room_boarding_match = ROOM_BOARDING_PATTERNS.search(endorsement_5i_text)
+        if room_boarding_match:
+            room_boarding_percentage = int(room_boarding_match.group(1))
         
         if room_boarding_percentage:
-            # Calculate amount using percentage and sum insured of 500000
-            calculated_amount = int((room_boarding_percentage / 100) * 500000)
+            # Calculate amount using percentage and the policy sum insured
+            calculated_amount = int((room_boarding_percentage / 100) * facts.policy_sum_insured)
             
             sublimits.append({
                 "applicable": "Yes",
                 "type": "Room, Boarding Expenses",
                 "limit": str(calculated_amount)
             })
-            print(f"[DEBUG] Found Room, Boarding Expenses: {room_boarding_percentage}% = {calculated_amount}")
+            logger.debug("Found Room, Boarding Expenses: %s%% = %s", room_boarding_percentage, calculated_amount)
         
         # Extract Intensive Care Unit - look for percentage pattern
-        icu_patterns = [
-            r'Intensive\s+Care\s+Unit.*?(\d+)%\s+of\s+the\s+Sum\s+Insured\s+per\s+day',
-            r'Intensive\s+Care.*?(\d+)%\s+of\s+the\s+Sum\s+Insured',
-            r'Intensive\s+Care.*?(\d+)%',
-            r'ICU.*?(\d+)%',
-            r'Intensive.*?(\d+)%'
-        ]
         
         icu_percentage = None
-        for pattern in icu_patterns:
-            icu_match = re.search(pattern, endorsement_5i_text, re.IGNORECASE | re.DOTALL)
-            if icu_match:
-                icu_percentage = int(icu_match.group(1))
-                break
+        icu_match = ICU_PATTERNS.search(endorsement_5i_text)
+        if icu_match:
+            icu_percentage = int(icu_match.group(1))
         
         if icu_percentage:
-            # Calculate amount using percentage and sum insured of 500000
-            calculated_amount = int((icu_percentage / 100) * 500000)
+            # Calculate amount using percentage and the policy sum insured
+            calculated_amount = int((icu_percentage / 100) * facts.policy_sum_insured)
             
             sublimits.append({
                 "applicable": "Yes",
                 "type": "Intensive Care Unit",
                 "limit": str(calculated_amount)
             })
-            print(f"[DEBUG] Found Intensive Care Unit: {icu_percentage}% = {calculated_amount}")
+            logger.debug("Found Intensive Care Unit: %s%% = %s", icu_percentage, calculated_amount)
     
-    print(f"[DEBUG] Total 5(i) sublimits extracted: {len(sublimits)}")
+    logger.debug("Total 5(i) sublimits extracted: %s", len(sublimits))
     for i, sublimit in enumerate(sublimits):
-        print(f"[DEBUG] {i+1}. Type: '{sublimit['type']}', Limit: '{sublimit['limit']}'")
+        logger.debug("%s. Type: '%s', Limit: '%s'", i+1, sublimit['type'], sublimit['limit'])
     
     return sublimits
 
 
-def extract_all_sublimits_from_endorsement_5ii(text: str) -> List[Dict]:
+def extract_all_sublimits_from_endorsement_5ii(text: str, index: Optional[EndorsementIndex] = None,
+                                               facts: Optional[DocumentFacts] = None) -> List[Dict]:
     """Extract ALL sublimits from Endt. No. 5(ii) section dynamically - handles multiple formats"""
     sublimits = []
+    index = index or segment_endorsements(text)
+    facts = facts or DocumentFacts(text, index)
     
-    # Look for Endt. No. 5(ii) patterns
-    endorsement_5ii_match = re.search(r'Endt\.\s*No\.\s*5\(ii\).*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
-    if endorsement_5ii_match:
-        endorsement_5ii_text = endorsement_5ii_match.group(0)
-        print(f"[DEBUG] Found Endt. No. 5(ii) section")
+    # Look for Endt. No. 5(ii) section
+    endorsement_5ii_text = index.section(5, "ii", form="endt")
+    if endorsement_5ii_text:
+        logger.debug("Found Endt. No. 5(ii) section")
         
         # SMART DETECTION: Check input format to choose extraction method
-        print(f"[DEBUG] Analyzing input format...")
+        logger.debug("Analyzing input format...")
         
         # Check if this is the MERGED format (comma-separated conditions in one row)
         # Look for the specific merged string pattern with commas
-        merged_conditions_pattern = r'Balloon\s*Sinsuplasty,.*?bronchical\s+thermoplasty,.*?vaporization.*?intra\s+operative\s+neuro\s+monitoring,.*?Intra\s+vitreal\s+injections'
-        merged_format_detected = bool(re.search(merged_conditions_pattern, endorsement_5ii_text, re.IGNORECASE | re.DOTALL))
+        merged_format_detected = bool(MERGED_CONDITIONS_ROW.search(endorsement_5ii_text))
         
-        print(f"[DEBUG] Merged format detection result: {merged_format_detected}")
+        logger.debug("Merged format detection result: %s", merged_format_detected)
         if merged_format_detected:
-            print(f"[DEBUG] Found merged pattern in text")
+            logger.debug("Found merged pattern in text")
         
         # Additional check: if we find specific merged condition patterns, force merged format
-        force_merged = bool(re.search(
-            r'(?:Treatment\s+of\s+mental\s+illness.*?neurodegenerative|Oral\s+Chemotherapy.*?Immunotherapy.*?monoclonal)',
-            endorsement_5ii_text, re.IGNORECASE | re.DOTALL
-        ))
+        force_merged = bool(MERGED_CONDITION_HINT.search(endorsement_5ii_text))
         
         if merged_format_detected or force_merged:
-            print(f"[DEBUG] MERGED FORMAT detected - using merged extraction logic")
-            return extract_merged_format(endorsement_5ii_text)
+            logger.debug("MERGED FORMAT detected - using merged extraction logic")
+            return extract_merged_format(endorsement_5ii_text, facts.policy_sum_insured)
         else:
-            print(f"[DEBUG] INDIVIDUAL FORMAT detected - using individual extraction logic")
+            logger.debug("INDIVIDUAL FORMAT detected - using individual extraction logic")
             return extract_individual_format(endorsement_5ii_text)
     
     return sublimits
 
 
 
-def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
-    """Extract sublimits for MERGED format (comma-separated conditions stay merged)"""
+def extract_merged_format(endorsement_5ii_text: str, sum_insured: int = DEFAULT_SUM_INSURED) -> List[Dict]:
+    """
+    Extract sublimits for MERGED format (comma-separated conditions stay merged).
+    Percentage limits are calculated on sum_insured.
+    """
     sublimits = []
     
     # Extract conditions in the correct order based on input sequence
     # Define all conditions with their patterns in the order they appear in input
-    all_conditions = [
-        {
-            "name": "Cataract",
-            "patterns": [
-                r'\bCataract\b',
-                r'Treatment\s*\n\s*Cataract',
-                r'Treatment\s+Cataract',
-                r'Cataract\s+Nil\s+Capping',
-                r'Cataract.*?Nil\s+Capping',
-                r'Cataract\s*\|.*?Nil\s+Capping',
-                r'Cataract\s*\|.*?Nil'
-            ]
-        },
-        {
-            "name": "Treatment of mental illness, stress or psychological disorders and neurodegenerative disorders",
-            "patterns": [
-                r'Treatment\s+of\s+mental\s+illness,?\s+stress\s+or\s+psychological\s+disorders\s+and\s+neurodegenerative\s+disorders',
-                r'Treatment\s+of\s+mental\s+illness,\s*stress\s*or\s*psychological\s*disorders\s*and\s*neurodegenerative\s*disorders',
-                r'Treatment\s+of\s+mental\s+illness.*?neurodegenerative\s+disorders',
-                r'Treatment\s+of\s+mental\s+illness.*?psychological\s+disorders.*?neurodegenerative\s+disorders',
-                r'mental\s+illness.*?psychological\s+disorders.*?neurodegenerative\s+disorders',
-                r'Treatment\s+of\s+mental\s+illness.*?stress.*?psychological.*?neurodegenerative',
-                r'mental\s+illness.*?stress.*?psychological.*?neurodegenerative'
-            ]
-        },
-        {
-            "name": "Balloon Sinsuplasty, bronchical thermoplasty, vaporization of prostate(green laser treatment), intra operative neuro monitoring, Intra vitreal injections",
-            "patterns": [
-                r'Balloon\s*Sinsuplasty,\s*bronchical\s+thermoplasty,\s*vaporization\s+of\s+prostate\s*\([^)]*\),?\s*intra\s+operative\s+neuro\s+monitoring,?\s*Intra\s+vitreal\s+injections',
-                r'Balloon\s*Sinsuplasty,\s*bronchical\s+thermoplasty,\s*vaporization.*?intra\s+operative\s+neuro\s+monitoring.*?Intra\s+vitreal\s+injections',
-                r'Balloon.*?thermoplasty.*?vaporization.*?monitoring.*?injections',
-                r'Balloon\s*Sinsuplasty,.*?bronchical\s+thermoplasty,.*?vaporization.*?intra\s+operative\s+neuro\s+monitoring.*?Intra\s+vitreal\s+injections'
-            ]
-        },
-        {
-            "name": "Stem Cell therapy",
-            "patterns": [
-                r'Stem\s+Cell\s+therapy\s*-\s*Hematopoietic\s+stem\s+cells\s+for\s+bone\s+marrow\s+transplant\s+for\s+haematological\s+conditions\s+to\s+be\s+covered',
-                r'Stem\s+Cell\s+therapy\s*-\s*Hematopoietic\s+stem\s+cells\s+for\s+bone\s+marrow\s+transplant\s+for\s+h[ae]ematological\s+conditions\s+to\s+be\s+covered',
-                r'Stem\s+Cell\s+therapy.*?Hematopoietic.*?bone\s+marrow\s+transplant.*?haematological\s+conditions.*?covered',
-                r'Stem\s+Cell\s+therapy.*?bone\s+marrow\s+transplant.*?covered',
-                r'Stem\s+Cell\s+therapy\s*-\s*Hematopoietic.*?bone.*?marrow.*?transplant.*?haematological.*?conditions.*?covered',
-                r'Stem\s+Cell\s+therapy.*?Hematopoietic.*?transplant.*?conditions.*?covered',
-                r'Stem\s+Cell\s+therapy.*?bone\s+marrow.*?transplant.*?covered',
-                r'Stem\s+Cell\s+therapy.*?haematological.*?conditions.*?covered',
-                r'Stem\s+Cell\s+therapy'
-            ]
-        },
-        {
-            "name": "Oral Chemotherapy, Immunotherapy(monoclonal antibody to be given as injection)",
-            "patterns": [
-                r'Oral\s+Chemotherapy,?\s+Immunotherapy\s*\(\s*monoclonal\s+antibody\s+to\s+be\s+given\s+as\s+injection\s*\)',
-                r'Oral\s+Chemotherapy,?\s+Immunotherapy\s*\([^)]*monoclonal[^)]*\)',
-                r'Oral\s+Chemotherapy,?\s+Immunotherapy\s*\([^)]*\)',
-                r'Oral\s+Chemotherapy,?\s+Immunotherapy',
-                r'Oral\s+Chemotherapy.*?Immunotherapy.*?monoclonal.*?antibody',
-                r'Oral\s+Chemotherapy.*?Immunotherapy.*?injection',
-                r'Oral\s+Chemotherapy.*?Immunotherapy'
-            ]
-        }
-    ]
     
     # Extract conditions in order
-    for condition in all_conditions:
+    for condition in MERGED_CONDITIONS:
         condition_name = condition["name"]
         patterns = condition["patterns"]
         
         # Special debug for Stem Cell therapy
         if "Stem Cell" in condition_name:
-            print(f"[DEBUG] Searching for Stem Cell therapy...")
-            print(f"[DEBUG] Will test {len(patterns)} patterns")
+            logger.debug("Searching for Stem Cell therapy...")
+            logger.debug("Will test %s patterns", len(patterns))
         
         # Special debug for Cataract
         if condition_name == "Cataract":
-            print(f"[DEBUG] Searching for Cataract...")
-            print(f"[DEBUG] Will test {len(patterns)} patterns for Cataract")
+            logger.debug("Searching for Cataract...")
+            logger.debug("Will test %s patterns for Cataract", len(patterns))
             # Check if Cataract appears anywhere in the text
-            if re.search(r'[Cc]ataract', endorsement_5ii_text, re.IGNORECASE):
-                print(f"[DEBUG] Cataract found in text")
+            if CATARACT_MENTION.search(endorsement_5ii_text):
+                logger.debug("Cataract found in text")
             else:
-                print(f"[DEBUG] WARNING: Cataract NOT found in text at all")
+                logger.debug("WARNING: Cataract NOT found in text at all")
         
         for pattern_idx, pattern in enumerate(patterns):
-            if re.search(pattern, endorsement_5ii_text, re.IGNORECASE | re.DOTALL):
-                print(f"[DEBUG] Found condition: {condition_name}")
+            if pattern.search(endorsement_5ii_text):
+                logger.debug("Found condition: %s", condition_name)
                 
                 # Check if already exists to avoid duplicates
                 if any(sub['type'] == condition_name for sub in sublimits):
-                    print(f"[DEBUG] Condition {condition_name} already exists, skipping")
+                    logger.debug("Condition %s already exists, skipping", condition_name)
                     break
                 
                 # Try to find associated amount and percentage
@@ -273,9 +502,9 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
                 
                 # ENHANCED: Check for "Nil Capping" specifically for Cataract
                 if condition_name == "Cataract":
-                    nil_capping_match = re.search(r'Cataract.*?Nil\s+Capping', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                    nil_capping_match = CATARACT_NIL_CAPPING.search(endorsement_5ii_text)
                     if nil_capping_match:
-                        print(f"[DEBUG] Found Cataract with Nil Capping - setting limit to empty")
+                        logger.debug("Found Cataract with Nil Capping - setting limit to empty")
                         limit_amount = ""
                         sublimits.append({
                             "applicable": "Yes",
@@ -285,9 +514,9 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
                         break
                     
                     # CRITICAL FIX: Check for Cataract with missing percentage (just "%" without number)
-                    missing_percentage_match = re.search(r'Cataract.*?%\s+of\s+the\s+sum\s+insured.*?maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                    missing_percentage_match = CATARACT_MISSING_PERCENTAGE.search(endorsement_5ii_text)
                     if missing_percentage_match:
-                        print(f"[DEBUG] Found Cataract with missing percentage (just '%' without number) - setting limit to empty")
+                        logger.debug("Found Cataract with missing percentage (just '%' without number) - setting limit to empty")
                         limit_amount = ""
                         sublimits.append({
                             "applicable": "Yes",
@@ -298,122 +527,113 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
                 
                 # Look for specific amount patterns near the condition
                 # First try to find the condition in context and extract amount from nearby text
-                condition_context = re.search(f'{pattern}.*?(?:\n|$)', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                condition_context = condition["context_patterns"][pattern_idx].search(endorsement_5ii_text)
                 if condition_context:
                     context_text = condition_context.group(0)
                     
                     # ENHANCED: Check for "Nil Capping" in the context text first
-                    if condition_name == "Cataract" and re.search(r'Nil\s+Capping', context_text, re.IGNORECASE):
-                        print(f"[DEBUG] Found Cataract with Nil Capping in context - setting limit to empty")
+                    if condition_name == "Cataract" and NIL_CAPPING.search(context_text):
+                        logger.debug("Found Cataract with Nil Capping in context - setting limit to empty")
                         limit_amount = ""
                     else:
                         # Look for percentage first
-                        percentage_match = re.search(r'(\d+)%\s+of\s+the\s+sum\s+insured', context_text, re.IGNORECASE)
+                        percentage_match = PERCENT_OF_SUM_INSURED.search(context_text)
                         if percentage_match:
                             percentage = f"{percentage_match.group(1)}%"
-                            print(f"[DEBUG] Found percentage: {percentage}")
+                            logger.debug("Found percentage: %s", percentage)
                         
                         # Look for specific amount patterns in the context
-                        amount_patterns_in_context = [
-                            r'sublimit\s+of\s+(\d+)',  # "sublimit of 30000"
-                            r'(?:INR\.?|Rs\.?)\s*([\d,]+)/-',  # "Rs.100000/-"
-                            r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)',  # "maximum of Rs.100000"
-                            r'(\d+)\s*during\s+the\s+Period\s+of\s+Insurance',  # "100000 during the Period of Insurance"
-                            r'(?:INR\.?|Rs\.?)\s*([\d,]+)',  # General amount pattern
-                        ]
                         
-                        for amount_pattern in amount_patterns_in_context:
-                            amount_match = re.search(amount_pattern, context_text, re.IGNORECASE)
-                            if amount_match:
-                                limit_amount = amount_match.group(1).replace(',', '')
-                                print(f"[DEBUG] Found amount in context: {limit_amount}")
-                                break
+                        amount_match = AMOUNT_PATTERNS_IN_CONTEXT.search(context_text)
+                        if amount_match:
+                            limit_amount = amount_match.group(1).replace(',', '')
+                            logger.debug("Found amount in context: %s", limit_amount)
                 
                 # If no amount found in context, try to find it in the broader text
                 if not limit_amount:
                     # ENHANCED: Check for "Nil Capping" in broader text for Cataract
                     if condition_name == "Cataract":
-                        broader_nil_match = re.search(r'Cataract.*?Nil\s+Capping', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                        broader_nil_match = CATARACT_NIL_CAPPING.search(endorsement_5ii_text)
                         if broader_nil_match:
-                            print(f"[DEBUG] Found Cataract with Nil Capping in broader text - setting limit to empty")
+                            logger.debug("Found Cataract with Nil Capping in broader text - setting limit to empty")
                             limit_amount = ""
                         else:
                             # Look for percentage and amount patterns near the condition
-                            context_match = re.search(f'{pattern}.*?(?:INR\.?|Rs\.?)\s*([\d,]+)', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                            context_match = condition["amount_patterns"][pattern_idx].search(endorsement_5ii_text)
                             if context_match:
                                 limit_amount = context_match.group(1).replace(',', '')
-                                print(f"[DEBUG] Found amount: {limit_amount}")
+                                logger.debug("Found amount: %s", limit_amount)
                             
                             # CRITICAL FIX: Only look for percentage in the immediate context of Cataract, not broader text
                             # This prevents picking up percentages from other conditions
-                            cataract_context = re.search(r'Cataract.*?(?:\n|$)', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                            cataract_context = CATARACT_CONTEXT.search(endorsement_5ii_text)
                             if cataract_context:
                                 cataract_text = cataract_context.group(0)
-                                percentage_context = re.search(r'(\d+)%\s+of\s+the\s+sum\s+insured', cataract_text, re.IGNORECASE)
+                                percentage_context = PERCENT_OF_SUM_INSURED.search(cataract_text)
                                 if percentage_context:
                                     percentage = f"{percentage_context.group(1)}%"
-                                    print(f"[DEBUG] Found percentage in Cataract context: {percentage}")
+                                    logger.debug("Found percentage in Cataract context: %s", percentage)
                                 else:
-                                    print(f"[DEBUG] No percentage found in Cataract context - setting to empty")
+                                    logger.debug("No percentage found in Cataract context - setting to empty")
                                     percentage = ""
                             else:
-                                print(f"[DEBUG] No Cataract context found - setting percentage to empty")
+                                logger.debug("No Cataract context found - setting percentage to empty")
                                 percentage = ""
                     else:
                         # Look for percentage and amount patterns near the condition
-                        context_match = re.search(f'{pattern}.*?(?:INR\.?|Rs\.?)\s*([\d,]+)', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                        context_match = condition["amount_patterns"][pattern_idx].search(endorsement_5ii_text)
                         if context_match:
                             limit_amount = context_match.group(1).replace(',', '')
-                            print(f"[DEBUG] Found amount: {limit_amount}")
+                            logger.debug("Found amount: %s", limit_amount)
                         
                         # CRITICAL FIX: Only look for percentage in the immediate context of the condition, not broader text
                         # This prevents picking up percentages from other conditions
-                        condition_context = re.search(f'{pattern}.*?(?:\n|$)', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                        condition_context = condition["context_patterns"][pattern_idx].search(endorsement_5ii_text)
                         if condition_context:
                             condition_text = condition_context.group(0)
-                            percentage_context = re.search(r'(\d+)%\s+of\s+the\s+sum\s+insured', condition_text, re.IGNORECASE)
+                            percentage_context = PERCENT_OF_SUM_INSURED.search(condition_text)
                             if percentage_context:
                                 percentage = f"{percentage_context.group(1)}%"
-                                print(f"[DEBUG] Found percentage in {condition_name} context: {percentage}")
+                                logger.debug("Found percentage in %s context: %s", condition_name, percentage)
                             else:
-                                print(f"[DEBUG] No percentage found in {condition_name} context - keeping existing")
+                                logger.debug("No percentage found in %s context - keeping existing", condition_name)
                                 # Keep the existing percentage if already found in earlier context
                         else:
-                            print(f"[DEBUG] No {condition_name} context found - keeping existing percentage")
+                            logger.debug("No %s context found - keeping existing percentage", condition_name)
                             # Keep the existing percentage if already found in earlier context
                 
                 # If we found a percentage, calculate the amount using it
                 if percentage and limit_amount:
                     try:
                         # Extract the maximum amount from the limit_amount
-                        max_amount_match = re.search(r'(\d+)', limit_amount)
+                        max_amount_match = FIRST_NUMBER.search(limit_amount)
                         if max_amount_match:
                             max_amount = int(max_amount_match.group(1))
                             # Calculate using the percentage and sum insured
                             percent_value = float(percentage.strip('%')) / 100
-                            calculated_amount = int(500000 * percent_value)
+                            calculated_amount = int(sum_insured * percent_value)
                             # Return the smaller value between calculated and maximum
                             final_amount = min(calculated_amount, max_amount)
                             limit_amount = str(final_amount)
-                            print(f"[DEBUG] Calculated amount using {percentage}: {calculated_amount}, max: {max_amount}, final: {limit_amount}")
+                            logger.debug("Calculated amount using %s: %s, max: %s, final: %s", percentage, calculated_amount, max_amount, limit_amount)
                     except:
                         pass  # Keep original amount if calculation fails
                 elif not percentage and limit_amount:
                     # If no percentage found but amount exists, use the amount as is
-                    print(f"[DEBUG] No percentage found for {condition_name}, using amount as is: {limit_amount}")
+                    logger.debug("No percentage found for %s, using amount as is: %s", condition_name, limit_amount)
                 elif percentage and not limit_amount:
                     # If percentage found but no amount, calculate using percentage only
                     try:
                         percent_value = float(percentage.strip('%')) / 100
-                        calculated_amount = int(500000 * percent_value)
+                        calculated_amount = int(sum_insured * percent_value)
                         limit_amount = str(calculated_amount)
-                        print(f"[DEBUG] Calculated amount using {percentage} only: {limit_amount}")
+                        logger.debug("Calculated amount using %s only: %s", percentage, limit_amount)
                     except:
                         limit_amount = ""
-                        print(f"[DEBUG] Failed to calculate amount using {percentage}")
+                        logger.debug("Failed to calculate amount using %s", percentage)
                 else:
                     # No percentage and no amount - keep empty
-                    print(f"[DEBUG] No percentage and no amount found for {condition_name} - keeping empty")
+                    logger.debug("No percentage and no amount found for %s - keeping empty", condition_name)
                     limit_amount = ""
                 
                 sublimits.append({
@@ -425,52 +645,45 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             else:
                 # Special debug for Stem Cell therapy
                 if "Stem Cell" in condition_name:
-                    print(f"[DEBUG] Pattern {pattern_idx + 1} did not match for Stem Cell therapy")
+                    logger.debug("Pattern %s did not match for Stem Cell therapy", pattern_idx + 1)
         
         # Special debug for Stem Cell therapy if no patterns matched
         if "Stem Cell" in condition_name and not any(sub['type'] == condition_name for sub in sublimits):
-            print(f"[DEBUG] No Stem Cell therapy patterns matched!")
+            logger.debug("No Stem Cell therapy patterns matched!")
             # Check if 'Stem Cell' appears anywhere in the text
-            if re.search(r'Stem\s+Cell', endorsement_5ii_text, re.IGNORECASE):
-                print(f"[DEBUG] 'Stem Cell' found in text - checking surrounding context")
-                stem_match = re.search(r'Stem\s+Cell.*?(?:\n.*?){0,5}', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+            if STEM_CELL_MENTION.search(endorsement_5ii_text):
+                logger.debug("'Stem Cell' found in text - checking surrounding context")
+                stem_match = STEM_CELL_CONTEXT.search(endorsement_5ii_text)
                 if stem_match:
-                    print(f"[DEBUG] Stem Cell context: {stem_match.group(0)}")
+                    logger.debug("Stem Cell context: %s", stem_match.group(0))
             else:
-                print(f"[DEBUG] 'Stem Cell' NOT found in text at all")
+                logger.debug("'Stem Cell' NOT found in text at all")
     
     # Method 3: Extract amounts from general amount patterns if not found yet
     # Look for specific amount patterns in the text
-    amount_patterns = [
-        r'sublimit\s+of\s+(\d+)',  # "sublimit of 30000"
-        r'(?:INR\.?|Rs\.?)\s*([\d,]+)/-',  # "Rs.100000/-"
-        r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)',  # "maximum of Rs.100000"
-        r'(?:INR\.?|Rs\.?)\s*([\d,]+)',  # General amount pattern
-        r'(\d+)\s*during\s+the\s+Period\s+of\s+Insurance'  # "100000 during the Period of Insurance"
-    ]
     
     # Try to extract amounts for each sublimit that doesn't have one yet
     for sublimit in sublimits:
         if not sublimit["limit"]:  # If no amount found yet
             # ENHANCED: Check for "Nil Capping" for Cataract before assigning amounts
             if sublimit["type"] == "Cataract":
-                nil_capping_check = re.search(r'Cataract.*?Nil\s+Capping', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                nil_capping_check = CATARACT_NIL_CAPPING.search(endorsement_5ii_text)
                 if nil_capping_check:
-                    print(f"[DEBUG] Cataract has Nil Capping - keeping limit empty")
+                    logger.debug("Cataract has Nil Capping - keeping limit empty")
                     continue  # Skip amount assignment for Cataract with Nil Capping
                 
                 # CRITICAL FIX: Also check for Cataract with missing percentage (just "%" without number)
-                missing_percentage_check = re.search(r'Cataract.*?%\s+of\s+the\s+sum\s+insured.*?maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                missing_percentage_check = CATARACT_MISSING_PERCENTAGE.search(endorsement_5ii_text)
                 if missing_percentage_check:
-                    print(f"[DEBUG] Cataract has missing percentage - keeping limit empty")
+                    logger.debug("Cataract has missing percentage - keeping limit empty")
                     continue  # Skip amount assignment for Cataract with missing percentage
             
             # Try to find amount in the broader text context
-            for amount_pattern in amount_patterns:
-                amount_match = re.search(amount_pattern, endorsement_5ii_text, re.IGNORECASE)
+            for amount_pattern in AMOUNT_PATTERNS:
+                amount_match = amount_pattern.search(endorsement_5ii_text)
                 if amount_match:
                     sublimit["limit"] = amount_match.group(1).replace(',', '')
-                    print(f"[DEBUG] Assigned amount {sublimit['limit']} to {sublimit['type']}")
+                    logger.debug("Assigned amount %s to %s", sublimit['limit'], sublimit['type'])
                     break
     
     # Post-process to assign correct amounts based on condition types
@@ -480,86 +693,86 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
         
         # CRITICAL FIX: Check for Cataract with Nil Capping first before any amount assignment
         if condition_type == "cataract" or "cataract" in condition_type:
-            nil_capping_check = re.search(r'Cataract.*?Nil\s+Capping', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+            nil_capping_check = CATARACT_NIL_CAPPING.search(endorsement_5ii_text)
             if nil_capping_check:
-                print(f"[DEBUG] Cataract has Nil Capping - keeping limit empty in post-processing")
+                logger.debug("Cataract has Nil Capping - keeping limit empty in post-processing")
                 sublimit["limit"] = ""  # Ensure it stays empty
                 continue  # Skip all amount assignment for Cataract with Nil Capping
             
             # CRITICAL FIX: Also check for Cataract with missing percentage (just "%" without number)
-            missing_percentage_check = re.search(r'Cataract.*?%\s+of\s+the\s+sum\s+insured.*?maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+            missing_percentage_check = CATARACT_MISSING_PERCENTAGE.search(endorsement_5ii_text)
             if missing_percentage_check:
-                print(f"[DEBUG] Cataract has missing percentage - keeping limit empty in post-processing")
+                logger.debug("Cataract has missing percentage - keeping limit empty in post-processing")
                 sublimit["limit"] = ""  # Ensure it stays empty
                 continue  # Skip all amount assignment for Cataract with missing percentage
         
         # CRITICAL FIX: Also check if Cataract already has an amount but should be empty due to Nil Capping or missing percentage
         if condition_type == "cataract" or "cataract" in condition_type:
-            nil_capping_check = re.search(r'Cataract.*?Nil\s+Capping', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
-            missing_percentage_check = re.search(r'Cataract.*?%\s+of\s+the\s+sum\s+insured.*?maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+            nil_capping_check = CATARACT_NIL_CAPPING.search(endorsement_5ii_text)
+            missing_percentage_check = CATARACT_MISSING_PERCENTAGE.search(endorsement_5ii_text)
             if (nil_capping_check or missing_percentage_check) and sublimit["limit"]:  # If it has a limit but should be empty
-                print(f"[DEBUG] Cataract has Nil Capping or missing percentage but has amount {sublimit['limit']} - clearing it")
+                logger.debug("Cataract has Nil Capping or missing percentage but has amount %s - clearing it", sublimit['limit'])
                 sublimit["limit"] = ""  # Clear any existing amount
                 continue  # Skip all amount assignment for Cataract with Nil Capping or missing percentage
         
         # Assign amounts based on condition type if not already set
         if not sublimit["limit"]:
             # First, try to find any percentage pattern for this condition
-            condition_name_for_search = condition_type.replace(' ', '.*?')
-            percentage_pattern = rf'{condition_name_for_search}.*?(\d+)%\s+of\s+the\s+sum\s+insured'
-            percentage_match = re.search(percentage_pattern, endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+            # Merged-format sublimits are always one of MERGED_CONDITIONS
+            percentage_pattern = PERCENTAGE_PATTERN_BY_CONDITION.get(condition_type)
+            percentage_match = percentage_pattern.search(endorsement_5ii_text) if percentage_pattern else None
             
             if percentage_match:
                 percentage = f"{percentage_match.group(1)}%"
                 # Look for maximum amount
-                max_amount_match = re.search(r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE)
+                max_amount_match = MAXIMUM_AMOUNT.search(endorsement_5ii_text)
                 if max_amount_match:
                     max_amount = int(max_amount_match.group(1).replace(',', ''))
                     sublimit["limit"] = str(max_amount)
-                    print(f"[DEBUG] Using maximum amount for {condition_type}: {sublimit['limit']}")
+                    logger.debug("Using maximum amount for %s: %s", condition_type, sublimit['limit'])
                 else:
                     # If no maximum found, calculate using the percentage and sum insured
                     if percentage:
                         try:
                             percent_value = float(percentage.strip('%')) / 100
-                            calculated_amount = int(500000 * percent_value)
+                            calculated_amount = int(sum_insured * percent_value)
                             sublimit["limit"] = str(calculated_amount)
-                            print(f"[DEBUG] Calculated amount using {percentage} and sum insured 500000: {sublimit['limit']}")
+                            logger.debug("Calculated amount using %s and sum insured %s: %s", percentage, sum_insured, sublimit['limit'])
                         except:
                             sublimit["limit"] = ""
-                            print(f"[DEBUG] Failed to calculate amount for {condition_type}")
+                            logger.debug("Failed to calculate amount for %s", condition_type)
                     else:
                         sublimit["limit"] = ""
-                        print(f"[DEBUG] No percentage found for {condition_type}")
+                        logger.debug("No percentage found for %s", condition_type)
             else:
                 # Fallback to specific condition patterns
                 if "mental illness" in condition_type or "psychological disorders" in condition_type:
                     # Fallback to "sublimit of 30000" pattern
-                    mental_match = re.search(r'sublimit\s+of\s+(\d+)', endorsement_5ii_text, re.IGNORECASE)
+                    mental_match = SUBLIMIT_OF_AMOUNT.search(endorsement_5ii_text)
                     if mental_match:
                         sublimit["limit"] = mental_match.group(1)
-                        print(f"[DEBUG] Assigned mental illness amount: {sublimit['limit']}")
+                        logger.debug("Assigned mental illness amount: %s", sublimit['limit'])
                 
                 elif "balloon" in condition_type and "thermoplasty" in condition_type and "vaporization" in condition_type and "monitoring" in condition_type and "injections" in condition_type:
                     # Fallback to general maximum pattern
-                    balloon_match = re.search(r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE)
+                    balloon_match = MAXIMUM_AMOUNT.search(endorsement_5ii_text)
                     if balloon_match:
                         sublimit["limit"] = balloon_match.group(1).replace(',', '')
-                        print(f"[DEBUG] Assigned balloon/thermoplasty/vaporization/monitoring/injections amount: {sublimit['limit']}")
+                        logger.debug("Assigned balloon/thermoplasty/vaporization/monitoring/injections amount: %s", sublimit['limit'])
                 
                 elif "stem cell" in condition_type:
                     # Fallback to general maximum pattern
-                    stem_match = re.search(r'maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE)
+                    stem_match = MAXIMUM_AMOUNT.search(endorsement_5ii_text)
                     if stem_match:
                         sublimit["limit"] = stem_match.group(1).replace(',', '')
-                        print(f"[DEBUG] Assigned stem cell amount: {sublimit['limit']}")
+                        logger.debug("Assigned stem cell amount: %s", sublimit['limit'])
                 
                 elif "oral chemotherapy" in condition_type or "immunotherapy" in condition_type:
                     # Fallback to "during the Period of Insurance" pattern
-                    chemo_match = re.search(r'(\d+)\s*during\s+the\s+Period\s+of\s+Insurance', endorsement_5ii_text, re.IGNORECASE)
+                    chemo_match = DURING_PERIOD_AMOUNT.search(endorsement_5ii_text)
                     if chemo_match:
                         sublimit["limit"] = chemo_match.group(1)
-                        print(f"[DEBUG] Assigned chemotherapy amount: {sublimit['limit']}")
+                        logger.debug("Assigned chemotherapy amount: %s", sublimit['limit'])
     
     # Final pass: Ensure all sublimits have the correct amounts
     # This handles cases where the amounts might be in different formats
@@ -567,29 +780,29 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
         if not sublimit["limit"]:
             # CRITICAL FIX: Check for "Nil Capping" for Cataract before fallback assignment
             if sublimit["type"] == "Cataract" or "cataract" in sublimit["type"].lower():
-                nil_capping_final_check = re.search(r'Cataract.*?Nil\s+Capping', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                nil_capping_final_check = CATARACT_NIL_CAPPING.search(endorsement_5ii_text)
                 if nil_capping_final_check:
-                    print(f"[DEBUG] Cataract has Nil Capping - keeping limit empty in final pass")
+                    logger.debug("Cataract has Nil Capping - keeping limit empty in final pass")
                     sublimit["limit"] = ""  # Ensure it stays empty
                     continue  # Skip fallback amount assignment for Cataract with Nil Capping
                 
                 # CRITICAL FIX: Also check for Cataract with missing percentage (just "%" without number)
-                missing_percentage_final_check = re.search(r'Cataract.*?%\s+of\s+the\s+sum\s+insured.*?maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                missing_percentage_final_check = CATARACT_MISSING_PERCENTAGE.search(endorsement_5ii_text)
                 if missing_percentage_final_check:
-                    print(f"[DEBUG] Cataract has missing percentage - keeping limit empty in final pass")
+                    logger.debug("Cataract has missing percentage - keeping limit empty in final pass")
                     sublimit["limit"] = ""  # Ensure it stays empty
                     continue  # Skip fallback amount assignment for Cataract with missing percentage
             
             # Try to find any amount in the text and assign it
-            all_amounts = re.findall(r'(?:INR\.?|Rs\.?)\s*([\d,]+)', endorsement_5ii_text, re.IGNORECASE)
+            all_amounts = RUPEE_AMOUNT.findall(endorsement_5ii_text)
             if all_amounts:
                 # Use the first available amount
                 sublimit["limit"] = all_amounts[0].replace(',', '')
-                print(f"[DEBUG] Assigned fallback amount {sublimit['limit']} to {sublimit['type']}")
+                logger.debug("Assigned fallback amount %s to %s", sublimit['limit'], sublimit['type'])
 
-    print(f"[DEBUG] Total sublimits extracted: {len(sublimits)}")
+    logger.debug("Total sublimits extracted: %s", len(sublimits))
     for i, sublimit in enumerate(sublimits):
-        print(f"[DEBUG] {i+1}. Type: '{sublimit['type']}', Limit: '{sublimit['limit']}'")
+        logger.debug("%s. Type: '%s', Limit: '%s'", i+1, sublimit['type'], sublimit['limit'])
     
     # Debug: Check what conditions we missed
     expected_conditions = [
@@ -603,14 +816,14 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
     found_conditions = [sub['type'] for sub in sublimits]
     missing = [cond for cond in expected_conditions if cond not in found_conditions]
     if missing:
-        print(f"[DEBUG] Missing conditions: {missing}")
+        logger.debug("Missing conditions: %s", missing)
         
         # Try to find missing conditions with more flexible patterns
         for missing_condition in missing:
             if "mental illness" in missing_condition.lower():
                 # Look for any mention of mental illness
-                if re.search(r'mental\s+illness', endorsement_5ii_text, re.IGNORECASE):
-                    print(f"[DEBUG] Found mental illness mention, adding condition")
+                if MENTAL_ILLNESS_MENTION.search(endorsement_5ii_text):
+                    logger.debug("Found mental illness mention, adding condition")
                     sublimits.append({
                         "applicable": "Yes",
                         "type": missing_condition,
@@ -619,8 +832,8 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             
             elif "oral chemotherapy" in missing_condition.lower() or "immunotherapy" in missing_condition.lower():
                 # Look for any mention of chemotherapy or immunotherapy
-                if re.search(r'(?:oral\s+)?chemotherapy|immunotherapy', endorsement_5ii_text, re.IGNORECASE):
-                    print(f"[DEBUG] Found chemotherapy/immunotherapy mention, adding condition")
+                if CHEMOTHERAPY_MENTION.search(endorsement_5ii_text):
+                    logger.debug("Found chemotherapy/immunotherapy mention, adding condition")
                     sublimits.append({
                         "applicable": "Yes",
                         "type": missing_condition,
@@ -629,8 +842,8 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             
             elif "stem cell" in missing_condition.lower():
                 # Look for any mention of stem cell
-                if re.search(r'stem\s+cell', endorsement_5ii_text, re.IGNORECASE):
-                    print(f"[DEBUG] Found stem cell mention, adding condition")
+                if STEM_CELL_MENTION.search(endorsement_5ii_text):
+                    logger.debug("Found stem cell mention, adding condition")
                     sublimits.append({
                         "applicable": "Yes",
                         "type": missing_condition,
@@ -639,8 +852,8 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             
             elif "balloon" in missing_condition.lower() and "thermoplasty" in missing_condition.lower() and "vaporization" in missing_condition.lower() and "monitoring" in missing_condition.lower() and "injections" in missing_condition.lower():
                 # Look for any mention of the merged condition
-                if re.search(r'balloon.*?thermoplasty.*?vaporization.*?monitoring.*?injections', endorsement_5ii_text, re.IGNORECASE):
-                    print(f"[DEBUG] Found balloon/thermoplasty/vaporization/monitoring/injections mention, adding condition")
+                if BALLOON_GROUP_MENTION.search(endorsement_5ii_text):
+                    logger.debug("Found balloon/thermoplasty/vaporization/monitoring/injections mention, adding condition")
                     sublimits.append({
                         "applicable": "Yes",
                         "type": missing_condition,
@@ -665,7 +878,7 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             
             # Use the original calculated amount from the merged condition
             original_amount = sublimit["limit"]
-            print(f"[DEBUG] Using original amount from merged condition: {original_amount}")
+            logger.debug("Using original amount from merged condition: %s", original_amount)
             
             # Create individual sublimit entries for each condition
             for individual_condition in individual_conditions:
@@ -675,10 +888,10 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
                 # Special handling for mental illness conditions to ensure correct amount
                 if "mental illness" in individual_condition.lower() or "psychological disorders" in individual_condition.lower() or "neurodegenerative disorders" in individual_condition.lower():
                     # Look for the specific "sublimit of 30000" pattern
-                    mental_match = re.search(r'sublimit\s+of\s+(\d+)', endorsement_5ii_text, re.IGNORECASE)
+                    mental_match = SUBLIMIT_OF_AMOUNT.search(endorsement_5ii_text)
                     if mental_match:
                         individual_amount = mental_match.group(1)
-                        print(f"[DEBUG] Corrected mental illness amount for {individual_condition}: {individual_amount}")
+                        logger.debug("Corrected mental illness amount for %s: %s", individual_condition, individual_amount)
                 
                 final_sublimits.append({
                     "applicable": "Yes",
@@ -696,7 +909,7 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             
             # Use the original calculated amount from the merged condition
             original_amount = sublimit["limit"]
-            print(f"[DEBUG] Using original amount from merged condition: {original_amount}")
+            logger.debug("Using original amount from merged condition: %s", original_amount)
             
             # Create individual sublimit entries for each condition
             for individual_condition in individual_conditions:
@@ -706,16 +919,16 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
                 # Special handling for Oral Chemotherapy and Immunotherapy conditions
                 if any(keyword in individual_condition.lower() for keyword in ["oral chemotherapy", "immunotherapy"]):
                     # Look for the percentage pattern for the merged condition (5% per month)
-                    percentage_match = re.search(r'(\d+)%\s+of\s+the\s+Sum\s+Insured\s+per\s+month\s+subject\s+to\s+a\s+maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE)
+                    percentage_match = PERCENT_PER_MONTH_WITH_MAXIMUM.search(endorsement_5ii_text)
                     if percentage_match:
                         percentage = int(percentage_match.group(1))
                         max_amount = int(percentage_match.group(2).replace(',', ''))
                         # Calculate using the percentage and sum insured
-                        calculated_amount = int((percentage / 100) * 500000)
+                        calculated_amount = int((percentage / 100) * sum_insured)
                         # Return the smaller value between calculated and maximum
                         final_amount = min(calculated_amount, max_amount)
                         individual_amount = str(final_amount)
-                        print(f"[DEBUG] Corrected Oral Chemotherapy/Immunotherapy amount for {individual_condition}: {individual_amount} (using {percentage}%)")
+                        logger.debug("Corrected Oral Chemotherapy/Immunotherapy amount for %s: %s (using %s%%)", individual_condition, individual_amount, percentage)
                 
                 final_sublimits.append({
                     "applicable": "Yes",
@@ -736,7 +949,7 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             
             # Use the original calculated amount from the merged condition
             original_amount = sublimit["limit"]
-            print(f"[DEBUG] Using original amount from merged condition: {original_amount}")
+            logger.debug("Using original amount from merged condition: %s", original_amount)
             
             # Create individual sublimit entries for each condition
             for individual_condition in individual_conditions:
@@ -746,16 +959,16 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
                 # Special handling for balloon/thermoplasty/vaporization/monitoring/injections conditions
                 if any(keyword in individual_condition.lower() for keyword in ["balloon", "thermoplasty", "vaporization", "monitoring", "injections", "bronchial", "intra operative", "intra vitreal"]):
                     # Look for the percentage pattern for the merged condition
-                    percentage_match = re.search(r'(\d+)%\s+of\s+the\s+Sum\s+Insured\s+subject\s+to\s+a\s+maximum\s+of\s+(?:INR\.?|Rs\.?)\s*([\d,]+)/-', endorsement_5ii_text, re.IGNORECASE)
+                    percentage_match = PERCENT_WITH_MAXIMUM.search(endorsement_5ii_text)
                     if percentage_match:
                         percentage = int(percentage_match.group(1))
                         max_amount = int(percentage_match.group(2).replace(',', ''))
                         # Calculate using the percentage and sum insured
-                        calculated_amount = int((percentage / 100) * 500000)
+                        calculated_amount = int((percentage / 100) * sum_insured)
                         # Return the smaller value between calculated and maximum
                         final_amount = min(calculated_amount, max_amount)
                         individual_amount = str(final_amount)
-                        print(f"[DEBUG] Corrected balloon/thermoplasty/vaporization/monitoring/injections amount for {individual_condition}: {individual_amount} (using {percentage}%)")
+                        logger.debug("Corrected balloon/thermoplasty/vaporization/monitoring/injections amount for %s: %s (using %s%%)", individual_condition, individual_amount, percentage)
                 
                 final_sublimits.append({
                     "applicable": "Yes",
@@ -766,11 +979,11 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
             # For non-merged conditions, clean up the name and keep as is
             cleaned_condition_name = condition_name
             # Remove brackets and their contents
-            cleaned_condition_name = re.sub(r'\s*\([^)]*\)', '', cleaned_condition_name)
+            cleaned_condition_name = BRACKETED_TEXT.sub('', cleaned_condition_name)
             # Remove hyphens
-            cleaned_condition_name = re.sub(r'\s*-\s*', ' ', cleaned_condition_name)
+            cleaned_condition_name = HYPHEN.sub(' ', cleaned_condition_name)
             # Clean up extra spaces
-            cleaned_condition_name = re.sub(r'\s+', ' ', cleaned_condition_name).strip()
+            cleaned_condition_name = WHITESPACE_RUN.sub(' ', cleaned_condition_name).strip()
             
             final_sublimits.append({
                 "applicable": sublimit["applicable"],
@@ -786,119 +999,57 @@ def extract_merged_format(endorsement_5ii_text: str) -> List[Dict]:
 
 def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
     """Extract sublimits for INDIVIDUAL format (each condition gets separate row)"""
-    print(f"[DEBUG] Starting INDIVIDUAL format extraction")
+    logger.debug("Starting INDIVIDUAL format extraction")
     sublimits = []
-    table_row_patterns = [
-        # Pattern 1: Exact condition names from table (case-insensitive) - ENHANCED PATTERNS
-        r'^\s*(Cataract)\s*(?:\||Nil|50%|5\(ii\)|$)',
-        r'^\s*(Cataract)\s*Nil\s*Capping',
-        r'^\s*(Cataract)\s*\|.*?Nil\s*Capping',
-        r'^\s*(Cataract)\s*\|.*?Nil',
-        r'^\s*(Cataract)\s*Nil',
-        r'^\s*(Balloon\s+Sinsuplasty)\s*(?:\||50%|5\(ii\)|$)',
-        r'^\s*(Stem\s+Cell\s+therapy)\s*(?:\||50%|5\(ii\)|$)',
-        r'^\s*(Oral\s+Chemotherapy,?\s+Immunotherapy\s*\(\s*monoclonal\s+antibody\s+to\s+be\s+given\s+as\s+injection\s*\))\s*(?:\||50%|5\(ii\)|$)',
-        r'^\s*(Bronchical\s+Thermoplasty)\s*(?:\||50%|5\(ii\)|$)',
-        
-        # VAPORIZATION PATTERNS - individual line formats
-        r'^\s*(vaporization\s+of\s+prostate\s*\(\s*green\s+laser\s+treatment\s*\))\s*(?:\||Nil|50%|10%|5\(ii\)|$)',
-        r'^\s*(vaporization\s+of\s+prostate\s*\(\s*green\s+laser\s+treatment\s*\))',
-        r'^\s*(vaporization\s+of\s+prostate\s*\([^)]*\))',
-        r'^\s*(vaporization\s+of\s+prostate)',
-        
-        r'^\s*(Intra\s+Operative\s+Neuro\s+Monitoring)\s*(?:\||50%|5\(ii\)|$)',
-        r'^\s*(Intra\s+vitreal\s+injections)\s*(?:\||50%|5\(ii\)|$)',
-        
-        # Individual mental illness conditions
-        r'^\s*(Treatment\s+of\s+mental\s+illness)\s*(?:\||50%|5\(ii\)|$)',
-        r'^\s*(stress\s+or\s+psychological\s+disorders)\s*(?:\||50%|5\(ii\)|$)',
-        r'^\s*(neurodegenerative\s+disorders)\s*(?:\||50%|5\(ii\)|$)',
-        
-        # Individual chemotherapy conditions
-        r'^\s*(Oral\s+Chemotherapy)\s*(?:\||50%|5\(ii\)|$)',
-        r'^\s*(Immunotherapy)\s*(?:\||50%|5\(ii\)|$)',
-        
-        # Pattern 2: More flexible patterns for variations
-        r'(Treatment\s+of\s+mental\s+illness,\s+stress\s+or\s+psychological\s+disorders\s+and\s+neurodegenerative\s+disorders\.?)',
-        r'(Treatment\s+of\s+mental\s+illness)',
-        r'(stress\s+or\s+psychological\s+disorders)',
-        r'(neurodegenerative\s+disorders)',
-        r'(Stem\s+[Cc]ell\s+[Tt]herapy(?:\s*-[^|]*)?)',
-        r'(Oral\s+[Cc]hemotherapy,?\s*[Ii]mmunotherapy(?:\s*\([^)]+\))?)',
-        r'(Oral\s+[Cc]hemotherapy)',
-        r'([Ii]mmunotherapy)',
-        r'(Balloon\s+[Ss]in[us]*plasty)',
-        r'(Bronchical?\s+[Tt]hermoplasty)',
-        r'(Intra\s+[Oo]perative\s+[Nn]euro\s+[Mm]onitoring)',
-        r'(Intra\s+[Vv]itreal\s+[Ii]njections)',
-        
-        # Pattern 3: Condition followed by "Nil Capping" - enhanced for vaporization
-        r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+Nil\s+Capping',
-        r'(vaporization[^|]+?)\s+Nil\s+Capping',
-        
-        # Pattern 4: Condition followed by percentage and amount description - enhanced for vaporization
-        r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured',
-        r'(vaporization[^|]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured',
-        
-        # Pattern 5: Specific format from user's text - condition followed by percentage and maximum
-        r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured\s+subject\s+to\s+a\s+maximum',
-        r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured\s+subject\s+to\s+a\s+maximum\s+of',
-        r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+(?:50%|10%|25%|5%)\s+of\s+the\s+sum\s+insured\s+subject\s+to\s+a\s+maximum\s+of\s+(?:INR\.?|Rs\.?)\s*[\d,]+/-',
-        
-        # Pattern 5a: Condition followed by 5(ii) - specific to user's format
-        r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+5\(ii\)',
-        r'^([A-Za-z][A-Za-z\s,\-()]+?)\s+5\(ii\)\s*$',
-        
-        # Pattern 6: Medical conditions with specific keywords (broader match)
-        r'([A-Za-z\s,\-()]*(?:[Tt]herapy|[Pp]lasty|[Mm]onitoring|[Ii]njections|[Cc]hemotherapy|[Ii]mmunotherapy|[Cc]ell|[Pp]rostate|[Nn]euro|[Vv]itreal|[Cc]ataract|[Tt]reatment)[A-Za-z\s,\-()]*)',
-        
-    ]
     
     # Split the text into lines and process each line
     lines = endorsement_5ii_text.split('\n')
-    print(f"[DEBUG] Processing {len(lines)} lines for individual extraction")
+    logger.debug("Processing %s lines for individual extraction", len(lines))
+    # The per-line tracing below lowercases every line; skip it unless debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     for line in lines:
         line = line.strip()
         if not line or len(line) < 5:  # Skip empty or very short lines
             continue
             
-        print(f"[DEBUG] Processing line: {line[:100]}...")  # Debug first 100 chars
+        if debug:
+            logger.debug("Processing line: %s...", line[:100])  # Debug first 100 chars
         
-        # Special debug for vaporization
-        if "vaporization" in line.lower():
-            print(f"[DEBUG] Found vaporization line: {line}")
-            print(f"[DEBUG] Vaporization line will be tested against {len(table_row_patterns)} patterns")
+            # Special debug for vaporization
+            if "vaporization" in line.lower():
+                logger.debug("Found vaporization line: %s", line)
+                logger.debug("Vaporization line will be tested against %s patterns", len(TABLE_ROW_PATTERNS))
         
-        # Special debug for Cataract
-        if "cataract" in line.lower():
-            print(f"[DEBUG] Found Cataract line: {line}")
-            print(f"[DEBUG] Cataract line will be tested against {len(table_row_patterns)} patterns")
+            # Special debug for Cataract
+            if "cataract" in line.lower():
+                logger.debug("Found Cataract line: %s", line)
+                logger.debug("Cataract line will be tested against %s patterns", len(TABLE_ROW_PATTERNS))
         
         # Try to extract condition and limit from each line
-        for pattern_idx, pattern in enumerate(table_row_patterns):
-            match = re.search(pattern, line, re.IGNORECASE | re.MULTILINE)
+        for pattern_idx, pattern in enumerate(TABLE_ROW_PATTERNS):
+            match = pattern.search(line)
             if match:
                 condition_name = match.group(1).strip()
                 
                 # Debug for vaporization matches
-                if "vaporization" in condition_name.lower():
-                    print(f"[DEBUG] VAPORIZATION MATCH found with pattern {pattern_idx}: '{condition_name}'")
-                    print(f"[DEBUG] Pattern was: {pattern}")
+                if debug and "vaporization" in condition_name.lower():
+                    logger.debug("VAPORIZATION MATCH found with pattern %s: '%s'", pattern_idx, condition_name)
+                    logger.debug("Pattern was: %s", pattern.pattern)
                 
                 # Debug for Cataract matches
-                if "cataract" in condition_name.lower():
-                    print(f"[DEBUG] CATARACT MATCH found with pattern {pattern_idx}: '{condition_name}'")
-                    print(f"[DEBUG] Pattern was: {pattern}")
+                if debug and "cataract" in condition_name.lower():
+                    logger.debug("CATARACT MATCH found with pattern %s: '%s'", pattern_idx, condition_name)
+                    logger.debug("Pattern was: %s", pattern.pattern)
                 
                 # Clean up condition name
-                condition_name = re.sub(r'^[\d\.\s\|]+', '', condition_name)  # Remove leading numbers/pipes
-                condition_name = re.sub(r'\s*\|\s*.*$', '', condition_name)  # Remove anything after pipe
+                condition_name = LEADING_NUMBERS_PIPES.sub('', condition_name)  # Remove leading numbers/pipes
+                condition_name = AFTER_PIPE.sub('', condition_name)  # Remove anything after pipe
                 condition_name = condition_name.strip()
                 
                 # Debug after cleanup
-                if "vaporization" in condition_name.lower():
-                    print(f"[DEBUG] VAPORIZATION condition after cleanup: '{condition_name}'")
+                if debug and "vaporization" in condition_name.lower():
+                    logger.debug("VAPORIZATION condition after cleanup: '%s'", condition_name)
                 
                 # Skip if condition name is too short, looks like a header, or contains unwanted patterns
                 skip_patterns = [
@@ -910,7 +1061,7 @@ def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
                 
                 if (len(condition_name) < 3 or 
                     any(skip in condition_name.lower() for skip in skip_patterns) or
-                    re.match(r'^[0-9%\s\-/]+$', condition_name)):  # Skip if only numbers/symbols
+                    ONLY_NUMBERS_SYMBOLS.match(condition_name)):  # Skip if only numbers/symbols
                     continue
                 
                 # Check if we already have this condition
@@ -930,23 +1081,23 @@ def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
                 }
                 
                 # Check if this line has "Nil Capping" anywhere
-                if re.search(r'Nil\s+Capping|nil\s+capping|NIL\s+CAPPING', line, re.IGNORECASE):
+                if NIL_CAPPING_ANY_CASE.search(line):
                     sublimit_info["limit"] = ""
-                    print(f"[DEBUG] Found condition: {condition_name} with Nil Capping")
+                    logger.debug("Found condition: %s with Nil Capping", condition_name)
                 else:
                     # ENHANCED: For Cataract, double-check if "Nil Capping" appears anywhere in the broader text
                     if condition_name.lower() == "cataract":
-                        nil_capping_broader = re.search(r'Cataract.*?Nil\s+Capping', endorsement_5ii_text, re.IGNORECASE | re.DOTALL)
+                        nil_capping_broader = CATARACT_NIL_CAPPING.search(endorsement_5ii_text)
                         if nil_capping_broader:
                             sublimit_info["limit"] = ""
-                            print(f"[DEBUG] Found Cataract with Nil Capping in broader text - setting limit to empty")
+                            logger.debug("Found Cataract with Nil Capping in broader text - setting limit to empty")
                         else:
                             # Try to extract amount from the same line first
-                            amount_match = re.search(r'(?:INR\.?|Rs\.?)\s*([\d,]+)', line, re.IGNORECASE)
+                            amount_match = RUPEE_AMOUNT.search(line)
                             if amount_match:
                                 amount_str = amount_match.group(1).replace(',', '')
                                 sublimit_info["limit"] = amount_str
-                                print(f"[DEBUG] Found condition: {condition_name} with amount on same line: {amount_str}")
+                                logger.debug("Found condition: %s with amount on same line: %s", condition_name, amount_str)
                             else:
                                 # Look for amount in the next few lines after this condition
                                 found_amount = False
@@ -954,30 +1105,30 @@ def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
                                     next_line = lines[next_line_idx].strip()
                                     
                                     # Look for INR/Rs amount patterns
-                                    amount_match = re.search(r'(?:INR\.?|Rs\.?)\s*([\d,]+)/?-?', next_line, re.IGNORECASE)
+                                    amount_match = RUPEE_AMOUNT_NEXT_LINE.search(next_line)
                                     if amount_match:
                                         amount_str = amount_match.group(1).replace(',', '')
                                         sublimit_info["limit"] = amount_str
-                                        print(f"[DEBUG] Found condition: {condition_name} with amount in next line: {amount_str}")
+                                        logger.debug("Found condition: %s with amount in next line: %s", condition_name, amount_str)
                                         found_amount = True
                                         break
                                     
                                     # Also look for percentage patterns that might indicate the amount
-                                    percentage_match = re.search(r'(\d+)%\s+of\s+the\s+sum\s+insured', next_line, re.IGNORECASE)
+                                    percentage_match = PERCENT_OF_SUM_INSURED.search(next_line)
                                     if percentage_match:
                                         percentage = percentage_match.group(1)
-                                        print(f"[DEBUG] Found percentage: {percentage}% for condition: {condition_name}")
+                                        logger.debug("Found percentage: %s%% for condition: %s", percentage, condition_name)
                                 
                                 if not found_amount:
                                     sublimit_info["limit"] = ""
-                                    print(f"[DEBUG] Found condition: {condition_name} with no amount")
+                                    logger.debug("Found condition: %s with no amount", condition_name)
                     else:
                         # Try to extract amount from the same line first
-                        amount_match = re.search(r'(?:INR\.?|Rs\.?)\s*([\d,]+)', line, re.IGNORECASE)
+                        amount_match = RUPEE_AMOUNT.search(line)
                         if amount_match:
                             amount_str = amount_match.group(1).replace(',', '')
                             sublimit_info["limit"] = amount_str
-                            print(f"[DEBUG] Found condition: {condition_name} with amount on same line: {amount_str}")
+                            logger.debug("Found condition: %s with amount on same line: %s", condition_name, amount_str)
                         else:
                             # Look for amount in the next few lines after this condition
                             found_amount = False
@@ -985,23 +1136,23 @@ def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
                                 next_line = lines[next_line_idx].strip()
                                 
                                 # Look for INR/Rs amount patterns
-                                amount_match = re.search(r'(?:INR\.?|Rs\.?)\s*([\d,]+)/?-?', next_line, re.IGNORECASE)
+                                amount_match = RUPEE_AMOUNT_NEXT_LINE.search(next_line)
                                 if amount_match:
                                     amount_str = amount_match.group(1).replace(',', '')
                                     sublimit_info["limit"] = amount_str
-                                    print(f"[DEBUG] Found condition: {condition_name} with amount in next line: {amount_str}")
+                                    logger.debug("Found condition: %s with amount in next line: %s", condition_name, amount_str)
                                     found_amount = True
                                     break
                                 
                                 # Also look for percentage patterns that might indicate the amount
-                                percentage_match = re.search(r'(\d+)%\s+of\s+the\s+sum\s+insured', next_line, re.IGNORECASE)
+                                percentage_match = PERCENT_OF_SUM_INSURED.search(next_line)
                                 if percentage_match:
                                     percentage = percentage_match.group(1)
-                                    print(f"[DEBUG] Found percentage: {percentage}% for condition: {condition_name}")
+                                    logger.debug("Found percentage: %s%% for condition: %s", percentage, condition_name)
                             
                             if not found_amount:
                                 sublimit_info["limit"] = ""
-                                print(f"[DEBUG] Found condition: {condition_name} with no amount")
+                                logger.debug("Found condition: %s with no amount", condition_name)
                 
                 sublimits.append(sublimit_info)
                 break  # Found a match for this line, move to next line
@@ -1036,7 +1187,7 @@ def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
         # Handle any other vaporization variations
         elif "vaporization" in condition_lower and "prostate" in condition_lower:
             cleaned_name = "vaporization of prostate"
-            print(f"[DEBUG] VAPORIZATION condition standardized to: '{cleaned_name}'")
+            logger.debug("VAPORIZATION condition standardized to: '%s'", cleaned_name)
         elif "stem cell therapy" in condition_lower or "bone marrow transplant" in condition_lower:
             cleaned_name = "Stem Cell therapy"
         elif "oral chemotherapy" in condition_lower and "immunotherapy" in condition_lower:
@@ -1063,13 +1214,13 @@ def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
             cleaned_name = "Cataract"
         
         # Remove trailing commas and clean up
-        cleaned_name = re.sub(r',\s*$', '', cleaned_name)
+        cleaned_name = TRAILING_COMMA.sub('', cleaned_name)
         cleaned_name = cleaned_name.strip()
         
         # Remove brackets and their contents, and hyphens
-        cleaned_name = re.sub(r'\s*\([^)]*\)', '', cleaned_name)
-        cleaned_name = re.sub(r'\s*-\s*', ' ', cleaned_name)
-        cleaned_name = re.sub(r'\s+', ' ', cleaned_name).strip()
+        cleaned_name = BRACKETED_TEXT.sub('', cleaned_name)
+        cleaned_name = HYPHEN.sub(' ', cleaned_name)
+        cleaned_name = WHITESPACE_RUN.sub(' ', cleaned_name).strip()
         
         # Skip if this is a duplicate or sub-part of existing condition
         if cleaned_name not in condition_map:
@@ -1118,9 +1269,9 @@ def extract_individual_format(endorsement_5ii_text: str) -> List[Dict]:
     
     sublimits = merged_sublimits
     
-    print(f"[DEBUG] Total sublimits extracted: {len(sublimits)}")
+    logger.debug("Total sublimits extracted: %s", len(sublimits))
     for i, sublimit in enumerate(sublimits):
-        print(f"[DEBUG] {i+1}. Type: '{sublimit['type']}', Limit: '{sublimit['limit']}'")
+        logger.debug("%s. Type: '%s', Limit: '%s'", i+1, sublimit['type'], sublimit['limit'])
     
     return sublimits
 
@@ -1147,7 +1298,7 @@ def extract_corporate_buffer_applicability(text: str) -> str:
     Checks if Endt. No. 10 or Endorsement No. 10 exists in the text.
     Returns 'Yes' if applicable, else 'No'.
     """
-    if re.search(r'(Endt\.|Endorsement)\s*No\.?\s*10\b', text, re.IGNORECASE):
+    if ENDORSEMENT_10_HEADER.search(text):
         return "Yes"
     return "No"
 
@@ -1214,23 +1365,27 @@ def get_complete_row_template():
         "Critical Illness Whether increase in sum insured permissible at renewal": ""
     }
 
-def extract_Eligibility(text: str) -> List[Dict]:
+def extract_Eligibility(text: str, index: Optional[EndorsementIndex] = None,
+                        facts: Optional[DocumentFacts] = None) -> List[Dict]:
+    index = index or segment_endorsements(text)
+    facts = facts or DocumentFacts(text, index)
+
     # Extract Endorsement No. 1 section
-    endorsement_1_match = re.search(r'Endt\.\s*No\.\s*1.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
+    endorsement_1_text = index.section(1, form="endt")
     
-    if not endorsement_1_match:
+    if endorsement_1_text is None:
         # Try alternative patterns for Endt. No. 1
-        endorsement_1_match = re.search(r'Endorsement\s*No\.\s*1.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
+        endorsement_1_text = index.section(1, form="endorsement")
         
-    if not endorsement_1_match:
+    if endorsement_1_text is None:
         # Try to find any section that mentions eligibility or member definitions
-        endorsement_1_match = re.search(r'(?:Eligibility|Member|Insured Person).*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
+        eligibility_match = ELIGIBILITY_SECTION_HINT.search(text)
+        if eligibility_match:
+            endorsement_1_text = index.until_next_header(eligibility_match.start(), eligibility_match.end())
     
-    if not endorsement_1_match:
-        print("[WARNING] Endt. No. 1 section not found, using entire text for extraction")
+    if endorsement_1_text is None:
+        logger.warning("Endt. No. 1 section not found, using entire text for extraction")
         endorsement_1_text = text
-    else:
-        endorsement_1_text = endorsement_1_match.group(0)
     
     # Extract age ranges dynamically from Endorsement No. 1 only
     age_ranges = extract_age_ranges(endorsement_1_text)
@@ -1238,75 +1393,41 @@ def extract_Eligibility(text: str) -> List[Dict]:
     # Extract member counts from Endorsement No. 1 only
     # More robust employee detection - look for various patterns that indicate employee coverage
     employee = 0
-    if re.search(r'Insured Person covers employees of the Insured', endorsement_1_text, re.IGNORECASE):
+    if EMPLOYEES_COVERED.search(endorsement_1_text):
         employee = 1
-    elif re.search(r'employee', endorsement_1_text, re.IGNORECASE):
+    elif EMPLOYEE_MENTION.search(endorsement_1_text):
         employee = 1
-    elif re.search(r'insured person', endorsement_1_text, re.IGNORECASE):
+    elif INSURED_PERSON_MENTION.search(endorsement_1_text):
         employee = 1
     # If we have spouse or children but no explicit employee detection, assume employee is covered
-    elif re.search(r'spouse', endorsement_1_text, re.IGNORECASE) or re.search(r'children', endorsement_1_text, re.IGNORECASE):
+    elif SPOUSE_MENTION.search(endorsement_1_text) or CHILDREN_MENTION.search(endorsement_1_text):
         employee = 1
     
     # More robust spouse detection
     spouse = 0
-    spouse_patterns = [
-        r'Spouse\s*-\s*Spouse means the employee[\u2019\'s]{0,2}\s+legally married partner',
-        r'spouse',
-        r'Dependent Spouse',
-        r'Dependant Spouse',
-        r'Spouse\s*-\s*(\d+)',
-        r'Spouse\s*:\s*(\d+)'
-    ]
     
-    for pattern in spouse_patterns:
-        if re.search(pattern, endorsement_1_text, re.IGNORECASE):
-            spouse = 1
-            break
+    if SPOUSE_PATTERNS.search(endorsement_1_text):
+        spouse = 1
     
     # Extract children count dynamically from Endorsement No. 1 only
     children = 0
     
     # Multiple patterns to catch different formats of dependent children mentions
-    children_patterns = [
-        r'Maximum of (?:the )?first\s*(\d+)\s*dependent children',
-        r'Maximum of (?:the )?first\s*(\d+)\s*dependant children',
-        r'(\d+)\s*dependent children',
-        r'(\d+)\s*dependant children',
-        r'Maximum of (?:the )?first\s*(\d+)\s*children',
-        r'(\d+)\s*children',
-        r'Dependent Children\s*-\s*(\d+)',
-        r'Dependant Children\s*-\s*(\d+)',
-        r'Children\s*-\s*(\d+)',
-        r'Maximum of (?:the )?first\s*(\d+)\s*dependent',
-        r'(\d+)\s*dependent',
-        r'Children\s*:\s*(\d+)',
-        r'Dependent Children\s*:\s*(\d+)',
-        r'Dependant Children\s*:\s*(\d+)',
-        r'Maximum\s*(\d+)\s*children',
-        r'Maximum\s*(\d+)\s*dependent',
-        r'Maximum\s*(\d+)\s*dependant',
-        r'Up to\s*(\d+)\s*children',
-        r'Up to\s*(\d+)\s*dependent',
-        r'Up to\s*(\d+)\s*dependant'
-    ]
     
-    for pattern in children_patterns:
-        children_match = re.search(pattern, endorsement_1_text, re.IGNORECASE)
-        if children_match:
-            children = int(children_match.group(1))
-            break
+    children_match = CHILDREN_PATTERNS.search(endorsement_1_text)
+    if children_match:
+        children = int(children_match.group(1))
     
     # If no specific count found, check if dependent children are mentioned at all
     if children == 0:
-        if re.search(r'dependent children', endorsement_1_text, re.IGNORECASE) or re.search(r'dependant children', endorsement_1_text, re.IGNORECASE):
+        if DEPENDENT_CHILDREN_MENTION.search(endorsement_1_text) or DEPENDANT_CHILDREN_MENTION.search(endorsement_1_text):
             # Default to 2 children if mentioned but no count specified
             children = 2
     
     # If we have children but no employee detected, assume employee is covered
     if children > 0 and employee == 0:
         employee = 1
-        print(f"[INFO] Employee coverage assumed due to {children} dependent children found")
+        logger.debug("Employee coverage assumed due to %s dependent children found", children)
     
     # Extract parents count from Endorsement No. 1 only
     # Check for various parent patterns
@@ -1314,32 +1435,16 @@ def extract_Eligibility(text: str) -> List[Dict]:
     parents_in_law = 0
     
     # Patterns for dependent parents
-    dependent_parents_patterns = [
-        r'Dependent Parents',
-        r'Dependant Parents',
-        r'Dependent Parent',
-        r'Dependant Parent',
-        r'Parents\s*-\s*(\d+)',
-        r'Parent\s*-\s*(\d+)'
-    ]
     
-    for pattern in dependent_parents_patterns:
-        if re.search(pattern, endorsement_1_text, re.IGNORECASE):
+    for pattern in DEPENDENT_PARENTS_PATTERNS:
+        if pattern.search(endorsement_1_text):
             dependent_parents = 2  # Default to 2 (father + mother)
             break
     
     # Patterns for parents in law
-    parents_in_law_patterns = [
-        r'Dependant Parents in law',
-        r'Dependent Parents in law',
-        r'Dependant Parents-in-law',
-        r'Dependent Parents-in-law',
-        r'Parents in law',
-        r'Parents-in-law'
-    ]
     
-    for pattern in parents_in_law_patterns:
-        if re.search(pattern, endorsement_1_text, re.IGNORECASE):
+    for pattern in PARENTS_IN_LAW_PATTERNS:
+        if pattern.search(endorsement_1_text):
             parents_in_law = 2  # Default to 2 (father-in-law + mother-in-law)
             break
     
@@ -1349,31 +1454,17 @@ def extract_Eligibility(text: str) -> List[Dict]:
     total_covered = employee + spouse + children + parents
     
     # Debug information
-    print(f"[DEBUG] Endt. No. 1 extraction results:")
-    print(f"[DEBUG] - Employee: {employee}")
-    print(f"[DEBUG] - Spouse: {spouse}")
-    print(f"[DEBUG] - Children: {children}")
-    print(f"[DEBUG] - Parents: {parents}")
-    print(f"[DEBUG] - Total covered: {total_covered}")
+    logger.debug("Endt. No. 1 extraction results:")
+    logger.debug("- Employee: %s", employee)
+    logger.debug("- Spouse: %s", spouse)
+    logger.debug("- Children: %s", children)
+    logger.debug("- Parents: %s", parents)
+    logger.debug("- Total covered: %s", total_covered)
     
     # Extract buffer information from Endorsement No. 1 only
-    buffer_match = re.search(r'limit of Rs[\.:]?\s?([\d,]+)', endorsement_1_text, re.IGNORECASE)
+    buffer_match = BUFFER_LIMIT.search(endorsement_1_text)
     buffer_limit = int(buffer_match.group(1).replace(',', '')) if buffer_match else 0
 
-    # Extract Sum Insured from the policy text
-    sum_insured = 0
-    sum_insured_match = re.search(r'limit of Rs\.([\d,]+)/- as Corporate floater', text, re.IGNORECASE)
-    if sum_insured_match:
-        sum_insured = int(sum_insured_match.group(1).replace(",", ""))
-    else:
-        # Try alternative patterns for sum insured
-        sum_insured_match = re.search(r'sum insured.*?Rs\.([\d,]+)', text, re.IGNORECASE)
-        if sum_insured_match:
-            sum_insured = int(sum_insured_match.group(1).replace(",", ""))
-        else:
-            # Default sum insured if not found
-            sum_insured = 500000  # Default value
-
     # Extract Corporate Buffer values from Endorsement No: 10
     corporate_buffer_applicable = extract_corporate_buffer_applicability(text)
     corporate_buffer_limit_family = 0
@@ -1382,38 +1473,32 @@ def extract_Eligibility(text: str) -> List[Dict]:
     buffer_opd_limit = 0
     
     # Look for Endorsement No: 10
-    endorsement_10_match = re.search(r'Endt\.\s*No\.\s*10.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
-    if endorsement_10_match:
-        endorsement_10_text = endorsement_10_match.group(0)
+    endorsement_10_text = index.section(10, form="endt")
+    if endorsement_10_text:
         
         # Check if Corporate Buffer/Floater is applicable
-        if re.search(r'corporate\s+(?:buffer|floater)', endorsement_10_text, re.IGNORECASE):
+        if CORPORATE_BUFFER_MENTION.search(endorsement_10_text):
             corporate_buffer_applicable = "Yes"
             
             # Extract Corporate Buffer/Floater Limit
-            floater_limit_match = re.search(r'limit\s+of\s+Rs[\.:]?\s?([\d,]+).*?corporate\s+(?:buffer|floater)', endorsement_10_text, re.IGNORECASE)
-            if floater_limit_match:
-                corporate_buffer_limit_family = int(floater_limit_match.group(1).replace(',', ''))
+            if facts.floater_limit is not None:
+                corporate_buffer_limit_family = facts.floater_limit
             
             # Extract Corporate Buffer Limit Per Family (if different from floater limit)
-            family_limit_match = re.search(r'corporate\s+buffer\s+limit\s+per\s+family.*?Rs[\.:]?\s?([\d,]+)', endorsement_10_text, re.IGNORECASE)
+            family_limit_match = BUFFER_LIMIT_PER_FAMILY.search(endorsement_10_text)
             if family_limit_match:
                 corporate_buffer_limit_family = int(family_limit_match.group(1).replace(',', ''))
             
             # Extract Corporate Buffer Limit Per Parent
-            parent_limit_match = re.search(r'corporate\s+buffer\s+limit\s+per\s+parent.*?Rs[\.:]?\s?([\d,]+)', endorsement_10_text, re.IGNORECASE)
+            parent_limit_match = BUFFER_LIMIT_PER_PARENT.search(endorsement_10_text)
             if parent_limit_match:
                 corporate_buffer_limit_parent = int(parent_limit_match.group(1).replace(',', ''))
             
             # Extract Reload of SI options - Per person limit pattern
-            if re.search(r'per\s+person\s+limit', endorsement_10_text, re.IGNORECASE):
-                equivalent_pattern = r'equivalent\s+to\s+the\s+per\s+person\s+limit'
-                double_pattern = r'double\s+to\s+the\s+per\s+person\s+limit'
-                thrice_pattern = r'thrice\s+to\s+the\s+per\s+person\s+limit'
-
-                has_equivalent = re.search(equivalent_pattern, endorsement_10_text, re.IGNORECASE)
-                has_double = re.search(double_pattern, endorsement_10_text, re.IGNORECASE)
-                has_thrice = re.search(thrice_pattern, endorsement_10_text, re.IGNORECASE)
+            if PER_PERSON_LIMIT.search(endorsement_10_text):
+                has_equivalent = RELOAD_EQUIVALENT.search(endorsement_10_text)
+                has_double = RELOAD_DOUBLE.search(endorsement_10_text)
+                has_thrice = RELOAD_THRICE.search(endorsement_10_text)
 
                 # Check for specific patterns
                 if has_equivalent:
@@ -1426,7 +1511,7 @@ def extract_Eligibility(text: str) -> List[Dict]:
                     reload_of_si = "No limit for the reload of SI"
             
             # Extract Buffer OPD Limit
-            opd_limit_match = re.search(r'buffer\s+opd\s+limit.*?Rs[\.:]?\s?([\d,]+)', endorsement_10_text, re.IGNORECASE)
+            opd_limit_match = BUFFER_OPD_LIMIT.search(endorsement_10_text)
             if opd_limit_match:
                 buffer_opd_limit = int(opd_limit_match.group(1).replace(',', ''))
 
@@ -1441,28 +1526,28 @@ def extract_Eligibility(text: str) -> List[Dict]:
     
     # Extract Critical Illness limit per family only if applicable
     if critical_illness_applicable != "No":
-        critical_limit_match = re.search(r'critical\s+illness\s+limit\s+per\s+family.*?Rs[\.:]?\s?([\d,]+)', text, re.IGNORECASE)
+        critical_limit_match = CRITICAL_ILLNESS_FAMILY_LIMIT.search(text)
         if critical_limit_match:
             critical_illness_limit_family = float(critical_limit_match.group(1).replace(',', ''))
         else:
             # Look for general critical illness limit
-            general_critical_match = re.search(r'critical\s+illness.*?limit.*?Rs[\.:]?\s?([\d,]+)', text, re.IGNORECASE)
+            general_critical_match = CRITICAL_ILLNESS_LIMIT.search(text)
             if general_critical_match:
                 critical_illness_limit_family = float(general_critical_match.group(1).replace(',', ''))
 
     # Extract ALL sublimits from Endt. No. 5(i) and Endt. No. 5(ii)
-    all_sublimits_5i = extract_sublimits_from_endorsement_5i(text)
-    all_sublimits_5ii = extract_all_sublimits_from_endorsement_5ii(text)
+    all_sublimits_5i = extract_sublimits_from_endorsement_5i(text, index, facts)
+    all_sublimits_5ii = extract_all_sublimits_from_endorsement_5ii(text, index, facts)
     
     # Combine both sets of sublimits
     all_sublimits = all_sublimits_5i + all_sublimits_5ii
     
     # Debug: Check what sublimits were extracted
-    print(f"[DEBUG] Total sublimits extracted from 5(i): {len(all_sublimits_5i)}")
-    print(f"[DEBUG] Total sublimits extracted from 5(ii): {len(all_sublimits_5ii)}")
-    print(f"[DEBUG] Combined total sublimits: {len(all_sublimits)}")
+    logger.debug("Total sublimits extracted from 5(i): %s", len(all_sublimits_5i))
+    logger.debug("Total sublimits extracted from 5(ii): %s", len(all_sublimits_5ii))
+    logger.debug("Combined total sublimits: %s", len(all_sublimits))
     for i, sublimit in enumerate(all_sublimits):
-        print(f"[DEBUG] Sublimit {i+1}: Type='{sublimit.get('type', 'MISSING')}', Limit='{sublimit.get('limit', 'MISSING')}'")
+        logger.debug("Sublimit %s: Type='%s', Limit='%s'", i+1, sublimit.get('type', 'MISSING'), sublimit.get('limit', 'MISSING'))
     
    
     covers = []
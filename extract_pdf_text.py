@@ -0,0 +1,170 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+
+import PyPDF2
+import pdfplumber
+
+from app_logging import get_logger
+from pdf_text_cache import CACHE_ENABLED, PDFTextCache, get_default_cache
+from progress import ProgressCallback, report
+
+
+logger = get_logger(__name__)
+
+# Number of worker processes used for page-parallel extraction.
+# Set PDF_EXTRACT_WORKERS=1 to force the sequential path.
+DEFAULT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", "0")) or (os.cpu_count() or 1)
+
+# Below this many pages the cost of starting the pool outweighs the gain
+MIN_PAGES_FOR_POOL = 16
+
+# Same threshold Main used before falling back to PyPDF2
+MIN_TEXT_LENGTH = 100
+
+# Part of the cache key: bump when the extraction output changes
+EXTRACTOR_VERSION = f"pdfplumber-{pdfplumber.__version__}/PyPDF2-{PyPDF2.__version__}/1"
+
+
+def read_pdf_bytes(pdf_file) -> bytes:
+    """Return the raw bytes of an uploaded file, file-like object, path or bytes"""
+    if isinstance(pdf_file, (bytes, bytearray)):
+        return bytes(pdf_file)
+    if isinstance(pdf_file, (str, os.PathLike)):
+        with open(pdf_file, "rb") as handle:
+            return handle.read()
+    if hasattr(pdf_file, "getvalue"):
+        return pdf_file.getvalue()
+    if hasattr(pdf_file, "seek"):
+        pdf_file.seek(0)
+    return pdf_file.read()
+
+
+def count_pages(pdf_bytes: bytes) -> int:
+    """Return the number of pages in the PDF"""
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_page_range(args: Tuple[bytes, int, int], progress: Optional[ProgressCallback] = None) -> List[str]:
+    """Worker: open the in-memory PDF and extract text for pages [start, end)"""
+    pdf_bytes, start, end = args
+    pages = []
+    with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+        for page in pdf.pages[start:end]:
+            pages.append(page.extract_text() or "")
+            # Release the parsed layout objects so long ranges stay flat in memory
+            page.close()
+            report(progress, len(pages), end - start)
+    return pages
+
+
+def _split_page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split the page range into contiguous chunks, one per worker"""
+    chunk_size, remainder = divmod(page_count, workers)
+    ranges = []
+    start = 0
+    for i in range(workers):
+        end = start + chunk_size + (1 if i < remainder else 0)
+        if end > start:
+            ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def extract_pages_pdfplumber(pdf_bytes: bytes, workers: Optional[int] = None,
+                             progress: Optional[ProgressCallback] = None) -> List[str]:
+    """
+    Extract the text of every page with pdfplumber, in page order.
+    The page range is split across a process pool when workers > 1 and the
+    document is large enough; each worker opens the same in-memory bytes.
+    progress is called with (pages done, page count): per page when sequential,
+    per finished chunk with the pool.
+    """
+    workers = workers or DEFAULT_WORKERS
+    page_count = count_pages(pdf_bytes)
+
+    if workers <= 1 or page_count < MIN_PAGES_FOR_POOL:
+        return _extract_page_range((pdf_bytes, 0, page_count), progress)
+
+    ranges = _split_page_ranges(page_count, min(workers, page_count))
+    logger.debug("Extracting %s pages with %s workers", page_count, len(ranges))
+    pages = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        # map() yields results in submission order, so pages come back in order
+        for chunk in executor.map(_extract_page_range, [(pdf_bytes, start, end) for start, end in ranges]):
+            pages.extend(chunk)
+            report(progress, len(pages), page_count)
+    return pages
+
+
+def extract_pages_pypdf2(pdf_bytes: bytes) -> List[str]:
+    """Extract the text of every page with PyPDF2 (fallback backend)"""
+    pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
+    return [page.extract_text() for page in pdf_reader.pages]
+
+
+def join_pages(pages: List[str], skip_empty: bool = True) -> Tuple[str, List[int]]:
+    """
+    Join page texts with a trailing newline per page, as Main always has.
+    Returns the text and the offset at which each page starts in it.
+    """
+    parts = []
+    page_offsets = []
+    position = 0
+    for page in pages:
+        page_offsets.append(position)
+        if page or not skip_empty:
+            parts.append(page + "\n")
+            position += len(page) + 1
+    return "".join(parts), page_offsets
+
+
+def extract_document(pdf_bytes: bytes, workers: Optional[int] = None,
+                     progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Extract text from PDF bytes using pdfplumber, falling back to PyPDF2 when
+    pdfplumber returns too little text (e.g. unusual encodings)
+    """
+    text, page_offsets = join_pages(extract_pages_pdfplumber(pdf_bytes, workers, progress))
+    backend = "pdfplumber"
+
+    # If pdfplumber didn't extract much text, try PyPDF2 as backup
+    if len(text.strip()) < MIN_TEXT_LENGTH:
+        pages = extract_pages_pypdf2(pdf_bytes)
+        report(progress, len(pages), len(pages), "PyPDF2")
+        text, page_offsets = join_pages(pages, skip_empty=False)
+        backend = "PyPDF2"
+
+    return {"text": text, "page_offsets": page_offsets, "backend": backend}
+
+
+def extract_document_cached(pdf_bytes: bytes, workers: Optional[int] = None,
+                            cache: Optional[PDFTextCache] = None,
+                            progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """Return the extracted document from the on-disk cache, extracting it on a miss"""
+    cache = cache or get_default_cache()
+    key = cache.key_for(pdf_bytes, EXTRACTOR_VERSION)
+    entry = cache.get(key)
+    if entry is not None:
+        logger.debug("PDF text cache hit %s", key[:12])
+        pages = len(entry.get("page_offsets") or [])
+        report(progress, pages, pages, "cached")
+        return entry
+
+    entry = extract_document(pdf_bytes, workers, progress)
+    cache.put(key, entry)
+    return entry
+
+
+def extract_text_from_pdf_bytes(pdf_bytes: bytes, workers: Optional[int] = None,
+                                use_cache: bool = CACHE_ENABLED,
+                                progress: Optional[ProgressCallback] = None) -> str:
+    """
+    Extract text from PDF bytes, reusing the on-disk cache for repeat uploads.
+    progress, if given, is called with (pages done, page count) as pages are extracted.
+    """
+    if use_cache:
+        return extract_document_cached(pdf_bytes, workers, progress=progress)["text"]
+    return extract_document(pdf_bytes, workers, progress)["text"]
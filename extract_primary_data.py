@@ -1,6 +1,127 @@
 import re
-from typing import List, Dict
-
+from typing import List, Dict, Optional
+from app_logging import get_logger
+from document_facts import DocumentFacts
+from endorsement_segmenter import EndorsementIndex, register_title, segment_endorsements
+from pattern_registry import register, register_list
+
+logger = get_logger(__name__)
+
+
+# New Born (Endt. No. 12)
+NEWBORN_SPACED = register("primary_data.newborn_spaced", r'new\s*born', re.IGNORECASE)
+NEWBORN = register("primary_data.newborn", r'newborn', re.IGNORECASE)
+NEWBORN_CAPITALISED = register("primary_data.newborn_capitalised", r'new\s*Born', re.IGNORECASE)
+NEWBORN_LIMIT_WORD = register("primary_data.newborn_limit_word", r'limit', re.IGNORECASE)
+NEWBORN_AMOUNT_WORD = register("primary_data.newborn_amount_word", r'amount', re.IGNORECASE)
+NEWBORN_PREMIUM_WORD = register("primary_data.newborn_premium_word", r'premium', re.IGNORECASE)
+NEWBORN_DEPOSIT_WORD = register("primary_data.newborn_deposit_word", r'deposit', re.IGNORECASE)
+NEWBORN_LIMIT = register("primary_data.newborn_limit", r'new\s*born.*?limit.*?Rs\.?([\d,]+)', re.IGNORECASE)
+NEWBORN_AMOUNT = register("primary_data.newborn_amount", r'new\s*born.*?amount.*?Rs\.?([\d,]+)', re.IGNORECASE)
+NEWBORN_AMOUNT_BEFORE = register("primary_data.newborn_amount_before", r'Rs\.?([\d,]+).*?new\s*born', re.IGNORECASE)
+
+# Pre & Post Natal (Endt. No. 11b and Special Conditions)
+MATERNITY_11B_TITLE = r'Maternity Treatment Charges Benefit Extension'
+register_title(MATERNITY_11B_TITLE)
+PRE_POST_NATAL = register("primary_data.pre_post_natal", r'pre.*?natal.*?post.*?natal', re.IGNORECASE)
+PRE_POST_NATAL_SHORT = register("primary_data.pre_post_natal_short", r'pre.*?post.*?natal', re.IGNORECASE)
+PRE_POST_NATAL_HYPHENATED = register("primary_data.pre_post_natal_hyphenated", r'pre-natal.*?post-natal', re.IGNORECASE)
+PRE_POST_NATAL_COVERED = register("primary_data.pre_post_natal_covered", r'Pre-natal and post-natal expenses are covered', re.IGNORECASE)
+OVER_ABOVE_MATERNITY = register("primary_data.over_above_maternity", r'over.*?above.*?maternity.*?limit', re.IGNORECASE)
+OVER_ABOVE_MATERNITY_AMOUNT = register("primary_data.over_above_maternity_amount", r'over.*?above.*?maternity.*?limit.*?Rs\.?([\d,]+)', re.IGNORECASE)
+PRE_POST_NATAL_INPATIENT_ONLY = register("primary_data.pre_post_natal_inpatient_only", r'Pre-natal and post-natal expenses are covered only if.*?in-patient.*?hospital', re.IGNORECASE)
+PRE_POST_NATAL_INPATIENT_LOOSE = register("primary_data.pre_post_natal_inpatient_loose", r'Pre-natal and post-natal expenses are covered.*?only.*?in-patient', re.IGNORECASE)
+PRE_POST_NATAL_OPD_WITHIN_MATERNITY = register("primary_data.pre_post_natal_opd_within_maternity", r'Pre and Post natal OPD expenses.*?sublimit.*?within.*?Maternity limit', re.IGNORECASE)
+PRE_POST_NATAL_OPD_SUBLIMIT = register("primary_data.pre_post_natal_opd_sublimit", r'Pre and Post natal OPD expenses.*?sublimit', re.IGNORECASE)
+LIMITED_TO_AMOUNT = register("primary_data.limited_to_amount", r'limited to Rs\.([\d,]+)', re.IGNORECASE)
+PRE_POST_NATAL_LIMIT = register("primary_data.pre_post_natal_limit", r'pre.*?post.*?natal.*?limit.*?Rs\.?([\d,]+)', re.IGNORECASE)
+SUBLIMIT_AMOUNT = register("primary_data.sublimit_amount", r'sublimit.*?Rs\.?([\d,]+)', re.IGNORECASE)
+COPAY_PERCENT_ADMISSIBLE = register("primary_data.copay_percent_admissible", r'(\d+)%.*?admissible', re.IGNORECASE)
+DEDUCTIBLE_AMOUNT = register("primary_data.deductible_amount", r'deductible.*?Rs\.?([\d,]+)', re.IGNORECASE)
+MEMBER_CONTRIBUTION = register("primary_data.member_contribution", r'member.*?contribution', re.IGNORECASE)
+WAITING_PERIOD_DAYS = register("primary_data.waiting_period_days", r'(\d+)\s*days\s*waiting\s*period', re.IGNORECASE)
+FIRST_N_CHILDREN = register("primary_data.first_n_children", r'first\s*(\d+)\s*children', re.IGNORECASE)
+
+# Maternity (Endt. No. 11b)
+COPAY_WORD = register("primary_data.copay_word", r"copay", re.IGNORECASE)
+COPAY_PERCENT = register("primary_data.copay_percent", r"(\d+)%.*?copay", re.IGNORECASE)
+DEDUCTIBLE_WORD = register("primary_data.deductible_word", r"deductible", re.IGNORECASE)
+DEDUCTIBLE_NUMBER = register("primary_data.deductible_number", r"deductible.*?(\d+)", re.IGNORECASE)
+MATERNITY_COMBINED = register("primary_data.maternity_combined", r"maternity.*?combined", re.IGNORECASE)
+SUM_INSURED_AMOUNT = register("primary_data.sum_insured_amount", r"sum\s+insured.*?Rs\.?([\d,]+)", re.IGNORECASE)
+NORMAL_CAESAREAN_LIMITED_TO = register("primary_data.normal_caesarean_limited_to", r"limited to Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", re.IGNORECASE | re.DOTALL)
+NORMAL_CAESAREAN_MAXIMUM_BENEFIT = register("primary_data.normal_caesarean_maximum_benefit", r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", re.IGNORECASE | re.DOTALL)
+NORMAL_CAESAREAN_RS = register("primary_data.normal_caesarean_rs", r"Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", re.IGNORECASE | re.DOTALL)
+NORMAL_CAESAREAN_LIMITED_TO_SPACED = register("primary_data.normal_caesarean_limited_to_spaced", r"limited to Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", re.IGNORECASE | re.DOTALL)
+BOTH_NORMAL_CAESAREAN_RS = register("primary_data.both_normal_caesarean_rs", r"Rs\.([\d,]+).*?for both Normal and Caesarean", re.IGNORECASE | re.DOTALL)
+BOTH_NORMAL_CAESAREAN_LIMITED_TO = register("primary_data.both_normal_caesarean_limited_to", r"limited to Rs\.([\d,]+).*?for both Normal and Caesarean", re.IGNORECASE | re.DOTALL)
+NORMAL_C_SECTION_INR_FIRST_TWO = register("primary_data.normal_c_section_inr_first_two", r"maximum benefit.*?limited to.*?INR\.?([\d,]+)/-.*?Normal.*?INR\.?([\d,]+)/-.*?C\s*-\s*section.*?first.*?Tow.*?children.*?per.*?Family", re.IGNORECASE | re.DOTALL)
+NORMAL_C_SECTION_INR_FULL_SENTENCE = register("primary_data.normal_c_section_inr_full_sentence", r"The maximum benefit under this Benefit is limited to INR\.?([\d,]+)/-.*?Normal.*?INR\.?([\d,]+)/-.*?C\s*-\s*section.*?first.*?Tow.*?children.*?per.*?Family", re.IGNORECASE | re.DOTALL)
+NORMAL_C_SECTION_INR = register("primary_data.normal_c_section_inr", r"INR\.?([\d,]+)/-.*?Normal.*?INR\.?([\d,]+)/-.*?C\s*-\s*section", re.IGNORECASE | re.DOTALL)
+NORMAL_C_SECTION_INR_AMPERSAND = register("primary_data.normal_c_section_inr_ampersand", r"INR\.?([\d,]+).*?Normal.*?&.*?INR\s*([\d,]+).*?C\s*-\s*section", re.IGNORECASE | re.DOTALL)
+NORMAL_C_SECTION_INR_LOOSE = register("primary_data.normal_c_section_inr_loose", r"INR\.?([\d,]+).*?Normal.*?INR\.?([\d,]+).*?C\s*-\s*section", re.IGNORECASE | re.DOTALL)
+NORMAL_C_SECTION_INR_40000 = register("primary_data.normal_c_section_inr_40000", r"INR\.?40000.*?Normal.*?INR\.?40000.*?C\s*-\s*section", re.IGNORECASE | re.DOTALL)
+MAXIMUM_BENEFIT_LIMITED_TO = register("primary_data.maximum_benefit_limited_to", r"maximum benefit.*?limited to Rs\.([\d,]+)(?:/-)?", re.IGNORECASE | re.DOTALL)
+MATERNITY_LIMIT_AMOUNT = register("primary_data.maternity_limit_amount", r"maternity.*?limit.*?Rs\.?([\d,]+)", re.IGNORECASE)
+
+# Pre/Post Hospitalisation, OPD and policy-wide limits
+PRE_HOSPITALISATION_DAYS = register("primary_data.pre_hospitalisation_days", r'(\d+)\s*days?\s*preceding', re.IGNORECASE)
+POST_HOSPITALISATION_DAYS = register("primary_data.post_hospitalisation_days", r'(\d+)\s*days?\s*immediately\s*after', re.IGNORECASE)
+PRE_POST_COMBINED = register("primary_data.pre_post_combined", r"pre.*?post.*?combined", re.IGNORECASE)
+COMBINED_PRE_POST = register("primary_data.combined_pre_post", r"combined.*?pre.*?post", re.IGNORECASE)
+SUBLIMIT_OF_RS = register("primary_data.sublimit_of_rs", r"sublimit of Rs\.?\s?([\d,]+)", re.IGNORECASE)
+COPAY_OF_ADMISSIBLE_CLAIM = register("primary_data.copay_of_admissible_claim", r"(\d+)% of the admissible claim", re.IGNORECASE)
+AMBULANCE_PER_CLAIM = register("primary_data.ambulance_per_claim", r"limit of Rs\.([\d,]+)/- per claim", re.IGNORECASE)
+AYUSH_PERCENT = register("primary_data.ayush_percent", r"covered up to (\d+)% of the Sum Insured", re.IGNORECASE)
+DISEASE_PERCENT_MAXIMUM = register("primary_data.disease_percent_maximum", r"(\d+)% of the sum insured subject to a maximum of INR\.([\d,]+)/-", re.IGNORECASE)
+ANY_PERCENT = register("primary_data.any_percent", r"(\d+)%")
+MEMBER_CONTRIBUTION_NUMBER = register("primary_data.member_contribution_number", r"member.*?contribution.*?(\d+)", re.IGNORECASE)
+OVER_ABOVE_MATERNITY_RS = register("primary_data.over_above_maternity_rs", r"over.*?above.*?maternity.*?limit.*?Rs\.([\d,]+)", re.IGNORECASE)
+FIRST_ONE_OR_TWO_CHILDREN = register("primary_data.first_one_or_two_children", r"first\s+(one|two|1|2)\s+children?", re.IGNORECASE)
+MATERNITY_WORD = register("primary_data.maternity_word", r"maternity", re.IGNORECASE)
+MATERNAL_WORD = register("primary_data.maternal_word", r"maternal", re.IGNORECASE)
+MATERNITY_LIMIT_WORD = register("primary_data.maternity_limit_word", r"maternity.*?limit", re.IGNORECASE)
+MATERNITY_COVERAGE_WORD = register("primary_data.maternity_coverage_word", r"maternity.*?coverage", re.IGNORECASE)
+NEW_BORN_LIMIT_RS = register("primary_data.new_born_limit_rs", r"new born.*?limit.*?Rs\.([\d,]+)", re.IGNORECASE)
+
+# Maternity and Pre&Post Natal "Is Combined?" detection and limits.
+# Combined pattern (same amount for both Normal and Caesarean)
+COMBINED_DETECTION_PATTERNS = register_list("primary_data.combined_detection", [
+    r"for both Normal and Caesarean",
+    r"both Normal and Caesarean.*?per Family",
+    r"limited to Rs\.([\d,]+).*?for both Normal and Caesarean",
+    r"maximum benefit.*?limited to Rs\.([\d,]+).*?for both Normal and Caesarean"
+], re.IGNORECASE | re.DOTALL)
+# Not combined pattern (different amounts for Normal and Caesarean)
+NOT_COMBINED_DETECTION_PATTERNS = register_list("primary_data.not_combined_detection", [
+    r"Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
+    r"limited to Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
+    r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
+    r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?per Family"
+], re.IGNORECASE | re.DOTALL)
+# Pre&Post Natal combined (specific to the extended coverage example)
+PRE_POST_COMBINED_PATTERNS = register_list("primary_data.pre_post_combined_detection", [
+    r"pre.*?natal.*?and.*?post.*?natal.*?expense.*?is.*?extended.*?to.*?be.*?covered.*?on.*?out.*?patient.*?basis",
+    r"pre.*?natal.*?and.*?post.*?natal.*?expense.*?extended.*?to.*?be.*?covered.*?with.*?a.*?sublimit.*?within.*?maternity.*?limit"
+], re.IGNORECASE | re.DOTALL)
+# Pre&Post Natal not combined (specific to the OPD sublimit example)
+PRE_POST_NOT_COMBINED_PATTERNS = register_list("primary_data.pre_post_not_combined_detection", [
+    r"pre.*?and.*?post.*?natal.*?opd.*?expenses.*?as.*?sublimit.*?of.*?rs\.\s*[\d,]+.*?within.*?maternity.*?limit",
+    r"pre.*?post.*?natal.*?opd.*?expenses.*?as.*?sublimit.*?within.*?maternity.*?limit"
+], re.IGNORECASE | re.DOTALL)
+# Maternity limit: single amount for both Normal and Caesarean
+COMBINED_LIMIT_PATTERNS = register_list("primary_data.combined_limit", [
+    r"limited to Rs\.([\d,]+).*?for both Normal and Caesarean",
+    r"maximum benefit.*?limited to Rs\.([\d,]+).*?for both Normal and Caesarean",
+    r"Rs\.([\d,]+).*?for both Normal and Caesarean.*?per Family"
+], re.IGNORECASE | re.DOTALL)
+# Maternity limit: different amounts for Normal and Caesarean
+NOT_COMBINED_LIMIT_PATTERNS = register_list("primary_data.not_combined_limit", [
+    r"limited to Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
+    r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
+    r"Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
+    r"limited to Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean"
+], re.IGNORECASE | re.DOTALL)
 
 
 Newborn_sum_insured = ""
@@ -9,7 +130,8 @@ Newborn_Limit_percentage = ""
 Newborn_Limit_amount = ""
 Newborn_applicability = ""
 
-def extract_newborn_from_endt_12(text: str) -> Dict:
+def extract_newborn_from_endt_12(text: str, index: Optional[EndorsementIndex] = None,
+                                 facts: Optional[DocumentFacts] = None) -> Dict:
     """Extract New Born data specifically from Endorsement No. 12/12a"""
     newborn_data = {
         "New Born Covered?": "No",
@@ -29,17 +151,17 @@ def extract_newborn_from_endt_12(text: str) -> Dict:
     }
     
     # Extract Endorsement No. 12/12a section
-    endorsement_12_match = re.search(r'Endt\.\s*No\.\s*12\s*(?:\(?a?\)?)?.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
+    index = index or segment_endorsements(text)
+    facts = facts or DocumentFacts(text, index)
+    endorsement_12_text = index.section(12, form="endt")
     
-    if not endorsement_12_match:
+    if endorsement_12_text is None:
         return newborn_data
     
-    endorsement_12_text = endorsement_12_match.group(0)
-    
     # Check if New Born is covered
-    if re.search(r'new\s*born', endorsement_12_text, re.IGNORECASE) or \
-       re.search(r'newborn', endorsement_12_text, re.IGNORECASE) or \
-       re.search(r'new\s*Born', endorsement_12_text, re.IGNORECASE):
+    if NEWBORN_SPACED.search(endorsement_12_text) or \
+       NEWBORN.search(endorsement_12_text) or \
+       NEWBORN_CAPITALISED.search(endorsement_12_text):
         
         newborn_data["New Born Covered?"] = "Yes"
         newborn_data["New Born Covered"] = "Yes"
@@ -48,10 +170,10 @@ def extract_newborn_from_endt_12(text: str) -> Dict:
         newborn_data["Covered From"] = "0"
         
         # Check if New Born Limit is applicable
-        if re.search(r'limit', endorsement_12_text, re.IGNORECASE) or \
-           re.search(r'amount', endorsement_12_text, re.IGNORECASE) or \
-           re.search(r'premium', endorsement_12_text, re.IGNORECASE) or \
-           re.search(r'deposit', endorsement_12_text, re.IGNORECASE):
+        if NEWBORN_LIMIT_WORD.search(endorsement_12_text) or \
+           NEWBORN_AMOUNT_WORD.search(endorsement_12_text) or \
+           NEWBORN_PREMIUM_WORD.search(endorsement_12_text) or \
+           NEWBORN_DEPOSIT_WORD.search(endorsement_12_text):
             newborn_data["Is New Born Limit Applicable"] = "No"
             
             # Set default Sum Insured dropdown to "Sum Insured"
@@ -63,28 +185,27 @@ def extract_newborn_from_endt_12(text: str) -> Dict:
             newborn_data["New Born % Limit Applicable On"] = "Sum Insured"
             
             # Extract Sum Insured amount (from corporate floater or main policy)
-            sum_insured_match = re.search(r'limit of Rs\.([\d,]+)/- as Corporate floater', text, re.IGNORECASE)
-            if sum_insured_match:
-                sum_insured = sum_insured_match.group(1).replace(",", "")
+            if facts.corporate_floater:
+                sum_insured = facts.corporate_floater.replace(",", "")
                 # Store the numeric value for calculation
                 newborn_data["_sum_insured_numeric"] = sum_insured
             
             # Extract New Born Limit Amount from Policy PDF
-            newborn_limit_match = re.search(r'new\s*born.*?limit.*?Rs\.?([\d,]+)', endorsement_12_text, re.IGNORECASE)
+            newborn_limit_match = NEWBORN_LIMIT.search(endorsement_12_text)
             if newborn_limit_match:
                 newborn_limit = newborn_limit_match.group(1).replace(",", "")
                 newborn_data["Limit Amount"] = newborn_limit
                 newborn_data["New Born Limit"] = newborn_limit
             else:
                 # Look for general newborn amount
-                newborn_amount_match = re.search(r'new\s*born.*?amount.*?Rs\.?([\d,]+)', endorsement_12_text, re.IGNORECASE)
+                newborn_amount_match = NEWBORN_AMOUNT.search(endorsement_12_text)
                 if newborn_amount_match:
                     newborn_amount = newborn_amount_match.group(1).replace(",", "")
                     newborn_data["Limit Amount"] = newborn_amount
                     newborn_data["New Born Limit"] = newborn_amount
                 else:
                     # Look for any amount mentioned in newborn context
-                    newborn_general_match = re.search(r'Rs\.?([\d,]+).*?new\s*born', endorsement_12_text, re.IGNORECASE)
+                    newborn_general_match = NEWBORN_AMOUNT_BEFORE.search(endorsement_12_text)
                     if newborn_general_match:
                         newborn_amount = newborn_general_match.group(1).replace(",", "")
                         newborn_data["Limit Amount"] = newborn_amount
@@ -110,7 +231,8 @@ def extract_newborn_from_endt_12(text: str) -> Dict:
     
     return newborn_data
 
-def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
+def extract_pre_post_natal_from_endt_11b(text: str, index: Optional[EndorsementIndex] = None,
+                                         facts: Optional[DocumentFacts] = None) -> Dict:
     """Extract Pre & Post Natal data from Endorsement 11b and Special Conditions"""
     pre_post_natal_data = {
         # Pre-Natal fields
@@ -158,48 +280,50 @@ def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
     }
     
     # Extract Endorsement No. 11b section
-    endorsement_11b_match = re.search(r'Endt\.\s*No\.\s*11\s*\(?b?\)?.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|$)', text, re.IGNORECASE | re.DOTALL)
+    index = index or segment_endorsements(text)
+    facts = facts or DocumentFacts(text, index)
+    endorsement_11b_text = index.section(11, form="endt")
     
     # Check for Pre & Post Natal in Special Conditions
-    special_conditions_match = re.search(r'Special\s+Conditions.*?(?=Endorsement|Endt\.|$)', text, re.IGNORECASE | re.DOTALL)
+    special_conditions_text = index.named_section("Special Conditions")
     
     # Combine both sections for analysis
     analysis_text = ""
-    if endorsement_11b_match:
-        analysis_text += endorsement_11b_match.group(0) + " "
-    if special_conditions_match:
-        analysis_text += special_conditions_match.group(0) + " "
+    if endorsement_11b_text is not None:
+        analysis_text += endorsement_11b_text + " "
+    if special_conditions_text is not None:
+        analysis_text += special_conditions_text + " "
     
     if not analysis_text:
         return pre_post_natal_data
     
     # Check if Pre & Post Natal is applicable
-    if re.search(r'pre.*?natal.*?post.*?natal', analysis_text, re.IGNORECASE) or \
-       re.search(r'pre.*?post.*?natal', analysis_text, re.IGNORECASE) or \
-       re.search(r'pre-natal.*?post-natal', analysis_text, re.IGNORECASE) or \
-       re.search(r'Pre-natal and post-natal expenses are covered', analysis_text, re.IGNORECASE):
+    if PRE_POST_NATAL.search(analysis_text) or \
+       PRE_POST_NATAL_SHORT.search(analysis_text) or \
+       PRE_POST_NATAL_HYPHENATED.search(analysis_text) or \
+       PRE_POST_NATAL_COVERED.search(analysis_text):
         
         pre_post_natal_data["Pre-Natal Benefit Applicable?"] = "Yes"
         pre_post_natal_data["Post-Natal Benefit Applicable?"] = "Yes"
         pre_post_natal_data["Pre-Post-Natal Benefit Applicable?"] = "Yes"
         
         # Check for Over & Above Maternity Limit
-        if re.search(r'over.*?above.*?maternity.*?limit', analysis_text, re.IGNORECASE):
+        if OVER_ABOVE_MATERNITY.search(analysis_text):
             pre_post_natal_data["Over-Above-Maternity Applicable?"] = "Yes"
             
             # Extract Over & Above Maternity Limit amount
-            over_above_match = re.search(r'over.*?above.*?maternity.*?limit.*?Rs\.?([\d,]+)', analysis_text, re.IGNORECASE)
+            over_above_match = OVER_ABOVE_MATERNITY_AMOUNT.search(analysis_text)
             if over_above_match:
                 pre_post_natal_data["Over-Above-Maternity Limit"] = over_above_match.group(1).replace(",", "")
         
         # Check for "Pre-natal and post-natal expenses are covered" with restrictions
-        if re.search(r'Pre-natal and post-natal expenses are covered only if.*?in-patient.*?hospital', analysis_text, re.IGNORECASE):
+        if PRE_POST_NATAL_INPATIENT_ONLY.search(analysis_text):
             # Covered but with restrictions (in-patient only) = No
             pre_post_natal_data["Pre-Natal and Post-Natal Expenses Covered"] = "No"
-        elif re.search(r'Pre-natal and post-natal expenses are covered.*?only.*?in-patient', analysis_text, re.IGNORECASE):
+        elif PRE_POST_NATAL_INPATIENT_LOOSE.search(analysis_text):
             # Covered but with restrictions (in-patient only) = No
             pre_post_natal_data["Pre-Natal and Post-Natal Expenses Covered"] = "No"
-        elif re.search(r'Pre-natal and post-natal expenses are covered', analysis_text, re.IGNORECASE):
+        elif PRE_POST_NATAL_COVERED.search(analysis_text):
             # Covered without restrictions = Yes
             pre_post_natal_data["Pre-Natal and Post-Natal Expenses Covered"] = "Yes"
         else:
@@ -207,9 +331,9 @@ def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
             pre_post_natal_data["Pre-Natal and Post-Natal Expenses Covered"] = "No"
         
         # Check for "Pre and Post natal OPD expenses as sublimit... within the Maternity limit"
-        if re.search(r'Pre and Post natal OPD expenses.*?sublimit.*?within.*?Maternity limit', analysis_text, re.IGNORECASE):
+        if PRE_POST_NATAL_OPD_WITHIN_MATERNITY.search(analysis_text):
             pre_post_natal_data["Over-Above-Maternity Limit Applicable"] = "No"  # Within maternity limit = No
-        elif re.search(r'Pre and Post natal OPD expenses.*?sublimit', analysis_text, re.IGNORECASE):
+        elif PRE_POST_NATAL_OPD_SUBLIMIT.search(analysis_text):
             pre_post_natal_data["Over-Above-Maternity Limit Applicable"] = "Yes"  # Sublimit but not within = Yes
         else:
             pre_post_natal_data["Over-Above-Maternity Limit Applicable"] = "No"
@@ -227,14 +351,13 @@ def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
         pre_post_natal_data["Post-Natal Is Combined (2)"] = "No"
         
         # Extract Sum Insured (from corporate floater or main policy)
-        sum_insured_match = re.search(r'limit of Rs\.([\d,]+)/- as Corporate floater', text, re.IGNORECASE)
-        if sum_insured_match:
-            sum_insured = sum_insured_match.group(1).replace(",", "")
+        if facts.corporate_floater:
+            sum_insured = facts.corporate_floater.replace(",", "")
             pre_post_natal_data["Pre-Natal Sum Insured"] = sum_insured
             pre_post_natal_data["Post-Natal Sum Insured"] = sum_insured
         
         # Extract Maternity Limit for percentage calculation
-        maternity_limit_match = re.search(r'limited to Rs\.([\d,]+)', analysis_text, re.IGNORECASE)
+        maternity_limit_match = LIMITED_TO_AMOUNT.search(analysis_text)
         if maternity_limit_match:
             maternity_limit = maternity_limit_match.group(1).replace(",", "")
             
@@ -261,35 +384,35 @@ def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
                     pass
         
         # Extract Pre & Post Natal Limit Amount from Policy PDF
-        pre_post_limit_match = re.search(r'pre.*?post.*?natal.*?limit.*?Rs\.?([\d,]+)', analysis_text, re.IGNORECASE)
+        pre_post_limit_match = PRE_POST_NATAL_LIMIT.search(analysis_text)
         if pre_post_limit_match:
             limit_amount = pre_post_limit_match.group(1).replace(",", "")
             pre_post_natal_data["Pre-Natal Limit"] = limit_amount
             pre_post_natal_data["Post-Natal Limit"] = limit_amount
         else:
             # Look for general sublimit
-            sublimit_match = re.search(r'sublimit.*?Rs\.?([\d,]+)', analysis_text, re.IGNORECASE)
+            sublimit_match = SUBLIMIT_AMOUNT.search(analysis_text)
             if sublimit_match:
                 limit_amount = sublimit_match.group(1).replace(",", "")
                 pre_post_natal_data["Pre-Natal Limit"] = limit_amount
                 pre_post_natal_data["Post-Natal Limit"] = limit_amount
         
-        # Calculate Pre-Natal Limit Calc Percentage (Pre-Natal Limit/500000*100)
+        # Calculate Pre-Natal Limit Calc Percentage (Pre-Natal Limit/policy sum insured*100)
         if pre_post_natal_data.get("Pre-Natal Limit"):
             try:
                 pre_natal_limit_val = float(pre_post_natal_data["Pre-Natal Limit"])
-                pre_natal_percentage = (pre_natal_limit_val / 500000) * 100
+                pre_natal_percentage = (pre_natal_limit_val / facts.policy_sum_insured) * 100
                 pre_post_natal_data["Pre-Natal Limit Calc Percentage"] = f"{pre_natal_percentage:.1f}"
-                print(f"[OK] Pre-Natal Limit Calc Percentage calculated: {pre_natal_percentage:.1f}%")
+                logger.debug("Pre-Natal Limit Calc Percentage calculated: %.1f%%", pre_natal_percentage)
             except (ValueError, TypeError):
                 pre_post_natal_data["Pre-Natal Limit Calc Percentage"] = ""
-                print("[EMPTY] Could not calculate Pre-Natal Limit Calc Percentage")
+                logger.debug("Could not calculate Pre-Natal Limit Calc Percentage")
         else:
             pre_post_natal_data["Pre-Natal Limit Calc Percentage"] = ""
-            print("[EMPTY] Pre-Natal Limit not found for percentage calculation")
+            logger.debug("Pre-Natal Limit not found for percentage calculation")
         
         # Extract Copay and Deductible information
-        copay_match = re.search(r'(\d+)%.*?admissible', analysis_text, re.IGNORECASE)
+        copay_match = COPAY_PERCENT_ADMISSIBLE.search(analysis_text)
         if copay_match:
             copay_percentage = copay_match.group(1)
             pre_post_natal_data["Pre-Natal Copay"] = copay_percentage
@@ -297,7 +420,7 @@ def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
             pre_post_natal_data["Pre-Natal Copay/Deductible"] = "Copay"
             pre_post_natal_data["Post-Natal Copay/Deductible"] = "Copay"
         
-        deductible_match = re.search(r'deductible.*?Rs\.?([\d,]+)', analysis_text, re.IGNORECASE)
+        deductible_match = DEDUCTIBLE_AMOUNT.search(analysis_text)
         if deductible_match:
             deductible_amount = deductible_match.group(1).replace(",", "")
             pre_post_natal_data["Pre-Natal Deductible"] = deductible_amount
@@ -306,19 +429,19 @@ def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
             pre_post_natal_data["Post-Natal Copay/Deductible"] = "Deductible"
         
         # Extract Member Contribution
-        if re.search(r'member.*?contribution', analysis_text, re.IGNORECASE):
+        if MEMBER_CONTRIBUTION.search(analysis_text):
             pre_post_natal_data["Pre-Natal Member Contribution"] = "Yes"
             pre_post_natal_data["Post-Natal Member Contribution"] = "Yes"
         
         # Extract waiting period
-        waiting_period_match = re.search(r'(\d+)\s*days\s*waiting\s*period', analysis_text, re.IGNORECASE)
+        waiting_period_match = WAITING_PERIOD_DAYS.search(analysis_text)
         if waiting_period_match:
             waiting_period = waiting_period_match.group(1)
             pre_post_natal_data["Pre-Natal Waiting Period"] = waiting_period
             pre_post_natal_data["Post-Natal Waiting Period"] = waiting_period
         
         # Extract limit on number of children
-        children_limit_match = re.search(r'first\s*(\d+)\s*children', analysis_text, re.IGNORECASE)
+        children_limit_match = FIRST_N_CHILDREN.search(analysis_text)
         if children_limit_match:
             children_limit = children_limit_match.group(1)
             pre_post_natal_data["Pre-Natal Limit On Children"] = children_limit
@@ -326,7 +449,8 @@ def extract_pre_post_natal_from_endt_11b(text: str) -> Dict:
     
     return pre_post_natal_data
 
-def extract_maternity_from_endt_11b(text: str) -> Dict:
+def extract_maternity_from_endt_11b(text: str, index: Optional[EndorsementIndex] = None,
+                                    facts: Optional[DocumentFacts] = None) -> Dict:
     """Extract maternity data specifically from Endorsement No. 11(b)"""
     maternity_data = {
         "Benefit Applicable?": "No",
@@ -346,135 +470,134 @@ def extract_maternity_from_endt_11b(text: str) -> Dict:
     }
     
     # Extract Endorsement No. 11(b) section specifically
-    endorsement_11b_match = re.search(r'Endt\.\s*No\.\s*11\s*\(b\)\s*Maternity Treatment Charges Benefit Extension.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|Group Health Policy|$)', text, re.IGNORECASE | re.DOTALL)
+    index = index or segment_endorsements(text)
+    facts = facts or DocumentFacts(text, index)
+    endorsement_11b_text = index.titled_section(11, "b", MATERNITY_11B_TITLE, stop_at_footer=True)
     
-    if not endorsement_11b_match:
-        print("[EMPTY] Endt. No. 11(b) section not found")
+    if endorsement_11b_text is None:
+        logger.debug("Endt. No. 11(b) section not found")
         return maternity_data
-    
-    endorsement_11b_text = endorsement_11b_match.group(0)
-    print("[OK] Endt. No. 11(b) section found")
+    logger.debug("Endt. No. 11(b) section found")
     
     # Check if maternity benefit is applicable (Endt. No. 11(b) exists)
     if "Endt. No. 11 (b) Maternity Treatment Charges Benefit Extension" in text:
         maternity_data["Benefit Applicable?"] = "Yes"
-        print("[OK] Maternity benefit applicable")
+        logger.debug("Maternity benefit applicable")
         
         # Set default waiting period to 0 as per instructions
         maternity_data["Waiting Period (In Days)"] = "0"
-        print("[OK] Waiting period set to 0 (default)")
+        logger.debug("Waiting period set to 0 (default)")
         
         # Set default limit on number of children to 2 as per instructions
         maternity_data["Limit On Number Of Live Children"] = "2"
-        print("[OK] Limit on number of live children set to 2 (default)")
+        logger.debug("Limit on number of live children set to 2 (default)")
         
         # Extract limit on number of children from policy if available
-        children_limit_match = re.search(r"first\s*(\d+)\s*children", endorsement_11b_text, re.IGNORECASE)
+        children_limit_match = FIRST_N_CHILDREN.search(endorsement_11b_text)
         if children_limit_match:
             maternity_data["Limit On Number Of Live Children"] = children_limit_match.group(1)
-            print(f"[OK] Limit on children updated to: {children_limit_match.group(1)}")
+            logger.debug("Limit on children updated to: %s", children_limit_match.group(1))
         
         # Check for Member Contribution
-        if re.search(r"member.*?contribution", endorsement_11b_text, re.IGNORECASE):
+        if MEMBER_CONTRIBUTION.search(endorsement_11b_text):
             maternity_data["Member Contribution Applicable?"] = "Yes"
-            print("[OK] Member contribution applicable")
+            logger.debug("Member contribution applicable")
             
             # Extract Copay or Deductible from Endorsement 11b
-            if re.search(r"copay", endorsement_11b_text, re.IGNORECASE):
+            if COPAY_WORD.search(endorsement_11b_text):
                 maternity_data["Copay or deductible Applicable?"] = "Copay"
-                print("[OK] Copay applicable")
+                logger.debug("Copay applicable")
                 # Extract copay percentage
-                copay_match = re.search(r"(\d+)%.*?copay", endorsement_11b_text, re.IGNORECASE)
+                copay_match = COPAY_PERCENT.search(endorsement_11b_text)
                 if copay_match:
                     maternity_data["Copay"] = copay_match.group(1)
-                    print(f"[OK] Copay percentage: {copay_match.group(1)}%")
+                    logger.debug("Copay percentage: %s%%", copay_match.group(1))
                 else:
                     # Look for general copay percentage
-                    general_copay_match = re.search(r"(\d+)%.*?admissible", endorsement_11b_text, re.IGNORECASE)
+                    general_copay_match = COPAY_PERCENT_ADMISSIBLE.search(endorsement_11b_text)
                     if general_copay_match:
                         maternity_data["Copay"] = general_copay_match.group(1)
-                        print(f"[OK] Copay percentage (general): {general_copay_match.group(1)}%")
+                        logger.debug("Copay percentage (general): %s%%", general_copay_match.group(1))
             
-            elif re.search(r"deductible", endorsement_11b_text, re.IGNORECASE):
+            elif DEDUCTIBLE_WORD.search(endorsement_11b_text):
                 maternity_data["Copay or deductible Applicable?"] = "Deductible"
-                print("[OK] Deductible applicable")
+                logger.debug("Deductible applicable")
                 # Extract deductible amount
-                deductible_match = re.search(r"deductible.*?Rs\.?([\d,]+)", endorsement_11b_text, re.IGNORECASE)
+                deductible_match = DEDUCTIBLE_AMOUNT.search(endorsement_11b_text)
                 if deductible_match:
                     maternity_data["Deductible"] = deductible_match.group(1).replace(",", "")
-                    print(f"[OK] Deductible amount: Rs. {deductible_match.group(1)}")
+                    logger.debug("Deductible amount: Rs. %s", deductible_match.group(1))
                 else:
                     # Look for general deductible
-                    general_deductible_match = re.search(r"deductible.*?(\d+)", endorsement_11b_text, re.IGNORECASE)
+                    general_deductible_match = DEDUCTIBLE_NUMBER.search(endorsement_11b_text)
                     if general_deductible_match:
                         maternity_data["Deductible"] = general_deductible_match.group(1)
-                        print(f"[OK] Deductible amount (general): Rs. {general_deductible_match.group(1)}")
+                        logger.debug("Deductible amount (general): Rs. %s", general_deductible_match.group(1))
         else:
             maternity_data["Member Contribution Applicable?"] = "No"
             maternity_data["Copay or deductible Applicable?"] = "No"
-            print("[OK] Member contribution not applicable")
+            logger.debug("Member contribution not applicable")
         
         # Check if Maternity is Combined
-        if re.search(r"maternity.*?combined", endorsement_11b_text, re.IGNORECASE):
+        if MATERNITY_COMBINED.search(endorsement_11b_text):
             maternity_data["Is Maternity Combined?"] = "Yes"
-            print("[OK] Maternity is combined")
+            logger.debug("Maternity is combined")
         else:
             maternity_data["Is Maternity Combined?"] = "No"
-            print("[OK] Maternity is not combined")
+            logger.debug("Maternity is not combined")
         
         # Extract Sum Insured if maternity is combined
         if maternity_data["Is Maternity Combined?"] == "Yes":
-            sum_insured_match = re.search(r"sum\s+insured.*?Rs\.?([\d,]+)", endorsement_11b_text, re.IGNORECASE)
+            sum_insured_match = SUM_INSURED_AMOUNT.search(endorsement_11b_text)
             if sum_insured_match:
                 maternity_data["Sum Insured"] = sum_insured_match.group(1).replace(",", "")
-                print(f"[OK] Sum Insured: Rs. {sum_insured_match.group(1)}")
+                logger.debug("Sum Insured: Rs. %s", sum_insured_match.group(1))
             else:
                 # Fallback to corporate floater
-                corp_floater_match = re.search(r"limit of Rs\.([\d,]+)/- as Corporate floater", text, re.IGNORECASE)
-                if corp_floater_match:
-                    maternity_data["Sum Insured"] = corp_floater_match.group(1).replace(",", "")
-                    print(f"[OK] Sum Insured (corporate floater): Rs. {corp_floater_match.group(1)}")
+                if facts.corporate_floater:
+                    maternity_data["Sum Insured"] = facts.corporate_floater.replace(",", "")
+                    logger.debug("Sum Insured (corporate floater): Rs. %s", facts.corporate_floater)
         
         # Set % Limit to "Sum Insured" as per instructions
         maternity_data["% Limit"] = "Sum Insured"
-        print("[OK] % Limit set to 'Sum Insured'")
+        logger.debug("% Limit set to 'Sum Insured'")
         
         # Extract Maternity Limit Amount from Policy PDF under Maternity amount
         # First check for Normal delivery and Caesarean amounts
-        normal_caesarean_match = re.search(r"limited to Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+        normal_caesarean_match = NORMAL_CAESAREAN_LIMITED_TO.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Alternative pattern for different text formats
-            normal_caesarean_match = re.search(r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_CAESAREAN_MAXIMUM_BENEFIT.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Pattern for "Rs. 25000/- Per Family for Normal delivery and 35000/- for Caesarean"
-            normal_caesarean_match = re.search(r"Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_CAESAREAN_RS.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Pattern for "limited to Rs. 25000/- Per Family for Normal delivery and 35000/- for Caesarean"
-            normal_caesarean_match = re.search(r"limited to Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_CAESAREAN_LIMITED_TO_SPACED.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Pattern for "Rs.75,000 for both Normal and Caesarean per Family"
-            normal_caesarean_match = re.search(r"Rs\.([\d,]+).*?for both Normal and Caesarean", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = BOTH_NORMAL_CAESAREAN_RS.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Pattern for "limited to Rs.75,000 for both Normal and Caesarean per Family"
-            normal_caesarean_match = re.search(r"limited to Rs\.([\d,]+).*?for both Normal and Caesarean", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = BOTH_NORMAL_CAESAREAN_LIMITED_TO.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Pattern for maximum benefit limit with INR amounts for first two children per family
-            normal_caesarean_match = re.search(r"maximum benefit.*?limited to.*?INR\.?([\d,]+)/-.*?Normal.*?INR\.?([\d,]+)/-.*?C\s*[–-]\s*section.*?first.*?Tow.*?children.*?per.*?Family", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_C_SECTION_INR_FIRST_TWO.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Pattern for "The maximum benefit under this Benefit is limited to INR.40000/- for Normal & INR 40000/- for C – section for first Tow children for per Family."
-            normal_caesarean_match = re.search(r"The maximum benefit under this Benefit is limited to INR\.?([\d,]+)/-.*?Normal.*?INR\.?([\d,]+)/-.*?C\s*[–-]\s*section.*?first.*?Tow.*?children.*?per.*?Family", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_C_SECTION_INR_FULL_SENTENCE.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Simpler pattern for INR amounts - just look for INR followed by amounts for Normal and C-section
-            normal_caesarean_match = re.search(r"INR\.?([\d,]+)/-.*?Normal.*?INR\.?([\d,]+)/-.*?C\s*[–-]\s*section", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_C_SECTION_INR.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Pattern to handle both INR.40000 and INR 40000 formats
-            normal_caesarean_match = re.search(r"INR\.?([\d,]+).*?Normal.*?&.*?INR\s*([\d,]+).*?C\s*[–-]\s*section", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_C_SECTION_INR_AMPERSAND.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Even simpler pattern - just look for INR amounts near Normal and C-section
-            normal_caesarean_match = re.search(r"INR\.?([\d,]+).*?Normal.*?INR\.?([\d,]+).*?C\s*[–-]\s*section", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_C_SECTION_INR_LOOSE.search(endorsement_11b_text)
         if not normal_caesarean_match:
             # Specific pattern for INR 40000 case
-            normal_caesarean_match = re.search(r"INR\.?40000.*?Normal.*?INR\.?40000.*?C\s*[–-]\s*section", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = NORMAL_C_SECTION_INR_40000.search(endorsement_11b_text)
             if normal_caesarean_match:
                 # Force the amounts to be 40000 for both
                 normal_caesarean_match = type('MockMatch', (), {
@@ -482,7 +605,7 @@ def extract_maternity_from_endt_11b(text: str) -> Dict:
                     'group': lambda x: '40000' if x in [1, 2] else None
                 })()
         if not normal_caesarean_match: 
-            normal_caesarean_match = re.search(r"maximum benefit.*?limited to Rs\.([\d,]+)(?:/-)?", endorsement_11b_text, re.IGNORECASE | re.DOTALL)
+            normal_caesarean_match = MAXIMUM_BENEFIT_LIMITED_TO.search(endorsement_11b_text)
 
         if normal_caesarean_match:
             # Check if this is the "for both Normal and Caesarean" pattern (only one amount)
@@ -492,22 +615,22 @@ def extract_maternity_from_endt_11b(text: str) -> Dict:
                 maternity_data["Normal Delivery Limit"] = str(shared_amount)
                 maternity_data["Caesarean Limit"] = str(shared_amount)
                 maternity_data["Limit"] = str(shared_amount)
-                print(f"[OK] Maternity limit extracted - Normal and Caesarean (same amount): Rs. {shared_amount}")
+                logger.debug("Maternity limit extracted - Normal and Caesarean (same amount): Rs. %s", shared_amount)
             elif "per Family" in endorsement_11b_text and len(normal_caesarean_match.groups()) == 1:
                 # Single amount pattern like "Rs.50,000/- per Family"
                 single_amount = int(normal_caesarean_match.group(1).replace(",", ""))
                 maternity_data["Normal Delivery Limit"] = str(single_amount)
                 maternity_data["Caesarean Limit"] = str(single_amount)
                 maternity_data["Limit"] = str(single_amount)
-                print(f"[OK] Maternity limit extracted - Single amount per Family: Rs. {single_amount}")
+                logger.debug("Maternity limit extracted - Single amount per Family: Rs. %s", single_amount)
             elif len(normal_caesarean_match.groups()) == 2:
                 # Different amounts for Normal and Caesarean
                 normal_amount = int(normal_caesarean_match.group(1).replace(",", ""))
                 caesarean_amount = int(normal_caesarean_match.group(2).replace(",", ""))
                 
-                print(f"[DEBUG] Found 2 amounts: Normal={normal_amount}, Caesarean={caesarean_amount}")
-                print(f"[DEBUG] Text contains 'first Tow children': {'first Tow children' in endorsement_11b_text}")
-                print(f"[DEBUG] Text contains 'first two children': {'first two children' in endorsement_11b_text}")
+                logger.debug("Found 2 amounts: Normal=%s, Caesarean=%s", normal_amount, caesarean_amount)
+                logger.debug("Text contains 'first Tow children': %s", 'first Tow children' in endorsement_11b_text)
+                logger.debug("Text contains 'first two children': %s", 'first two children' in endorsement_11b_text)
                 
                 # Check if this is the maximum benefit limit pattern for first two children
                 if "first Tow children" in endorsement_11b_text or "first two children" in endorsement_11b_text:
@@ -518,8 +641,8 @@ def extract_maternity_from_endt_11b(text: str) -> Dict:
                     maternity_data["Limit"] = str(max(normal_amount, caesarean_amount))
                     maternity_data["Max_Benefit_Rule"] = f"Maximum benefit limited to INR {normal_amount}/- for Normal and INR {caesarean_amount}/- for C-section for first two children per Family"
                     
-                    print(f"[OK] Maximum benefit limit extracted - Normal: Rs. {normal_amount}, Caesarean: Rs. {caesarean_amount}")
-                    print(f"[OK] Rule applied: {maternity_data['Max_Benefit_Rule']}")
+                    logger.debug("Maximum benefit limit extracted - Normal: Rs. %s, Caesarean: Rs. %s", normal_amount, caesarean_amount)
+                    logger.debug("Rule applied: %s", maternity_data['Max_Benefit_Rule'])
                 else:
                     # Regular different amounts for Normal and Caesarean
                     maternity_data["Normal Delivery Limit"] = str(normal_amount)
@@ -527,57 +650,60 @@ def extract_maternity_from_endt_11b(text: str) -> Dict:
                     # Use the higher amount as the maternity limit
                     maternity_limit = max(normal_amount, caesarean_amount)
                     maternity_data["Limit"] = str(maternity_limit)
-                    print(f"[OK] Maternity limit extracted - Normal: Rs. {normal_amount}, Caesarean: Rs. {caesarean_amount}, Using: Rs. {maternity_limit}")
+                    logger.debug("Maternity limit extracted - Normal: Rs. %s, Caesarean: Rs. %s, Using: Rs. %s", normal_amount, caesarean_amount, maternity_limit)
             else:
                 # Single amount pattern (fallback)
                 single_amount = int(normal_caesarean_match.group(1).replace(",", ""))
                 maternity_data["Normal Delivery Limit"] = str(single_amount)
                 maternity_data["Caesarean Limit"] = str(single_amount)
                 maternity_data["Limit"] = str(single_amount)
-                print(f"[OK] Maternity limit extracted - Single amount: Rs. {single_amount}")
+                logger.debug("Maternity limit extracted - Single amount: Rs. %s", single_amount)
         else:
             # Fallback to standard single amount pattern
-            maternity_limit_match = re.search(r"limited to Rs\.([\d,]+)", endorsement_11b_text, re.IGNORECASE)
+            maternity_limit_match = LIMITED_TO_AMOUNT.search(endorsement_11b_text)
             if maternity_limit_match:
                 maternity_data["Limit"] = maternity_limit_match.group(1).replace(",", "")
-                print(f"[OK] Maternity limit amount: Rs. {maternity_limit_match.group(1)}")
+                logger.debug("Maternity limit amount: Rs. %s", maternity_limit_match.group(1))
             else:
                 # Look for alternative maternity limit patterns
-                alt_limit_match = re.search(r"maternity.*?limit.*?Rs\.?([\d,]+)", endorsement_11b_text, re.IGNORECASE)
+                alt_limit_match = MATERNITY_LIMIT_AMOUNT.search(endorsement_11b_text)
                 if alt_limit_match:
                     maternity_data["Limit"] = alt_limit_match.group(1).replace(",", "")
-                    print(f"[OK] Maternity limit amount (alternative): Rs. {alt_limit_match.group(1)}")
+                    logger.debug("Maternity limit amount (alternative): Rs. %s", alt_limit_match.group(1))
                 else:
-                    print("[EMPTY] Maternity limit amount not found")
+                    logger.debug("Maternity limit amount not found")
         
         # Set default applicability to "Lower"
         maternity_data["Applicability"] = "Lower"
-        print("[OK] Applicability set to 'Lower'")
+        logger.debug("Applicability set to 'Lower'")
         
         # Extract Copay and Deductible amounts if not already set
         if not maternity_data.get("Copay"):
-            copay_match = re.search(r"(\d+)%.*?admissible", endorsement_11b_text, re.IGNORECASE)
+            copay_match = COPAY_PERCENT_ADMISSIBLE.search(endorsement_11b_text)
             if copay_match:
                 maternity_data["Copay"] = copay_match.group(1)
-                print(f"[OK] Copay percentage: {copay_match.group(1)}%")
+                logger.debug("Copay percentage: %s%%", copay_match.group(1))
         
         if not maternity_data.get("Deductible"):
-            deductible_match = re.search(r"deductible.*?Rs\.?([\d,]+)", endorsement_11b_text, re.IGNORECASE)
+            deductible_match = DEDUCTIBLE_AMOUNT.search(endorsement_11b_text)
             if deductible_match:
                 maternity_data["Deductible"] = deductible_match.group(1).replace(",", "")
-                print(f"[OK] Deductible amount: Rs. {deductible_match.group(1)}")
+                logger.debug("Deductible amount: Rs. %s", deductible_match.group(1))
             else:
-                general_deductible_match = re.search(r"deductible.*?(\d+)", endorsement_11b_text, re.IGNORECASE)
+                general_deductible_match = DEDUCTIBLE_NUMBER.search(endorsement_11b_text)
                 if general_deductible_match:
                     maternity_data["Deductible"] = general_deductible_match.group(1)
-                    print(f"[OK] Deductible amount (general): Rs. {general_deductible_match.group(1)}")
+                    logger.debug("Deductible amount (general): Rs. %s", general_deductible_match.group(1))
     else:
-        print("[EMPTY] Maternity benefit not applicable")
+        logger.debug("Maternity benefit not applicable")
     
     return maternity_data
 
-def extract_primary_data(text: str) -> List[Dict[str, str]]:
+def extract_primary_data(text: str, index: Optional[EndorsementIndex] = None,
+                         facts: Optional[DocumentFacts] = None) -> List[Dict[str, str]]:
     """Extract Pre & Post Hospitalisation, Maternity, and OPD details"""
+    index = index or segment_endorsements(text)
+    facts = facts or DocumentFacts(text, index)
     
     data = {
         # === DYNAMIC COMBINED SECTION - BASED ON SPECIAL CLAUSES ===
@@ -716,7 +842,7 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     # === DEFAULT LOGIC FOR COMBINED_BENEFIT_APPLICABLE ===
     # Set Combined_Benefit_Applicable to "Yes" by default
     data["Combined_Benefit_Applicable"] = "Yes"
-    print("[OK] Combined_Benefit_Applicable set to 'Yes' (default)")
+    logger.debug("Combined_Benefit_Applicable set to 'Yes' (default)")
 
     # === DYNAMIC LOGIC FOR PRE & POST HOSPITALISATION FIELDS ===
     # Always set Pre Hospitalisation fields (with defaults)
@@ -735,29 +861,28 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     data["Limit Amount 2"] = "500000"
     data["Applicability 2"] = "Lower"
     
-    print("[OK] Default values set for Pre & Post Hospitalisation fields")
+    logger.debug("Default values set for Pre & Post Hospitalisation fields")
     
     # Try to extract days from Special Clauses if available
-    special_clauses_match = re.search(r'Special\s+Clauses:\s*(.*?)(?=Endorsement|Endt\.|Group Health Policy|$)', text, re.IGNORECASE | re.DOTALL)
-    if special_clauses_match:
-        special_clauses_text = special_clauses_match.group(1).strip()
+    special_clauses_text = index.named_section("Special Clauses", stop_at_footer=True, require_colon=True, body_only=True)
+    if special_clauses_text is not None:
         
         # Extract number of days from Pre Hospitalisation text (if found)
-        pre_days_match = re.search(r'(\d+)\s*days?\s*preceding', special_clauses_text, re.IGNORECASE)
+        pre_days_match = PRE_HOSPITALISATION_DAYS.search(special_clauses_text)
         if pre_days_match:
             data["No. Of Days 1"] = pre_days_match.group(1)
-            print(f"[OK] Pre Hospitalisation days extracted from Special Clauses: {pre_days_match.group(1)}")
+            logger.debug("Pre Hospitalisation days extracted from Special Clauses: %s", pre_days_match.group(1))
         
         # Extract number of days from Post Hospitalisation text (if found)
-        post_days_match = re.search(r'(\d+)\s*days?\s*immediately\s*after', special_clauses_text, re.IGNORECASE)
+        post_days_match = POST_HOSPITALISATION_DAYS.search(special_clauses_text)
         if post_days_match:
             data["No. Of Days 2"] = post_days_match.group(1)
-            print(f"[OK] Post Hospitalisation days extracted from Special Clauses: {post_days_match.group(1)}")
+            logger.debug("Post Hospitalisation days extracted from Special Clauses: %s", post_days_match.group(1))
 
     # Check if Pre and Post are combined (this logic is preserved but won't affect the hardcoded combined section)
     if "Pre Hospitalisation Expenses" in text and "Post Hospitalisation Expenses" in text:
         # Check if they are mentioned as combined (but won't change the hardcoded "Combined_Is_Pre_and_Post_Combined" value)
-        if re.search(r"pre.*?post.*?combined", text, re.IGNORECASE) or re.search(r"combined.*?pre.*?post", text, re.IGNORECASE):
+        if PRE_POST_COMBINED.search(text) or COMBINED_PRE_POST.search(text):
             # The hardcoded value "No" will remain unchanged
             pass
         else:
@@ -789,43 +914,39 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     if "Pre-Natal and Post-Natal Expense is extended to be covered on Out-patient basis" in text:
         # Note: Post Hospitalisation fields are hardcoded and will not be updated here
         # Only Limit Amount 2 can be updated for OPD sublimit
-        opd_limit = re.search(r"sublimit of Rs\.?\s?([\d,]+)", text, re.IGNORECASE)
+        opd_limit = SUBLIMIT_OF_RS.search(text)
         if opd_limit:
             data["Limit Amount 2"] = opd_limit.group(1).replace(",", "")
 
     # === Maternity Limit ===
-    maternity_limit = re.search(r"limited to Rs\.([\d,]+)", text, re.IGNORECASE)
+    maternity_limit = LIMITED_TO_AMOUNT.search(text)
     if maternity_limit:
         # Note: This will NOT affect the hardcoded "Combined_Limit" field in Combined section
         pass
 
     # === Co-payment % ===
-    co_pay = re.search(r"(\d+)% of the admissible claim", text, re.IGNORECASE)
+    co_pay = COPAY_OF_ADMISSIBLE_CLAIM.search(text)
     if co_pay:
         # Note: This will NOT affect the hardcoded "Combined_Percent_Limit" field in Combined section
         pass
 
     # === Corporate Floater ===
-    corp_floater = re.search(r"limit of Rs\.([\d,]+)/- as Corporate floater", text, re.IGNORECASE)
-    if corp_floater:
-        data["Limit Amount 1"] = corp_floater.group(1).replace(",", "")
+    if facts.corporate_floater:
+        data["Limit Amount 1"] = facts.corporate_floater.replace(",", "")
 
     # === Ambulance limit fallback ===
-    ambulance = re.search(r"limit of Rs\.([\d,]+)/- per claim", text, re.IGNORECASE)
+    ambulance = AMBULANCE_PER_CLAIM.search(text)
     if ambulance and not data["Limit Amount 1"]:
         data["Limit Amount 1"] = ambulance.group(1).replace(",", "")
 
     # === AYUSH treatment ===
-    ayush = re.search(r"covered up to (\d+)% of the Sum Insured", text, re.IGNORECASE)
+    ayush = AYUSH_PERCENT.search(text)
     if ayush:
         data["Limit Percentage 1"] = ayush.group(1)
 
     # NOTE: Post Hospitalisation "Limit Percentage 2" is hardcoded to "100" and will not be modified by any logic
     # === Specific disease limits ===
-    disease = re.search(
-        r"(\d+)% of the sum insured subject to a maximum of INR\.([\d,]+)/-",
-        text, re.IGNORECASE
-    )
+    disease = DISEASE_PERCENT_MAXIMUM.search(text)
     if disease:
         # Note: Post Hospitalisation "Limit Percentage 2" is hardcoded and will not be updated here
         # Only Limit Amount 2 can be updated for disease limits
@@ -833,14 +954,14 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
 
     # NOTE: Pre Hospitalisation "% Limit Applicable 1" is hardcoded to "Sum Insured" and will not be modified by any logic
     # === Fallback: generic % ===
-    percentages = re.findall(r"(\d+)%", text)
+    percentages = ANY_PERCENT.findall(text)
     used = {data.get("Limit Percentage 1"), data.get("Limit Percentage 2")}
     unused = [p for p in percentages if p not in used]
     # Removed logic that was updating "% Limit Applicable 1" as it's now hardcoded
 
     # === Maternity Benefits from Endorsement 11b ===
     # Extract maternity data specifically from Endorsement No. 11b
-    maternity_data = extract_maternity_from_endt_11b(text)
+    maternity_data = extract_maternity_from_endt_11b(text, index, facts)
     
     # Update the main data dictionary with maternity data
     data.update(maternity_data)
@@ -850,37 +971,21 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     # Combined example: "The maximum benefit under this Benefit is limited to Rs.75,000 for both Normal and Caesarean per Family"
     # Not combined example: "The maximum benefit under this Benefit is limited to Rs. 25000/- Per Family for Normal delivery and 35000/- for Caesarean"
     
-    # Search for combined pattern (same amount for both Normal and Caesarean)
-    combined_patterns = [
-        r"for both Normal and Caesarean",
-        r"both Normal and Caesarean.*?per Family",
-        r"limited to Rs\.([\d,]+).*?for both Normal and Caesarean",
-        r"maximum benefit.*?limited to Rs\.([\d,]+).*?for both Normal and Caesarean"
-    ]
-    
-    # Search for not combined pattern (different amounts for Normal and Caesarean)
-    not_combined_patterns = [
-        r"Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
-        r"limited to Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
-        r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
-        r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?per Family"
-    ]
-    
     is_combined = None
     
     # First check for combined patterns
-    for pattern in combined_patterns:
-        if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
+    for pattern in COMBINED_DETECTION_PATTERNS:
+        if pattern.search(text):
             is_combined = True
-            print("[OK] Maternity benefits are COMBINED (same amount for Normal and Caesarean)")
+            logger.debug("Maternity benefits are COMBINED (same amount for Normal and Caesarean)")
             break
     
     # If not found as combined, check for not combined patterns
     if is_combined is None:
-        for pattern in not_combined_patterns:
-            if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
+        for pattern in NOT_COMBINED_DETECTION_PATTERNS:
+            if pattern.search(text):
                 is_combined = False
-                print("[OK] Maternity benefits are NOT COMBINED (different amounts for Normal and Caesarean)")
+                logger.debug("Maternity benefits are NOT COMBINED (different amounts for Normal and Caesarean)")
                 break
     
     # Update the data with the result
@@ -888,7 +993,7 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
         data["Maternity Is Combined?"] = "Yes" if is_combined else "No"
     else:
         # If no pattern found, keep the default value
-        print("[INFO] No clear pattern found for Maternity Is Combined?, keeping default value")
+        logger.debug("No clear pattern found for Maternity Is Combined?, keeping default value")
     
     # === Pre&Post Natal Is Combined Logic ===
     # Check if Pre&Post Natal benefits are combined based on text patterns from Endt. No. 11 and Special Clauses
@@ -900,47 +1005,35 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     special_clauses_section = ""
     
     # Extract Endt. No. 11 section
-    endt_11_match = re.search(r'Endt\.\s*No\.\s*11.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|Group Health Policy|$)', text, re.IGNORECASE | re.DOTALL)
-    if endt_11_match:
-        endt_11_section = endt_11_match.group(0)
-        print("[OK] Endt. No. 11 section found")
+    endt_11_match = index.section(11, form="endt", stop_at_footer=True)
+    if endt_11_match is not None:
+        endt_11_section = endt_11_match
+        logger.debug("Endt. No. 11 section found")
     
     # Extract Special Clauses section
-    special_clauses_match = re.search(r'Special\s+Clauses.*?(?=Endt\.\s*No\.|Endorsement\s*No\.|Group Health Policy|$)', text, re.IGNORECASE | re.DOTALL)
-    if special_clauses_match:
-        special_clauses_section = special_clauses_match.group(0)
-        print("[OK] Special Clauses section found")
+    special_clauses_match = index.named_section("Special Clauses", stop_at_headers_only=True, stop_at_footer=True)
+    if special_clauses_match is not None:
+        special_clauses_section = special_clauses_match
+        logger.debug("Special Clauses section found")
     
     # Combine both sections for search
     search_text = endt_11_section + " " + special_clauses_section
     
-    # Search for combined patterns (specific to the extended coverage example)
-    pre_post_combined_patterns = [
-        r"pre.*?natal.*?and.*?post.*?natal.*?expense.*?is.*?extended.*?to.*?be.*?covered.*?on.*?out.*?patient.*?basis",
-        r"pre.*?natal.*?and.*?post.*?natal.*?expense.*?extended.*?to.*?be.*?covered.*?with.*?a.*?sublimit.*?within.*?maternity.*?limit"
-    ]
-    
-    # Search for not combined patterns (specific to the OPD sublimit example)
-    pre_post_not_combined_patterns = [
-        r"pre.*?and.*?post.*?natal.*?opd.*?expenses.*?as.*?sublimit.*?of.*?rs\.\s*[\d,]+.*?within.*?maternity.*?limit",
-        r"pre.*?post.*?natal.*?opd.*?expenses.*?as.*?sublimit.*?within.*?maternity.*?limit"
-    ]
-    
     pre_post_is_combined = None
     
     # First check for combined patterns in the specific sections
-    for pattern in pre_post_combined_patterns:
-        if re.search(pattern, search_text, re.IGNORECASE | re.DOTALL):
+    for pattern in PRE_POST_COMBINED_PATTERNS:
+        if pattern.search(search_text):
             pre_post_is_combined = True
-            print("[OK] Pre&Post Natal benefits are COMBINED (found in Endt. No. 11 or Special Clauses)")
+            logger.debug("Pre&Post Natal benefits are COMBINED (found in Endt. No. 11 or Special Clauses)")
             break
     
     # If not found as combined, check for not combined patterns in the specific sections
     if pre_post_is_combined is None:
-        for pattern in pre_post_not_combined_patterns:
-            if re.search(pattern, search_text, re.IGNORECASE | re.DOTALL):
+        for pattern in PRE_POST_NOT_COMBINED_PATTERNS:
+            if pattern.search(search_text):
                 pre_post_is_combined = False
-                print("[OK] Pre&Post Natal benefits are NOT COMBINED (found in Endt. No. 11 or Special Clauses)")
+                logger.debug("Pre&Post Natal benefits are NOT COMBINED (found in Endt. No. 11 or Special Clauses)")
                 break
     
     # Update the data with the result
@@ -948,11 +1041,11 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
         data["Is Pre&Post Natal Combined?"] = "Yes" if pre_post_is_combined else "No"
     else:
         # If no pattern found, keep the default value
-        print("[INFO] No clear pattern found for Is Pre&Post Natal Combined? in Endt. No. 11 or Special Clauses, keeping default value")
+        logger.debug("No clear pattern found for Is Pre&Post Natal Combined? in Endt. No. 11 or Special Clauses, keeping default value")
     
     # === Pre & Post Natal Benefits from Endorsement 11b and Special Conditions ===
     # Extract Pre & Post Natal data specifically from Endorsement 11b and Special Conditions
-    pre_post_natal_data = extract_pre_post_natal_from_endt_11b(text)
+    pre_post_natal_data = extract_pre_post_natal_from_endt_11b(text, index, facts)
     
     # Update the main data dictionary with Pre & Post Natal data
     data.update(pre_post_natal_data)
@@ -962,36 +1055,22 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     
     if data.get("Maternity Is Combined?") == "Yes":
         # Combined case: Look for single amount for both Normal and Caesarean
-        combined_patterns = [
-            r"limited to Rs\.([\d,]+).*?for both Normal and Caesarean",
-            r"maximum benefit.*?limited to Rs\.([\d,]+).*?for both Normal and Caesarean",
-            r"Rs\.([\d,]+).*?for both Normal and Caesarean.*?per Family"
-            
-        ]
-        
-        for pattern in combined_patterns:
-            maternity_limit_match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in COMBINED_LIMIT_PATTERNS:
+            maternity_limit_match = pattern.search(text)
             if maternity_limit_match:
                 shared_amount = int(maternity_limit_match.group(1).replace(",", ""))
                 data["Maternity Normal Delivery Limit"] = str(shared_amount)
                 data["Maternity Caesarean Limit"] = str(shared_amount)
                 data["Maternity Limit"] = str(shared_amount)
-                print(f"[OK] Maternity limit extracted (COMBINED) - Normal and Caesarean: Rs. {shared_amount}")
+                logger.debug("Maternity limit extracted (COMBINED) - Normal and Caesarean: Rs. %s", shared_amount)
                 break
         else:
-            print("[EMPTY] Combined maternity limit not found")
+            logger.debug("Combined maternity limit not found")
             
     elif data.get("Maternity Is Combined?") == "No":
         # Not combined case: Look for different amounts for Normal and Caesarean
-        not_combined_patterns = [
-            r"limited to Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
-            r"maximum.*?benefit.*?limited.*?Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
-            r"Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean",
-            r"limited to Rs\.\s*([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean"
-        ]
-        
-        for pattern in not_combined_patterns:
-            maternity_limit_match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in NOT_COMBINED_LIMIT_PATTERNS:
+            maternity_limit_match = pattern.search(text)
             if maternity_limit_match:
                 normal_amount = int(maternity_limit_match.group(1).replace(",", ""))
                 caesarean_amount = int(maternity_limit_match.group(2).replace(",", ""))
@@ -1001,24 +1080,24 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
                 # Use the higher amount as the maternity limit
                 maternity_limit = max(normal_amount, caesarean_amount)
                 data["Maternity Limit"] = str(maternity_limit)
-                print(f"[OK] Maternity limit extracted (NOT COMBINED) - Normal: Rs. {normal_amount}, Caesarean: Rs. {caesarean_amount}, Using: Rs. {maternity_limit}")
+                logger.debug("Maternity limit extracted (NOT COMBINED) - Normal: Rs. %s, Caesarean: Rs. %s, Using: Rs. %s", normal_amount, caesarean_amount, maternity_limit)
                 break
         else:
-            print("[EMPTY] Not combined maternity limit not found")
+            logger.debug("Not combined maternity limit not found")
     
     else:
         # Fallback: Try both patterns if combined status is unknown
         # First try combined pattern
-        combined_match = re.search(r"limited to Rs\.([\d,]+).*?for both Normal and Caesarean", text, re.IGNORECASE | re.DOTALL)
+        combined_match = BOTH_NORMAL_CAESAREAN_LIMITED_TO.search(text)
         if combined_match:
             shared_amount = int(combined_match.group(1).replace(",", ""))
             data["Maternity Normal Delivery Limit"] = str(shared_amount)
             data["Maternity Caesarean Limit"] = str(shared_amount)
             data["Maternity Limit"] = str(shared_amount)
-            print(f"[OK] Maternity limit extracted (fallback combined) - Normal and Caesarean: Rs. {shared_amount}")
+            logger.debug("Maternity limit extracted (fallback combined) - Normal and Caesarean: Rs. %s", shared_amount)
         else:
             # Try not combined pattern
-            not_combined_match = re.search(r"limited to Rs\.([\d,]+)/-.*?Normal\s+delivery.*?([\d,]+)/-.*?Caesarean", text, re.IGNORECASE | re.DOTALL)
+            not_combined_match = NORMAL_CAESAREAN_LIMITED_TO.search(text)
             if not_combined_match:
                 normal_amount = int(not_combined_match.group(1).replace(",", ""))
                 caesarean_amount = int(not_combined_match.group(2).replace(",", ""))
@@ -1026,21 +1105,20 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
                 data["Maternity Caesarean Limit"] = str(caesarean_amount)
                 maternity_limit = max(normal_amount, caesarean_amount)
                 data["Maternity Limit"] = str(maternity_limit)
-                print(f"[OK] Maternity limit extracted (fallback not combined) - Normal: Rs. {normal_amount}, Caesarean: Rs. {caesarean_amount}, Using: Rs. {maternity_limit}")
+                logger.debug("Maternity limit extracted (fallback not combined) - Normal: Rs. %s, Caesarean: Rs. %s, Using: Rs. %s", normal_amount, caesarean_amount, maternity_limit)
             else:
                 # Final fallback to standard single amount pattern
-                maternity_limit_match = re.search(r"limited to Rs\.([\d,]+)", text, re.IGNORECASE)
+                maternity_limit_match = LIMITED_TO_AMOUNT.search(text)
                 if maternity_limit_match:
                     maternity_limit = int(maternity_limit_match.group(1).replace(",", ""))
                     data["Maternity Limit"] = str(maternity_limit)
-                    print(f"[OK] Maternity limit extracted (single amount fallback): Rs. {maternity_limit}")
+                    logger.debug("Maternity limit extracted (single amount fallback): Rs. %s", maternity_limit)
                 else:
-                    print("[EMPTY] Maternity limit not found")
+                    logger.debug("Maternity limit not found")
     
     # Extract Sum Insured (assuming from corporate floater or main policy)
-    sum_insured_match = re.search(r"limit of Rs\.([\d,]+)/- as Corporate floater", text, re.IGNORECASE)
-    if sum_insured_match:
-        sum_insured = int(sum_insured_match.group(1).replace(",", ""))
+    if facts.sum_insured:
+        sum_insured = facts.sum_insured
         data["Maternity Sum Insured"] = str(sum_insured)
         data["Pre-Natal Sum Insured"] = str(sum_insured)
         data["Post-Natal Sum Insured"] = str(sum_insured)
@@ -1062,28 +1140,28 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
             data["Post-Natal % Limit"] = f"{post_natal_percentage:.1f}"
 
     # Extract Pre & Post Natal sublimit from Special Conditions
-    opd_sublimit_match = re.search(r"sublimit of Rs\.?\s?([\d,]+)", text, re.IGNORECASE)
+    opd_sublimit_match = SUBLIMIT_OF_RS.search(text)
     if opd_sublimit_match:
         opd_sublimit = int(opd_sublimit_match.group(1).replace(",", ""))
         data["Pre-Natal Limit"] = str(opd_sublimit)
         data["Post-Natal Limit"] = str(opd_sublimit)
     
-    # Calculate Pre-Natal Limit Calc Percentage (Pre-Natal Limit/500000*100)
+    # Calculate Pre-Natal Limit Calc Percentage (Pre-Natal Limit/policy sum insured*100)
     if data.get("Pre-Natal Limit"):
         try:
             pre_natal_limit_val = float(data["Pre-Natal Limit"])
-            pre_natal_percentage = (pre_natal_limit_val / 500000) * 100
+            pre_natal_percentage = (pre_natal_limit_val / facts.policy_sum_insured) * 100
             data["Pre-Natal Limit Calc Percentage"] = f"{pre_natal_percentage:.1f}"
-            print(f"[OK] Pre-Natal Limit Calc Percentage calculated: {pre_natal_percentage:.1f}%")
+            logger.debug("Pre-Natal Limit Calc Percentage calculated: %.1f%%", pre_natal_percentage)
         except (ValueError, TypeError):
             data["Pre-Natal Limit Calc Percentage"] = ""
-            print("[EMPTY] Could not calculate Pre-Natal Limit Calc Percentage")
+            logger.debug("Could not calculate Pre-Natal Limit Calc Percentage")
     else:
         data["Pre-Natal Limit Calc Percentage"] = ""
-        print("[EMPTY] Pre-Natal Limit not found for percentage calculation")
+        logger.debug("Pre-Natal Limit not found for percentage calculation")
 
     # Extract Co-payment information
-    co_payment_matches = re.findall(r"(\d+)% of the admissible claim", text, re.IGNORECASE)
+    co_payment_matches = COPAY_OF_ADMISSIBLE_CLAIM.findall(text)
     if co_payment_matches:
         co_payment_percentage = co_payment_matches[0]
         data["Maternity Copay"] = co_payment_percentage
@@ -1101,36 +1179,35 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
         data["Pre-Natal Benefit Applicable?"] = "Yes"
         data["Post-Natal Benefit Applicable?"] = "Yes"
         data["Pre-Post-Natal Benefit Applicable?"] = "Yes"
-        print("[OK] Pre & Post Natal OPD benefits found in Special Conditions")
+        logger.debug("Pre & Post Natal OPD benefits found in Special Conditions")
 
     # Extract Sum Insured for Pre-Natal and Post-Natal
-    sum_insured_match = re.search(r"limit of Rs\.([\d,]+)/- as Corporate floater", text, re.IGNORECASE)
-    if sum_insured_match:
-        sum_insured = int(sum_insured_match.group(1).replace(",", ""))
+    if facts.sum_insured:
+        sum_insured = facts.sum_insured
         data["Sum Insured"] = str(sum_insured)
         data["Pre-Natal % Limit Applicable On"] = "Sum Insured"
         data["Post-Natal % Limit Applicable On"] = "Sum Insured"
         data["Pre-Post-Natal % Limit Applicable On"] = "Sum Insured"
-        print(f"[OK] Sum Insured: Rs. {sum_insured}")
+        logger.debug("Sum Insured: Rs. %s", sum_insured)
 
     # Extract Co-payment information
-    co_payment_matches = re.findall(r"(\d+)% of the admissible claim", text, re.IGNORECASE)
+    co_payment_matches = COPAY_OF_ADMISSIBLE_CLAIM.findall(text)
     if co_payment_matches:
         co_payment_percentage = co_payment_matches[0]
         data["Copay"] = co_payment_percentage
-        print(f"[OK] Co-payment: {co_payment_percentage}%")
+        logger.debug("Co-payment: %s%%", co_payment_percentage)
 
     # Extract deductible information if present
-    deductible_match = re.search(r"deductible.*?(\d+)", text, re.IGNORECASE)
+    deductible_match = DEDUCTIBLE_NUMBER.search(text)
     if deductible_match:
         data["Deductible"] = deductible_match.group(1)
-        print(f"[OK] Deductible: {deductible_match.group(1)}")
+        logger.debug("Deductible: %s", deductible_match.group(1))
 
     # Extract member contribution information
-    member_contribution_match = re.search(r"member.*?contribution.*?(\d+)", text, re.IGNORECASE)
+    member_contribution_match = MEMBER_CONTRIBUTION_NUMBER.search(text)
     if member_contribution_match:
         data["Member Contribution Applicable?"] = "Yes"
-        print(f"[OK] Member contribution: {member_contribution_match.group(1)}%")
+        logger.debug("Member contribution: %s%%", member_contribution_match.group(1))
 
     # Set Pre & Post Natal defaults as per instructions
     if data["Pre-Natal Benefit Applicable?"] == "Yes":
@@ -1144,7 +1221,7 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
             if maternity_limit_val > 0:
                 pre_natal_percentage = (sum_insured_val / maternity_limit_val) * 100
                 data["Pre-Natal % Limit"] = f"{pre_natal_percentage:.1f}"
-                print(f"[OK] Pre-Natal % Limit calculated: {pre_natal_percentage:.1f}%")
+                logger.debug("Pre-Natal %% Limit calculated: %.1f%%", pre_natal_percentage)
 
     if data["Post-Natal Benefit Applicable?"] == "Yes":
         data["Post-Natal No of Days"] = "60"  # Default 60 days
@@ -1157,16 +1234,16 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
             if maternity_limit_val > 0:
                 post_natal_percentage = (sum_insured_val / maternity_limit_val) * 100
                 data["Post-Natal % Limit"] = f"{post_natal_percentage:.1f}"
-                print(f"[OK] Post-Natal % Limit calculated: {post_natal_percentage:.1f}%")
+                logger.debug("Post-Natal %% Limit calculated: %.1f%%", post_natal_percentage)
 
     # Extract Pre & Post Natal sublimit from Special Conditions
-    opd_sublimit_match = re.search(r"sublimit of Rs\.?\s?([\d,]+)", text, re.IGNORECASE)
+    opd_sublimit_match = SUBLIMIT_OF_RS.search(text)
     if opd_sublimit_match:
         opd_sublimit = int(opd_sublimit_match.group(1).replace(",", ""))
         data["Pre-Natal Limit"] = str(opd_sublimit)
         data["Post-Natal Limit"] = str(opd_sublimit)
         data["Pre-Post-Natal Limit"] = str(opd_sublimit)
-        print(f"[OK] Pre & Post Natal OPD sublimit: Rs. {opd_sublimit}")
+        logger.debug("Pre & Post Natal OPD sublimit: Rs. %s", opd_sublimit)
 
     # Set Pre & Post Natal Combined defaults - FIXED: Use .get() to safely check
     if data.get("Pre-Post-Natal Benefit Applicable?") == "Yes":
@@ -1181,35 +1258,35 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
             if maternity_limit_val > 0:
                 combined_percentage = (sum_insured_val / maternity_limit_val) * 100
                 data["Pre-Post-Natal % Limit"] = f"{combined_percentage:.1f}"
-                print(f"[OK] Pre-Post-Natal Combined % Limit calculated: {combined_percentage:.1f}%")
+                logger.debug("Pre-Post-Natal Combined %% Limit calculated: %.1f%%", combined_percentage)
 
     # Check for Over & Above Maternity Limit with better extraction
     if "over and above maternity limit" in text.lower():
         data["Over-Above-Maternity Applicable?"] = "Yes"
         # Try to extract the specific limit amount
-        over_above_match = re.search(r"over.*?above.*?maternity.*?limit.*?Rs\.([\d,]+)", text, re.IGNORECASE)
+        over_above_match = OVER_ABOVE_MATERNITY_RS.search(text)
         if over_above_match:
             over_above_limit = int(over_above_match.group(1).replace(",", ""))
             data["Over-Above-Maternity Limit"] = str(over_above_limit)
-            print(f"[OK] Over & Above Maternity Limit: Rs. {over_above_limit}")
+            logger.debug("Over & Above Maternity Limit: Rs. %s", over_above_limit)
         else:
-            print("[OK] Over & Above Maternity Limit applicable (amount not found)")
+            logger.debug("Over & Above Maternity Limit applicable (amount not found)")
 
     # === New Born Benefits from Endorsement No. 12/12a ===
     # Extract New Born data specifically from Endorsement No. 12/12a
-    newborn_data = extract_newborn_from_endt_12(text)
+    newborn_data = extract_newborn_from_endt_12(text, index, facts)
     
     # Update the main data dictionary with New Born data
     data.update(newborn_data)
 
     # Extract waiting period information
-    waiting_period_match = re.search(r"(\d+)\s*days\s*waiting\s*period", text, re.IGNORECASE)
+    waiting_period_match = WAITING_PERIOD_DAYS.search(text)
     if waiting_period_match:
         data["Waiting Period(In Days)"] = waiting_period_match.group(1)
-        print(f"[OK] Waiting period: {waiting_period_match.group(1)} days")
+        logger.debug("Waiting period: %s days", waiting_period_match.group(1))
 
     # Extract limit on number of children using improved regex
-    children_limit_match = re.search(r"first\s+(one|two|1|2)\s+children?", text, re.IGNORECASE)
+    children_limit_match = FIRST_ONE_OR_TWO_CHILDREN.search(text)
     if children_limit_match:
         value = children_limit_match.group(1).lower()
         if value in ["two", "2"]:
@@ -1222,13 +1299,13 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
         data["Maternity Limit On Number Of Live Children"] = str(count)
         data["Pre-Natal Limit On Children"] = str(count)
         data["Post-Natal Limit On Children"] = str(count)
-        print(f"[OK] Limit on children: {count}")
+        logger.debug("Limit on children: %s", count)
     else:
         # Default to 0 if no match found
         data["Maternity Limit On Number Of Live Children"] = "0"
         data["Pre-Natal Limit On Children"] = "0"
         data["Post-Natal Limit On Children"] = "0"
-        print("[INFO] No children limit found, defaulting to 0")
+        logger.debug("No children limit found, defaulting to 0")
 
     # NOTE: Maternity Copay or deductible Applicable? is left empty and will not be automatically set
 
@@ -1241,35 +1318,34 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     if "Endt. No. 11 (b) Maternity Treatment Charges Benefit Extension" in text:
         data["Maternity Benefit Applicable?"] = "Yes"
         maternity_found = True
-        print("[OK] Maternity benefits found in Endorsement 11b")
+        logger.debug("Maternity benefits found in Endorsement 11b")
     
     # Check for other maternity-related content
-    if re.search(r"maternity", text, re.IGNORECASE) or re.search(r"maternal", text, re.IGNORECASE):
+    if MATERNITY_WORD.search(text) or MATERNAL_WORD.search(text):
         if not maternity_found:
             data["Maternity Benefit Applicable?"] = "Yes"
             maternity_found = True
-            print("[OK] Maternity benefits found in text")
+            logger.debug("Maternity benefits found in text")
     
     # Check for maternity limits or coverage
-    if re.search(r"maternity.*?limit", text, re.IGNORECASE) or re.search(r"maternity.*?coverage", text, re.IGNORECASE):
+    if MATERNITY_LIMIT_WORD.search(text) or MATERNITY_COVERAGE_WORD.search(text):
         if not maternity_found:
             data["Maternity Benefit Applicable?"] = "Yes"
             maternity_found = True
-            print("[OK] Maternity coverage/limits found in text")
+            logger.debug("Maternity coverage/limits found in text")
 
     # Extract Maternity limit from Endorsement 11b
-    maternity_limit_match = re.search(r"limited to Rs\.([\d,]+)", text, re.IGNORECASE)
+    maternity_limit_match = LIMITED_TO_AMOUNT.search(text)
     if maternity_limit_match:
         maternity_limit = int(maternity_limit_match.group(1).replace(",", ""))
         data["limit"] = str(maternity_limit)
         data["limit_2"] = str(maternity_limit)
         data["limit amount"] = str(maternity_limit)
 
-    sum_insured_match = re.search(r"limit of Rs\.([\d,]+)/- as Corporate floater", text, re.IGNORECASE)
-    if sum_insured_match:
-        sum_insured = int(sum_insured_match.group(1).replace(",", ""))
+    if facts.sum_insured:
+        sum_insured = facts.sum_insured
         data["Sum insured"] = str(sum_insured)
-        print(f"[OK] Sum Insured: Rs. {sum_insured}")
+        logger.debug("Sum Insured: Rs. %s", sum_insured)
 
     # Calculate % Limit for other sections if both values exist (not combined section)
     if data["Sum insured"] and data["limit"]:
@@ -1282,28 +1358,28 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
             # Note: Combined section "% Limit" is hardcoded and not updated here
             data["%limit_2"] = f"{percentage:.1f}"
             data["Limit Percentage"] = f"{percentage:.1f}"
-            print(f"[OK] % Limit calculated: {percentage:.1f}%")
+            logger.debug("%% Limit calculated: %.1f%%", percentage)
 
     # Extract Pre & Post Natal sublimit from Special Conditions
-    opd_sublimit_match = re.search(r"sublimit of Rs\.?\s?([\d,]+)", text, re.IGNORECASE)
+    opd_sublimit_match = SUBLIMIT_OF_RS.search(text)
     if opd_sublimit_match:
         opd_sublimit = int(opd_sublimit_match.group(1).replace(",", ""))
         data["limit amount"] = str(opd_sublimit)
-        print(f"[OK] Pre & Post Natal OPD sublimit: Rs. {opd_sublimit}")
+        logger.debug("Pre & Post Natal OPD sublimit: Rs. %s", opd_sublimit)
 
     # Extract Co-payment information
-    co_payment_matches = re.findall(r"(\d+)% of the admissible claim", text, re.IGNORECASE)
+    co_payment_matches = COPAY_OF_ADMISSIBLE_CLAIM.findall(text)
     if co_payment_matches:
         co_payment_percentage = co_payment_matches[0]
-        print(f"[OK] Co-payment: {co_payment_percentage}%")
+        logger.debug("Co-payment: %s%%", co_payment_percentage)
 
     # Extract waiting period information
-    waiting_period_match = re.search(r"(\d+)\s*days\s*waiting\s*period", text, re.IGNORECASE)
+    waiting_period_match = WAITING_PERIOD_DAYS.search(text)
     if waiting_period_match:
         data["No.of Days"] = waiting_period_match.group(1)
         data["no.of Days"] = waiting_period_match.group(1)
         data["No.of Days_2"] = waiting_period_match.group(1)
-        print(f"[OK] Waiting period: {waiting_period_match.group(1)} days")
+        logger.debug("Waiting period: %s days", waiting_period_match.group(1))
 
     # Set default values for % Limit Applicable On (for other sections, not combined section)
     data["%Limit Applicable on"] = "Sum Insured"
@@ -1320,34 +1396,34 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     if "Endt. No. 12" in text or "Endt. No. 12 (a)" in text:
         data["new born covered?"] = "Yes"
         data["Is New Born Limit Applicable"] = "No"
-        print("[OK] New Born coverage found in Endorsement 12/12a")
+        logger.debug("New Born coverage found in Endorsement 12/12a")
 
     # Set default values for New Born
     data["covered From"] = "Day 0"
 
     # Extract New Born limit if present
-    newborn_limit_match = re.search(r"new born.*?limit.*?Rs\.([\d,]+)", text, re.IGNORECASE)
+    newborn_limit_match = NEW_BORN_LIMIT_RS.search(text)
     if newborn_limit_match:
         newborn_limit = int(newborn_limit_match.group(1).replace(",", ""))
         data["limit amount"] = str(newborn_limit)
-        print(f"[OK] New Born limit: Rs. {newborn_limit}")
+        logger.debug("New Born limit: Rs. %s", newborn_limit)
 
     # Set default values for Benefit Applicable fields if not found
     if not data.get("Maternity Benefit Applicable?"):
         data["Maternity Benefit Applicable?"] = "No"
-        print("[INFO] Maternity Benefit Applicable set to 'No' (no maternity benefits found in text)")
+        logger.debug("Maternity Benefit Applicable set to 'No' (no maternity benefits found in text)")
     
     if not data.get("Pre-Natal Benefit Applicable?"):
         data["Pre-Natal Benefit Applicable?"] = "No"
-        print("[INFO] Pre-Natal Benefit Applicable set to 'No' (not found in text)")
+        logger.debug("Pre-Natal Benefit Applicable set to 'No' (not found in text)")
     
     if not data.get("Post-Natal Benefit Applicable?"):
         data["Post-Natal Benefit Applicable?"] = "No"
-        print("[INFO] Post-Natal Benefit Applicable set to 'No' (not found in text)")
+        logger.debug("Post-Natal Benefit Applicable set to 'No' (not found in text)")
 
     # Clear ALL maternity fields if Maternity Benefit Applicable is "No"
     if data.get("Maternity Benefit Applicable?") == "No":
-        print("[INFO] Clearing ALL maternity fields as Maternity Benefit Applicable is 'No'")
+        logger.debug("Clearing ALL maternity fields as Maternity Benefit Applicable is 'No'")
         # Clear ALL maternity fields including hardcoded ones
         data["Maternity Waiting Period(In Days)"] = ""
         data["Maternity Limit On Number Of Live Children"] = ""
@@ -1364,7 +1440,7 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
 
     # Clear SOME maternity fields if Maternity Is Combined? is "No" (but preserve normal/caesarean amounts)
     if data.get("Maternity Is Combined?") == "No":
-        print("[INFO] Clearing SOME maternity fields as Maternity Is Combined? is 'No' (preserving normal/caesarean amounts)")
+        logger.debug("Clearing SOME maternity fields as Maternity Is Combined? is 'No' (preserving normal/caesarean amounts)")
         # Clear SOME maternity fields when maternity is not combined, but preserve normal/caesarean amounts
         data["Maternity Sum Insured"] = ""
         data["Maternity % Limit"] = ""
@@ -1376,7 +1452,7 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
 
     # Clear ALL Pre-Natal fields if Pre-Natal Benefit Applicable is "No"
     if data.get("Pre-Natal Benefit Applicable?") == "No":
-        print("[INFO] Clearing ALL Pre-Natal fields as Pre-Natal Benefit Applicable is 'No'")
+        logger.debug("Clearing ALL Pre-Natal fields as Pre-Natal Benefit Applicable is 'No'")
         # Clear ALL Pre-Natal fields
         data["Pre-Natal Waiting Period"] = ""
         data["Pre-Natal Limit On Children"] = ""
@@ -1393,7 +1469,7 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
 
     # Clear ALL Post-Natal fields if Post-Natal Benefit Applicable is "No"
     if data.get("Post-Natal Benefit Applicable?") == "No":
-        print("[INFO] Clearing ALL Post-Natal fields as Post-Natal Benefit Applicable is 'No'")
+        logger.debug("Clearing ALL Post-Natal fields as Post-Natal Benefit Applicable is 'No'")
         # Clear ALL Post-Natal fields
         data["Post-Natal Waiting Period"] = ""
         data["Post-Natal Limit On Children"] = ""
@@ -1412,11 +1488,11 @@ def extract_primary_data(text: str) -> List[Dict[str, str]]:
     # Step 1: If New Born Covered? is "Yes", set Covered From to "0"
     if data.get("New Born Covered?") == "Yes":
         data["Covered From"] = "Day 0"
-        print("[INFO] New Born Covered is 'Yes', setting Covered From to '0'")
+        logger.debug("New Born Covered is 'Yes', setting Covered From to '0'")
     
     # Step 2: If Is New Born Limit Applicable is "No", clear all other New Born fields
     if data.get("Is New Born Limit Applicable") == "No":
-        print("[INFO] Clearing New Born fields as Is New Born Limit Applicable is 'No'")
+        logger.debug("Clearing New Born fields as Is New Born Limit Applicable is 'No'")
         # Clear New Born fields but keep Covered From if it was set
         data["New Born Covered?"] = ""
         data["New Born Covered"] = ""
@@ -0,0 +1,330 @@
+"""
+Background processing of uploaded PDFs for the Streamlit app.
+
+Extraction is CPU-bound pure Python, so running it in the script thread blocks
+the user's session and, under concurrent use, the whole server. JobQueue runs
+each upload in a bounded process pool instead and hands out a job id the UI
+polls until the results are ready:
+
+    jobs = get_default_queue()
+    job_id = jobs.submit(pdf_bytes, name="policy.pdf")
+    job = jobs.get(job_id)        # job.status: queued, running, done or failed
+    job.progress                  # latest progress event per stage (see progress)
+    if job.status == DONE:
+        results = job.result      # as get_pipeline_results used to build them,
+                                  # plus "timings": seconds per stage
+
+JOB_WORKERS sets how many PDFs are processed at once (default: CPU count).
+At most JOB_QUEUE_SIZE jobs may be queued or running; submit raises
+QueueFullError beyond that so a burst of uploads cannot pile up unbounded.
+Finished jobs are kept for JOB_TTL_SECONDS, then forgotten; beyond
+JOB_MAX_FINISHED finished jobs the oldest are forgotten sooner, since each
+holds its text, workbook and exports. Callers that still need a finished job
+keep their own reference to it (the app keeps the results in session state).
+
+If a worker process dies (e.g. killed for running out of memory) the pool is
+broken for good: the jobs it was running fail, and the next submit starts a
+new pool.
+
+Submitting a PDF that is already queued, running or done returns the existing
+job, so reruns and repeat uploads do not process it twice.
+
+submit(..., exports=True) also builds the CSV / JSON Lines / Parquet exports
+(results["exports"], zipped per format); by default only the workbook is
+built, and the app builds an export when its download is used.
+
+submit(..., debug=True) runs the job with the pipeline's debug logging on
+(see app_logging.debug_logging) and returns the lines in results["debug_log"],
+for diagnosing one PDF without raising the log level of the whole server.
+"""
+import contextlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+from app_logging import configure_logging, debug_logging, get_logger
+from data_export import available_formats, build_export_zip
+from extract_pdf_text import extract_text_from_pdf_bytes
+from pipeline import build_excel_bytes_cached, file_hash, log_debug_summary, run_extractors
+from progress import StageTimings, log_stage_timings
+
+
+logger = get_logger(__name__)
+
+DEFAULT_WORKERS = int(os.getenv("JOB_WORKERS", "0")) or (os.cpu_count() or 1)
+DEFAULT_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "16"))
+DEFAULT_TTL_SECONDS = float(os.getenv("JOB_TTL_SECONDS", "3600"))
+DEFAULT_MAX_FINISHED = int(os.getenv("JOB_MAX_FINISHED", "32"))
+
+# Page-parallel extraction inside a job; jobs already run side by side, so
+# extra page workers per job would only oversubscribe the CPUs
+JOB_PAGE_WORKERS = int(os.getenv("JOB_PAGE_WORKERS", "1"))
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFullError(RuntimeError):
+    """Raised by JobQueue.submit when max_pending jobs are already queued or running"""
+
+
+def process_pdf(pdf_bytes: bytes, name: str = "", job_id: str = "", events=None,
+                debug: bool = False, exports: bool = False) -> Dict[str, Any]:
+    """
+    Text extraction, the extractors, the workbook and, with exports, the data
+    exports for one PDF. Runs in a worker process; returns the results dict the app renders.
+    Progress events (see progress.StageTimings) go to the events queue as (job_id, event).
+    With debug, the debug log of the run is returned as results["debug_log"].
+    """
+    configure_logging()
+    with debug_logging() if debug else contextlib.nullcontext() as debug_log:
+        results = _run_pipeline(pdf_bytes, name, job_id, events, exports)
+    if debug_log is not None:
+        results["debug_log"] = debug_log
+    return results
+
+
+def _run_pipeline(pdf_bytes: bytes, name: str, job_id: str, events, exports: bool) -> Dict[str, Any]:
+    timings = StageTimings((lambda event: events.put((job_id, event))) if events is not None else None)
+
+    with timings.stage("extract_text") as progress:
+        text = extract_text_from_pdf_bytes(pdf_bytes, JOB_PAGE_WORKERS, progress=progress)
+    if not text or not text.strip():
+        raise ValueError("No text could be extracted from the PDF")
+
+    with timings.stage("extractors") as progress:
+        results = run_extractors(text, progress)
+    log_debug_summary(results)
+
+    results["excel_bytes"] = None
+    results["excel_error"] = None
+    with timings.stage("excel") as progress:
+        try:
+            results["excel_bytes"] = build_excel_bytes_cached(results, progress=progress)
+        except Exception as e:
+            results["excel_error"] = str(e)
+
+    # CSV / JSON Lines / Parquet downloads: the four result sets zipped per format
+    results["exports"] = {}
+    with timings.stage("exports") as progress:
+        export_formats = available_formats() if exports else []
+        for done, export_format in enumerate(export_formats, 1):
+            try:
+                results["exports"][export_format] = build_export_zip(results, export_format)
+            except Exception as e:
+                logger.warning("%s export failed: %s", export_format, e)
+            progress(done, len(export_formats), export_format)
+
+    results["text"] = text
+    results["timings"] = dict(timings.timings, total=timings.total())
+    log_stage_timings(name or "upload", results["timings"], sha256=file_hash(pdf_bytes), job_id=job_id)
+    return results
+
+
+class Job:
+    """One submitted PDF and, once finished, its results or error"""
+
+    __slots__ = ("job_id", "name", "file_hash", "debug", "exports", "status", "submitted", "finished", "result",
+                 "error", "future", "progress")
+
+    def __init__(self, job_id: str, name: str, file_hash: str, debug: bool = False, exports: bool = False):
+        self.job_id = job_id
+        self.name = name
+        self.file_hash = file_hash
+        self.debug = debug
+        self.exports = exports
+        self.status = QUEUED
+        self.submitted = time.time()
+        self.finished: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.future: Optional[Future] = None
+        # Latest progress event per stage, in stage order (see progress.StageTimings)
+        self.progress: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    def elapsed(self) -> float:
+        """Seconds since submission, up to completion for finished jobs"""
+        return (self.finished or time.time()) - self.submitted
+
+
+class JobQueue:
+    """Bounded process pool processing uploaded PDFs, with jobs looked up by id"""
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_QUEUE_SIZE,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS, max_finished: int = DEFAULT_MAX_FINISHED):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self.max_finished = max_finished
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        # Started on the first submit, so importing the module forks nothing
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Progress events from the workers, as (job id, event), through a manager queue
+        self._manager = None
+        self._events = None
+
+    def submit(self, pdf_bytes: bytes, name: str = "", debug: bool = False, exports: bool = False) -> str:
+        """
+        Queue a PDF and return its job id; raises QueueFullError when the queue is full.
+        With debug the job also collects its debug log, with exports it also builds
+        the data exports; a job without them is not reused.
+        """
+        digest = file_hash(pdf_bytes)
+        with self._lock:
+            self._prune()
+            for job in self._jobs.values():
+                if (job.file_hash == digest and job.status != FAILED
+                        and (job.debug or not debug) and (job.exports or not exports)):
+                    return job.job_id
+            if self._pending() >= self.max_pending:
+                raise QueueFullError(f"{self.max_pending} documents are already being processed; try again shortly")
+            if self._executor is None:
+                self._start_pool()
+            job = Job(uuid.uuid4().hex, name, digest, debug, exports)
+            try:
+                future = self._executor.submit(process_pdf, pdf_bytes, name, job.job_id, self._events, debug,
+                                               exports)
+            except BrokenProcessPool:
+                # A worker died since the last submit; its jobs have failed, start over
+                self._restart_pool()
+                future = self._executor.submit(process_pdf, pdf_bytes, name, job.job_id, self._events, debug,
+                                               exports)
+            job.future = future
+            self._jobs[job.job_id] = job
+        future.add_done_callback(lambda future: self._finish(job, future))
+        return job.job_id
+
+    def _start_pool(self) -> None:
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._manager = multiprocessing.Manager()
+        self._events = self._manager.Queue()
+
+    def _restart_pool(self) -> None:
+        """Replace a broken pool (and its event queue); jobs still on it are marked failed"""
+        executor, manager = self._executor, self._manager
+        for job in self._jobs.values():
+            if job.active:
+                job.status = FAILED
+                job.error = "BrokenProcessPool: a worker process terminated abruptly"
+                job.finished = time.time()
+                job.future = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        try:
+            manager.shutdown()
+        except OSError:
+            pass
+        self._start_pool()
+
+    def _finish(self, job: Job, future: Future) -> None:
+        error = RuntimeError("cancelled") if future.cancelled() else future.exception()
+        with self._lock:
+            if job.future is not future:
+                # Already failed when its pool was replaced
+                return
+            job.finished = time.time()
+            if error is None:
+                job.result = future.result()
+                job.status = DONE
+            else:
+                job.error = f"{type(error).__name__}: {error}"
+                job.status = FAILED
+            job.future = None
+
+    def _drain_events(self) -> None:
+        """Move the progress events sent by the workers so far onto their jobs"""
+        if self._events is None:
+            return
+        while True:
+            try:
+                job_id, event = self._events.get_nowait()
+            except (queue.Empty, OSError, EOFError):
+                return
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.progress[event["stage"]] = event
+
+    @staticmethod
+    def _refresh(job: Job) -> Job:
+        if job.status == QUEUED and job.future is not None and job.future.running():
+            # Handed to a worker (the pool pre-fetches one call, so this may be a little early)
+            job.status = RUNNING
+        return job
+
+    def get(self, job_id: Optional[str]) -> Optional[Job]:
+        """The job with this id, or None if it is unknown or expired"""
+        with self._lock:
+            self._drain_events()
+            job = self._jobs.get(job_id) if job_id else None
+            return self._refresh(job) if job is not None else None
+
+    def position(self, job_id: str) -> int:
+        """Number of queued jobs submitted before this one"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or self._refresh(job).status != QUEUED:
+                return 0
+            return sum(1 for other in self._jobs.values()
+                       if self._refresh(other).status == QUEUED and other.submitted < job.submitted)
+
+    def _pending(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.active)
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the TTL, and the oldest beyond max_finished"""
+        now = time.time()
+        finished = sorted((job for job in self._jobs.values() if job.finished is not None),
+                          key=lambda job: job.finished)
+        excess = len(finished) - self.max_finished
+        for index, job in enumerate(finished):
+            if index < excess or now - job.finished > self.ttl_seconds:
+                del self._jobs[job.job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counts by status and the pool limits"""
+        with self._lock:
+            counts = {status: 0 for status in (QUEUED, RUNNING, DONE, FAILED)}
+            for job in self._jobs.values():
+                counts[self._refresh(job).status] += 1
+            return {**counts, "max_workers": self.max_workers, "max_pending": self.max_pending,
+                    "max_finished": self.max_finished}
+
+    def jobs(self) -> List[Job]:
+        """All known jobs, oldest first"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.submitted)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes; queued jobs are cancelled"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            manager, self._manager, self._events = self._manager, None, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        if manager is not None:
+            manager.shutdown()
+
+
+_default_queue: Optional[JobQueue] = None
+_default_queue_lock = threading.Lock()
+
+
+def get_default_queue() -> JobQueue:
+    """Return the process-wide queue shared by every app session"""
+    global _default_queue
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = JobQueue()
+        return _default_queue
@@ -0,0 +1,245 @@
+r"""
+Central registry of precompiled, named extraction patterns.
+
+Every module registers its regexes at import time under a stable dotted name
+("<module>.<what it matches>") and keeps the returned NamedPattern in a module
+constant, so no pattern is compiled while a document is being processed:
+
+    CORPORATE_FLOATER = register("primary_data.corporate_floater",
+                                 r'limit of Rs\.([\d,]+)/- as Corporate floater', re.IGNORECASE)
+    match = CORPORATE_FLOATER.search(text)
+
+Ordered fallback lists are registered with register_list and get the names
+"<name>[0]", "<name>[1]", ... register_fallbacks does the same and also returns
+a FallbackPatterns that finds the first matching pattern of the list in a
+single scan.
+
+Calls go through NamedPattern.regex, which is normally the compiled pattern
+itself. PatternRegistry.set_wrapper swaps it for an instrumented stand-in
+(see regex_profiler.py) without touching the call sites.
+"""
+import re
+from typing import Callable, Dict, Iterator, List, Match, Optional, Pattern
+
+
+class NamedPattern:
+    """A compiled regex with a stable registry name; exposes the usual Pattern methods"""
+
+    __slots__ = ("name", "compiled", "regex")
+
+    def __init__(self, name: str, compiled: Pattern):
+        self.name = name
+        self.compiled = compiled
+        # What calls are dispatched to: the compiled pattern, or a wrapper around it
+        self.regex = compiled
+
+    @property
+    def pattern(self) -> str:
+        return self.compiled.pattern
+
+    @property
+    def flags(self) -> int:
+        return self.compiled.flags
+
+    def search(self, string: str, *args):
+        return self.regex.search(string, *args)
+
+    def match(self, string: str, *args):
+        return self.regex.match(string, *args)
+
+    def fullmatch(self, string: str, *args):
+        return self.regex.fullmatch(string, *args)
+
+    def findall(self, string: str, *args):
+        return self.regex.findall(string, *args)
+
+    def finditer(self, string: str, *args):
+        return self.regex.finditer(string, *args)
+
+    def sub(self, repl, string: str, count: int = 0):
+        return self.regex.sub(repl, string, count)
+
+    def split(self, string: str, maxsplit: int = 0):
+        return self.regex.split(string, maxsplit)
+
+    def __repr__(self):
+        return f"NamedPattern({self.name!r}, {self.compiled.pattern!r})"
+
+
+class FallbackPatterns:
+    """
+    An ordered fallback list searched as one alternation. search() returns exactly
+    the match that the usual loop returns:
+
+        for pattern in patterns:
+            match = pattern.search(string)
+            if match:
+                return match
+
+    The combined pattern finds the leftmost position where any pattern matches;
+    the pattern the alternation picked there is the first one that matches at
+    that position. Patterns earlier in the list can only match further right, so
+    the search is repeated from there with the alternation of just those patterns
+    until none of them matches. The result is the winning pattern's own match.
+    """
+
+    def __init__(self, name: str, patterns: List[NamedPattern], alternations: Optional[List[NamedPattern]]):
+        self.name = name
+        self.patterns = patterns
+        # alternations[k] combines patterns[:k + 1]; None if they could not be combined
+        self.alternations = alternations
+
+    def search(self, string: str) -> Optional[Match]:
+        """First-match-wins search over the list"""
+        if self.alternations is None:
+            return self.search_each(string)
+
+        found = self.alternations[-1].search(string)
+        if found is None:
+            return None
+        index, match = self._first_match_at(string, found.start(), len(self.patterns))
+        while index > 0 and match.start() < len(string):
+            found = self.alternations[index - 1].search(string, match.start() + 1)
+            if found is None:
+                break
+            index, match = self._first_match_at(string, found.start(), index)
+        return match
+
+    def _first_match_at(self, string: str, position: int, count: int):
+        """The first of patterns[:count] matching at position, i.e. the branch the alternation took"""
+        for index in range(count):
+            match = self.patterns[index].match(string, position)
+            if match:
+                return index, match
+        raise RuntimeError(f"No pattern of {self.name} matches where its alternation did")
+
+    def search_each(self, string: str) -> Optional[Match]:
+        """The same search, one pattern at a time"""
+        for pattern in self.patterns:
+            match = pattern.search(string)
+            if match:
+                return match
+        return None
+
+    def __iter__(self) -> Iterator[NamedPattern]:
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __getitem__(self, index: int) -> NamedPattern:
+        return self.patterns[index]
+
+    def __repr__(self):
+        return f"FallbackPatterns({self.name!r}, {len(self.patterns)} patterns)"
+
+
+class PatternRegistry:
+    """Name -> NamedPattern mapping shared by all extraction modules"""
+
+    def __init__(self):
+        self._patterns: Dict[str, NamedPattern] = {}
+        self._fallbacks: Dict[str, FallbackPatterns] = {}
+        self._wrapper: Optional[Callable[[NamedPattern], object]] = None
+
+    def register(self, name: str, pattern: str, flags: int = 0) -> NamedPattern:
+        """
+        Compile and register a pattern under name.
+        Registering the same name again with the same pattern and flags returns the
+        existing entry (e.g. on module reload); a different pattern raises ValueError.
+        """
+        existing = self._patterns.get(name)
+        if existing is not None:
+            if existing.compiled.pattern != pattern or existing.compiled.flags != re.compile(pattern, flags).flags:
+                raise ValueError(f"Pattern name '{name}' is already registered with a different pattern")
+            return existing
+
+        named = NamedPattern(name, re.compile(pattern, flags))
+        if self._wrapper is not None:
+            named.regex = self._wrapper(named)
+        self._patterns[name] = named
+        return named
+
+    def register_list(self, name: str, patterns: List[str], flags: int = 0) -> List[NamedPattern]:
+        """Register an ordered list of patterns as name[0], name[1], ..."""
+        return [self.register(f"{name}[{i}]", pattern, flags) for i, pattern in enumerate(patterns)]
+
+    def register_fallbacks(self, name: str, patterns: List[str], flags: int = 0,
+                           combine: bool = True) -> FallbackPatterns:
+        """
+        Register an ordered fallback list as name[0], name[1], ... plus the combined
+        alternations name[:1], name[:2], ... used by FallbackPatterns.search.
+        combine=False searches one pattern at a time instead: re cannot skip ahead
+        in an alternation of patterns with different leading literals, so for such
+        lists separate scans are faster than a single combined one.
+        """
+        named = self.register_list(name, patterns, flags)
+        alternations = None
+        if combine:
+            try:
+                alternations = [
+                    self.register(f"{name}[:{count}]", "|".join(f"(?:{pattern})" for pattern in patterns[:count]),
+                                  flags)
+                    for count in range(1, len(patterns) + 1)
+                ]
+            except re.error:
+                # e.g. the same group name used in two patterns
+                alternations = None
+        fallbacks = FallbackPatterns(name, named, alternations)
+        self._fallbacks[name] = fallbacks
+        return fallbacks
+
+    def set_wrapper(self, wrapper: Optional[Callable[[NamedPattern], object]]) -> None:
+        """
+        Route every pattern's calls through wrapper(named_pattern), including patterns
+        registered later. None restores direct calls to the compiled patterns.
+        """
+        self._wrapper = wrapper
+        for named in self._patterns.values():
+            named.regex = named.compiled if wrapper is None else wrapper(named)
+
+    @property
+    def wrapped(self) -> bool:
+        return self._wrapper is not None
+
+    def get(self, name: str) -> NamedPattern:
+        """Return the registered pattern for name (KeyError if unknown)"""
+        return self._patterns[name]
+
+    def find(self, name: str) -> Optional[NamedPattern]:
+        """Return the registered pattern for name, or None"""
+        return self._patterns.get(name)
+
+    def fallbacks(self) -> List[FallbackPatterns]:
+        """Every fallback list registered with register_fallbacks"""
+        return list(self._fallbacks.values())
+
+    def names(self) -> List[str]:
+        return list(self._patterns)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._patterns
+
+    def __iter__(self) -> Iterator[NamedPattern]:
+        return iter(self._patterns.values())
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+
+PATTERNS = PatternRegistry()
+
+
+def register(name: str, pattern: str, flags: int = 0) -> NamedPattern:
+    """Register a pattern in the shared registry"""
+    return PATTERNS.register(name, pattern, flags)
+
+
+def register_list(name: str, patterns: List[str], flags: int = 0) -> List[NamedPattern]:
+    """Register an ordered fallback list of patterns in the shared registry"""
+    return PATTERNS.register_list(name, patterns, flags)
+
+
+def register_fallbacks(name: str, patterns: List[str], flags: int = 0, combine: bool = True) -> FallbackPatterns:
+    """Register an ordered fallback list searched as one alternation in the shared registry"""
+    return PATTERNS.register_fallbacks(name, patterns, flags, combine)
@@ -0,0 +1,171 @@
+"""
+Content-addressed on-disk cache of extracted PDF text.
+
+Entries are keyed by the SHA-256 of the PDF bytes plus the extractor version,
+stored as one JSON file each, and evicted least-recently-used once the cache
+grows past its size cap. The cache lives in .cache/pdf_text next to this
+module (PDF_TEXT_CACHE_DIR overrides it), whatever the working directory.
+
+    python pdf_text_cache.py --stats
+    python pdf_text_cache.py --purge
+"""
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+from app_logging import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv(
+    "PDF_TEXT_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "pdf_text")
+)
+DEFAULT_MAX_BYTES = int(os.getenv("PDF_TEXT_CACHE_MAX_MB", "256")) * 1024 * 1024
+CACHE_ENABLED = os.getenv("PDF_TEXT_CACHE", "1") != "0"
+
+
+class PDFTextCache:
+    """Disk cache of {"text", "page_offsets", "backend"} entries with LRU eviction"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(pdf_bytes: bytes, version: str) -> str:
+        """SHA-256 of the PDF bytes, salted with the extractor backend/version"""
+        digest = hashlib.sha256(pdf_bytes)
+        digest.update(b"\0" + version.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Touch the file so eviction treats it as most recently used
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry atomically, then evict old entries if over the size cap"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning("Could not write PDF text cache entry: %s", e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def _entries(self):
+        """Return (mtime, size, path) for every entry in the cache directory"""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least-recently-used entries until the cache fits under max_bytes"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def purge(self) -> int:
+        """Delete every cached entry and return how many were removed"""
+        removed = 0
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus the current on-disk footprint"""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "size_bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "cache_dir": self.cache_dir,
+        }
+
+
+_default_cache: Optional[PDFTextCache] = None
+
+
+def get_default_cache() -> PDFTextCache:
+    """Return the process-wide cache configured from the environment"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = PDFTextCache()
+    return _default_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--purge", action="store_true", help="Delete every cached entry")
+    parser.add_argument("--stats", action="store_true", help="Show entry count and size")
+    args = parser.parse_args()
+
+    cache = get_default_cache()
+    if args.purge:
+        print(f"Removed {cache.purge()} cached entries from {cache.cache_dir}")
+    if args.stats or not args.purge:
+        print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import hashlib
+import logging
+import os
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+from app_logging import get_logger
+from extract_Eligibility import extract_Eligibility
+from extract_primary_data import extract_primary_data
+from create_comprehensive_excel_with_formatting import EXCEL_WRITER_VERSION, create_comprehensive_excel_with_formatting
+from create_addon import create_addon
+from create_AddonCoverages import create_AddonCoverages
+from document_facts import DocumentFacts
+from endorsement_segmenter import segment_endorsements
+from excel_cache import WorkbookCache, get_default_cache
+from progress import ProgressCallback, report
+from text_normalizer import NormalizedText, normalize_text
+
+
+logger = get_logger(__name__)
+
+# Stream the workbook in openpyxl's write-only mode (see excel_streaming);
+# EXCEL_WRITE_ONLY=0 builds it in normal mode instead
+EXCEL_WRITE_ONLY = os.getenv("EXCEL_WRITE_ONLY", "1") != "0"
+
+
+def file_hash(file_bytes: bytes) -> str:
+    """SHA-256 of an uploaded file, used to key per-file results"""
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+# Result key and extractor, in the order run_extractors runs them
+EXTRACTORS = [
+    ("eligibility_data", extract_Eligibility),
+    ("primary_data", extract_primary_data),
+    ("addon_data", create_addon),
+    ("AddonCoverages_data", create_AddonCoverages),
+]
+
+# Keys of the result sets in run_extractors' results, for everything that lists them
+RESULT_KEYS = [key for key, _ in EXTRACTORS]
+
+
+def run_extractors(text: Union[str, NormalizedText], progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Run all four extractors over the policy text and return their results.
+    Raw text is normalized first (see text_normalizer); pass a NormalizedText to
+    reuse one that was already built, e.g. to map match positions back to the PDF text.
+    progress, if given, is called with (extractors done, 4, result key) after each one.
+    """
+    if not isinstance(text, NormalizedText):
+        text = normalize_text(text)
+    text = text.text
+    # Segment the endorsements and collect the policy-wide facts once; every
+    # extractor shares them instead of searching the whole text again
+    endorsement_index = segment_endorsements(text)
+    facts = DocumentFacts(text, endorsement_index)
+    results = {}
+    for key, extractor in EXTRACTORS:
+        results[key] = extractor(text, endorsement_index, facts)
+        report(progress, len(results), len(EXTRACTORS), key)
+    return results
+
+
+def write_excel(results: Dict[str, Any], output: Union[str, BinaryIO], write_only: bool = EXCEL_WRITE_ONLY,
+                progress: Optional[ProgressCallback] = None) -> None:
+    """Build the formatted workbook for the extractor results and save it to a path or binary file"""
+    wb = create_comprehensive_excel_with_formatting(
+        results["eligibility_data"], results["primary_data"],
+        results["addon_data"], results["AddonCoverages_data"],
+        write_only=write_only, progress=progress
+    )
+    wb.save(output)
+
+
+def build_excel_bytes(results: Dict[str, Any], write_only: bool = EXCEL_WRITE_ONLY,
+                      progress: Optional[ProgressCallback] = None) -> bytes:
+    """Build the formatted workbook for the extractor results and return the .xlsx bytes"""
+    excel_buffer = BytesIO()
+    write_excel(results, excel_buffer, write_only, progress)
+    return excel_buffer.getvalue()
+
+
+def excel_cache_key(results: Dict[str, Any], write_only: bool = EXCEL_WRITE_ONLY) -> str:
+    """Hash of the four extractor results and the writer version (and mode: the two modes' bytes differ)"""
+    data = [results.get(key) for key in RESULT_KEYS]
+    return WorkbookCache.key_for(data, f"{EXCEL_WRITER_VERSION}/{'write-only' if write_only else 'normal'}")
+
+
+def build_excel_bytes_cached(results: Dict[str, Any], write_only: bool = EXCEL_WRITE_ONLY,
+                             cache: Optional[WorkbookCache] = None,
+                             progress: Optional[ProgressCallback] = None) -> bytes:
+    """build_excel_bytes, served from the in-memory workbook cache when the same results were built before"""
+    cache = cache or get_default_cache()
+    key = excel_cache_key(results, write_only)
+    excel_bytes = cache.get(key)
+    if excel_bytes is not None:
+        logger.debug("Workbook cache hit %s", key[:12])
+        report(progress, 1, 1, "cached")
+        return excel_bytes
+    excel_bytes = build_excel_bytes(results, write_only, progress)
+    cache.put(key, excel_bytes)
+    return excel_bytes
+
+
+def log_debug_summary(results: Dict[str, Any]) -> None:
+    """Log the shape of each extractor result at debug level"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Data extraction results:")
+    for name, data in results.items():
+        logger.debug("%s type: %s, length: %s", name, type(data), len(data) if isinstance(data, list) else 'N/A')
+
+    AddonCoverages_data = results.get("AddonCoverages_data")
+    if AddonCoverages_data and isinstance(AddonCoverages_data, list) and len(AddonCoverages_data) > 0:
+        logger.debug("AddonCoverages_data first item keys:")
+        for key, value in AddonCoverages_data[0].items():
+            if value:  # Only log non-empty values
+                logger.debug("  %s: %s", key, value)
@@ -0,0 +1,157 @@
+"""
+Progress events and stage timings of the pipeline.
+
+Long-running steps take an optional progress callback and call it as they go:
+
+    progress(done, total, detail)     # e.g. (120, 400, "") for pages,
+                                      # (2, 4, "primary_data") for extractors
+
+StageTimings wraps one document's run. Each stage() hands out such a callback
+and turns the calls into events for a listener, e.g. the job queue feeding
+the UI:
+
+    timings = StageTimings(listener)
+    with timings.stage("extract_text") as progress:
+        text = extract_text_from_pdf_bytes(pdf_bytes, progress=progress)
+    ...
+    log_stage_timings("policy.pdf", timings.timings)
+
+Events are plain dicts, so they can cross process boundaries:
+
+    {"stage": "extract_text", "status": "running", "done": 120, "total": 400,
+     "detail": "", "elapsed": 3.2}
+
+with status "started", "running" or "finished" and elapsed the seconds since
+the stage started. Running events are sent at most every
+PROGRESS_INTERVAL_SECONDS; the last step of a stage is always sent.
+
+log_stage_timings logs the durations and appends them as one JSON line to
+STAGE_TIMINGS_LOG (default .cache/stage_timings.jsonl next to this module,
+whatever the working directory; empty disables it).
+"""
+import contextlib
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from app_logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Pipeline stages in order, with the labels the UI shows
+STAGES = [
+    ("extract_text", "Extracting text"),
+    ("extractors", "Running extractors"),
+    ("excel", "Writing Excel sheets"),
+    ("exports", "Building exports"),
+]
+
+STARTED = "started"
+RUNNING = "running"
+FINISHED = "finished"
+
+PROGRESS_INTERVAL_SECONDS = 0.2
+STAGE_TIMINGS_LOG = os.getenv(
+    "STAGE_TIMINGS_LOG", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "stage_timings.jsonl")
+)
+
+ProgressCallback = Callable[..., None]
+
+
+def report(progress: Optional[ProgressCallback], done: int, total: int, detail: str = "") -> None:
+    """Call progress if one was given"""
+    if progress is not None:
+        progress(done, total, detail)
+
+
+class StageTimings:
+    """Wall time of each stage of one document, reported to an optional event listener"""
+
+    __slots__ = ("listener", "timings", "started")
+
+    def __init__(self, listener: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.listener = listener
+        self.timings: Dict[str, float] = {}
+        self.started = time.perf_counter()
+
+    def _emit(self, stage: str, status: str, done: int, total: int, detail: str, elapsed: float) -> None:
+        if self.listener is not None:
+            self.listener({"stage": stage, "status": status, "done": done, "total": total,
+                           "detail": detail, "elapsed": round(elapsed, 3)})
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[ProgressCallback]:
+        """Time the stage; the yielded callback reports its steps"""
+        started = time.perf_counter()
+        last_sent = started
+        state = {"done": 0, "total": 0}
+        self._emit(name, STARTED, 0, 0, "", 0.0)
+
+        def progress(done: int, total: int, detail: str = "") -> None:
+            nonlocal last_sent
+            state["done"], state["total"] = done, total
+            now = time.perf_counter()
+            if now - last_sent >= PROGRESS_INTERVAL_SECONDS or done >= total:
+                last_sent = now
+                self._emit(name, RUNNING, done, total, detail, now - started)
+
+        try:
+            yield progress
+        finally:
+            elapsed = time.perf_counter() - started
+            self.timings[name] = round(elapsed, 4)
+            self._emit(name, FINISHED, state["total"], state["total"], "", elapsed)
+
+    def total(self) -> float:
+        """Seconds since the timings were started"""
+        return round(time.perf_counter() - self.started, 4)
+
+
+def overall_progress(events: Dict[str, Dict[str, Any]]) -> float:
+    """Share of the pipeline done, 0 to 1, from the latest event per stage; every stage weighs the same"""
+    done = 0.0
+    for stage, _ in STAGES:
+        event = events.get(stage)
+        if event is None:
+            continue
+        if event["status"] == FINISHED:
+            done += 1
+        elif event["total"]:
+            done += event["done"] / event["total"]
+    return min(done / len(STAGES), 1.0)
+
+
+def describe_stage(stage: str, event: Optional[Dict[str, Any]]) -> str:
+    """One line for a stage, e.g. "Running extractors: 2/4 (0.8s)" """
+    label = dict(STAGES).get(stage, stage)
+    if event is None:
+        return label
+    if event["status"] == FINISHED:
+        return f"{label} ({event['elapsed']:.1f}s)"
+    steps = f": {event['done']}/{event['total']}" if event["total"] else ""
+    return f"{label}{steps} ({event['elapsed']:.1f}s)"
+
+
+def current_stage(events: Dict[str, Dict[str, Any]]) -> str:
+    """describe_stage of the stage in progress, or of the last finished one"""
+    for stage, _ in reversed(STAGES):
+        if stage in events:
+            return describe_stage(stage, events[stage])
+    return "Waiting for a worker"
+
+
+def log_stage_timings(name: str, timings: Dict[str, float], **fields: Any) -> None:
+    """Log a document's stage durations and append them to STAGE_TIMINGS_LOG"""
+    logger.info("Stage timings for %s: %s", name, timings, extra={"document": name, "timings": timings})
+    if not STAGE_TIMINGS_LOG:
+        return
+    record = {"time": datetime.now().isoformat(timespec="seconds"), "document": name, "timings": timings, **fields}
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(STAGE_TIMINGS_LOG)), exist_ok=True)
+        with open(STAGE_TIMINGS_LOG, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, default=str) + "\n")
+    except OSError as e:
+        logger.warning("Could not write stage timings: %s", e)
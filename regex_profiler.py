@@ -0,0 +1,280 @@
+"""
+Opt-in per-pattern profiling of the named extraction patterns.
+
+    python regex_profiler.py policy.pdf other_policy.txt --top 15 --output profile.json
+    python regex_profiler.py --sizes large        # synthetic benchmark policies
+    python batch_convert.py renewals/ -o out/ --profile-regex
+    REGEX_PROFILE=1 python batch_convert.py renewals/ -o out/
+
+While profiling is enabled every pattern in pattern_registry.PATTERNS is called
+through a TimedRegex that records call count, cumulative and worst-case time and
+how often the pattern matched. Reports are sorted with the most expensive pattern
+first and can be printed or written as JSON, per document or aggregated over a
+batch. When profiling is off the patterns are called directly, with no overhead.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from pattern_registry import PATTERNS
+
+
+# Enables profiling in batch_convert without passing --profile-regex
+PROFILE_ENABLED = os.environ.get("REGEX_PROFILE", "0") not in ("", "0")
+
+SORT_KEYS = ("total_s", "max_s", "mean_s", "calls")
+
+
+class RegexProfiler:
+    """Per-pattern call statistics keyed by registry name"""
+
+    def __init__(self):
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, name: str, elapsed: float, matched: bool) -> None:
+        entry = self.stats.get(name)
+        if entry is None:
+            entry = self.stats[name] = {"calls": 0, "total_s": 0.0, "max_s": 0.0, "matches": 0, "misses": 0}
+        entry["calls"] += 1
+        entry["total_s"] += elapsed
+        if elapsed > entry["max_s"]:
+            entry["max_s"] = elapsed
+        if matched:
+            entry["matches"] += 1
+        else:
+            entry["misses"] += 1
+
+    def reset(self) -> None:
+        self.stats = {}
+
+    def report(self, label: str = "", sort_by: str = "total_s") -> Dict[str, Any]:
+        """Return the collected statistics as a JSON-serialisable report"""
+        rows = []
+        for name, entry in self.stats.items():
+            named = PATTERNS.find(name)
+            rows.append({
+                "name": name,
+                "pattern": named.pattern if named else "",
+                **entry,
+                "mean_s": entry["total_s"] / entry["calls"],
+            })
+        return {
+            "label": label,
+            "documents": 1,
+            "total_s": sum(row["total_s"] for row in rows),
+            "patterns": sort_rows(rows, sort_by),
+        }
+
+
+class TimedRegex:
+    """Stand-in for a compiled pattern that records every call in a RegexProfiler"""
+
+    __slots__ = ("name", "regex", "profiler")
+
+    def __init__(self, name: str, regex, profiler: RegexProfiler):
+        self.name = name
+        self.regex = regex
+        self.profiler = profiler
+
+    @property
+    def pattern(self) -> str:
+        return self.regex.pattern
+
+    @property
+    def flags(self) -> int:
+        return self.regex.flags
+
+    def search(self, string: str, *args):
+        start = time.perf_counter()
+        result = self.regex.search(string, *args)
+        self.profiler.record(self.name, time.perf_counter() - start, result is not None)
+        return result
+
+    def match(self, string: str, *args):
+        start = time.perf_counter()
+        result = self.regex.match(string, *args)
+        self.profiler.record(self.name, time.perf_counter() - start, result is not None)
+        return result
+
+    def fullmatch(self, string: str, *args):
+        start = time.perf_counter()
+        result = self.regex.fullmatch(string, *args)
+        self.profiler.record(self.name, time.perf_counter() - start, result is not None)
+        return result
+
+    def findall(self, string: str, *args):
+        start = time.perf_counter()
+        result = self.regex.findall(string, *args)
+        self.profiler.record(self.name, time.perf_counter() - start, bool(result))
+        return result
+
+    def finditer(self, string: str, *args):
+        # Collect the matches so the scan itself is what gets timed
+        start = time.perf_counter()
+        result = list(self.regex.finditer(string, *args))
+        self.profiler.record(self.name, time.perf_counter() - start, bool(result))
+        return iter(result)
+
+    def sub(self, repl, string: str, count: int = 0):
+        start = time.perf_counter()
+        result, replaced = self.regex.subn(repl, string, count)
+        self.profiler.record(self.name, time.perf_counter() - start, replaced > 0)
+        return result
+
+    def split(self, string: str, maxsplit: int = 0):
+        start = time.perf_counter()
+        result = self.regex.split(string, maxsplit)
+        self.profiler.record(self.name, time.perf_counter() - start, len(result) > 1)
+        return result
+
+
+PROFILER = RegexProfiler()
+
+
+def enable(profiler: RegexProfiler = PROFILER) -> None:
+    """Route every registered pattern (and any registered later) through the profiler"""
+    PATTERNS.set_wrapper(lambda named: TimedRegex(named.name, named.compiled, profiler))
+
+
+def disable() -> None:
+    """Call the compiled patterns directly again"""
+    PATTERNS.set_wrapper(None)
+
+
+def is_enabled() -> bool:
+    return PATTERNS.wrapped
+
+
+@contextlib.contextmanager
+def profile_document(label: str, sort_by: str = "total_s") -> Iterator[Dict[str, Any]]:
+    """
+    Profile the patterns used inside the block. Yields a dict that is filled with
+    the report for the block on exit:
+
+        with profile_document("policy.pdf") as report:
+            run_extractors(text)
+        print(format_report(report))
+    """
+    was_enabled = is_enabled()
+    enable()
+    PROFILER.reset()
+    report: Dict[str, Any] = {}
+    try:
+        yield report
+    finally:
+        report.update(PROFILER.report(label, sort_by))
+        PROFILER.reset()
+        if not was_enabled:
+            disable()
+
+
+def sort_rows(rows: List[Dict[str, Any]], sort_by: str = "total_s") -> List[Dict[str, Any]]:
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key '{sort_by}', expected one of {', '.join(SORT_KEYS)}")
+    return sorted(rows, key=lambda row: row[sort_by], reverse=True)
+
+
+def aggregate_reports(reports: List[Dict[str, Any]], label: str = "batch", sort_by: str = "total_s") -> Dict[str, Any]:
+    """Combine per-document reports into one report over all documents"""
+    combined: Dict[str, Dict[str, Any]] = {}
+    for report in reports:
+        for row in report.get("patterns", []):
+            entry = combined.get(row["name"])
+            if entry is None:
+                combined[row["name"]] = dict(row)
+                continue
+            entry["calls"] += row["calls"]
+            entry["total_s"] += row["total_s"]
+            entry["max_s"] = max(entry["max_s"], row["max_s"])
+            entry["matches"] += row["matches"]
+            entry["misses"] += row["misses"]
+    for entry in combined.values():
+        entry["mean_s"] = entry["total_s"] / entry["calls"]
+    rows = list(combined.values())
+    return {
+        "label": label,
+        "documents": sum(report.get("documents", 1) for report in reports),
+        "total_s": sum(row["total_s"] for row in rows),
+        "patterns": sort_rows(rows, sort_by),
+    }
+
+
+def format_report(report: Dict[str, Any], top: int = 20, pattern_width: int = 60) -> str:
+    """Render the top rows of a report as a console table"""
+    rows = report.get("patterns", [])
+    lines = [
+        f"Regex profile: {report.get('label') or 'unnamed'} ({report.get('documents', 1)} document(s), "
+        f"{len(rows)} patterns, {report.get('total_s', 0.0) * 1000:.3f} ms in regex calls)",
+        f"{'total ms':>10} {'share':>6} {'calls':>7} {'mean ms':>9} {'max ms':>9} {'match':>6} {'miss':>6}  name / pattern",
+    ]
+    total = report.get("total_s") or 1.0
+    for row in rows[:top] if top else rows:
+        pattern = row["pattern"].replace("\n", "\\n")
+        if len(pattern) > pattern_width:
+            pattern = pattern[:pattern_width - 3] + "..."
+        lines.append(
+            f"{row['total_s'] * 1000:10.3f} {row['total_s'] / total:6.1%} {row['calls']:7d} "
+            f"{row['mean_s'] * 1000:9.4f} {row['max_s'] * 1000:9.4f} {row['matches']:6d} {row['misses']:6d}  "
+            f"{row['name']}  {pattern}"
+        )
+    return "\n".join(lines)
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+
+
+def load_documents(inputs: List[str], sizes: Optional[List[str]]) -> Dict[str, str]:
+    """Policy texts keyed by label: PDFs or .txt files, or the synthetic benchmark corpus"""
+    if not inputs:
+        from benchmarks.synthetic_policy import generate_corpus
+        return generate_corpus(sizes)
+
+    from extract_pdf_text import extract_text_from_pdf_bytes, read_pdf_bytes
+    documents = {}
+    for path in inputs:
+        if path.lower().endswith(".pdf"):
+            documents[path] = extract_text_from_pdf_bytes(read_pdf_bytes(path), 1)
+        else:
+            with open(path, "r", encoding="utf-8") as handle:
+                documents[path] = handle.read()
+    return documents
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="*", help="Policy PDFs or extracted .txt files (default: synthetic corpus)")
+    parser.add_argument("--sizes", nargs="+", help="Synthetic corpus sizes when no inputs are given")
+    parser.add_argument("--top", type=int, default=20, help="Rows to print per report (0 for all)")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="total_s")
+    parser.add_argument("--output", help="Write the per-document and aggregated reports to this JSON file")
+    args = parser.parse_args(argv)
+
+    from pipeline import run_extractors
+
+    reports = []
+    for label, text in load_documents(args.inputs, args.sizes).items():
+        with contextlib.redirect_stdout(io.StringIO()), profile_document(label, args.sort) as report:
+            run_extractors(text)
+        reports.append(report)
+        print(format_report(report, args.top) + "\n")
+
+    aggregate = aggregate_reports(reports, sort_by=args.sort)
+    if len(reports) > 1:
+        print(format_report(aggregate, args.top))
+
+    if args.output:
+        write_report({"documents": reports, "aggregate": aggregate}, args.output)
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Column subsets and field/value views of the extractor results for the app's tabs.
+
+The primary and addon coverage results have one column per field the
+extractors know about, most of them empty for any given policy. Shipping all
+of them to the browser makes wide, mostly blank grids, so tables wider than
+WIDE_TABLE_COLUMNS are shown with only the chosen columns (by default the
+ones with a value) and can be flipped into one row per field:
+
+    df = pd.DataFrame(results["primary_data"])
+    columns = non_empty_columns(df)
+    view = field_value_view(df[columns])    # Field | Value (or Row 1, Row 2, ...)
+"""
+import os
+from typing import Any, List
+
+import pandas as pd
+
+
+# Tables with more columns than this get the column picker and the field/value view
+WIDE_TABLE_COLUMNS = int(os.getenv("WIDE_TABLE_COLUMNS", "12"))
+
+FIELD_COLUMN = "Field"
+
+
+def is_empty(value: Any) -> bool:
+    """None, NaN, blank strings and empty containers"""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, (list, tuple, dict, set)):
+        return not value
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def non_empty_columns(df: pd.DataFrame) -> List[str]:
+    """Columns with a value in at least one row, in table order"""
+    return [column for column in df.columns if not all(is_empty(value) for value in df[column])]
+
+
+def field_value_view(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per column of df: the field name, then its value ("Value") for a
+    single record or one column per record ("Row 1", "Row 2", ...).
+    Values are shown as text, since a field's values may mix types.
+    """
+    labels = ["Value"] if len(df) == 1 else [f"Row {number}" for number in range(1, len(df) + 1)]
+    view = pd.DataFrame({FIELD_COLUMN: [str(column) for column in df.columns]})
+    for label, (_, row) in zip(labels, df.iterrows()):
+        view[label] = ["" if is_empty(value) else str(value) for value in row]
+    return view
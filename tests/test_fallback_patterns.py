@@ -0,0 +1,97 @@
+"""
+FallbackPatterns.search (one scan over the combined alternation) must return
+exactly the match of the per-pattern loop (search_each) for every registered
+fallback list.
+"""
+import itertools
+
+import pytest
+
+# The extractors register their fallback lists at import
+import create_AddonCoverages  # noqa: F401
+import extract_Eligibility  # noqa: F401
+import extract_primary_data  # noqa: F401
+from benchmarks.synthetic_policy import generate_corpus
+from pattern_registry import PATTERNS
+
+
+# Lines aimed at the individual patterns of each list, so later patterns of a
+# list also win; in the pairs below they precede matches of earlier patterns
+FIXTURE_LINES = [
+    "Room, Boarding Expenses are payable up to 1% of the Sum Insured per day.",
+    "Room and Boarding charges 2% of the Sum Insured",
+    "Room rent, Boarding 3% cap",
+    "Room,Boarding limited to 4%",
+    "Intensive Care Unit expenses are payable up to 2% of the Sum Insured per day.",
+    "Intensive Care charges 5% of the Sum Insured",
+    "Intensive Care 4% cap",
+    "ICU limited to 3%",
+    "Intensive therapy 6%",
+    "sublimit of 30000",
+    "Rs. 25,000/- per claim",
+    "subject to a maximum of INR.100000",
+    "100000 during the Period of Insurance",
+    "INR 150000",
+    "Spouse - Spouse means the employee's legally married partner.",
+    "Dependent Spouse covered",
+    "Dependant Spouse covered",
+    "Spouse - 1",
+    "Spouse: 1",
+    "Maximum of the first 2 dependent children aged between 3 to 25 years",
+    "Maximum of first 2 dependant children",
+    "3 dependent children",
+    "Maximum of the first 2 children",
+    "Dependent Children - 2",
+    "Children - 3",
+    "Children: 4",
+    "Maximum 3 dependant",
+    "Up to 2 children",
+    "Up to 3 dependent",
+    "Critical illness benefit over and above the sum insured",
+    "over and above the individual limit",
+    "over and above insured amount",
+    "survival period of 30 days",
+    "waiting period of 90 days",
+    "minimum survival",
+    "daily cash ranging from Rs 500",
+    "range from 1000 to Rs 2000",
+    "from 500 to 1000 rs",
+    "Rs 500 to Rs 1000",
+    "between 2 and Rs 3000",
+    "Rs 100 - Rs 200",
+    "Rs 100 and Rs 300",
+    "No limits apply",
+]
+
+
+def build_corpus():
+    documents = list(generate_corpus(["small", "200"]).values())
+    lines = [line for document in documents for line in document.splitlines() if line.strip()]
+    pairs = [f"{first}\n{second}" for first, second in itertools.permutations(FIXTURE_LINES, 2)]
+    return documents + lines + FIXTURE_LINES + pairs
+
+
+CORPUS = build_corpus()
+
+
+def outcome(match):
+    """What a caller can observe of a match"""
+    if match is None:
+        return None
+    return match.re.pattern, match.span(), match.groups()
+
+
+def test_fallback_lists_are_registered():
+    names = [fallbacks.name for fallbacks in PATTERNS.fallbacks()]
+    assert "eligibility.room_boarding" in names
+    assert any(fallbacks.alternations is not None for fallbacks in PATTERNS.fallbacks())
+
+
+@pytest.mark.parametrize("fallbacks", PATTERNS.fallbacks(), ids=lambda fallbacks: fallbacks.name)
+def test_search_matches_search_each(fallbacks):
+    matched = 0
+    for text in CORPUS:
+        expected = fallbacks.search_each(text)
+        assert outcome(fallbacks.search(text)) == outcome(expected), text
+        matched += expected is not None
+    assert matched, f"no text of the corpus matches {fallbacks.name}"
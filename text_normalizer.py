@@ -0,0 +1,168 @@
+"""
+Canonical form of the extracted policy text, produced once before the extractors run.
+
+    document = normalize_text(raw_text)
+    match = SOME_PATTERN.search(document.text)
+    start, end = document.raw_span(match.start(), match.end())   # position in raw_text
+
+PDF text comes with non-breaking and repeated spaces, curly quotes, en/em dashes,
+ligatures and the rupee sign mixed in with their ASCII forms. The normalized text
+  - turns CRLF / CR line endings into LF (line breaks are kept: several extractors
+    work line by line)
+  - collapses every run of spaces, tabs and Unicode spaces into a single space
+  - drops zero-width characters and soft hyphens
+  - unifies curly quotes to ' and " and the dash family to -
+  - expands ligatures (fi, fl, ...)
+  - writes the rupee sign as "Rs." (INR and Rs are left as written; some patterns
+    tell the two apart)
+so patterns only have to cope with one spelling. Every edit is recorded, which
+maps any position in the normalized text back to the raw text.
+"""
+import re
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple
+
+from pattern_registry import register
+
+
+# Bump when the rules change so cached results built on normalized text are invalidated
+NORMALIZER_VERSION = "1"
+
+REPLACEMENTS = {
+    "\r\n": "\n",
+    "\r": "\n",
+    # Zero-width characters and soft hyphens
+    "\u00ad": "",
+    "\u200b": "",
+    "\u200c": "",
+    "\u200d": "",
+    "\u2060": "",
+    "\ufeff": "",
+    # Quotes
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201a": "'",
+    "\u201b": "'",
+    "\u2032": "'",
+    "\u02bc": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u201e": '"',
+    "\u2033": '"',
+    # Dashes and minus signs
+    "\u2010": "-",
+    "\u2011": "-",
+    "\u2012": "-",
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2015": "-",
+    "\u2212": "-",
+    "\ufe58": "-",
+    "\ufe63": "-",
+    "\uff0d": "-",
+    # Ligatures
+    "\ufb00": "ff",
+    "\ufb01": "fi",
+    "\ufb02": "fl",
+    "\ufb03": "ffi",
+    "\ufb04": "ffl",
+    # Currency
+    "\u20b9": "Rs.",
+}
+
+# Horizontal whitespace other than the plain space: tab, form feed, vertical tab,
+# NBSP and the Unicode spaces
+OTHER_SPACES = "\t\f\v\u00a0\u1680\u2000-\u200a\u202f\u205f\u3000"
+
+# Single characters replaced through REPLACEMENTS (line endings are matched separately)
+REPLACED_CHARS = "".join(re.escape(key) for key in REPLACEMENTS if len(key) == 1 and key != "\r")
+
+# Everything the normalizer rewrites, found in one scan. A single plain space is
+# already canonical, so only runs of spaces and the other space characters match.
+NORMALIZE_PATTERN = register(
+    "normalizer.rewrite",
+    rf"\r\n?| [ {OTHER_SPACES}]+|[{OTHER_SPACES}][ {OTHER_SPACES}]*"
+    rf"|[{REPLACED_CHARS}]"
+)
+
+
+class NormalizedText:
+    """
+    Normalized text plus the edits that produced it from the raw text.
+    Each edit is (normalized start, normalized end, raw start, raw end); text
+    between edits is unchanged, so positions there shift by a constant.
+    """
+
+    __slots__ = ("text", "raw", "_norm_starts", "_edits")
+
+    def __init__(self, text: str, raw: str, edits: List[Tuple[int, int, int, int]]):
+        self.text = text
+        self.raw = raw
+        self._edits = edits
+        self._norm_starts = [edit[0] for edit in edits]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._edits)
+
+    def to_raw(self, position: int) -> int:
+        """Raw position of the character at position in the normalized text"""
+        index = bisect_right(self._norm_starts, position) - 1
+        if index < 0:
+            return position
+        norm_start, norm_end, raw_start, raw_end = self._edits[index]
+        if position < norm_end:
+            # Inside a rewritten run: it all comes from the run's first raw character
+            return raw_start
+        return raw_end + position - norm_end
+
+    def to_raw_end(self, position: int) -> int:
+        """Raw position for an exclusive end position in the normalized text"""
+        index = bisect_left(self._norm_starts, position) - 1
+        if index < 0:
+            return position
+        norm_start, norm_end, raw_start, raw_end = self._edits[index]
+        if position <= norm_end:
+            return raw_end
+        return raw_end + position - norm_end
+
+    def raw_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Map a normalized [start, end) span, e.g. match.span(), to the raw text"""
+        if end <= start:
+            raw_start = self.to_raw(start)
+            return raw_start, raw_start
+        return self.to_raw(start), self.to_raw_end(end)
+
+    def raw_slice(self, start: int, end: int) -> str:
+        """The raw text behind a normalized span"""
+        raw_start, raw_end = self.raw_span(start, end)
+        return self.raw[raw_start:raw_end]
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self):
+        return f"NormalizedText({len(self.raw)} -> {len(self.text)} chars, {len(self._edits)} edits)"
+
+
+def normalize_text(raw: str) -> NormalizedText:
+    """Normalize extracted PDF text and record the offset map back to it"""
+    parts = []
+    edits = []
+    raw_position = 0
+    norm_position = 0
+    for match in NORMALIZE_PATTERN.finditer(raw):
+        start, end = match.span()
+        found = match.group()
+        if start > raw_position:
+            parts.append(raw[raw_position:start])
+            norm_position += start - raw_position
+        replacement = REPLACEMENTS.get(found, " ")
+        parts.append(replacement)
+        edits.append((norm_position, norm_position + len(replacement), start, end))
+        norm_position += len(replacement)
+        raw_position = end
+    if not edits:
+        return NormalizedText(raw, raw, edits)
+    parts.append(raw[raw_position:])
+    return NormalizedText("".join(parts), raw, edits)
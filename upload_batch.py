@@ -0,0 +1,187 @@
+"""
+Several uploaded PDFs processed as one batch through the background job queue.
+
+    batch = UploadBatch([(uploaded.name, uploaded.getvalue()) for uploaded in files])
+    batch.submit_pending(jobs)         # call again on every poll until it returns 0
+    batch.statuses(jobs)               # per-file status rows for the UI
+    if batch.finished(jobs):
+        archive = batch.build_zip(jobs)
+
+The job queue only accepts JOB_QUEUE_SIZE jobs at a time, so files are
+submitted in upload order as slots free up rather than all at once. The ZIP
+holds one workbook per processed PDF (named like the single-file download),
+all_policies.xlsx with every policy's rows (see consolidated_excel) and
+summary.csv with one line per uploaded file (status, row counts and the
+seconds spent in each pipeline stage).
+
+The batch keeps each finished job itself, so the queue may forget it (see
+job_queue's JOB_MAX_FINISHED) without the file being processed again.
+"""
+import csv
+import io
+import os
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from consolidated_excel import ConsolidatedWorkbook
+from job_queue import DONE, FAILED, RUNNING, Job, JobQueue, QueueFullError
+from pipeline import RESULT_KEYS, file_hash
+from progress import STAGES, current_stage
+
+
+# Status of a file whose job has not been accepted by the queue yet
+WAITING = "waiting"
+
+CONSOLIDATED_NAME = "all_policies.xlsx"
+SUMMARY_NAME = "summary.csv"
+
+# Seconds per pipeline stage of each file, from the job's results
+TIMING_FIELDS = [f"{stage}_seconds" for stage, _ in STAGES]
+
+SUMMARY_FIELDS = ["file", "status", "seconds", "workbook"] + RESULT_KEYS + TIMING_FIELDS + ["error"]
+
+
+def record_count(data: Any) -> int:
+    """Rows in one extractor result: list items, or entries per cover for AddonCoverages_data"""
+    if not data:
+        return 0
+    if isinstance(data, dict):
+        return sum(len(entries) if isinstance(entries, list) else 1 for entries in data.values())
+    return len(data)
+
+
+class UploadBatch:
+    """The uploaded files of one multi-file upload and their jobs"""
+
+    def __init__(self, files: Sequence[Tuple[str, bytes]]):
+        self.files = [
+            {"name": name, "data": data, "sha256": file_hash(data), "job_id": None, "job": None}
+            for name, data in files
+        ]
+        self._zip: Optional[bytes] = None
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    @staticmethod
+    def _job(entry: Dict[str, Any], jobs: JobQueue) -> Optional[Job]:
+        """The file's job; once finished, the batch's own reference to it"""
+        if entry["job"] is not None:
+            return entry["job"]
+        job = jobs.get(entry["job_id"])
+        if job is not None and not job.active:
+            entry["job"] = job
+        return job
+
+    def submit_pending(self, jobs: JobQueue) -> int:
+        """Submit files without a live job, in order, until the queue is full; returns how many still wait"""
+        waiting = 0
+        for entry in self.files:
+            if self._job(entry, jobs) is not None:
+                continue
+            # Never submitted, or the finished job expired from the queue
+            if not waiting:
+                try:
+                    entry["job_id"] = jobs.submit(entry["data"], entry["name"])
+                    continue
+                except QueueFullError:
+                    pass
+            entry["job_id"] = None
+            waiting += 1
+        return waiting
+
+    def statuses(self, jobs: JobQueue) -> List[Dict[str, Any]]:
+        """One row per file: name, status, current stage while running, seconds and error"""
+        rows = []
+        for entry in self.files:
+            job = self._job(entry, jobs)
+            rows.append({
+                "file": entry["name"],
+                "status": job.status if job is not None else WAITING,
+                "stage": current_stage(job.progress) if job is not None and job.status == RUNNING else None,
+                "seconds": round(job.elapsed(), 1) if job is not None else None,
+                "error": job.error if job is not None else None,
+            })
+        return rows
+
+    def finished(self, jobs: JobQueue) -> bool:
+        """True once every file's job is done or failed"""
+        return all(row["status"] in (DONE, FAILED) for row in self.statuses(jobs))
+
+    def output_names(self, jobs: JobQueue) -> List[Optional[str]]:
+        """
+        Per file, the name its results go out under: the workbook name without
+        .xlsx, also the Policy id in the consolidated workbook. None for files
+        not processed (yet); files whose workbook failed are numbered all the same.
+        """
+        names = []
+        taken = set()
+        for entry in self.files:
+            job = self._job(entry, jobs)
+            names.append(self._output_name(entry["name"], taken) if job is not None and job.status == DONE else None)
+        return names
+
+    def summary(self, jobs: JobQueue) -> List[Dict[str, Any]]:
+        """statuses plus the workbook name, the row count of every result set and the stage timings"""
+        rows = []
+        for entry, row, name in zip(self.files, self.statuses(jobs), self.output_names(jobs)):
+            job = self._job(entry, jobs)
+            results = job.result if job is not None and job.status == DONE else None
+            row = dict(row, workbook=None)
+            del row["stage"]
+            if results is not None:
+                if results.get("excel_bytes"):
+                    row["workbook"] = f"{name}.xlsx"
+                else:
+                    row["error"] = results.get("excel_error")
+                for key in RESULT_KEYS:
+                    row[key] = record_count(results.get(key))
+                timings = results.get("timings") or {}
+                for (stage, _), field in zip(STAGES, TIMING_FIELDS):
+                    row[field] = timings.get(stage)
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _output_name(pdf_name: str, taken: set) -> str:
+        """Workbook name as for the single-file download (without .xlsx), numbered when two uploads share a name"""
+        base_filename = os.path.splitext(os.path.basename(pdf_name))[0]
+        stamp = datetime.now().strftime('%d-%m-%Y')
+        name = f"{base_filename}_{stamp}"
+        counter = 1
+        while name in taken:
+            counter += 1
+            name = f"{base_filename}_{stamp}_{counter}"
+        taken.add(name)
+        return name
+
+    def build_zip(self, jobs: JobQueue) -> bytes:
+        """Every workbook, the consolidated workbook and summary.csv in one .zip; built once per batch"""
+        if self._zip is not None:
+            return self._zip
+
+        summary = self.summary(jobs)
+        output = io.BytesIO()
+        consolidated = ConsolidatedWorkbook()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+            for entry, row, name in zip(self.files, summary, self.output_names(jobs)):
+                job = self._job(entry, jobs)
+                if job is None or job.status != DONE:
+                    continue
+                if row["workbook"]:
+                    archive.writestr(row["workbook"], job.result["excel_bytes"])
+                consolidated.add_policy(name, job.result)
+
+            workbook = io.BytesIO()
+            consolidated.save(workbook)
+            archive.writestr(CONSOLIDATED_NAME, workbook.getvalue())
+
+            summary_csv = io.StringIO(newline="")
+            writer = csv.DictWriter(summary_csv, fieldnames=SUMMARY_FIELDS, restval="")
+            writer.writeheader()
+            writer.writerows(summary)
+            archive.writestr(SUMMARY_NAME, summary_csv.getvalue().encode("utf-8"))
+
+        self._zip = output.getvalue()
+        return self._zip